@@ -160,6 +160,7 @@ from ocs_ci.utility import (
 from ocs_ci.utility.aws import update_config_from_s3, create_and_attach_sts_role
 from ocs_ci.utility.multicluster import create_mce_catsrc
 from ocs_ci.utility.operators import NMStateOperator
+from ocs_ci.utility.readiness import ReadinessGraph, wait_for_operator_ready
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.secret import link_all_sa_and_secret_and_delete_pods
 from ocs_ci.utility.ssl_certs import (
@@ -348,19 +349,9 @@ class Deployment(object):
 
         run_cmd(f"oc apply -f {constants.GITOPS_SUBSCRIPTION_YAML}")
 
-        self.wait_for_subscription(
-            constants.GITOPS_OPERATOR_NAME, namespace=constants.GITOPS_NAMESPACE
+        wait_for_operator_ready(
+            constants.GITOPS_OPERATOR_NAME, constants.GITOPS_NAMESPACE, timeout=900
         )
-        logger.info("Sleeping for 120 seconds after subscribing to GitOps Operator")
-        time.sleep(120)
-        subscriptions = ocp.OCP(
-            kind=constants.SUBSCRIPTION_WITH_ACM,
-            resource_name=constants.GITOPS_OPERATOR_NAME,
-            namespace=constants.GITOPS_NAMESPACE,
-        ).get()
-        gitops_csv_name = subscriptions["status"]["currentCSV"]
-        csv = CSV(resource_name=gitops_csv_name, namespace=constants.GITOPS_NAMESPACE)
-        csv.wait_for_phase("Succeeded", timeout=720)
         logger.info("GitOps Operator Deployment Succeeded")
         ocp_version = version.get_semantic_ocp_version_from_config()
         if (
@@ -384,8 +375,13 @@ class Deployment(object):
         # Multicluster operations
         if config.multicluster:
             # Gitops operator is needed on all clusters for appset type workload deployment using pull model
-            for cluster_index in range(config.nclusters):
-                self.deploy_gitops_operator(switch_ctx=cluster_index)
+            self.run_on_clusters(
+                "gitops",
+                lambda cluster_index: self.deploy_gitops_operator(
+                    switch_ctx=cluster_index
+                ),
+                range(config.nclusters),
+            )
 
             # Switching back context to ACM as below configs are specific to hub cluster
             config.switch_ctx(get_active_acm_index())
@@ -604,87 +600,84 @@ class Deployment(object):
                         return True
             return False
 
-        if config.multicluster:
-            for cluster in config.clusters:
-                index = cluster.MULTICLUSTER["multicluster_index"]
-                with config.RunWithConfigContext(index):
-                    config.switch_ctx(index)
-                    logger.info("Creating Namespace")
-                    # creating Namespace and operator group for cert-manager
-                    logger.info(
-                        "Creating namespace and operator group for Openshift-oadp"
-                    )
-                    run_cmd(f"oc apply -f {constants.OADP_NS_YAML}")
-                    logger.info("Creating OADP Operator Subscription")
-                    oadp_subscription_yaml_data = templating.load_yaml(
-                        constants.OADP_SUBSCRIPTION_YAML
-                    )
-                    package_manifest = PackageManifest(
-                        resource_name=constants.OADP_OPERATOR_NAME,
-                        selector="catalog=redhat-operators",
-                    )
-                    try:
-                        pm_data = package_manifest.get()
-                        pm_list = pm_data if isinstance(pm_data, list) else [pm_data]
-                        required_oadp_version = config.ENV_DATA["oadp_version"]
-
-                        if not any(
-                            version_exist(pm, required_oadp_version)
-                            and pm.get("status", {}).get("catalogSource")
-                            == constants.OPERATOR_CATALOG_SOURCE_NAME
-                            for pm in pm_list
-                        ):
-                            raise ResourceNotFoundError(
-                                f"Didn't find OADP {required_oadp_version}"
-                            )
+        def deploy_oadp_on_cluster(index):
+            """
+            Deploy OADP operator on the cluster
 
-                    except ResourceNotFoundError as ex:
-                        logger.warning(
-                            f"OADP operator not availabe - bringing up unreleased content {ex}!"
-                        )
-                        create_unreleased_oadp_catalog()
-                        package_manifest = PackageManifest(
-                            resource_name=constants.OADP_OPERATOR_NAME,
-                            selector=f"catalog={constants.OADP_CATALOG_NAME}",
+            Args:
+                index (int): Index of the cluster config
+
+            """
+            with config.RunWithConfigContext(index):
+                config.switch_ctx(index)
+                logger.info("Creating Namespace")
+                # creating Namespace and operator group for cert-manager
+                logger.info("Creating namespace and operator group for Openshift-oadp")
+                run_cmd(f"oc apply -f {constants.OADP_NS_YAML}")
+                logger.info("Creating OADP Operator Subscription")
+                oadp_subscription_yaml_data = templating.load_yaml(
+                    constants.OADP_SUBSCRIPTION_YAML
+                )
+                package_manifest = PackageManifest(
+                    resource_name=constants.OADP_OPERATOR_NAME,
+                    selector="catalog=redhat-operators",
+                )
+                try:
+                    pm_data = package_manifest.get()
+                    pm_list = pm_data if isinstance(pm_data, list) else [pm_data]
+                    required_oadp_version = config.ENV_DATA["oadp_version"]
+
+                    if not any(
+                        version_exist(pm, required_oadp_version)
+                        and pm.get("status", {}).get("catalogSource")
+                        == constants.OPERATOR_CATALOG_SOURCE_NAME
+                        for pm in pm_list
+                    ):
+                        raise ResourceNotFoundError(
+                            f"Didn't find OADP {required_oadp_version}"
                         )
-                        oadp_subscription_yaml_data["spec"][
-                            "source"
-                        ] = constants.OADP_CATALOG_NAME
-                    oadp_default_channel = package_manifest.get_default_channel()
-                    if config.MULTICLUSTER["acm_cluster"]:
-                        logger.info("Skipping oadp subscription for ACM hub")
-                        continue
 
-                    oadp_subscription_yaml_data["spec"][
-                        "channel"
-                    ] = oadp_default_channel
-                    oadp_subscription_manifest = tempfile.NamedTemporaryFile(
-                        mode="w+", prefix="oadp_subscription_manifest", delete=False
-                    )
-                    templating.dump_data_to_temp_yaml(
-                        oadp_subscription_yaml_data, oadp_subscription_manifest.name
-                    )
-                    run_cmd(f"oc apply -f {oadp_subscription_manifest.name}")
-                    self.wait_for_subscription(
-                        constants.OADP_OPERATOR_NAME, namespace=constants.OADP_NAMESPACE
+                except ResourceNotFoundError as ex:
+                    logger.warning(
+                        f"OADP operator not availabe - bringing up unreleased content {ex}!"
                     )
-                    logger.info(
-                        "Sleeping for 120 seconds after subscribing to OADP Operator"
-                    )
-                    time.sleep(120)
-                    oadp_subscriptions = ocp.OCP(
-                        kind=constants.SUBSCRIPTION_WITH_ACM,
+                    create_unreleased_oadp_catalog()
+                    package_manifest = PackageManifest(
                         resource_name=constants.OADP_OPERATOR_NAME,
-                        namespace=constants.OADP_NAMESPACE,
-                    ).get()
-                    oadp_csv_name = oadp_subscriptions["status"]["currentCSV"]
-                    csv = CSV(
-                        resource_name=oadp_csv_name, namespace=constants.OADP_NAMESPACE
+                        selector=f"catalog={constants.OADP_CATALOG_NAME}",
                     )
-                    csv.wait_for_phase("Succeeded", timeout=720)
-                    logger.info("OADP Operator Deployment Succeeded")
-                    if cluster.ENV_DATA["platform"] == constants.IBMCLOUD_PLATFORM:
-                        apply_oadp_workaround(namespace=constants.OADP_NAMESPACE)
+                    oadp_subscription_yaml_data["spec"][
+                        "source"
+                    ] = constants.OADP_CATALOG_NAME
+                oadp_default_channel = package_manifest.get_default_channel()
+                if config.MULTICLUSTER["acm_cluster"]:
+                    logger.info("Skipping oadp subscription for ACM hub")
+                    return
+
+                oadp_subscription_yaml_data["spec"]["channel"] = oadp_default_channel
+                oadp_subscription_manifest = tempfile.NamedTemporaryFile(
+                    mode="w+", prefix="oadp_subscription_manifest", delete=False
+                )
+                templating.dump_data_to_temp_yaml(
+                    oadp_subscription_yaml_data, oadp_subscription_manifest.name
+                )
+                run_cmd(f"oc apply -f {oadp_subscription_manifest.name}")
+                wait_for_operator_ready(
+                    constants.OADP_OPERATOR_NAME, constants.OADP_NAMESPACE, timeout=900
+                )
+                logger.info("OADP Operator Deployment Succeeded")
+                if config.ENV_DATA["platform"] == constants.IBMCLOUD_PLATFORM:
+                    apply_oadp_workaround(namespace=constants.OADP_NAMESPACE)
+
+        if config.multicluster:
+            self.run_on_clusters(
+                "oadp",
+                deploy_oadp_on_cluster,
+                [
+                    cluster.MULTICLUSTER["multicluster_index"]
+                    for cluster in config.clusters
+                ],
+            )
 
     def do_deploy_rdr(self):
         """
@@ -865,6 +858,102 @@ class Deployment(object):
             machineconfig.deploy_machineconfig(
                 tmp_path, "network-split", mc_dict, mcp_num=2
             )
+        self.deploy_operators()
+
+    def deploy_operators(self):
+        """
+        Deploy ODF and the dependent operators
+
+        The install steps are run as a dependency graph. With
+        DEPLOYMENT.parallel_operator_deployment enabled on a single cluster,
+        the independent operators are installed concurrently and every step
+        starts as soon as the steps it requires are ready, otherwise the
+        steps run one after another in the order they are added.
+
+        """
+        # The steps of the multicluster deployment switch the cluster context
+        # of the whole run, they can't run concurrently
+        parallel = (
+            config.DEPLOYMENT.get("parallel_operator_deployment")
+            and not config.multicluster
+        )
+        graph = ReadinessGraph("operators deployment")
+        graph.add_step("acm_hub", self.do_deploy_acm_hub)
+        node_config_steps = ["nested_virtualization", "data_replication_separation"]
+        if not parallel:
+            # The sequential deployment sets up LSO before the node configuration
+            graph.add_step("lso", self.do_deploy_lso)
+        graph.add_step("nested_virtualization", self.do_enable_nested_virtualization)
+        graph.add_step(
+            "data_replication_separation", self.do_enable_data_replication_separation
+        )
+        if parallel:
+            # The nodes must not be reconfigured while LSO is set up on them
+            graph.add_step("lso", self.do_deploy_lso, requires=node_config_steps)
+        graph.add_step("lvmo", self.do_deploy_lvmo, requires=node_config_steps)
+        graph.add_step("submariner", self.do_deploy_submariner, requires=["acm_hub"])
+        graph.add_step("gitops", self.do_gitops_deploy, requires=["acm_hub"])
+        graph.add_step("oadp", self.do_deploy_oadp)
+        graph.add_step(
+            "ocs",
+            self.do_deploy_ocs,
+            requires=[
+                "lso",
+                "nested_virtualization",
+                "data_replication_separation",
+                "lvmo",
+                "submariner",
+            ],
+        )
+        graph.add_step("rdr", self.do_deploy_rdr, requires=["ocs", "gitops", "oadp"])
+        graph.add_step("mce", self.do_deploy_mce, requires=["acm_hub"])
+        graph.add_step("cnv", self.do_deploy_cnv, requires=["nested_virtualization"])
+        graph.add_step(
+            "hyperconverged", self.do_deploy_hyperconverged, requires=["cnv"]
+        )
+        graph.add_step("metallb", self.do_deploy_metallb)
+        spoke_requires = ["ocs", "rdr", "mce", "hyperconverged", "metallb"]
+        graph.add_step(
+            "hosted_spoke_clusters",
+            self.do_deploy_hosted_spoke_clusters,
+            requires=spoke_requires,
+        )
+        graph.add_step(
+            "external_spoke_clusters",
+            self.do_deploy_external_spoke_clusters,
+            requires=spoke_requires + ["hosted_spoke_clusters"],
+        )
+        graph.run(max_workers=None if parallel else 1)
+
+    def run_on_clusters(self, name, func, indexes):
+        """
+        Run the install step on the clusters, concurrently if
+        DEPLOYMENT.parallel_operator_deployment is enabled
+
+        Args:
+            name (str): Name of the install step
+            func (function): Function performing the step on the cluster of
+                the current config context, called with the cluster index
+            indexes (list): Indexes of the clusters
+
+        """
+        graph = ReadinessGraph(name)
+        for index in indexes:
+            graph.add_step(f"{name}-{index}", func, index, config_index=index)
+        parallel = config.DEPLOYMENT.get("parallel_operator_deployment")
+        original_index = config.cur_index
+        try:
+            graph.run(max_workers=None if parallel else 1)
+        finally:
+            # the steps running concurrently switch the context of the run
+            if parallel and config.cur_index != original_index:
+                config.switch_ctx(original_index)
+
+    def do_deploy_acm_hub(self):
+        """
+        Deploy ACM hub if requested
+
+        """
         ocp_version = version.get_semantic_ocp_version_from_config()
         if (
             config.ENV_DATA.get("deploy_acm_hub_cluster")
@@ -872,6 +961,34 @@ class Deployment(object):
         ):
             self.deploy_acm_hub()
 
+    def do_enable_nested_virtualization(self):
+        """
+        Enable nested virtualization on the nodes if requested
+
+        """
+        if config.DEPLOYMENT.get("enable_nested_virtualization"):
+            from ocs_ci.deployment.hub_spoke import enable_nested_virtualization
+
+            enable_nested_virtualization()
+
+    def do_enable_data_replication_separation(self):
+        """
+        Annotate the worker nodes with the mon IPs on the provider cluster if
+        the data replication separation is requested
+
+        """
+        if (
+            config.DEPLOYMENT.get("enable_data_replication_separation")
+            and config.ENV_DATA.get("cluster_type") == "provider"
+        ):
+            annotate_worker_nodes_with_mon_ip()
+
+    def do_deploy_lso(self):
+        """
+        Deploy standalone LSO if requested and the LSO storage class doesn't
+        exist yet
+
+        """
         perform_lso_standalone_deployment = config.DEPLOYMENT.get(
             "lso_standalone_deployment", False
         ) and not ocp.OCP(kind=constants.STORAGECLASS).is_exist(
@@ -885,29 +1002,6 @@ class Deployment(object):
                 cleanup_nodes_for_lso_install()
             setup_local_storage(storageclass=constants.DEFAULT_STORAGECLASS_LSO)
 
-        if config.DEPLOYMENT.get("enable_nested_virtualization"):
-            from ocs_ci.deployment.hub_spoke import enable_nested_virtualization
-
-            enable_nested_virtualization()
-        if (
-            config.DEPLOYMENT.get("enable_data_replication_separation")
-            and config.ENV_DATA.get("cluster_type") == "provider"
-        ):
-            annotate_worker_nodes_with_mon_ip()
-
-        self.do_deploy_lvmo()
-        self.do_deploy_submariner()
-        self.do_gitops_deploy()
-        self.do_deploy_oadp()
-        self.do_deploy_ocs()
-        self.do_deploy_rdr()
-        self.do_deploy_mce()
-        self.do_deploy_cnv()
-        self.do_deploy_hyperconverged()
-        self.do_deploy_metallb()
-        self.do_deploy_hosted_spoke_clusters()
-        self.do_deploy_external_spoke_clusters()
-
     def get_rdr_conf(self):
         """
         Aggregate important Regional DR parameters in the dictionary
@@ -0,0 +1,52 @@
+# -*- coding: utf8 -*-
+
+import threading
+
+import pytest
+
+from ocs_ci.deployment.deployment import Deployment
+from ocs_ci.framework import config
+
+
+class RecordingDeployment:
+    """
+    Records the order the install steps of deploy_operators run in
+    """
+
+    def __init__(self):
+        self.steps = []
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if not name.startswith("do_"):
+            raise AttributeError(name)
+
+        def step():
+            with self._lock:
+                self.steps.append(name[len("do_") :])
+
+        return step
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_deploy_operators_order(monkeypatch, parallel):
+    monkeypatch.setitem(config.DEPLOYMENT, "parallel_operator_deployment", parallel)
+    deployment = RecordingDeployment()
+    Deployment.deploy_operators(deployment)
+    steps = deployment.steps
+    node_config_steps = [
+        steps.index("enable_nested_virtualization"),
+        steps.index("enable_data_replication_separation"),
+    ]
+    if parallel:
+        assert steps.index("deploy_lso") > max(node_config_steps)
+    else:
+        assert steps[:5] == [
+            "deploy_acm_hub",
+            "deploy_lso",
+            "enable_nested_virtualization",
+            "enable_data_replication_separation",
+            "deploy_lvmo",
+        ]
+    assert steps.index("deploy_lvmo") > max(node_config_steps)
+    assert steps.index("deploy_ocs") > steps.index("deploy_lso")
@@ -163,10 +163,21 @@ class MultiClusterConfig:
             )
             return getattr(self.clusters[config_index], attr)
 
+    @property
+    def cur_thread_index(self):
+        """
+        Index of the cluster in context of the current thread
+
+        Returns:
+            int: The thread-local index of a config safe thread, the global
+                cur_index otherwise
+
+        """
+        return getattr(self.thread_local_data, "config_index", self.cur_index)
+
     @property
     def cluster_ctx(self):
-        config_index = getattr(self.thread_local_data, "config_index", self.cur_index)
-        return self.clusters[config_index]
+        return self.clusters[self.cur_thread_index]
 
     @property
     def default_cluster_ctx(self):
@@ -226,7 +237,7 @@ class MultiClusterConfig:
         logger.info(f"Switched to cluster: {self.current_cluster_name()}")
 
     def switch_acm_ctx(self):
-        self.cur_index = self.get_active_acm_index()
+        self.switch_ctx(self.get_active_acm_index())
 
     def get_active_acm_index(self):
         """
@@ -529,16 +540,16 @@ class MultiClusterConfig:
 
     class RunWithConfigContext(object):
         def __init__(self, config_index):
-            self.original_config_index = config.cur_index
+            self.original_config_index = config.cur_thread_index
             self.config_index = config_index
 
         def __enter__(self):
-            if self.config_index != config.cur_index:
+            if self.config_index != config.cur_thread_index:
                 config.switch_ctx(self.config_index)
             return self
 
         def __exit__(self, exc_type, exc_value, exc_traceback):
-            if self.original_config_index != config.cur_index:
+            if self.original_config_index != config.cur_thread_index:
                 config.switch_ctx(self.original_config_index)
 
     class RunWithAcmConfigContext(RunWithConfigContext):
@@ -567,7 +578,7 @@ class MultiClusterConfig:
                 # if no provider is available then set the switch to current index so that
                 # no switch happens and code runs on current cluster
                 logger.debug("No provider was found - using current cluster")
-                switch_index = config.cur_index
+                switch_index = config.cur_thread_index
             super().__init__(switch_index)
 
     @staticmethod
@@ -603,7 +614,7 @@ class MultiClusterConfig:
                 # if no provider is available then set the switch to current index so that
                 # no switch happens and code runs on current cluster
                 logger.debug("No Consumer was found - using current cluster")
-                switch_index = config.cur_index
+                switch_index = config.cur_thread_index
             super().__init__(switch_index)
 
     def get_client_contexts_if_available(self):
@@ -693,7 +704,7 @@ class ConfigSafeThread(Thread):
         try:
             super(ConfigSafeThread, self).run()
         finally:
-            if hasattr(self.thread_local_data, "config_index"):
+            if hasattr(config.thread_local_data, "config_index"):
                 del config.thread_local_data.config_index
 
 
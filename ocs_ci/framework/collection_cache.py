@@ -0,0 +1,264 @@
+"""
+Cache of the collected tests for runs with -m or -k selection
+
+Importing every test module of the tests tree takes a long time, while a run
+selecting the tests by markers or keywords usually needs only a small part of
+them. The cache stores the node ids, markers and keywords of the tests of
+every collected module. A module which didn't change since it was cached and
+has no test matching the -m and -k expressions isn't imported at all.
+
+The entry of a module is valid only while the module, the conftest.py files
+it depends on, the ocs-ci marks module and the ocs-ci configuration, which can
+affect the markers and the parametrization of the tests, are the same. The cache is stored in the pytest
+cache directory and is removed by --cache-clear.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+from _pytest.mark import KeywordMatcher, MarkMatcher
+from _pytest.mark.expression import Expression, ParseError
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = "ocsci/collection_cache"
+MARKS_MODULE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "pytest_customization", "marks.py"
+)
+
+
+def get_file_hash(path):
+    """
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        str: sha256 of the content of the file
+
+    """
+    with open(path, "rb") as fd:
+        return hashlib.sha256(fd.read()).hexdigest()
+
+
+def get_config_hash(config_data):
+    """
+    Args:
+        config_data (list): Config sections of all the clusters
+
+    Returns:
+        str: sha256 of the config, the RUN section with the run specific
+            values like run_id is skipped
+
+    """
+    data = [
+        {section: value for section, value in sections.items() if section != "RUN"}
+        for sections in config_data
+    ]
+    return hashlib.sha256(
+        json.dumps(data, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def is_test_module(path):
+    """
+    Args:
+        path (str): Path to a collected file
+
+    Returns:
+        bool: True for a python module which is not a conftest.py or a package
+
+    """
+    return path.endswith(".py") and os.path.basename(path) not in (
+        "__init__.py",
+        "conftest.py",
+    )
+
+
+def compile_expression(expression):
+    """
+    Args:
+        expression (str): -m or -k expression
+
+    Returns:
+        Expression: Compiled expression, None if there is no expression or it
+            uses the deprecated -k syntax or it is invalid
+
+    """
+    expression = (expression or "").strip()
+    if not expression or expression.startswith("-") or expression.endswith(":"):
+        return None
+    try:
+        return Expression.compile(expression)
+    except ParseError:
+        return None
+
+
+class CollectionCache:
+    """
+    Collected tests of the test modules
+    """
+
+    def __init__(self, pytest_config, config_data):
+        """
+        Args:
+            pytest_config (pytest.config): Pytest config object
+            config_data (list): Config sections of all the clusters, see
+                get_config_hash
+
+        """
+        self.cache = pytest_config.cache
+        self.rootdir = str(pytest_config.rootdir)
+        # The test modules apply the markers defined in the marks module
+        self.config_hash = hashlib.sha256(
+            (get_config_hash(config_data) + get_file_hash(MARKS_MODULE)).encode()
+        ).hexdigest()
+        self.mark_expression = compile_expression(pytest_config.option.markexpr)
+        self.keyword_expression = compile_expression(pytest_config.option.keyword)
+        stored = self.cache.get(CACHE_KEY, {})
+        if stored.get("config_hash") == self.config_hash:
+            self.modules = stored.get("modules", {})
+        else:
+            self.modules = {}
+        self.collected = {}
+        self.failed = set()
+        self.skipped = set()
+        self._conftest_hashes = {}
+
+    @property
+    def has_selection(self):
+        return bool(self.mark_expression or self.keyword_expression)
+
+    def _relpath(self, path):
+        return os.path.relpath(str(path), self.rootdir)
+
+    def _get_conftest_hash(self, directory):
+        """
+        Returns:
+            str: Hashes of the conftest.py files from the directory up to the
+                rootdir
+
+        """
+        if directory not in self._conftest_hashes:
+            conftest = os.path.join(directory, "conftest.py")
+            conftest_hash = get_file_hash(conftest) if os.path.isfile(conftest) else ""
+            parent = os.path.dirname(directory)
+            if directory != self.rootdir and parent != directory:
+                conftest_hash += self._get_conftest_hash(parent)
+            self._conftest_hashes[directory] = conftest_hash
+        return self._conftest_hashes[directory]
+
+    def get_module_hash(self, path):
+        """
+        Args:
+            path (str): Path to the test module
+
+        Returns:
+            str: Hash of the module and the conftest.py files it depends on
+
+        """
+        path = str(path)
+        return hashlib.sha256(
+            (
+                get_file_hash(path) + self._get_conftest_hash(os.path.dirname(path))
+            ).encode()
+        ).hexdigest()
+
+    def _is_selected(self, test):
+        if self.mark_expression and not self.mark_expression.evaluate(
+            MarkMatcher(set(test["markers"]))
+        ):
+            return False
+        if self.keyword_expression and not self.keyword_expression.evaluate(
+            KeywordMatcher(set(test["keywords"]))
+        ):
+            return False
+        return True
+
+    def should_skip(self, path):
+        """
+        Check if a test module doesn't have to be collected
+
+        Args:
+            path (py.path.local): Path to the test module
+
+        Returns:
+            bool: True if the module didn't change since it was cached and
+                none of its tests is selected by the -m and -k expressions
+
+        """
+        if not self.has_selection or not is_test_module(path.basename):
+            return False
+        module = self.modules.get(self._relpath(path))
+        if module is None or module["hash"] != self.get_module_hash(path):
+            return False
+        if any(self._is_selected(test) for test in module["tests"]):
+            return False
+        self.skipped.add(self._relpath(path))
+        return True
+
+    def add_report(self, report):
+        """
+        Register the collection of a test module, the report comes after the
+        tests of the module were collected
+
+        Args:
+            report (pytest.CollectReport): Collection report
+
+        """
+        if not is_test_module(report.nodeid):
+            return
+        path = report.nodeid
+        if report.passed:
+            self.collected.setdefault(path, [])
+        else:
+            self.failed.add(path)
+
+    def add_item(self, item):
+        """
+        Register a collected test
+
+        Args:
+            item (pytest.Item): Collected test
+
+        """
+        path = item.nodeid.split("::")[0]
+        if not is_test_module(path):
+            return
+        callspec = getattr(item, "callspec", None)
+        self.collected.setdefault(path, []).append(
+            {
+                "nodeid": item.nodeid,
+                "markers": sorted(MarkMatcher.from_item(item).own_mark_names),
+                "keywords": sorted(KeywordMatcher.from_item(item)._names),
+                "params": callspec.id if callspec else None,
+            }
+        )
+
+    def save(self):
+        """
+        Store the tests of the modules collected in this run, the entries of
+        the modules which no longer exist are removed
+        """
+        for path in self.failed:
+            self.modules.pop(path, None)
+        for path, tests in self.collected.items():
+            if path in self.failed:
+                continue
+            self.modules[path] = {
+                "hash": self.get_module_hash(os.path.join(self.rootdir, path)),
+                "tests": tests,
+            }
+        self.modules = {
+            path: module
+            for path, module in self.modules.items()
+            if os.path.isfile(os.path.join(self.rootdir, path))
+        }
+        self.cache.set(
+            CACHE_KEY, {"config_hash": self.config_hash, "modules": self.modules}
+        )
+        logger.info(
+            f"Collection cache: {len(self.collected)} modules collected, "
+            f"{len(self.skipped)} modules skipped"
+        )
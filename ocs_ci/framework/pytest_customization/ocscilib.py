@@ -11,13 +11,20 @@ import datetime
 import logging
 import os
 import shutil
+import time
 
-import pandas as pd
 import pytest
 from junitparser import JUnitXml
 import ocs_ci.utility.memory
 from ocs_ci.framework import config as ocsci_config
+from ocs_ci.framework.collection_cache import CollectionCache
 from ocs_ci.framework.logger_factory import set_log_record_factory
+from ocs_ci.framework.sharding import (
+    load_test_durations,
+    read_shard_file,
+    split_into_shards,
+    write_shard_files,
+)
 from ocs_ci.framework.exceptions import (
     ClusterNameLengthError,
     ClusterNameNotProvidedError,
@@ -49,6 +56,7 @@ from ocs_ci.utility.utils import (
     create_kubeconfig,
 )
 
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.memory import (
     get_consumed_ram,
     start_monitor_memory,
@@ -64,9 +72,13 @@ __all__ = [
 
 current_factory = logging.getLogRecordFactory()
 log = logging.getLogger(__name__)
+pd = LazyModule("pandas")
 
 # Global variable to store test start time
 test_start_time = None
+# Collection cache of the session and duration of the collection in seconds
+collection_cache = None
+collection_time = None
 
 
 def _pytest_addoption_cluster_specific(parser):
@@ -345,6 +357,55 @@ def pytest_addoption(parser):
         failed / or had error in the provided report.
         """,
     )
+    parser.addoption(
+        "--shard-count",
+        dest="shard_count",
+        type=int,
+        help="""
+        Split the collected tests into this number of shards with balanced
+        expected duration, to be executed on separate clusters.
+        """,
+    )
+    parser.addoption(
+        "--shard-index",
+        dest="shard_index",
+        type=int,
+        help="Index of the shard to execute, used with --shard-count.",
+    )
+    parser.addoption(
+        "--shard-durations",
+        dest="shard_durations",
+        action="append",
+        help="""
+        Path to the xunit file for xml junit report from a previous execution,
+        the durations of the tests from the report are used to balance the
+        shards. This argument is repeatable.
+        """,
+    )
+    parser.addoption(
+        "--shard-output-dir",
+        dest="shard_output_dir",
+        help="""
+        Directory where the shard-<index>.txt files with the tests of every
+        shard are written, used with --shard-count.
+        """,
+    )
+    parser.addoption(
+        "--shard-file",
+        dest="shard_file",
+        help="Path to the shard-<index>.txt file with the tests to execute.",
+    )
+    parser.addoption(
+        "--collection-cache",
+        dest="collection_cache",
+        action="store_true",
+        default=False,
+        help="""
+        Cache the collected tests of every test module, with -m or -k selection
+        the modules which didn't change and have no selected test are not
+        imported. The cache is removed by --cache-clear.
+        """,
+    )
     parser.addoption(
         "--default-cluster-context-index",
         dest="default_cluster_context_index",
@@ -404,6 +465,7 @@ def pytest_configure(config):
     set_log_level(config)
     # Set the new factory for the logging of pytest
     set_log_record_factory()
+    config.pluginmanager.register(ShardingPlugin(), "ocsci_sharding")
     # Somewhat hacky but this lets us differentiate between run-ci executions
     # and plain pytest unit test executions
     ocscilib_module = "ocs_ci.framework.pytest_customization.ocscilib"
@@ -813,6 +875,60 @@ def process_cluster_cli_params(config):
     ocsci_config.ENV_DATA["product_type"] = get_cli_param(config, "product_type")
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_collection(session):
+    """
+    Measure the duration of the collection and store the collection cache
+    """
+    global collection_cache, collection_time
+    if session.config.getoption("collection_cache") and hasattr(
+        session.config, "cache"
+    ):
+        collection_cache = CollectionCache(
+            session.config, [cluster.to_dict() for cluster in ocsci_config.clusters]
+        )
+    start_time = time.time()
+    yield
+    collection_time = time.time() - start_time
+    log.info(f"Collection of the tests took {collection_time:.2f} seconds")
+    if collection_cache:
+        collection_cache.save()
+
+
+def pytest_ignore_collect(path, config):
+    """
+    Skip the test modules without any selected test according to the
+    collection cache
+    """
+    if collection_cache and collection_cache.should_skip(path):
+        return True
+
+
+def pytest_collectreport(report):
+    if collection_cache:
+        collection_cache.add_report(report)
+
+
+def pytest_itemcollected(item):
+    if collection_cache:
+        collection_cache.add_item(item)
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Report the duration of the collection in the session summary
+    """
+    if collection_time is None:
+        return
+    message = f"collection took {collection_time:.2f} seconds"
+    if collection_cache:
+        message += (
+            f", {len(collection_cache.skipped)} unchanged test modules without "
+            "selected tests skipped by the collection cache"
+        )
+    terminalreporter.write_sep("-", message)
+
+
 def pytest_collection_modifyitems(session, config, items):
     """
     Add Polarion ID property to test cases that are marked with one.
@@ -824,9 +940,9 @@ def pytest_collection_modifyitems(session, config, items):
     re_trigger_failed_tests = ocsci_config.RUN.get("re_trigger_failed_tests")
     if re_trigger_failed_tests:
         junit_report = JUnitXml.fromfile(re_trigger_failed_tests)
-        cases_to_re_trigger = []
+        cases_to_re_trigger = set()
         for suite in junit_report:
-            cases_to_re_trigger += [_case.name for _case in suite if _case.result]
+            cases_to_re_trigger.update(_case.name for _case in suite if _case.result)
 
     # Check for test names that are too long
     long_test_names = []
@@ -863,14 +979,16 @@ def pytest_collection_modifyitems(session, config, items):
         # Exit with the complete error message
         pytest.exit(full_error_message, returncode=1)
 
-    for item in items[:]:
+    remaining_items = []
+    for item in items:
         if re_trigger_failed_tests and item.name not in cases_to_re_trigger:
             log.info(
                 f"Test case: {item.name} will be removed from execution, "
                 "because of you provided --re-trigger-failed-tests parameter "
                 "and this test passed in previous execution from the report!"
             )
-            items.remove(item)
+        else:
+            remaining_items.append(item)
         try:
             marker = item.get_closest_marker(name="polarion_id")
             if marker:
@@ -883,6 +1001,65 @@ def pytest_collection_modifyitems(session, config, items):
                 f"{item.name} in {item.fspath}",
                 exc_info=True,
             )
+    # removing the items one by one is quadratic for large collections
+    items[:] = remaining_items
+
+
+def apply_test_sharding(config, items):
+    """
+    Keep only the tests of one shard when a shard is selected by --shard-file
+    or --shard-count with --shard-index, the tests of the other shards are
+    deselected
+
+    Args:
+        config (pytest.config): Pytest config object
+        items (list): Collected tests, modified in place
+
+    """
+    shard_file = config.getoption("shard_file")
+    shard_count = config.getoption("shard_count")
+    if shard_file:
+        nodeids = read_shard_file(shard_file)
+        log.info(f"Running {len(nodeids)} tests from the shard file {shard_file}")
+    elif shard_count:
+        durations = load_test_durations(config.getoption("shard_durations") or [])
+        shards = split_into_shards(items, shard_count, durations)
+        for shard in shards:
+            log.info(
+                f"Shard {shard.index}: {len(shard.nodeids)} tests, expected "
+                f"duration {shard.duration / 60:.1f} minutes"
+            )
+        shard_output_dir = config.getoption("shard_output_dir")
+        if shard_output_dir:
+            shard_files = write_shard_files(shards, shard_output_dir)
+            log.info(f"Shard files written: {shard_files}")
+        shard_index = config.getoption("shard_index")
+        if shard_index is None:
+            return
+        if not 0 <= shard_index < shard_count:
+            raise pytest.UsageError(
+                f"--shard-index must be between 0 and {shard_count - 1}"
+            )
+        nodeids = set(shards[shard_index].nodeids)
+    else:
+        return
+    selected = [item for item in items if item.nodeid in nodeids]
+    deselected = [item for item in items if item.nodeid not in nodeids]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+class ShardingPlugin(object):
+    """
+    Applies the test sharding after all the other pytest_collection_modifyitems
+    hooks, so the shards are built only from the tests left after the -m and
+    -k deselection and the other filters
+    """
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        apply_test_sharding(config, items)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
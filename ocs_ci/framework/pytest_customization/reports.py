@@ -117,6 +117,15 @@ def pytest_sessionfinish(session, exitstatus):
             f"Failed to save Test Time report to logs directory with exception. {e}"
         )
 
+    try:
+        from ocs_ci.utility.resource_executor import shutdown_resource_executor
+
+        shutdown_resource_executor(
+            os.path.join(ocsci_log_path(), "resource_operations_metrics.json")
+        )
+    except Exception as e:
+        log.warning(f"Failed to report the resource operation metrics: {e}")
+
     for i in range(ocsci_config.nclusters):
         ocsci_config.switch_ctx(i)
         if not (
@@ -0,0 +1,220 @@
+"""
+Duration aware sharding of the collected tests across multiple clusters
+
+The tests are split into shards with similar expected run time based on the
+durations from the JUnit XML reports of previous executions, every shard is
+then executed by a separate run-ci on its own cluster.
+
+Tests which have to run on the same cluster stay in one group:
+
+* the tests with the order marker (the upgrade flow and the tests ordered
+  around it) are kept together in one group,
+* the tests of one class, or of one module when they are not in a class,
+  share class and module scoped fixtures and are kept together.
+
+The disruptive groups (e.g. tier4) are distributed first, so every cluster
+gets its share of the disruptive tests and the non-disruptive groups
+balance the rest of the run time.
+"""
+
+import heapq
+import json
+import logging
+import os
+from statistics import mean, median
+
+from junitparser import JUnitXml, TestSuite
+
+logger = logging.getLogger(__name__)
+
+DISRUPTIVE_MARKERS = ("tier4", "tier4a", "tier4b", "tier4c", "resiliency", "chaos")
+ORDERED_GROUP = "ordered"
+
+
+def get_junit_test_id(nodeid):
+    """
+    Get the test identification used in the JUnit XML reports of pytest
+
+    Args:
+        nodeid (str): Pytest node id, e.g. "tests/test_a.py::TestA::test_a[1]"
+
+    Returns:
+        tuple: classname and name of the test case, e.g.
+            ("tests.test_a.TestA", "test_a[1]")
+
+    """
+    parts = nodeid.split("::")
+    module_path = parts[0]
+    if module_path.endswith(".py"):
+        module_path = module_path[: -len(".py")]
+    classname = ".".join([module_path.replace("/", ".")] + parts[1:-1])
+    return classname, parts[-1]
+
+
+def load_test_durations(junit_paths):
+    """
+    Load the durations of the test cases from the JUnit XML reports, the
+    duration of a test reported by multiple files is averaged
+
+    Args:
+        junit_paths (list): Paths to the JUnit XML reports
+
+    Returns:
+        dict: Tuples of classname and name of the test cases mapped to the
+            durations in seconds
+
+    """
+    durations = {}
+    for junit_path in junit_paths:
+        report = JUnitXml.fromfile(os.path.expanduser(junit_path))
+        suites = [report] if isinstance(report, TestSuite) else report
+        for suite in suites:
+            for case in suite:
+                if case.time is None:
+                    continue
+                durations.setdefault((case.classname, case.name), []).append(case.time)
+    logger.info(f"Loaded durations of {len(durations)} tests from {junit_paths}")
+    return {test_id: mean(times) for test_id, times in durations.items()}
+
+
+def get_group_key(item):
+    """
+    Args:
+        item (pytest.Item): Collected test
+
+    Returns:
+        str: Key of the group of tests which have to run on the same cluster
+
+    """
+    if item.get_closest_marker("order"):
+        return ORDERED_GROUP
+    return item.nodeid.rsplit("::", 1)[0]
+
+
+def is_disruptive(item):
+    """
+    Args:
+        item (pytest.Item): Collected test
+
+    Returns:
+        bool: True if the test is marked with a disruptive marker
+
+    """
+    return any(item.get_closest_marker(marker) for marker in DISRUPTIVE_MARKERS)
+
+
+class Shard:
+    """
+    Tests assigned to one cluster
+    """
+
+    def __init__(self, index):
+        """
+        Args:
+            index (int): Index of the shard
+
+        """
+        self.index = index
+        self.nodeids = []
+        self.duration = 0.0
+
+    def to_dict(self):
+        return {
+            "index": self.index,
+            "tests": len(self.nodeids),
+            "expected_duration": round(self.duration, 1),
+        }
+
+
+def split_into_shards(items, shard_count, durations=None):
+    """
+    Split the tests into shards with balanced expected duration, the largest
+    groups are assigned first, always to the shard with the lowest duration
+
+    Args:
+        items (list): Collected tests
+        shard_count (int): Number of shards
+        durations (dict): Durations of the tests from load_test_durations,
+            the tests without a duration get the median of the known ones
+
+    Returns:
+        list: Shard objects, the tests keep the collection order
+
+    """
+    durations = durations or {}
+    item_durations = {
+        item.nodeid: durations.get(get_junit_test_id(item.nodeid)) for item in items
+    }
+    known = [duration for duration in item_durations.values() if duration is not None]
+    default_duration = median(known) if known else 1.0
+
+    groups = {}
+    for item in items:
+        group = groups.setdefault(
+            get_group_key(item), {"items": [], "duration": 0.0, "disruptive": False}
+        )
+        group["items"].append(item)
+        duration = item_durations[item.nodeid]
+        group["duration"] += default_duration if duration is None else duration
+        group["disruptive"] = group["disruptive"] or is_disruptive(item)
+
+    shards = [Shard(index) for index in range(shard_count)]
+    heap = [(0.0, index) for index in range(shard_count)]
+    assignments = {}
+    # deterministic for the same collection and durations on every cluster
+    for key, group in sorted(
+        groups.items(),
+        key=lambda entry: (not entry[1]["disruptive"], -entry[1]["duration"], entry[0]),
+    ):
+        load, index = heapq.heappop(heap)
+        assignments[key] = index
+        shards[index].duration += group["duration"]
+        heapq.heappush(heap, (load + group["duration"], index))
+
+    for item in items:
+        shards[assignments[get_group_key(item)]].nodeids.append(item.nodeid)
+    return shards
+
+
+def write_shard_files(shards, output_dir):
+    """
+    Write the node ids of the tests of every shard to shard-<index>.txt, the
+    file is passed to run-ci by --shard-file, and the summary of the shards
+    to shards.json
+
+    Args:
+        shards (list): Shard objects
+        output_dir (str): Directory for the files
+
+    Returns:
+        list: Paths to the shard files
+
+    """
+    output_dir = os.path.expanduser(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    shard_files = []
+    for shard in shards:
+        shard_file = os.path.join(output_dir, f"shard-{shard.index}.txt")
+        with open(shard_file, "w") as fd:
+            fd.writelines(f"{nodeid}\n" for nodeid in shard.nodeids)
+        shard_files.append(shard_file)
+    with open(os.path.join(output_dir, "shards.json"), "w") as fd:
+        json.dump(
+            [dict(shard.to_dict(), file=f) for shard, f in zip(shards, shard_files)],
+            fd,
+            indent=2,
+        )
+    return shard_files
+
+
+def read_shard_file(shard_file):
+    """
+    Args:
+        shard_file (str): Path to the file written by write_shard_files
+
+    Returns:
+        set: Node ids of the tests of the shard
+
+    """
+    with open(os.path.expanduser(shard_file)) as fd:
+        return {line.strip() for line in fd if line.strip()}
@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import py
+
+from ocs_ci.framework import collection_cache as collection_cache_module
+from ocs_ci.framework.collection_cache import CollectionCache
+
+
+class FakeCache(dict):
+    def set(self, key, value):
+        self[key] = value
+
+
+def get_pytest_config(rootdir, cache, markexpr="", keyword=""):
+    return SimpleNamespace(
+        cache=cache,
+        rootdir=rootdir,
+        option=SimpleNamespace(markexpr=markexpr, keyword=keyword),
+    )
+
+
+def test_should_skip_unchanged_module_without_selected_tests(tmp_path):
+    test_file = tmp_path / "tests" / "test_a.py"
+    test_file.parent.mkdir()
+    test_file.write_text("def test_a():\n    pass\n")
+    cache = FakeCache()
+    config_data = [{"ENV_DATA": {"platform": "aws"}, "RUN": {"run_id": 1}}]
+
+    collection_cache = CollectionCache(get_pytest_config(tmp_path, cache), config_data)
+    collection_cache.collected["tests/test_a.py"] = [
+        {
+            "nodeid": "tests/test_a.py::test_a",
+            "markers": ["tier1"],
+            "keywords": ["test_a", "tier1"],
+            "params": None,
+        }
+    ]
+    collection_cache.save()
+
+    # the RUN section doesn't invalidate the cache
+    config_data[0]["RUN"]["run_id"] = 2
+    for markexpr, keyword, skipped in [
+        ("tier2", "", True),
+        ("tier1", "", False),
+        ("", "test_b", True),
+        ("tier1", "not test_a", True),
+        ("", "", False),
+    ]:
+        collection_cache = CollectionCache(
+            get_pytest_config(tmp_path, cache, markexpr, keyword), config_data
+        )
+        assert collection_cache.should_skip(py.path.local(test_file)) is skipped
+
+    conftest = tmp_path / "tests" / "conftest.py"
+    conftest.write_text("import pytest\n")
+    collection_cache = CollectionCache(
+        get_pytest_config(tmp_path, cache, "tier2"), config_data
+    )
+    assert not collection_cache.should_skip(py.path.local(test_file))
+
+
+def test_marks_module_change_invalidates_cache(tmp_path, monkeypatch):
+    test_file = tmp_path / "tests" / "test_a.py"
+    test_file.parent.mkdir()
+    test_file.write_text("def test_a():\n    pass\n")
+    marks_module = tmp_path / "marks.py"
+    marks_module.write_text("tier1 = None\n")
+    monkeypatch.setattr(collection_cache_module, "MARKS_MODULE", str(marks_module))
+    cache = FakeCache()
+    config_data = [{"ENV_DATA": {"platform": "aws"}}]
+
+    collection_cache = CollectionCache(get_pytest_config(tmp_path, cache), config_data)
+    collection_cache.collected["tests/test_a.py"] = [
+        {
+            "nodeid": "tests/test_a.py::test_a",
+            "markers": ["tier1"],
+            "keywords": ["test_a", "tier1"],
+            "params": None,
+        }
+    ]
+    collection_cache.save()
+    collection_cache = CollectionCache(
+        get_pytest_config(tmp_path, cache, "tier2"), config_data
+    )
+    assert collection_cache.should_skip(py.path.local(test_file))
+
+    marks_module.write_text("tier1 = None\ntier2 = None\n")
+    collection_cache = CollectionCache(
+        get_pytest_config(tmp_path, cache, "tier2"), config_data
+    )
+    assert not collection_cache.should_skip(py.path.local(test_file))
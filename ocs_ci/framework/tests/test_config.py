@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
+from concurrent.futures import ThreadPoolExecutor
+
 from pytest import fixture
 
 from ocs_ci import framework
+from ocs_ci.framework import config_safe_thread_pool_task
 
 
 class TestConfig(object):
@@ -101,6 +104,48 @@ class TestConfig(object):
         framework.config.reset_ctx()
 
 
+class TestThreadContext(object):
+    @fixture(autouse=True)
+    def multicluster_config(self):
+        clusters = framework.config.clusters
+        nclusters = framework.config.nclusters
+        framework.config.clusters = []
+        framework.config.nclusters = 3
+        framework.config.init_cluster_configs()
+        framework.config.clusters[2].MULTICLUSTER["active_acm_cluster"] = True
+        yield
+        framework.config.clusters = clusters
+        framework.config.nclusters = nclusters
+        framework.config.reset_ctx()
+
+    def run_in_thread(self, config_index, task):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(
+                config_safe_thread_pool_task, config_index, task
+            ).result()
+
+    def test_switch_acm_ctx(self):
+        framework.config.switch_acm_ctx()
+        assert framework.config.cur_index == 2
+        assert framework.config.cur_thread_index == 2
+
+    def test_switch_acm_ctx_in_config_safe_thread(self):
+        def task():
+            framework.config.switch_acm_ctx()
+            return framework.config.cur_thread_index
+
+        assert self.run_in_thread(1, task) == 2
+
+    def test_run_with_config_context_in_config_safe_thread(self):
+        def task():
+            with framework.config.RunWithConfigContext(0):
+                inside = framework.config.cur_thread_index
+            return inside, framework.config.cur_thread_index
+
+        assert framework.config.cur_index == 0
+        assert self.run_in_thread(1, task) == (0, 1)
+
+
 class TestMergeDict:
     def test_merge_dict(self):
         objA = dict(
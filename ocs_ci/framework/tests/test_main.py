@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
 import os
 import subprocess
+import sys
+
+import pytest
 from pytest import fixture, raises
 from unittest import mock
 
@@ -10,6 +13,45 @@ pytest_plugins = [
     "pytester",
 ]
 
+# Budgets in seconds of the cumulative import time reported by -X importtime,
+# run-ci imports the entrypoint and pytest loads the ocscilib plugin
+IMPORT_TIME_BUDGETS = {
+    "ocs_ci.framework.main": 1.5,
+    "ocs_ci.framework.pytest_customization.ocscilib": 3,
+}
+
+
+def get_import_time(module):
+    """
+    Import a module in a new interpreter and get its cumulative import time
+
+    Args:
+        module (str): Name of the module
+
+    Returns:
+        float: Import time of the module in seconds
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.split("|")[2].strip() == module:
+            return int(line.split("|")[1]) / 10**6
+    raise ValueError(f"Import time of {module} not found")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("module", IMPORT_TIME_BUDGETS)
+def test_import_time_budget(module):
+    import_time = get_import_time(module)
+    assert (
+        import_time < IMPORT_TIME_BUDGETS[module]
+    ), f"Importing {module} took {import_time:.2f}s"
+
 
 class TestEntrypoint(object):
     @fixture(autouse=True)
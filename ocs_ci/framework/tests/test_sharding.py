@@ -0,0 +1,99 @@
+import textwrap
+
+from ocs_ci.framework import sharding
+
+pytest_plugins = [
+    "pytester",
+]
+
+
+class FakeItem:
+    def __init__(self, nodeid, markers=()):
+        self.nodeid = nodeid
+        self.markers = markers
+
+    def get_closest_marker(self, name):
+        return name if name in self.markers else None
+
+
+JUNIT_XML = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">
+<testcase classname="tests.test_a.TestA" name="test_a[1]" time="100"/>
+<testcase classname="tests.test_a.TestA" name="test_a[2]" time="100"/>
+<testcase classname="tests.test_b" name="test_b" time="150"/>
+<testcase classname="tests.test_c" name="test_c" time="40"/>
+<testcase classname="tests.test_upgrade" name="test_upgrade" time="10"/>
+</testsuite></testsuites>
+"""
+
+
+def test_split_into_shards(tmp_path):
+    junit_xml = tmp_path / "junit.xml"
+    junit_xml.write_text(JUNIT_XML)
+    items = [
+        FakeItem("tests/test_a.py::TestA::test_a[1]"),
+        FakeItem("tests/test_a.py::TestA::test_a[2]"),
+        FakeItem("tests/test_b.py::test_b", markers=("tier4",)),
+        FakeItem("tests/test_c.py::test_c"),
+        FakeItem("tests/test_d.py::test_d"),
+        FakeItem("tests/test_pre.py::test_pre", markers=("order",)),
+        FakeItem("tests/test_upgrade.py::test_upgrade", markers=("order",)),
+    ]
+    durations = sharding.load_test_durations([str(junit_xml)])
+    shards = sharding.split_into_shards(items, 2, durations)
+
+    # the class and the upgrade flow are not split, test_d gets the median
+    assert shards[0].nodeids == [
+        "tests/test_b.py::test_b",
+        "tests/test_c.py::test_c",
+        "tests/test_pre.py::test_pre",
+        "tests/test_upgrade.py::test_upgrade",
+    ]
+    assert shards[1].nodeids == [
+        "tests/test_a.py::TestA::test_a[1]",
+        "tests/test_a.py::TestA::test_a[2]",
+        "tests/test_d.py::test_d",
+    ]
+    assert [shard.duration for shard in shards] == [300, 300]
+
+    shard_files = sharding.write_shard_files(shards, str(tmp_path / "shards"))
+    assert sharding.read_shard_file(shard_files[1]) == set(shards[1].nodeids)
+
+
+def test_shards_are_built_after_deselection(testdir):
+    testdir.makeconftest(
+        textwrap.dedent(
+            """
+        pytest_plugins = ['ocs_ci.framework.pytest_customization.ocscilib']
+    """
+        )
+    )
+    testdir.makepyfile(
+        test_module=textwrap.dedent(
+            """\
+        def test_a():
+            pass
+
+        def test_b():
+            pass
+
+        def test_c():
+            pass
+        """
+        )
+    )
+    shard_dir = testdir.tmpdir.join("shards")
+    result = testdir.runpytest_subprocess(
+        "--collect-only",
+        "-k",
+        "not test_b",
+        "--shard-count",
+        "2",
+        "--shard-output-dir",
+        str(shard_dir),
+    )
+    result.stdout.fnmatch_lines(["*1 deselected*"])
+    nodeids = set()
+    for shard_file in shard_dir.listdir("shard-*.txt"):
+        nodeids |= sharding.read_shard_file(str(shard_file))
+    assert nodeids == {"test_module.py::test_a", "test_module.py::test_c"}
@@ -12,6 +12,7 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.cluster import is_hci_cluster
 from ocs_ci.ocs.defaults import RBD_NAME
+from ocs_ci.ocs.dr.dr_state import get_active_dr_state_aggregator
 from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     UnexpectedBehaviour,
@@ -27,7 +28,7 @@ from ocs_ci.ocs.resources.pod import (
     get_pods_having_label,
     wait_for_matching_pattern_in_pod_logs,
 )
-from ocs_ci.ocs.resources.pvc import get_all_pvc_objs
+from ocs_ci.ocs.resources.pvc import get_all_pvc_objs, get_pvc_backend_volumes
 from ocs_ci.ocs.node import (
     gracefully_reboot_nodes,
     get_node_objs,
@@ -83,7 +84,7 @@ def get_current_primary_cluster_name(
         str: Current primary cluster name
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     if workload_type == constants.APPLICATION_SET:
         namespace = constants.GITOPS_CLUSTER_NAMESPACE
     if discovered_apps:
@@ -121,7 +122,7 @@ def get_current_secondary_cluster_name(
         str: Current secondary cluster name
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     if workload_type == constants.APPLICATION_SET:
         namespace = constants.GITOPS_CLUSTER_NAMESPACE
     if discovered_apps:
@@ -195,7 +196,7 @@ def get_scheduling_interval(
         int: scheduling interval value from DRPolicy
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     if workload_type == constants.APPLICATION_SET:
         namespace = constants.GITOPS_CLUSTER_NAMESPACE
     if discovered_apps:
@@ -220,6 +221,7 @@ def failover(
     switch_ctx=None,
     discovered_apps=False,
     old_primary=None,
+    timeline=None,
 ):
     """
     Initiates Failover action to the specified cluster
@@ -232,9 +234,11 @@ def failover(
         switch_ctx (int): The cluster index by the cluster name
         discovered_apps (bool): True when cluster is failing over DiscoveredApps
         old_primary (str): Name of cluster where workload were running
+        timeline (DRActionTimeline): Timeline recording the action, the moment
+            the action is initiated is marked on it
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     failover_params = f'{{"spec":{{"action":"{constants.ACTION_FAILOVER}","failoverCluster":"{failover_cluster}"}}}}'
     if workload_type == constants.APPLICATION_SET:
@@ -259,6 +263,8 @@ def failover(
     assert drpc_obj.patch(
         params=failover_params, format_type="merge"
     ), f"Failed to patch {constants.DRPC}: {drpc_obj.resource_name}"
+    if timeline:
+        timeline.mark("action_initiated")
 
     logger.info(
         f"Wait for {constants.DRPC}: {drpc_obj.resource_name} to reach {constants.STATUS_FAILEDOVER} phase"
@@ -283,6 +289,7 @@ def relocate(
     multi_ns=False,
     workload_instances_shared=None,
     vm_auto_cleanup=False,
+    timeline=None,
 ):
     """
     Initiates Relocate action to the specified cluster
@@ -299,9 +306,11 @@ def relocate(
         multi_ns (bool): Multi Namespace
         workload_instances_shared (list): List of workloads tied to a single DRPC using Shared Protection type
         vm_auto_cleanup (bool): If true, cleanup will not be initiated after relocate action, False otherwise.
+        timeline (DRActionTimeline): Timeline recording the action, the moment
+            the action is initiated is marked on it
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     relocate_params = f'{{"spec":{{"action":"{constants.ACTION_RELOCATE}","preferredCluster":"{preferred_cluster}"}}}}'
     if workload_type == constants.APPLICATION_SET:
@@ -326,6 +335,8 @@ def relocate(
     assert drpc_obj.patch(
         params=relocate_params, format_type="merge"
     ), f"Failed to patch {constants.DRPC}: {drpc_obj.resource_name}"
+    if timeline:
+        timeline.mark("action_initiated")
 
     logger.info(
         f"Wait for {constants.DRPC}: {drpc_obj.resource_name} to reach {constants.STATUS_RELOCATED} phase"
@@ -392,6 +403,28 @@ def check_mirroring_status_ok(
     Returns:
         bool: True if status contains expected health and states values, False otherwise
 
+    Raises:
+        NotFoundError: If the configuration is provider mode and the name of the cephblockpoolradosnamespace
+            is not obtained
+    """
+    mirroring_status = get_mirroring_status_summary(
+        cephblockpoolradosns=cephblockpoolradosns, storageclient_uid=storageclient_uid
+    )
+    return evaluate_mirroring_status(mirroring_status, replaying_images)
+
+
+def get_mirroring_status_summary(cephblockpoolradosns=None, storageclient_uid=None):
+    """
+    Get the mirroring status summary of the block pool used by DR on the current cluster
+
+    Args:
+        cephblockpoolradosns (string): The name of the cephblockpoolradosnamespace
+        storageclient_uid(string): The uid of the storageclient in the client cluster where the application is running.
+            Applicable for provider - client configuration.
+
+    Returns:
+        dict: The mirroringStatus summary of the pool
+
     Raises:
         NotFoundError: If the configuration is provider mode and the name of the cephblockpoolradosnamespace
             is not obtained
@@ -430,7 +463,25 @@ def check_mirroring_status_ok(
                 namespace=config.ENV_DATA["cluster_namespace"],
             )
 
-    mirroring_status = cbp_obj.get().get("status").get("mirroringStatus").get("summary")
+    return cbp_obj.get().get("status").get("mirroringStatus").get("summary")
+
+
+def evaluate_mirroring_status(mirroring_status, replaying_images=None):
+    """
+    Check if a mirroring status summary has health OK and expected number of replaying images
+
+    Args:
+        mirroring_status (dict): The mirroringStatus summary of the pool
+        replaying_images (int): Expected number of images in replaying state
+
+    Returns:
+        bool: True if status contains expected health and states values, False otherwise
+
+    Raises:
+        UnexpectedBehaviour: If there are more replaying images than expected
+
+    """
+    ocs_version = version.get_semantic_ocs_version_from_config()
     logger.info(f"Mirroring status: {mirroring_status}")
 
     health_keys = ["daemon_health", "health", "image_health"]
@@ -492,9 +543,30 @@ def wait_for_mirroring_status_ok(replaying_images=None, timeout=900):
 
     Raises:
         TimeoutExpiredError: In case of unexpected mirroring status
+        UnexpectedBehaviour: If there are more replaying images than expected
 
     """
-    restore_index = config.cur_index
+    aggregator = get_active_dr_state_aggregator()
+    if aggregator and aggregator.include_mirroring:
+        # The mirroring status of all the clusters is checked at the same time
+        if not aggregator.wait_for(
+            lambda snapshot: all(
+                evaluate_mirroring_status(snapshot.mirroring[name], replaying_images)
+                for name in aggregator.managed_clusters
+            ),
+            timeout=timeout,
+            description="mirroring status OK on all the clusters",
+            raise_on=(UnexpectedBehaviour,),
+        ):
+            error_msg = (
+                "The mirroring status does not have expected values within the time"
+                " limit on all the clusters"
+            )
+            logger.error(error_msg)
+            raise TimeoutExpiredError(error_msg)
+        return True
+
+    restore_index = config.cur_thread_index
     for cluster in get_non_acm_cluster_config():
         config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
         logger.info(
@@ -543,7 +615,7 @@ def check_mirroring_status_for_custom_pool(
     Raises:
         ValueError: If custom Pool is missing, insufficient Pool count, or summary is not found.
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     managed_clusters = get_non_acm_cluster_config()
     for cluster in managed_clusters:
         index = cluster.MULTICLUSTER["multicluster_index"]
@@ -615,6 +687,22 @@ def is_cg_enabled():
         return False
 
 
+def _get_dr_state_aggregator(kind):
+    """
+    Args:
+        kind (str): Kind of the resources to wait for
+
+    Returns:
+        DRStateAggregator: The active aggregator if it samples the kind on the
+            current cluster, None otherwise
+
+    """
+    aggregator = get_active_dr_state_aggregator()
+    if aggregator and aggregator.covers(config.ENV_DATA["cluster_name"], kind):
+        return aggregator
+    return None
+
+
 def get_resource_count(kind, namespace=None):
     """
     Gets resource count in given namespace for specified resource kind
@@ -692,6 +780,22 @@ def check_replication_resource_state(kind, state, namespace, resource_name=""):
     else:
         resource_list = resource_obj.get().get("items")
 
+    return replication_resources_in_state(kind, state, resource_list)
+
+
+def replication_resources_in_state(kind, state, resource_list):
+    """
+    Check if replication resources are in expected state
+
+    Args:
+        kind (str): Kind of resource (e.g., constants.VOLUME_REPLICATION, constants.VOLUME_REPLICATION_GROUP, etc.)
+        state (str): The resource state to check for (e.g. 'primary', 'secondary')
+        resource_list (list): The resources of the kind
+
+    Returns:
+        bool: True if resources are in expected state or were deleted, False otherwise
+
+    """
     # Handle deletion case
     if len(resource_list) == 0 and state.lower() == "secondary":
         if kind == constants.VOLUME_REPLICATION_GROUP:
@@ -778,6 +882,23 @@ def wait_for_resource_existence(
         expected_result = False
         error_msg = f"{kind} {resource_name} not deleted within the time limit."
 
+    aggregator = _get_dr_state_aggregator(kind)
+    if aggregator:
+        cluster_name = config.ENV_DATA["cluster_name"]
+
+        def _existence_reached(snapshot):
+            resources = snapshot.get_resources(
+                cluster_name, kind, namespace, resource_name
+            )
+            return resources is not None and bool(resources) == expected_result
+
+        if not aggregator.wait_for(
+            _existence_reached, timeout, f"{kind} {resource_name} existence"
+        ):
+            logger.error(error_msg)
+            raise TimeoutExpiredError(error_msg)
+        return
+
     sample = TimeoutSampler(
         timeout=timeout,
         sleep=5,
@@ -810,6 +931,20 @@ def wait_for_resource_count(kind, namespace, expected_count=1, timeout=900):
     else:
         logger.info(f"Waiting for {expected_count} {kind} to be created")
 
+    aggregator = _get_dr_state_aggregator(kind)
+    if aggregator:
+        cluster_name = config.ENV_DATA["cluster_name"]
+        if not aggregator.wait_for(
+            lambda snapshot: len(snapshot.get_resources(cluster_name, kind, namespace))
+            == expected_count,
+            timeout,
+            f"{expected_count} {kind} in namespace {namespace}",
+        ):
+            raise TimeoutExpiredError(
+                f"Count of {kind} did not reach {expected_count} within the time limit."
+            )
+        return
+
     sample = TimeoutSampler(
         timeout=timeout,
         sleep=5,
@@ -836,6 +971,23 @@ def wait_for_resource_state(kind, state, namespace, resource_name="", timeout=90
 
     """
     logger.info(f"Waiting for {kind} {resource_name} to reach {state} state")
+    aggregator = _get_dr_state_aggregator(kind)
+    if aggregator:
+        cluster_name = config.ENV_DATA["cluster_name"]
+        if not aggregator.wait_for(
+            lambda snapshot: replication_resources_in_state(
+                kind,
+                state,
+                snapshot.get_resources(cluster_name, kind, namespace, resource_name),
+            ),
+            timeout,
+            f"{kind} {resource_name} in {state} state",
+        ):
+            error_msg = f"{kind} {resource_name} did not reach expected {state} state within the time limit."
+            logger.error(error_msg)
+            raise TimeoutExpiredError(error_msg)
+        return
+
     sample = TimeoutSampler(
         timeout=timeout,
         sleep=5,
@@ -1240,6 +1392,8 @@ def get_backend_volumes_for_pvcs(namespace):
     """
     Gets list of RBD images or CephFS subvolumes associated with the PVCs in the given namespace
 
+    The PVCs and PVs are listed once per managed cluster and joined in memory.
+
     Args:
         namespace (str): The namespace of the PVC resources
 
@@ -1247,31 +1401,19 @@ def get_backend_volumes_for_pvcs(namespace):
         list: List of RBD images or CephFS subvolumes
 
     """
-    backend_volumes = []
+    backend_volumes = set()
     for cluster in get_non_acm_cluster_config():
         config.switch_ctx(cluster.MULTICLUSTER["multicluster_index"])
         logger.info(f"Fetching backend volume names for PVCs in namespace: {namespace}")
-        all_pvcs = get_all_pvc_objs(namespace=namespace)
-        for pvc_obj in all_pvcs:
+        for pvc_name, volume in get_pvc_backend_volumes(namespace=namespace).items():
             # Skip volsync related PVCs
-            if pvc_obj.name.startswith("volsync") or pvc_obj.name.startswith("vs-"):
+            if pvc_name.startswith("volsync") or pvc_name.startswith("vs-"):
                 continue
+            backend_volume = volume["rbd_image"] or volume["cephfs_subvolume"]
+            if backend_volume:
+                backend_volumes.add(backend_volume)
 
-            if pvc_obj.backed_sc in [
-                constants.DEFAULT_STORAGECLASS_RBD,
-                constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_RBD,
-                constants.DEFAULT_CNV_CEPH_RBD_SC,
-            ]:
-                backend_volume = pvc_obj.get_rbd_image_name
-            elif pvc_obj.backed_sc in [
-                constants.DEFAULT_STORAGECLASS_CEPHFS,
-                constants.DEFAULT_EXTERNAL_MODE_STORAGECLASS_CEPHFS,
-            ]:
-                backend_volume = pvc_obj.get_cephfs_subvolume_name
-
-            backend_volumes.append(backend_volume)
-
-    backend_volumes = list(set(backend_volumes))
+    backend_volumes = list(backend_volumes)
     logger.info(f"Found {len(backend_volumes)} backend volumes: {backend_volumes}")
     return backend_volumes
 
@@ -1349,12 +1491,13 @@ def verify_backend_volume_deletion(
     )
     cephfs_subvolumes = [subvolume["name"] for subvolume in cephfs_cmd_output]
 
-    ceph_volumes = rbd_images + cephfs_subvolumes
+    ceph_volumes = set(rbd_images + cephfs_subvolumes)
     logger.info(f"All backend volumes present in the cluster: {ceph_volumes}")
-    not_deleted_volumes = []
-    for backend_volume in backend_volumes:
-        if backend_volume in ceph_volumes:
-            not_deleted_volumes.append(backend_volume)
+    not_deleted_volumes = [
+        backend_volume
+        for backend_volume in backend_volumes
+        if backend_volume in ceph_volumes
+    ]
     if not_deleted_volumes:
         logger.info(
             f"The following backend volumes were not deleted: {not_deleted_volumes}"
@@ -1547,7 +1690,7 @@ def verify_last_group_sync_time(
             (greater than or equal to three times the scheduling interval)
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_acm_ctx()
     if initial_last_group_sync_time:
         for last_group_sync_time in TimeoutSampler(
@@ -1593,7 +1736,7 @@ def get_all_drclusters():
     Returns:
         list: List of all DRClusters
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_acm_ctx()
     drclusters_obj = ocp.OCP(kind=constants.DRCLUSTER)
     drclusters = []
@@ -1653,7 +1796,7 @@ def enable_fence(drcluster_name, switch_ctx=None):
     logger.info(
         f"Edit the DRCluster resource for {drcluster_name} cluster on the Hub cluster"
     )
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     fence_params = f'{{"spec":{{"clusterFence":"{constants.ACTION_FENCE}"}}}}'
     drcluster_obj = ocp.OCP(resource_name=drcluster_name, kind=constants.DRCLUSTER)
@@ -1668,7 +1811,7 @@ def configure_drcluster_for_fencing():
     Configures DRClusters for enabling fencing
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     cluster_ip_list = get_managed_cluster_node_ips()
     config.switch_acm_ctx()
     for cluster in cluster_ip_list:
@@ -1707,7 +1850,7 @@ def enable_unfence(drcluster_name, switch_ctx=None):
     logger.info(
         f"Edit the DRCluster resource for {drcluster_name} cluster on the Hub cluster"
     )
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     unfence_params = f'{{"spec":{{"clusterFence":"{constants.ACTION_UNFENCE}"}}}}'
     drcluster_obj = ocp.OCP(resource_name=drcluster_name, kind=constants.DRCLUSTER)
@@ -1731,7 +1874,7 @@ def fence_state(drcluster_name, fence_state, switch_ctx=None):
     logger.info(
         f"Edit the DRCluster {drcluster_name} cluster clusterfence state {fence_state}  "
     )
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     params = f'{{"spec":{{"clusterFence":"{fence_state}"}}}}'
     drcluster_obj = ocp.OCP(resource_name=drcluster_name, kind=constants.DRCLUSTER)
@@ -1755,7 +1898,7 @@ def get_fence_state(drcluster_name, switch_ctx=None):
         state (str): If drcluster are fenced: Fenced or Unfenced, else None if not defined
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     drcluster_obj = ocp.OCP(resource_name=drcluster_name, kind=constants.DRCLUSTER)
     state = drcluster_obj.get().get("status").get("phase")
@@ -1795,7 +1938,7 @@ def create_backup_schedule():
     Create backupschedule resource only on active hub
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     config.switch_ctx(get_active_acm_index())
     backup_schedule = templating.load_yaml(constants.BACKUP_SCHEDULE_YAML)
     backup_schedule_yaml = tempfile.NamedTemporaryFile(
@@ -1826,7 +1969,7 @@ def restore_backup():
 
     """
 
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(get_passive_acm_index())
     restore_schedule = templating.load_yaml(constants.DR_RESTORE_YAML)
     restore_schedule["metadata"]["name"] = create_unique_resource_name(
@@ -1846,7 +1989,7 @@ def verify_restore_is_completed():
     Function to verify restore is completed or finished
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(get_passive_acm_index())
     restore_obj = ocp.OCP(
         kind=constants.ACM_HUB_RESTORE, namespace=constants.ACM_HUB_BACKUP_NAMESPACE
@@ -1872,7 +2015,7 @@ def verify_drpolicy_cli(switch_ctx=None):
 
     """
 
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     drpolicy_obj = ocp.OCP(kind=constants.DRPOLICY)
     status = drpolicy_obj.get().get("items")[0].get("status").get("conditions")[0]
@@ -1894,7 +2037,7 @@ def verify_backup_is_taken():
     Function to verify backup is taken
 
     """
-    backup_index = config.cur_index
+    backup_index = config.cur_thread_index
     config.switch_ctx(get_active_acm_index())
     backup_obj = ocp.OCP(
         kind=constants.ACM_BACKUP_SCHEDULE, namespace=constants.ACM_HUB_BACKUP_NAMESPACE
@@ -1928,16 +2071,16 @@ def get_nodes_from_active_zone(namespace):
 
     # Get nodes from zone where active hub running
     config.switch_ctx(get_active_acm_index())
-    active_hub_index = config.cur_index
+    active_hub_index = config.cur_thread_index
     zone = config.ENV_DATA.get("zone")
     active_hub_cluster_node_objs = get_node_objs()
     set_current_primary_cluster_context(namespace)
     if config.ENV_DATA.get("zone") == zone:
-        managed_cluster_index = config.cur_index
+        managed_cluster_index = config.cur_thread_index
         managed_cluster_node_objs = get_node_objs()
     else:
         set_current_secondary_cluster_context(namespace)
-        managed_cluster_index = config.cur_index
+        managed_cluster_index = config.cur_thread_index
         managed_cluster_node_objs = get_node_objs()
     external_cluster_node_roles = config.EXTERNAL_MODE.get(
         "external_cluster_node_roles"
@@ -1970,7 +2113,7 @@ def create_klusterlet_config():
     of resources by adding "AppliedManifestWork" eviction grace period
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     config.switch_ctx(get_passive_acm_index())
     klusterlet_config = templating.load_yaml(constants.KLUSTERLET_CONFIG_YAML)
     klusterlet_config_yaml = tempfile.NamedTemporaryFile(
@@ -1988,7 +2131,7 @@ def remove_parameter_klusterlet_config():
     remove the parameter appliedManifestWorkEvictionGracePeriod and its value
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     config.switch_ctx(get_passive_acm_index())
     klusterlet_config_obj = ocp.OCP(kind=constants.KLUSTERLET_CONFIG)
     name = klusterlet_config_obj.get().get("items")[0].get("metadata").get("name")
@@ -2013,7 +2156,7 @@ def add_label_to_appsub(workloads, label="test", value="test1"):
         value (str): Value to be added
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     config.switch_ctx(get_passive_acm_index())
     for wl in workloads:
         if wl.workload_type == constants.SUBSCRIPTION:
@@ -2035,7 +2178,7 @@ def disable_dr_from_app(secondary_cluster_name):
         secondary_cluster_name(str): cluster where application is running
 
     """
-    old_ctx = config.cur_index
+    old_ctx = config.cur_thread_index
     config.switch_acm_ctx()
 
     # get all placement and replace value with surviving cluster
@@ -2217,7 +2360,7 @@ def do_discovered_apps_cleanup(
                                         DR protected via ACM UI is deleted, refer DFBUGS-3706
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_acm_ctx()
     drpc_obj = DRPC(namespace=constants.DR_OPS_NAMESPACE, resource_name=drpc_name)
     drpc_obj.wait_for_progression_status(status=constants.STATUS_WAITFORUSERTOCLEANUP)
@@ -2261,7 +2404,7 @@ def do_discovered_apps_cleanup_multi_ns(
         workload_instance (list): Workload instance
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_acm_ctx()
 
     drpc_obj = DRPC(
@@ -2399,7 +2542,7 @@ def verify_last_kubeobject_protection_time(drpc_obj, kubeobject_sync_interval):
             (greater than or equal to two times the scheduling interval)
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_acm_ctx()
     last_kubeobject_protection_time = drpc_obj.get_last_kubeobject_protection_time()
     if not last_kubeobject_protection_time:
@@ -2484,7 +2627,7 @@ def get_cluster_set_name(switch_ctx=None):
         list: List of uniq cluster set name
     """
     cluster_set = []
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     config.switch_ctx(switch_ctx) if switch_ctx else config.switch_acm_ctx()
     managed_clusters = ocp.OCP(kind=constants.ACM_MANAGEDCLUSTER).get().get("items", [])
     current_managed_clusters_list = [
@@ -2536,7 +2679,7 @@ def validate_storage_cluster_peer_state():
         TimeoutExpiredError: incase storage cluster peer state is not reached 'Peered' state.
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     managed_clusters = get_non_acm_cluster_config()
     for cluster in managed_clusters:
         if cluster.ENV_DATA.get("cluster_type").lower() == constants.HCI_CLIENT:
@@ -2594,7 +2737,7 @@ def create_service_exporter(annotate=True):
         annotate (bool): If True - annotate the service exporter
 
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     managed_clusters = get_non_acm_cluster_config()
     for cluster in managed_clusters:
         index = cluster.MULTICLUSTER["multicluster_index"]
@@ -2639,7 +2782,7 @@ def verify_volsync():
     """
     Verify volsync pod is created in volsync-system namespace
     """
-    restore_index = config.cur_index
+    restore_index = config.cur_thread_index
     managed_clusters = get_non_acm_cluster_config()
     for cluster in managed_clusters:
         index = cluster.MULTICLUSTER["multicluster_index"]
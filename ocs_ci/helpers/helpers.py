@@ -12,7 +12,6 @@ import os
 import re
 import statistics
 import tempfile
-import threading
 import time
 import inspect
 import stat
@@ -20,7 +19,7 @@ import platform
 import ipaddress
 
 from urllib.parse import urlparse, urlunparse
-from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from itertools import cycle
 from subprocess import PIPE, run
 from uuid import uuid4
@@ -56,6 +55,7 @@ from ocs_ci.ocs.resources.ocs import OCS
 from ocs_ci.utility import templating, version
 from ocs_ci.utility.vsphere import VSPHERE
 from ocs_ci.utility.operators import NMStateOperator
+from ocs_ci.utility.resource_executor import get_resource_executor
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     ceph_health_check,
@@ -1015,6 +1015,7 @@ def create_multiple_pvcs(
     do_reload=False,
     access_mode=constants.ACCESS_MODE_RWO,
     burst=False,
+    wait_for_status=constants.STATUS_BOUND,
 ):
     """
     Create one or more PVC as a bulk or one by one
@@ -1028,6 +1029,8 @@ def create_multiple_pvcs(
             False otherwise
         access_mode (str): The kind of access mode for PVC
         burst (bool): True for bulk creation, False ( default) for multiple creation
+        wait_for_status (str): The status the PVCs created in bulk are waited
+            for, None to not wait
 
     Returns:
          ocs_objs (list): List of PVC objects
@@ -1062,34 +1065,101 @@ def create_multiple_pvcs(
     else:
         pvc_data["spec"]["volumeMode"] = None
 
-    # Creating tem directory to hold the files for the PVC creation
-    tmpdir = tempfile.mkdtemp()
-    logger.info("Creating the PVC yaml files for creation in bulk")
-    ocs_objs = []
+    pvc_dicts = []
     for _ in range(number_of_pvc):
-        name = create_unique_resource_name("test", "pvc")
-        logger.info(f"Adding PVC with name {name}")
-        pvc_data["metadata"]["name"] = name
-        templating.dump_data_to_temp_yaml(pvc_data, f"{tmpdir}/{name}.yaml")
-        ocs_objs.append(pvc.PVC(**pvc_data))
+        pvc_dict = deepcopy(pvc_data)
+        pvc_dict["metadata"]["name"] = create_unique_resource_name("test", "pvc")
+        pvc_dicts.append(pvc_dict)
 
-    logger.info("Creating all PVCs as bulk")
-    oc = OCP(kind="pod", namespace=namespace)
-    cmd = f"create -f {tmpdir}/"
-    oc.exec_oc_cmd(command=cmd, out_yaml_format=False)
-
-    # Letting the system 1 sec for each PVC to create.
-    # this will prevent any other command from running in the system in this
-    # period of time.
-    logger.info(
-        f"Going to sleep for {number_of_pvc} sec. "
-        "until starting verify that PVCs was created."
+    # The manifest is kept in a temp directory for the deletion in bulk
+    tmpdir = tempfile.mkdtemp()
+    created = create_resources_in_bulk(
+        pvc_dicts, namespace, manifest_file=os.path.join(tmpdir, "pvcs.json")
     )
-    time.sleep(number_of_pvc)
+    ocs_objs = [pvc.PVC(**pvc_dict) for pvc_dict in created]
+
+    if wait_for_status:
+        wait_for_resources_phase(
+            constants.PVC,
+            [ocs_obj.name for ocs_obj in ocs_objs],
+            wait_for_status,
+            namespace,
+            timeout=max(600, number_of_pvc),
+        )
 
     return ocs_objs, tmpdir
 
 
+def create_resources_in_bulk(resources, namespace=None, manifest_file=None):
+    """
+    Create resources in bulk by one `oc create` which reads all of them as
+    a single manifest streamed over stdin
+
+    Args:
+        resources (list): Dicts of the resources to create
+        namespace (str): The namespace of the resources
+        manifest_file (str): Path of a file to keep the manifest in, e.g. for
+            the deletion of the resources with `oc delete -f`
+
+    Returns:
+        list: Dicts of the created resources as returned by the API server,
+            with their uid and resourceVersion
+
+    """
+    manifest = json.dumps({"apiVersion": "v1", "kind": "List", "items": resources})
+    if manifest_file:
+        with open(manifest_file, "w") as f:
+            f.write(manifest)
+    logger.info(f"Creating {len(resources)} resources in bulk")
+    out = OCP(namespace=namespace).exec_oc_cmd(
+        "create -f - -o json",
+        out_yaml_format=False,
+        timeout=max(600, len(resources)),
+        input=manifest.encode(),
+    )
+    created = json.loads(out)
+    if created.get("kind") == "List":
+        return created["items"]
+    return [created]
+
+
+def wait_for_resources_phase(kind, resource_names, phase, namespace, timeout=600):
+    """
+    Wait for resources to reach a phase, the resources are read by a single
+    `oc get` of the kind per iteration regardless of their number
+
+    Args:
+        kind (str): The kind of the resources, e.g. PersistentVolumeClaim
+        resource_names (list): Names of the resources
+        phase (str): The phase to wait for, e.g. Bound
+        namespace (str): The namespace of the resources
+        timeout (int): Time in seconds to wait
+
+    Raises:
+        ResourceWrongStatusException: In case any of the resources hasn't
+            reached the phase
+
+    """
+    pending = set(resource_names)
+    logger.info(f"Waiting for {len(pending)} {kind} resources to reach {phase}")
+    ocp_obj = OCP(kind=kind, namespace=namespace)
+    try:
+        for items in TimeoutSampler(timeout, 5, lambda: ocp_obj.get()["items"]):
+            pending -= {
+                item["metadata"]["name"]
+                for item in items
+                if item.get("status", {}).get("phase") == phase
+            }
+            if not pending:
+                break
+            logger.info(f"{len(pending)} {kind} resources didn't reach {phase} yet")
+    except TimeoutExpiredError:
+        raise ResourceWrongStatusException(
+            ", ".join(sorted(pending)), expected=phase, column="phase"
+        )
+    logger.info(f"All {len(resource_names)} {kind} resources reached {phase}")
+
+
 def delete_bulk_pvcs(pvc_yaml_dir, pv_names_list, namespace):
     """
     Deletes all the pvcs created from yaml file in a provided dir
@@ -2547,39 +2617,49 @@ def create_multiple_pvc_parallel(sc_obj, namespace, number_of_pvc, size, access_
     Returns:
         pvc_objs_list (list): List of pvc objs created in function
     """
-    obj_status_list, result_lists = ([] for i in range(2))
-    with ThreadPoolExecutor() as executor:
-        for mode in access_modes:
-            result_lists.append(
-                executor.submit(
-                    create_multiple_pvcs,
-                    sc_name=sc_obj.name,
-                    namespace=namespace,
-                    number_of_pvc=number_of_pvc,
-                    access_mode=mode,
-                    size=size,
-                )
-            )
-    result_list = [result.result() for result in result_lists]
+    executor = get_resource_executor()
+    result_list = executor.map(
+        lambda mode: create_multiple_pvcs(
+            sc_name=sc_obj.name,
+            namespace=namespace,
+            number_of_pvc=number_of_pvc,
+            access_mode=mode,
+            size=size,
+        ),
+        access_modes,
+        operation="create_pvcs",
+    )
     pvc_objs_list = converge_lists(result_list)
     # Check for all the pvcs in Bound state
-    with ThreadPoolExecutor() as executor:
-        for objs in pvc_objs_list:
-            if objs is not None:
-                if type(objs) is list:
-                    for obj in objs:
-                        obj_status_list.append(
-                            executor.submit(wait_for_resource_state, obj, "Bound", 90)
-                        )
-                else:
-                    obj_status_list.append(
-                        executor.submit(wait_for_resource_state, objs, "Bound", 90)
-                    )
-    if False in [obj.result() for obj in obj_status_list]:
-        raise TimeoutExpiredError("Not all PVC are in bound state")
+    pvc_objs = _flatten_objs(pvc_objs_list)
+    executor.map(
+        lambda obj: wait_for_resource_state(obj, "Bound", 90),
+        pvc_objs,
+        operation="wait_for_pvc_bound",
+    )
     return pvc_objs_list
 
 
+def _flatten_objs(obj_list):
+    """
+    Args:
+        obj_list (list): Objects or lists of objects, None items are skipped
+
+    Returns:
+        list: The objects
+
+    """
+    objs = []
+    for obj in obj_list:
+        if obj is None:
+            continue
+        if type(obj) is list:
+            objs.extend(obj)
+        else:
+            objs.append(obj)
+    return objs
+
+
 def create_pods_parallel(
     pvc_list,
     namespace,
@@ -2608,60 +2688,34 @@ def create_pods_parallel(
     Returns:
         pod_objs (list): Returns list of pods created
     """
-    future_pod_objs = []
     # Added 300 sec wait time since in scale test once the setup has more
     # PODs time taken for the pod to be up will be based on resource available
     wait_time = 300
     if raw_block_pv and not pod_dict_path:
         pod_dict_path = constants.CSI_RBD_RAW_BLOCK_POD_YAML
-    with ThreadPoolExecutor() as executor:
-        for pvc_obj in pvc_list:
-            if pvc_obj is not None:
-                if type(pvc_obj) is list:
-                    for pvc_ in pvc_obj:
-                        future_pod_objs.append(
-                            executor.submit(
-                                create_pod,
-                                interface_type=interface,
-                                pvc_name=pvc_.name,
-                                do_reload=False,
-                                namespace=namespace,
-                                raw_block_pv=raw_block_pv,
-                                pod_dict_path=pod_dict_path,
-                                sa_name=sa_name,
-                                deployment=deployment,
-                                node_selector=node_selector,
-                            )
-                        )
-                else:
-                    future_pod_objs.append(
-                        executor.submit(
-                            create_pod,
-                            interface_type=interface,
-                            pvc_name=pvc_obj.name,
-                            do_reload=False,
-                            namespace=namespace,
-                            raw_block_pv=raw_block_pv,
-                            pod_dict_path=pod_dict_path,
-                            sa_name=sa_name,
-                            deployment=deployment,
-                            node_selector=node_selector,
-                        )
-                    )
-
-    pod_objs = [pvc_obj.result() for pvc_obj in future_pod_objs]
+    executor = get_resource_executor()
+    pod_objs = executor.map(
+        lambda pvc_obj: create_pod(
+            interface_type=interface,
+            pvc_name=pvc_obj.name,
+            do_reload=False,
+            namespace=namespace,
+            raw_block_pv=raw_block_pv,
+            pod_dict_path=pod_dict_path,
+            sa_name=sa_name,
+            deployment=deployment,
+            node_selector=node_selector,
+        ),
+        _flatten_objs(pvc_list),
+        operation="create_pod",
+    )
     # Check for all the pods are in Running state
-    # In above pod creation not waiting for the pod to be created because of threads usage
-    with ThreadPoolExecutor() as executor:
-        for obj in pod_objs:
-            future_pod_objs.append(
-                executor.submit(
-                    wait_for_resource_state, obj, "Running", timeout=wait_time
-                )
-            )
-    # If pods not up raise exception/failure
-    if False in [obj.result() for obj in future_pod_objs]:
-        raise TimeoutExpiredError("Not all pods are in running state")
+    # In above pod creation not waiting for the pod to be created
+    executor.map(
+        lambda obj: wait_for_resource_state(obj, "Running", timeout=wait_time),
+        pod_objs,
+        operation="wait_for_pod_running",
+    )
     return pod_objs
 
 
@@ -2675,20 +2729,14 @@ def delete_objs_parallel(obj_list):
         bool: True if obj deleted else False
 
     """
-    threads = list()
-    for obj in obj_list:
-        if obj is not None:
-            if type(obj) is list:
-                for obj_ in obj:
-                    process = threading.Thread(target=obj_.delete)
-                    process.start()
-                    threads.append(process)
-            else:
-                process = threading.Thread(target=obj.delete)
-                process.start()
-                threads.append(process)
-    for process in threads:
-        process.join()
+
+    def _delete(obj):
+        try:
+            obj.delete()
+        except Exception as e:
+            logger.error(f"Failed to delete {obj.kind} {obj.name}: {e}")
+
+    get_resource_executor().map(_delete, _flatten_objs(obj_list), operation="delete")
     return True
 
 
@@ -19,6 +19,7 @@ Success Criteria:
 """
 
 import logging
+import queue
 import threading
 import time
 import random
@@ -38,10 +39,53 @@ from ocs_ci.ocs.exceptions import (
     ResourceNotFoundError,
 )
 from ocs_ci.helpers import helpers
+from ocs_ci.utility.utils import percentile
 
 log = logging.getLogger(__name__)
 
 
+# Upper bounds in seconds of the operation latency histogram buckets
+LATENCY_BUCKETS = (5, 15, 30, 60, 120, 300, 600, 1200)
+
+# Relative frequency of the operations, the lifecycle operations exercise the
+# CSI paths and are cheap, the Ceph daemon operations are disruptive
+DEFAULT_OPERATION_WEIGHTS = {
+    "snapshot_lifecycle": 3,
+    "clone_lifecycle": 3,
+    "node_taint_churn": 1,
+    "osd_operations": 1,
+    "mds_failover": 1,
+    "rgw_restart": 1,
+    "reclaim_space": 2,
+    "volume_replication": 1,
+    "longevity_operations": 1,
+}
+
+# Maximal number of running instances of an operation
+DEFAULT_OPERATION_MAX_PARALLEL = {
+    "snapshot_lifecycle": 2,
+    "clone_lifecycle": 2,
+    "node_taint_churn": 1,
+    "osd_operations": 1,
+    "mds_failover": 1,
+    "rgw_restart": 1,
+    "reclaim_space": 2,
+    "volume_replication": 1,
+    "longevity_operations": 1,
+}
+
+# Operations of a group never run concurrently, the operations changing the
+# state of the Ceph daemons or the nodes would disrupt each other's recovery
+DEFAULT_OPERATION_EXCLUSION_GROUPS = {
+    "disruptive": [
+        "node_taint_churn",
+        "osd_operations",
+        "mds_failover",
+        "rgw_restart",
+    ],
+}
+
+
 class BackgroundClusterMetrics:
     """Track metrics for background cluster operations."""
 
@@ -51,24 +95,92 @@ class BackgroundClusterMetrics:
         self.failures = defaultdict(int)
         self.errors = []
         self.start_time = time.time()
+        # Latencies of the operations by the phase they started in
+        self.phase = "baseline"
+        self.phases: List[Dict[str, Any]] = [
+            {"name": self.phase, "timestamp": self.start_time}
+        ]
+        self.latencies = defaultdict(lambda: defaultdict(list))
+        self._lock = threading.Lock()
+
+    def set_phase(self, phase: str):
+        """
+        Start a new phase, e.g. before, during or after a krkn scenario.
+
+        Args:
+            phase: Name of the phase the next operations are attributed to
+        """
+        with self._lock:
+            self.phase = phase
+            self.phases.append({"name": phase, "timestamp": time.time()})
+        log.info(f"Background cluster operations phase: {phase}")
 
     def record_operation(
-        self, operation_type: str, success: bool, error: Optional[str] = None
+        self,
+        operation_type: str,
+        success: bool,
+        error: Optional[str] = None,
+        duration: Optional[float] = None,
+        phase: Optional[str] = None,
     ):
-        """Record an operation result."""
-        self.operations[operation_type] += 1
-        if success:
-            self.successes[operation_type] += 1
-        else:
-            self.failures[operation_type] += 1
-            if error:
-                self.errors.append(
-                    {
-                        "operation": operation_type,
-                        "error": error,
-                        "timestamp": time.time(),
-                    }
-                )
+        """
+        Record an operation result.
+
+        Args:
+            operation_type: Name of the operation
+            success: True if the operation succeeded
+            error: Error message of a failed operation
+            duration: Latency of the operation in seconds
+            phase: Phase the operation started in, the current phase if not set
+        """
+        with self._lock:
+            self.operations[operation_type] += 1
+            if success:
+                self.successes[operation_type] += 1
+            else:
+                self.failures[operation_type] += 1
+                if error:
+                    self.errors.append(
+                        {
+                            "operation": operation_type,
+                            "error": error,
+                            "timestamp": time.time(),
+                        }
+                    )
+            if duration is not None:
+                self.latencies[phase or self.phase][operation_type].append(duration)
+
+    def get_latency_histograms(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Get the latency statistics and histograms of the operations.
+
+        Returns:
+            dict: Phases mapped to operation names mapped to the count, p50,
+                p95 and max latency and the counts of the histogram buckets
+        """
+        with self._lock:
+            latencies = {
+                phase: {op: sorted(values) for op, values in ops.items()}
+                for phase, ops in self.latencies.items()
+            }
+        histograms = {}
+        for phase, ops in latencies.items():
+            histograms[phase] = {}
+            for op, values in ops.items():
+                buckets = {f"<={bound}s": 0 for bound in LATENCY_BUCKETS}
+                buckets[f">{LATENCY_BUCKETS[-1]}s"] = 0
+                for value in values:
+                    bound = next((b for b in LATENCY_BUCKETS if value <= b), None)
+                    key = f"<={bound}s" if bound else f">{LATENCY_BUCKETS[-1]}s"
+                    buckets[key] += 1
+                histograms[phase][op] = {
+                    "count": len(values),
+                    "p50": percentile(values, 50),
+                    "p95": percentile(values, 95),
+                    "max": values[-1],
+                    "buckets": buckets,
+                }
+        return histograms
 
     def get_summary(self) -> Dict[str, Any]:
         """Get operation summary."""
@@ -87,6 +199,8 @@ class BackgroundClusterMetrics:
                 if sum(self.operations.values()) > 0
                 else 0
             ),
+            "phases": list(self.phases),
+            "latency_by_phase": self.get_latency_histograms(),
         }
 
 
@@ -104,26 +218,70 @@ class BackgroundClusterOperations:
         enabled_operations: Optional[List[str]] = None,
         operation_interval: int = 60,
         max_concurrent_operations: int = 3,
+        operations_per_minute: Optional[float] = None,
+        operation_weights: Optional[Dict[str, float]] = None,
+        operation_max_parallel: Optional[Dict[str, int]] = None,
+        operation_exclusion_groups: Optional[Dict[str, List[str]]] = None,
+        jitter: float = 0.2,
     ):
         """
         Initialize BackgroundClusterOperations.
 
+        The operations are started by a scheduler at the target rate with a
+        random jitter, picked randomly by their weights among the operations
+        which didn't reach their max parallelism and whose exclusion groups
+        have no running operation, and executed by a pool of
+        max_concurrent_operations workers.
+
         Args:
             workload_ops: Workload operations object containing running workloads
             enabled_operations: List of enabled operation types (None = all)
-            operation_interval: Seconds between operations (default: 60)
+            operation_interval: Seconds between operations (default: 60), used
+                when operations_per_minute is not set
             max_concurrent_operations: Max concurrent background operations
+            operations_per_minute: Target rate of started operations
+            operation_weights: Relative frequencies of the operations, merged
+                with DEFAULT_OPERATION_WEIGHTS
+            operation_max_parallel: Max running instances of the operations,
+                merged with DEFAULT_OPERATION_MAX_PARALLEL
+            operation_exclusion_groups: Groups of the operations which never
+                run concurrently, DEFAULT_OPERATION_EXCLUSION_GROUPS if not set
+            jitter: Relative random deviation of the intervals between the
+                operations, e.g. 0.2 for +-20%
         """
         self.workload_ops = workload_ops
         self.namespace = workload_ops.namespace
         self.workloads = workload_ops.workloads
         self.operation_interval = operation_interval
         self.max_concurrent_operations = max_concurrent_operations
+        self.operations_per_minute = operations_per_minute or 60 / max(
+            operation_interval, 1
+        )
+        self.operation_weights = {
+            **DEFAULT_OPERATION_WEIGHTS,
+            **(operation_weights or {}),
+        }
+        self.operation_max_parallel = {
+            **DEFAULT_OPERATION_MAX_PARALLEL,
+            **(operation_max_parallel or {}),
+        }
+        if operation_exclusion_groups is None:
+            operation_exclusion_groups = DEFAULT_OPERATION_EXCLUSION_GROUPS
+        self.operation_exclusion_groups = {
+            group: set(operations)
+            for group, operations in operation_exclusion_groups.items()
+        }
+        self.jitter = jitter
 
         # Operation control
         self._running = False
+        self._stop_event = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._operation_threads: List[threading.Thread] = []
+        self._operation_queue: queue.Queue = queue.Queue()
+        self._in_flight: Dict[str, int] = defaultdict(int)
+        self._in_flight_lock = threading.Lock()
+        self.skipped_saturated = 0
 
         # Metrics and tracking
         self.metrics = BackgroundClusterMetrics()
@@ -167,8 +325,21 @@ class BackgroundClusterOperations:
             log.warning("Background cluster operations already running")
             return
 
-        log.info("Starting background cluster operations")
+        log.info(
+            f"Starting background cluster operations at "
+            f"{self.operations_per_minute:.2f} operations/min with "
+            f"{self.max_concurrent_operations} workers"
+        )
         self._running = True
+        self._stop_event.clear()
+        self._operation_threads = [
+            threading.Thread(
+                target=self._operation_worker, name=f"BgOpWorker-{i}", daemon=True
+            )
+            for i in range(self.max_concurrent_operations)
+        ]
+        for thread in self._operation_threads:
+            thread.start()
         self._thread = threading.Thread(
             target=self._operation_loop, name="BackgroundClusterOperations", daemon=True
         )
@@ -187,12 +358,15 @@ class BackgroundClusterOperations:
 
         log.info("Stopping background cluster operations")
         self._running = False
+        self._stop_event.set()
 
         # Wait for main thread
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=30)
 
-        # Wait for operation threads
+        # Wake up the idle workers and wait for the running operations
+        for _ in self._operation_threads:
+            self._operation_queue.put(None)
         for thread in self._operation_threads:
             if thread.is_alive():
                 thread.join(timeout=10)
@@ -203,42 +377,86 @@ class BackgroundClusterOperations:
         log.info("Background cluster operations stopped")
         self._log_final_summary()
 
+    def mark_phase(self, phase: str):
+        """
+        Attribute the next operations to a phase, e.g. 'before', 'during' and
+        'after' a krkn scenario, to compare the latencies between the phases.
+
+        Args:
+            phase: Name of the phase
+        """
+        self.metrics.set_phase(phase)
+
+    def _next_interval(self) -> float:
+        """Seconds until the next operation, with the random jitter applied."""
+        interval = 60 / self.operations_per_minute
+        return interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def _pick_operation(self) -> Optional[str]:
+        """
+        Pick a weighted random operation which can be started.
+
+        Returns:
+            Name of the operation, None if all the workers are busy or all the
+            operations reached their max parallelism or are excluded by
+            a running operation of their group
+        """
+        with self._in_flight_lock:
+            if sum(self._in_flight.values()) >= self.max_concurrent_operations:
+                return None
+            excluded = set()
+            for operations in self.operation_exclusion_groups.values():
+                if any(self._in_flight[name] for name in operations):
+                    excluded |= operations
+            candidates = [
+                name
+                for name in self.enabled_operations
+                if name not in excluded
+                and self._in_flight[name] < self.operation_max_parallel.get(name, 1)
+                and self.operation_weights.get(name, 1) > 0
+            ]
+            if not candidates:
+                return None
+            operation_name = random.choices(
+                candidates,
+                weights=[self.operation_weights.get(name, 1) for name in candidates],
+            )[0]
+            self._in_flight[operation_name] += 1
+            return operation_name
+
     def _operation_loop(self):
-        """Main operation loop - continuously performs background operations."""
+        """Scheduler loop - keeps a steady mix of background operations in flight."""
         log.info("Background cluster operation loop started")
 
         while self._running:
             try:
-                # Clean up completed threads
-                self._operation_threads = [
-                    t for t in self._operation_threads if t.is_alive()
-                ]
-
-                # Check if we can start new operations
-                if len(self._operation_threads) < self.max_concurrent_operations:
-                    # Select random operation
-                    operation_name = random.choice(list(self.enabled_operations.keys()))
-                    operation_func = self.enabled_operations[operation_name]
-
-                    # Start operation in separate thread
-                    op_thread = threading.Thread(
-                        target=self._run_operation_safe,
-                        args=(operation_name, operation_func),
-                        name=f"BgOp-{operation_name}",
-                        daemon=True,
-                    )
-                    op_thread.start()
-                    self._operation_threads.append(op_thread)
-
-                # Sleep before next operation
-                time.sleep(self.operation_interval)
-
+                operation_name = self._pick_operation()
+                if operation_name:
+                    self._operation_queue.put(operation_name)
+                else:
+                    self.skipped_saturated += 1
+                    log.debug("All background operation slots are busy, skipping")
             except Exception as e:
                 log.error(f"Error in background operation loop: {e}")
-                time.sleep(10)  # Back off on error
+            self._stop_event.wait(self._next_interval())
 
         log.info("Background cluster operation loop stopped")
 
+    def _operation_worker(self):
+        """Worker executing the scheduled operations."""
+        while self._running:
+            operation_name = self._operation_queue.get()
+            if operation_name is None:
+                return
+            try:
+                if self._running:
+                    self._run_operation_safe(
+                        operation_name, self.enabled_operations[operation_name]
+                    )
+            finally:
+                with self._in_flight_lock:
+                    self._in_flight[operation_name] -= 1
+
     def _namespace_exists(self) -> bool:
         """
         Check if the namespace still exists using the existing OCP utility.
@@ -272,21 +490,32 @@ class BackgroundClusterOperations:
             operation_name: Name of the operation
             operation_func: Function to execute
         """
-        try:
-            # Check if namespace still exists before running operation
-            if not self._namespace_exists():
-                log.info(f"Skipping {operation_name} - namespace no longer exists")
-                return
+        # Check if namespace still exists before running operation
+        if not self._namespace_exists():
+            log.info(f"Skipping {operation_name} - namespace no longer exists")
+            return
 
-            log.info(f"Starting background operation: {operation_name}")
+        log.info(f"Starting background operation: {operation_name}")
+        phase = self.metrics.phase
+        start = time.monotonic()
+        try:
             operation_func()
-            self.metrics.record_operation(operation_name, success=True)
-            log.info(f"Completed background operation: {operation_name}")
+            duration = time.monotonic() - start
+            self.metrics.record_operation(
+                operation_name, success=True, duration=duration, phase=phase
+            )
+            log.info(
+                f"Completed background operation: {operation_name} in {duration:.1f}s"
+            )
         except Exception as e:
             error_msg = f"{operation_name} failed: {str(e)}"
             log.error(error_msg)
             self.metrics.record_operation(
-                operation_name, success=False, error=error_msg
+                operation_name,
+                success=False,
+                error=error_msg,
+                duration=time.monotonic() - start,
+                phase=phase,
             )
 
     # ==========================================================================
@@ -1204,6 +1433,20 @@ class BackgroundClusterOperations:
             failures = summary["failures_by_type"].get(op_type, 0)
             log.info(f"  {op_type}: {count} ({successes} success, {failures} failed)")
 
+        if summary["latency_by_phase"]:
+            log.info("\nOperation latencies by phase (p50/p95/max seconds):")
+            for phase, ops in summary["latency_by_phase"].items():
+                for op_type, stats in ops.items():
+                    log.info(
+                        f"  [{phase}] {op_type}: {stats['count']} ops, "
+                        f"{stats['p50']:.1f}/{stats['p95']:.1f}/{stats['max']:.1f}"
+                    )
+        if self.skipped_saturated:
+            log.info(
+                f"\n{self.skipped_saturated} scheduled operations were skipped "
+                f"because all the operation slots were busy"
+            )
+
         if summary["error_count"] > 0:
             log.warning(f"\n{summary['error_count']} errors occurred during operations")
 
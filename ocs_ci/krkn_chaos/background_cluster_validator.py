@@ -9,9 +9,11 @@ It ensures success criteria are met:
 - Healthy Ceph status throughout operations
 """
 
+import json
 import logging
 import time
-from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Set, Tuple
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants, ocp
@@ -19,6 +21,77 @@ from ocs_ci.ocs.resources import pod as pod_helpers
 
 log = logging.getLogger(__name__)
 
+SECTION_MARKER = "==OCS-CI-SECTION=="
+RBD_DRIVER = "rbd.csi.ceph.com"
+CEPHFS_DRIVER = "cephfs.csi.ceph.com"
+
+
+@dataclass
+class ValidationSnapshot:
+    """
+    State of the PVs, PVCs and Ceph backend volumes captured at once.
+
+    The snapshot is taken by one PV list, one all-namespaces PVC list and one
+    toolbox command, regardless of the number of volumes, and the orphans are
+    found by set differences of its members.
+    """
+
+    pvs: List[Dict[str, Any]] = field(default_factory=list)
+    pvc_keys: Set[Tuple[str, str]] = field(default_factory=set)
+    rbd_images: Set[str] = field(default_factory=set)
+    cephfs_subvolumes: Set[str] = field(default_factory=set)
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def pv_count(self) -> int:
+        """Number of the PVs."""
+        return len(self.pvs)
+
+    @property
+    def pv_rbd_images(self) -> Set[str]:
+        """RBD image names of all RBD PVs."""
+        images = set()
+        for pv in self.pvs:
+            csi = pv["spec"].get("csi", {})
+            if RBD_DRIVER not in csi.get("driver", ""):
+                continue
+            image_name = csi.get("volumeAttributes", {}).get("imageName")
+            volume_handle = csi.get("volumeHandle", "")
+            if not image_name and volume_handle.count("-") >= 4:
+                # Volume handle format: <ids>-<pool-id>-<image uuid>, the image
+                # of a provisioned volume is named csi-vol-<image uuid>
+                image_name = "csi-vol-" + "-".join(volume_handle.split("-")[-5:])
+            if image_name:
+                images.add(image_name)
+        return images
+
+    @property
+    def pv_cephfs_subvolumes(self) -> Set[str]:
+        """CephFS subvolume names of all CephFS PVs."""
+        return {
+            pv["spec"]["csi"]["volumeAttributes"]["subvolumeName"]
+            for pv in self.pvs
+            if CEPHFS_DRIVER in pv["spec"].get("csi", {}).get("driver", "")
+            and pv["spec"]["csi"].get("volumeAttributes", {}).get("subvolumeName")
+        }
+
+    def orphan_pvs(self) -> List[str]:
+        """
+        PVs which are released or whose claimed PVC doesn't exist.
+
+        Returns:
+            List of orphan PV names
+        """
+        orphans = []
+        for pv in self.pvs:
+            claim_ref = pv["spec"].get("claimRef")
+            if not claim_ref:
+                if pv.get("status", {}).get("phase") == "Released":
+                    orphans.append(pv["metadata"]["name"])
+            elif (claim_ref["namespace"], claim_ref["name"]) not in self.pvc_keys:
+                orphans.append(pv["metadata"]["name"])
+        return orphans
+
 
 class BackgroundClusterValidator:
     """
@@ -40,6 +113,7 @@ class BackgroundClusterValidator:
         self.initial_rbd_images: set = set()
         self.initial_cephfs_subvolumes: set = set()
         self.validation_errors: List[Dict[str, Any]] = []
+        self.last_snapshot: ValidationSnapshot = None
 
     def pre_operation_validation(self):
         """
@@ -50,16 +124,18 @@ class BackgroundClusterValidator:
         log.info("Performing pre-operation validation")
 
         try:
+            snapshot = self.take_snapshot()
+
             # Capture initial PV count
-            self.initial_pv_count = self._get_pv_count()
+            self.initial_pv_count = snapshot.pv_count
             log.info(f"Initial PV count: {self.initial_pv_count}")
 
             # Capture initial Ceph RBD images
-            self.initial_rbd_images = self._get_rbd_images()
+            self.initial_rbd_images = snapshot.rbd_images
             log.info(f"Initial RBD images count: {len(self.initial_rbd_images)}")
 
             # Capture initial CephFS subvolumes
-            self.initial_cephfs_subvolumes = self._get_cephfs_subvolumes()
+            self.initial_cephfs_subvolumes = snapshot.cephfs_subvolumes
             log.info(
                 f"Initial CephFS subvolumes count: {len(self.initial_cephfs_subvolumes)}"
             )
@@ -77,10 +153,16 @@ class BackgroundClusterValidator:
             log.error(f"Pre-operation validation failed: {e}")
             raise
 
-    def continuous_validation(self) -> bool:
+    def continuous_validation(self, check_orphans: bool = False) -> bool:
         """
         Perform continuous validation during background cluster operations.
 
+        Args:
+            check_orphans: If True, take a validation snapshot and record the
+                orphan PVs and backend volumes found in it. The volumes of the
+                running operations can be caught in the middle of their deletion,
+                so the orphans are recorded but don't fail the validation.
+
         Returns:
             bool: True if validation passes, False otherwise
         """
@@ -115,6 +197,31 @@ class BackgroundClusterValidator:
                     }
                 )
 
+            if check_orphans:
+                snapshot = self.take_snapshot()
+                orphans = {
+                    "pvs": self._check_orphan_pvs(snapshot),
+                    "rbd_images": list(self._check_orphan_rbd_images(snapshot)),
+                    "cephfs_subvolumes": list(
+                        self._check_orphan_cephfs_subvolumes(snapshot)
+                    ),
+                }
+                if any(orphans.values()):
+                    error_msg = (
+                        f"Found orphans: {len(orphans['pvs'])} PVs, "
+                        f"{len(orphans['rbd_images'])} RBD images, "
+                        f"{len(orphans['cephfs_subvolumes'])} CephFS subvolumes"
+                    )
+                    log.warning(error_msg)
+                    self.validation_errors.append(
+                        {
+                            "type": "orphans",
+                            "message": error_msg,
+                            "details": orphans,
+                            "timestamp": snapshot.timestamp,
+                        }
+                    )
+
             return True
 
         except Exception as e:
@@ -136,8 +243,10 @@ class BackgroundClusterValidator:
         }
 
         try:
+            snapshot = self.take_snapshot()
+
             # Check 1: No orphan PVs
-            orphan_pvs = self._check_orphan_pvs()
+            orphan_pvs = self._check_orphan_pvs(snapshot)
             validation_report["checks"]["orphan_pvs"] = {
                 "passed": len(orphan_pvs) == 0,
                 "count": len(orphan_pvs),
@@ -148,7 +257,7 @@ class BackgroundClusterValidator:
                 validation_report["passed"] = False
 
             # Check 2: No orphan RBD images
-            orphan_rbd_images = self._check_orphan_rbd_images()
+            orphan_rbd_images = self._check_orphan_rbd_images(snapshot)
             rbd_check: Dict[str, Any] = {
                 "passed": len(orphan_rbd_images) == 0,
                 "count": len(orphan_rbd_images),
@@ -160,7 +269,7 @@ class BackgroundClusterValidator:
                 validation_report["passed"] = False
 
             # Check 3: No orphan CephFS subvolumes
-            orphan_subvolumes = self._check_orphan_cephfs_subvolumes()
+            orphan_subvolumes = self._check_orphan_cephfs_subvolumes(snapshot)
             subvol_check: Dict[str, Any] = {
                 "passed": len(orphan_subvolumes) == 0,
                 "count": len(orphan_subvolumes),
@@ -211,66 +320,87 @@ class BackgroundClusterValidator:
     # Helper Methods
     # ==========================================================================
 
-    def _get_pv_count(self) -> int:
-        """Get current PV count."""
-        pv_obj = ocp.OCP(kind=constants.PV)
-        pvs = pv_obj.get()["items"]
-        return len(pvs)
-
-    def _get_rbd_images(self) -> set:
-        """Get list of RBD images in Ceph."""
-        try:
-            ct_pod = pod_helpers.get_ceph_tools_pod()
-            pool = config.ENV_DATA.get("rbd_pool", constants.DEFAULT_BLOCKPOOL)
-
-            # List RBD images
-            cmd = f"rbd ls -p {pool}"
-            result = ct_pod.exec_cmd_on_pod(cmd, out_yaml_format=False)
-
-            images = set()
-            if result:
-                for line in result.strip().split("\n"):
-                    if line.strip():
-                        images.add(line.strip())
+    def take_snapshot(self) -> ValidationSnapshot:
+        """
+        Capture the PVs, PVCs and Ceph backend volumes by a constant number of calls.
 
-            return images
-        except Exception as e:
-            log.warning(f"Failed to get RBD images: {e}")
-            return set()
+        Returns:
+            ValidationSnapshot: The captured state
+        """
+        pvs = ocp.OCP(kind=constants.PV).get()["items"]
+        pvcs = ocp.OCP(kind=constants.PVC).get(all_namespaces=True)["items"]
+        rbd_images, cephfs_subvolumes = self._get_backend_volumes()
+        self.last_snapshot = ValidationSnapshot(
+            pvs=pvs,
+            pvc_keys={
+                (pvc["metadata"]["namespace"], pvc["metadata"]["name"]) for pvc in pvcs
+            },
+            rbd_images=rbd_images,
+            cephfs_subvolumes=cephfs_subvolumes,
+        )
+        log.debug(
+            f"Validation snapshot: {len(pvs)} PVs, {len(pvcs)} PVCs, "
+            f"{len(rbd_images)} RBD images, {len(cephfs_subvolumes)} CephFS subvolumes"
+        )
+        return self.last_snapshot
+
+    def _get_backend_volumes(self) -> Tuple[set, set]:
+        """
+        Get RBD images and CephFS subvolumes in Ceph by a single toolbox command.
 
-    def _get_cephfs_subvolumes(self) -> set:
-        """Get list of CephFS subvolumes."""
+        Returns:
+            Tuple of (RBD image names, CephFS subvolume names)
+        """
+        pool = config.ENV_DATA.get("rbd_pool", constants.DEFAULT_BLOCKPOOL)
+        # The subvolume group might not exist in all the filesystems
+        script = (
+            f"echo {SECTION_MARKER} rbd; rbd ls -p {pool} --format json; "
+            f"for fs in $(ceph fs ls | sed -n 's/^name: \\([^,]*\\),.*/\\1/p'); do "
+            f"echo {SECTION_MARKER} cephfs $fs; "
+            f"ceph fs subvolume ls $fs csi --format json 2>/dev/null || echo []; "
+            f"done"
+        )
         try:
             ct_pod = pod_helpers.get_ceph_tools_pod()
+            output = ct_pod.exec_sh_cmd_on_pod(script)
+        except Exception as e:
+            log.warning(f"Failed to get Ceph backend volumes: {e}")
+            return set(), set()
+        return self._parse_backend_volumes(output)
 
-            # Get filesystem name
-            cmd = "ceph fs ls --format=json"
-            result = ct_pod.exec_cmd_on_pod(cmd)
-
-            if not result or not isinstance(result, list):
-                return set()
+    @staticmethod
+    def _parse_backend_volumes(output: str) -> Tuple[set, set]:
+        """
+        Parse the sections of the backend volumes listing.
 
-            subvolumes = set()
-            for fs in result:
-                fs_name = fs.get("name")
-                if not fs_name:
-                    continue
+        Args:
+            output: Output of the toolbox command of _get_backend_volumes
 
-                # List subvolumes
-                cmd = f"ceph fs subvolume ls {fs_name} csi"
-                try:
-                    subvol_result = ct_pod.exec_cmd_on_pod(cmd)
-                    if subvol_result and isinstance(subvol_result, list):
-                        for subvol in subvol_result:
-                            if "name" in subvol:
-                                subvolumes.add(subvol["name"])
-                except Exception:
-                    pass  # Subvolume group might not exist
-
-            return subvolumes
-        except Exception as e:
-            log.warning(f"Failed to get CephFS subvolumes: {e}")
-            return set()
+        Returns:
+            Tuple of (RBD image names, CephFS subvolume names)
+        """
+        sections = []
+        for line in output.splitlines():
+            if line.startswith(SECTION_MARKER):
+                sections.append((line.split()[1], []))
+            elif sections:
+                sections[-1][1].append(line)
+
+        rbd_images = set()
+        cephfs_subvolumes = set()
+        for section_type, lines in sections:
+            try:
+                items = json.loads("\n".join(lines) or "[]")
+            except json.JSONDecodeError as e:
+                log.warning(f"Failed to parse {section_type} volumes listing: {e}")
+                continue
+            if section_type == "rbd":
+                rbd_images.update(items)
+            else:
+                cephfs_subvolumes.update(
+                    subvol["name"] for subvol in items if "name" in subvol
+                )
+        return rbd_images, cephfs_subvolumes
 
     def _check_ceph_health(self) -> str:
         """
@@ -287,139 +417,66 @@ class BackgroundClusterValidator:
             log.error(f"Failed to check Ceph health: {e}")
             return "ERROR"
 
-    def _check_orphan_pvs(self) -> List[str]:
+    def _check_orphan_pvs(self, snapshot: ValidationSnapshot = None) -> List[str]:
         """
         Check for orphan PVs (PVs without corresponding PVCs).
 
+        Args:
+            snapshot: Validation snapshot to check, a new one is taken if not set
+
         Returns:
             List of orphan PV names
         """
-        orphan_pvs = []
-
         try:
-            pv_obj = ocp.OCP(kind=constants.PV)
-            pvs = pv_obj.get()["items"]
-
-            for pv in pvs:
-                pv_name = pv["metadata"]["name"]
-                claim_ref = pv["spec"].get("claimRef")
-
-                if not claim_ref:
-                    # PV has no claim reference (available or released)
-                    phase = pv["status"]["phase"]
-                    if phase == "Released":
-                        orphan_pvs.append(pv_name)
-                else:
-                    # Check if PVC still exists
-                    pvc_name = claim_ref["name"]
-                    pvc_namespace = claim_ref["namespace"]
-
-                    pvc_obj = ocp.OCP(
-                        kind=constants.PVC,
-                        namespace=pvc_namespace,
-                        resource_name=pvc_name,
-                    )
-                    if not pvc_obj.is_exist():
-                        orphan_pvs.append(pv_name)
-
+            return (snapshot or self.take_snapshot()).orphan_pvs()
         except Exception as e:
             log.error(f"Failed to check orphan PVs: {e}")
+            return []
 
-        return orphan_pvs
-
-    def _check_orphan_rbd_images(self) -> set:
+    def _check_orphan_rbd_images(self, snapshot: ValidationSnapshot = None) -> set:
         """
         Check for orphan RBD images (images without corresponding PVs).
 
+        Args:
+            snapshot: Validation snapshot to check, a new one is taken if not set
+
         Returns:
             Set of orphan RBD image names
         """
         try:
-            current_images = self._get_rbd_images()
-
-            # Get all PV-backed RBD images
-            pv_images = self._get_pv_rbd_images()
-
+            snapshot = snapshot or self.take_snapshot()
             # Orphans are images not backed by PVs and not in initial set
-            orphans = current_images - pv_images - self.initial_rbd_images
-
-            return orphans
+            return (
+                snapshot.rbd_images - snapshot.pv_rbd_images - self.initial_rbd_images
+            )
         except Exception as e:
             log.error(f"Failed to check orphan RBD images: {e}")
             return set()
 
-    def _get_pv_rbd_images(self) -> set:
-        """Get RBD image names from all RBD PVs."""
-        images = set()
-
-        try:
-            pv_obj = ocp.OCP(kind=constants.PV)
-            pvs = pv_obj.get()["items"]
-
-            for pv in pvs:
-                # Check if it's an RBD PV
-                csi = pv["spec"].get("csi", {})
-                if "rbd.csi.ceph.com" in csi.get("driver", ""):
-                    # Extract image name from volume handle
-                    volume_handle = csi.get("volumeHandle", "")
-                    if volume_handle:
-                        # Volume handle format: <cluster-id>-<pool-id>-<image-name>-<image-id>
-                        parts = volume_handle.split("-")
-                        if len(parts) >= 4:
-                            image_name = "-".join(parts[2:-1])
-                            images.add(image_name)
-
-        except Exception as e:
-            log.error(f"Failed to get PV RBD images: {e}")
-
-        return images
-
-    def _check_orphan_cephfs_subvolumes(self) -> set:
+    def _check_orphan_cephfs_subvolumes(
+        self, snapshot: ValidationSnapshot = None
+    ) -> set:
         """
         Check for orphan CephFS subvolumes.
 
+        Args:
+            snapshot: Validation snapshot to check, a new one is taken if not set
+
         Returns:
             Set of orphan subvolume names
         """
         try:
-            current_subvolumes = self._get_cephfs_subvolumes()
-
-            # Get all PV-backed subvolumes
-            pv_subvolumes = self._get_pv_cephfs_subvolumes()
-
+            snapshot = snapshot or self.take_snapshot()
             # Orphans are subvolumes not backed by PVs and not in initial set
-            orphans = (
-                current_subvolumes - pv_subvolumes - self.initial_cephfs_subvolumes
+            return (
+                snapshot.cephfs_subvolumes
+                - snapshot.pv_cephfs_subvolumes
+                - self.initial_cephfs_subvolumes
             )
-
-            return orphans
         except Exception as e:
             log.error(f"Failed to check orphan CephFS subvolumes: {e}")
             return set()
 
-    def _get_pv_cephfs_subvolumes(self) -> set:
-        """Get CephFS subvolume names from all CephFS PVs."""
-        subvolumes = set()
-
-        try:
-            pv_obj = ocp.OCP(kind=constants.PV)
-            pvs = pv_obj.get()["items"]
-
-            for pv in pvs:
-                # Check if it's a CephFS PV
-                csi = pv["spec"].get("csi", {})
-                if "cephfs.csi.ceph.com" in csi.get("driver", ""):
-                    # Extract subvolume name from volume attributes
-                    volume_attributes = csi.get("volumeAttributes", {})
-                    subvol_name = volume_attributes.get("subvolumeName")
-                    if subvol_name:
-                        subvolumes.add(subvol_name)
-
-        except Exception as e:
-            log.error(f"Failed to get PV CephFS subvolumes: {e}")
-
-        return subvolumes
-
     def _check_pvc_events(self) -> List[Dict[str, Any]]:
         """
         Check PVC events for errors.
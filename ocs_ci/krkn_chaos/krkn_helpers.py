@@ -1844,9 +1844,36 @@ class KrknResultAnalyzer(BaseScenarioHelper):
 class KrknExecutionHelper(BaseScenarioHelper):
     """Helper class for executing Krkn chaos scenarios with consistent patterns."""
 
-    def __init__(self, namespace=None):
-        """Initialize Krkn execution helper."""
+    def __init__(self, namespace=None, workload_ops=None):
+        """
+        Initialize Krkn execution helper.
+
+        Args:
+            namespace (str): Namespace of the tested components
+            workload_ops: Workload ops running the background cluster
+                operations, their latencies are attributed to the 'during' and
+                'after' phases of the executed scenarios
+        """
         super().__init__(namespace=namespace)
+        self.workload_ops = workload_ops
+
+    def _run_krkn(self, krkn):
+        """
+        Run the Krkn scenarios and wait for their completion, the background
+        operations started meanwhile are attributed to the 'during' phase and
+        the later ones to the 'after' phase.
+
+        Args:
+            krkn (KrKnRunner): Runner of the scenarios
+        """
+        if self.workload_ops:
+            self.workload_ops.mark_background_operations_phase("during")
+        try:
+            krkn.run_async()
+            krkn.wait_for_completion(check_interval=60)
+        finally:
+            if self.workload_ops:
+                self.workload_ops.mark_background_operations_phase("after")
 
     def execute_chaos_scenarios(
         self, config, component_name, test_type="chaos", enable_error_check=True
@@ -1873,8 +1900,7 @@ class KrknExecutionHelper(BaseScenarioHelper):
         krkn = KrKnRunner(config.global_config)
         try:
             self.log.info(f"🚀 Starting {test_type} injection for {component_name}")
-            krkn.run_async()
-            krkn.wait_for_completion(check_interval=60)
+            self._run_krkn(krkn)
             self.log.info(
                 f"✅ {test_type.title()} injection completed for {component_name}"
             )
@@ -1921,8 +1947,7 @@ class KrknExecutionHelper(BaseScenarioHelper):
             self.log.info(
                 f"🚀 Starting {stress_level} strength testing for {component_name}"
             )
-            krkn.run_async()
-            krkn.wait_for_completion(check_interval=60)
+            self._run_krkn(krkn)
             self.log.info(
                 f"✅ Strength testing completed for {component_name} ({stress_level} level)"
             )
@@ -1971,8 +1996,7 @@ class KrknExecutionHelper(BaseScenarioHelper):
             self.log.info(
                 f"🚀 Starting chaos injection on ALL {component_name} instances"
             )
-            krkn.run_async()
-            krkn.wait_for_completion(check_interval=60)
+            self._run_krkn(krkn)
             self.log.info(
                 f"✅ Chaos injection completed successfully for {component_name}"
             )
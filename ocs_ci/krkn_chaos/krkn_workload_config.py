@@ -139,6 +139,33 @@ class KrknWorkloadConfig:
         bg_ops_config = self.get_background_cluster_operations_config()
         return bg_ops_config.get("max_concurrent_operations", 3)
 
+    def get_background_operations_scheduling(self) -> Dict[str, Any]:
+        """
+        Get the scheduling parameters of the background operations.
+
+        Returns:
+            dict: Keyword arguments of BackgroundClusterOperations with keys:
+                - operations_per_minute (float): Target rate of the operations
+                - operation_weights (dict): Relative frequencies of the operations
+                - operation_max_parallel (dict): Max running instances of the operations
+                - operation_exclusion_groups (dict): Groups of the operations which
+                  never run concurrently
+                - jitter (float): Relative random deviation of the intervals
+                Keys not present in the config are omitted.
+        """
+        bg_ops_config = self.get_background_cluster_operations_config()
+        return {
+            key: bg_ops_config[key]
+            for key in (
+                "operations_per_minute",
+                "operation_weights",
+                "operation_max_parallel",
+                "operation_exclusion_groups",
+                "jitter",
+            )
+            if key in bg_ops_config
+        }
+
     def get_enabled_background_operations(self) -> List[str]:
         """
         Get list of enabled background operation types.
@@ -199,6 +226,16 @@ class KrknWorkloadConfig:
         vdbench_config = self.get_vdbench_config()
         return vdbench_config.get("workload_loop", 1)
 
+    def use_workload_pool(self) -> bool:
+        """
+        Check if the VDBENCH workloads are leased from the session workload pool.
+
+        Returns:
+            bool: True if the workload pool is used (default: False)
+        """
+        vdbench_config = self.get_vdbench_config()
+        return vdbench_config.get("use_workload_pool", False)
+
     def get_num_pvcs_per_interface(self) -> int:
         """
         Get number of PVCs to create per storage interface.
@@ -17,7 +17,7 @@ class WorkloadOps:
     to validate workload health, start background operations, and perform cleanup.
     """
 
-    def __init__(self, project, workloads, workload_types=None):
+    def __init__(self, project, workloads, workload_types=None, workload_pool=None):
         """
         Initialize WorkloadOps.
 
@@ -25,6 +25,8 @@ class WorkloadOps:
             project: OCS project object
             workloads: List of workload objects or dict of {workload_type: [workload_objects]}
             workload_types: List of workload types (VDBENCH, CNV_WORKLOAD, etc.)
+            workload_pool: IOWorkloadPool the VDBENCH workloads were leased from,
+                the leased workloads are released back instead of being cleaned up
         """
         self.project = project
         self.namespace = project.namespace
@@ -45,6 +47,13 @@ class WorkloadOps:
             self.workload_types[0] if self.workload_types else "VDBENCH"
         )
 
+        self.workload_pool = workload_pool
+        self.leased_workloads = (
+            list(self.workloads_by_type.get(KrknWorkloadConfig.VDBENCH, []))
+            if workload_pool
+            else []
+        )
+
         # Background cluster operations
         self.background_cluster_ops = None
         self.background_cluster_validator = None
@@ -101,6 +110,15 @@ class WorkloadOps:
             from ocs_ci.krkn_chaos.background_cluster_operations import (
                 BackgroundClusterOperations,
             )
+            from ocs_ci.krkn_chaos.background_cluster_validator import (
+                BackgroundClusterValidator,
+            )
+
+            # Capture the baseline of the backend volumes for the orphan checks
+            self.background_cluster_validator = BackgroundClusterValidator(
+                self.namespace
+            )
+            self.background_cluster_validator.pre_operation_validation()
 
             # Get configuration
             enabled_operations = config.get_enabled_background_operations()
@@ -113,6 +131,7 @@ class WorkloadOps:
                 enabled_operations=enabled_operations if enabled_operations else None,
                 operation_interval=operation_interval,
                 max_concurrent_operations=max_concurrent,
+                **config.get_background_operations_scheduling(),
             )
             self.background_cluster_ops.start()
 
@@ -126,6 +145,23 @@ class WorkloadOps:
         except Exception as e:
             log.error(f"Failed to start background cluster operations: {e}")
             self.background_cluster_ops = None
+            self.background_cluster_validator = None
+
+    def check_background_operations_orphans(self):
+        """
+        Record the orphan PVs and backend volumes left while the background
+        operations are running. The volumes of the running operations can be
+        caught in the middle of their deletion, so the orphans are recorded in
+        the validation errors of the validator and don't fail the test.
+
+        Returns:
+            bool: False if the continuous validation failed
+        """
+        if not self.background_cluster_validator:
+            return True
+        return self.background_cluster_validator.continuous_validation(
+            check_orphans=True
+        )
 
     def validate_workload_operations(self):
         """
@@ -161,6 +197,8 @@ class WorkloadOps:
                 log.warning(error_msg)
                 validation_errors.append(error_msg)
 
+        self.check_background_operations_orphans()
+
         if validation_errors:
             error_summary = "\n".join(validation_errors)
             log.error(f"Workload validation errors:\n{error_summary}")
@@ -179,7 +217,8 @@ class WorkloadOps:
         This method:
         1. Stops background cluster operations
         2. Validates workloads are still running
-        3. Stops and cleans up all workloads
+        3. Stops and cleans up all workloads, the workloads leased from the
+           workload pool are released back to the pool
         """
         # Stop background cluster operations first
         self._stop_background_cluster_operations()
@@ -187,6 +226,8 @@ class WorkloadOps:
         log.info(f"Validating and cleaning up {len(self.workloads)} workloads")
 
         for i, workload in enumerate(self.workloads, 1):
+            if workload in self.leased_workloads:
+                continue
             try:
 
                 # Determine workload type for this specific workload
@@ -213,6 +254,34 @@ class WorkloadOps:
                 with suppress(Exception):
                     workload.cleanup_workload()
 
+        self.release_leased_workloads()
+
+    def release_leased_workloads(self):
+        """
+        Release the workloads leased from the workload pool, their data
+        integrity is verified on the logs since their previous verification
+        """
+        if not self.leased_workloads:
+            return
+        leased_workloads, self.leased_workloads = self.leased_workloads, []
+        try:
+            self.workload_pool.release(
+                leased_workloads, verify=KrknWorkloadConfig().should_run_verification()
+            )
+        except Exception as e:
+            log.warning(f"Issue with releasing the pooled workloads: {e}")
+
+    def mark_background_operations_phase(self, phase):
+        """
+        Attribute the next background operations to a phase, e.g. 'before',
+        'during' and 'after' a krkn scenario, to compare their latencies.
+
+        Args:
+            phase (str): Name of the phase
+        """
+        if self.background_cluster_ops:
+            self.background_cluster_ops.mark_phase(phase)
+
     def _stop_background_cluster_operations(self):
         """Stop background cluster operations."""
         if not self.background_cluster_ops:
@@ -223,6 +292,12 @@ class WorkloadOps:
         try:
             self.background_cluster_ops.stop(cleanup=True)
             log.info("Background cluster operations stopped")
+            if self.background_cluster_validator:
+                passed, _ = (
+                    self.background_cluster_validator.post_operation_validation()
+                )
+                if not passed:
+                    log.error("Background cluster operations left orphans behind")
         except Exception as e:
             log.error(f"Error stopping background cluster operations: {e}")
         finally:
@@ -348,6 +423,7 @@ class KrknWorkloadFactory:
         vdbench_block_config=None,
         vdbench_filesystem_config=None,
         multi_cnv_workload=None,
+        workload_pool=None,
     ):
         """
         Create WorkloadOps based on the configured workload types.
@@ -362,6 +438,8 @@ class KrknWorkloadFactory:
             loaded_fixtures: Dict of loaded fixtures (preferred, registry-based)
             timeout: Timeout for operations
             storageclass_factory: Storage class factory fixture (for encrypted PVCs)
+            workload_pool: IOWorkloadPool to lease the VDBENCH workloads from
+                instead of creating them
 
             # Backward compatibility (deprecated - use loaded_fixtures)
             resiliency_workload: VDBENCH fixture (optional)
@@ -397,6 +475,13 @@ class KrknWorkloadFactory:
 
         # Create workloads for each configured type using registry
         for workload_type in self.workload_types:
+            if workload_type == KrknWorkloadConfig.VDBENCH and workload_pool:
+                workloads = workload_pool.lease()
+                workloads_by_type[workload_type] = workloads
+                all_workloads.extend(workloads)
+                log.info(f"✓ Leased {len(workloads)} {workload_type} workloads")
+                continue
+
             if not KrknWorkloadRegistry.is_registered(workload_type):
                 log.warning(f"Workload type '{workload_type}' not registered, skipping")
                 continue
@@ -496,7 +581,35 @@ class KrknWorkloadFactory:
 
                 raise RuntimeError(error_msg)
 
-        return WorkloadOps(proj_obj, workloads_by_type, self.workload_types)
+        return WorkloadOps(
+            proj_obj, workloads_by_type, self.workload_types, workload_pool
+        )
+
+    def provision_workload_pool(
+        self, workload_pool, proj_obj, multi_pvc_factory, storageclass_factory=None
+    ):
+        """
+        Provision the session workload pool with VDBENCH workloads.
+
+        Args:
+            workload_pool: IOWorkloadPool to provision
+            proj_obj: Project object of the pooled workloads
+            multi_pvc_factory: Session scoped multi-PVC factory fixture
+            storageclass_factory: Session scoped storage class factory fixture
+                (optional, for encrypted PVCs)
+        """
+        from ocs_ci.resiliency.workload_pool import create_pooled_workload
+
+        workload_pool.provision(
+            lambda: self._create_vdbench_workloads_for_project(
+                proj_obj,
+                multi_pvc_factory,
+                create_pooled_workload,
+                None,
+                None,
+                storageclass_factory,
+            )
+        )
 
     def _create_vdbench_workloads(
         self,
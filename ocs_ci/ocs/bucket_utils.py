@@ -11,7 +11,6 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import uuid4
 
-import boto3
 from botocore.handlers import disable_signing
 import botocore.exceptions as boto3exception
 
@@ -23,8 +22,15 @@ from ocs_ci.ocs.exceptions import (
     UnexpectedBehaviour,
 )
 from ocs_ci.ocs.ocp import OCP
-from ocs_ci.ocs.resources.s3_batch_deleter import S3BatchDeleter
+from ocs_ci.ocs.resources.s3_batch_deleter import (
+    S3BatchDeleter,
+    delete_buckets_objects_in_parallel,
+)
+from ocs_ci.ocs.resources.s3_bucket_comparator import StreamingBucketComparator
+from ocs_ci.ocs.resources.s3_bulk_transfer import S3BulkUploader
+from ocs_ci.ocs.resources.s3_data_verifier import S3DataVerifier
 from ocs_ci.utility import templating
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.ssl_certs import get_root_ca_cert
 from ocs_ci.utility.utils import (
@@ -38,6 +44,7 @@ from ocs_ci.utility import version
 from ocs_ci.utility.prometheus import PrometheusAPI
 
 logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
 
 
 def craft_s3_command(cmd, mcg_obj=None, api=False, signed_request_creds=None):
@@ -104,6 +111,36 @@ def craft_s3_command(cmd, mcg_obj=None, api=False, signed_request_creds=None):
     return f"{base_command}{cmd}{string_wrapper}"
 
 
+def craft_s3_batch_command(cmd, args, mcg_obj, api=False, parallelism=8):
+    """
+    Crafts a single command running the given AWS CLI S3 command for many
+    arguments in parallel, so a batch of objects can be transferred
+    in one exec on the pod
+
+    Args:
+        cmd (str): The AWSCLI command to run, every occurrence of {} is
+            replaced by one of the args, quoted for the shell running the
+            command
+        args (list): The arguments to run the command for, e.g. object keys
+        mcg_obj: An MCG class instance
+        api (bool): True if the call is for s3api, false if s3
+        parallelism (int): Number of AWSCLI commands to run in parallel
+
+    Returns:
+        str: The crafted command, ready to be executed on the pod
+
+    """
+    # xargs substitutes the args into the script of the shell running the
+    # AWSCLI command, so they are quoted for that shell and again for the
+    # shell running printf
+    quoted_args = " ".join(shlex.quote(shlex.quote(arg)) for arg in args)
+    script = (
+        f"printf '%s\\0' {quoted_args} | xargs -0 -P {parallelism} -I{{}} "
+        f"{craft_s3_command(cmd, mcg_obj, api=api)}"
+    )
+    return f"sh -c {shlex.quote(script)}"
+
+
 def craft_sts_command(cmd, mcg_obj=None, signed_request_creds=None):
     """
     Crafts the AWS CLI STS command including the
@@ -643,7 +680,14 @@ def get_rgw_restart_counts():
 
 
 def write_individual_s3_objects(
-    mcg_obj, awscli_pod, bucket_factory, downloaded_files, target_dir, bucket_name=None
+    mcg_obj,
+    awscli_pod,
+    bucket_factory,
+    downloaded_files,
+    target_dir,
+    bucket_name=None,
+    parallelism=1,
+    batch_size=1000,
 ):
     """
     Writes objects one by one to an s3 bucket
@@ -656,9 +700,45 @@ def write_individual_s3_objects(
         target_dir (str): The fully qualified path of the download target folder
         bucket_name (str): Name of the bucket
             (default: none)
+        parallelism (int): Number of objects uploaded in parallel on the pod,
+            when bigger than 1 the objects are uploaded in batches of batch_size
+            keys per single exec instead of one exec per object
+        batch_size (int): Number of objects uploaded by a single exec on the pod
 
     """
     bucketname = bucket_name or bucket_factory(1)[0].name
+    secrets = [
+        mcg_obj.access_key_id,
+        mcg_obj.access_key,
+        mcg_obj.s3_internal_endpoint,
+    ]
+    if parallelism > 1:
+        logger.info(
+            f"Writing objects to bucket in batches of {batch_size} "
+            f"with {parallelism} parallel uploads"
+        )
+        uploaded_marker = "UPLOADED:"
+        for i in range(0, len(downloaded_files), batch_size):
+            batch = downloaded_files[i : i + batch_size]
+            output = awscli_pod.exec_cmd_on_pod(
+                command=craft_s3_batch_command(
+                    f"cp --only-show-errors {target_dir}{{}} s3://{bucketname}/{{}} "
+                    f"&& echo {uploaded_marker}{{}}",
+                    batch,
+                    mcg_obj,
+                    parallelism=parallelism,
+                ),
+                out_yaml_format=False,
+                secrets=secrets,
+            )
+            uploaded = {
+                line[len(uploaded_marker) :]
+                for line in output.splitlines()
+                if line.startswith(uploaded_marker)
+            }
+            not_uploaded = [obj_name for obj_name in batch if obj_name not in uploaded]
+            assert not not_uploaded, f"Failed to upload objects: {not_uploaded}"
+        return
     logger.info("Writing objects to bucket")
     for obj_name in downloaded_files:
         full_object_path = f"s3://{bucketname}/{obj_name}"
@@ -666,16 +746,19 @@ def write_individual_s3_objects(
         assert "Completed" in awscli_pod.exec_cmd_on_pod(
             command=craft_s3_command(copycommand, mcg_obj),
             out_yaml_format=False,
-            secrets=[
-                mcg_obj.access_key_id,
-                mcg_obj.access_key,
-                mcg_obj.s3_internal_endpoint,
-            ],
+            secrets=secrets,
         )
 
 
 def upload_parts(
-    mcg_obj, awscli_pod, bucketname, object_key, body_path, upload_id, uploaded_parts
+    mcg_obj,
+    awscli_pod,
+    bucketname,
+    object_key,
+    body_path,
+    upload_id,
+    uploaded_parts,
+    parallelism=1,
 ):
     """
     Uploads individual parts to a bucket
@@ -688,21 +771,22 @@ def upload_parts(
         body_path (str): Path of the directory on the aws pod which contains the parts to be uploaded
         upload_id (str): Multipart Upload-ID
         uploaded_parts (list): list containing the name of the parts to be uploaded
+        parallelism (int): Number of parts uploaded concurrently
 
     Returns:
         list: List containing the ETag of the parts
 
     """
-    parts = []
     secrets = [mcg_obj.access_key_id, mcg_obj.access_key, mcg_obj.s3_internal_endpoint]
-    for count, part in enumerate(uploaded_parts, 1):
+
+    def _upload_part(count, part):
         upload_cmd = (
             f"upload-part --bucket {bucketname} --key {object_key}"
             f" --part-number {count} --body {body_path}/{part}"
             f" --upload-id {upload_id}"
         )
         # upload_cmd will return ETag, upload_id etc which is then split to get just the ETag
-        part = (
+        etag = (
             awscli_pod.exec_cmd_on_pod(
                 command=craft_s3_command(upload_cmd, mcg_obj, api=True),
                 out_yaml_format=False,
@@ -711,8 +795,16 @@ def upload_parts(
             .split('"')[-3]
             .split("\\")[0]
         )
-        parts.append({"PartNumber": count, "ETag": f'"{part}"'})
-    return parts
+        return {"PartNumber": count, "ETag": f'"{etag}"'}
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        return list(
+            executor.map(
+                _upload_part,
+                range(1, len(uploaded_parts) + 1),
+                uploaded_parts,
+            )
+        )
 
 
 def oc_create_aws_backingstore(cld_mgr, backingstore_name, uls_name, region):
@@ -1746,14 +1838,14 @@ def check_cached_objects_by_name(mcg_obj, bucket_name, expected_objects_names=No
         bool: True if all the objects exist in the cache as expected, False otherwise
 
     """
-    res = mcg_obj.send_rpc_query(
+    reply = mcg_obj.get_rpc_reply(
         "object_api",
         "list_objects",
         {
             "bucket": bucket_name,
         },
-    ).json()
-    list_objects_res = [name["key"] for name in res.get("reply").get("objects")]
+    )
+    list_objects_res = [name["key"] for name in reply.get("objects")]
     if not expected_objects_names:
         expected_objects_names = []
 
@@ -2019,11 +2111,9 @@ def bucket_read_api(mcg_obj, bucket_name):
         dict : Bucket policy response
 
     """
-    resp = mcg_obj.send_rpc_query(
+    return mcg_obj.get_rpc_reply(
         "bucket_api", "read_bucket", params={"name": bucket_name}
     )
-    bucket_read_resp = resp.json().get("reply")
-    return bucket_read_resp
 
 
 def get_bucket_available_size(mcg_obj, bucket_name):
@@ -2044,47 +2134,56 @@ def get_bucket_available_size(mcg_obj, bucket_name):
 
 
 def compare_bucket_object_list(
-    mcg_obj, first_bucket_name, second_bucket_name, timeout=600
+    mcg_obj,
+    first_bucket_name,
+    second_bucket_name,
+    timeout=600,
+    compare_etag=False,
+    compare_size=False,
+    second_mcg_obj=None,
 ):
     """
     Compares the object lists of two given buckets
 
+    The buckets are compared by a streaming sorted merge of their listings,
+    and every poll resumes from the last key up to which the buckets were
+    identical, so only counts and a bounded sample of the differences are logged.
+
     Args:
         mcg_obj (MCG): An initialized MCG object
         first_bucket_name (str): The name of the first bucket to compare
         second_bucket_name (str): The name of the second bucket to compare
         timeout (int): The maximum time in seconds to wait for the buckets to be identical
+        compare_etag (bool): Whether to compare also the ETags of the objects
+        compare_size (bool): Whether to compare also the sizes of the objects
+        second_mcg_obj (MCG): An MCG object used to list the second bucket,
+            mcg_obj is used when not provided
 
     Returns:
         bool: True if both buckets contain the same object names in all objects,
         False otherwise
     """
+    comparator = StreamingBucketComparator(
+        mcg_obj,
+        first_bucket_name,
+        second_bucket_name,
+        second_s3_obj=second_mcg_obj,
+        compare_etag=compare_etag,
+        compare_size=compare_size,
+    )
 
     def _comparison_logic():
-        first_bucket_object_set = {
-            obj.key for obj in mcg_obj.s3_list_all_objects_in_bucket(first_bucket_name)
-        }
-        second_bucket_object_set = {
-            obj.key for obj in mcg_obj.s3_list_all_objects_in_bucket(second_bucket_name)
-        }
-        if first_bucket_object_set == second_bucket_object_set:
+        diff = comparator.compare()
+        if diff.identical:
             logger.info(
-                f"""Objects in both buckets are identical
-                {first_bucket_name} objects:
-                {first_bucket_object_set}
-                {second_bucket_name} objects:
-                {second_bucket_object_set}
-                """
+                f"Objects in buckets {first_bucket_name} and {second_bucket_name} "
+                f"are identical, {diff}"
             )
             return True
         else:
             logger.warning(
-                f"""Buckets {first_bucket_name} and {second_bucket_name} do not contain the same objects.
-                    {first_bucket_name} objects:
-                    {first_bucket_object_set}
-                    {second_bucket_name} objects:
-                    {second_bucket_object_set}
-                    """
+                f"Buckets {first_bucket_name} and {second_bucket_name} "
+                f"do not contain the same objects, {diff}"
             )
             return False
 
@@ -2109,6 +2208,8 @@ def write_random_test_objects_to_bucket(
     bs="1M",
     mcg_obj=None,
     s3_creds=None,
+    in_process=False,
+    verifier=None,
 ):
     """
     Write files generated by /dev/urandom to a bucket
@@ -2124,10 +2225,33 @@ def write_random_test_objects_to_bucket(
         mcg_obj (MCG, optional): An MCG class instance
         s3_creds (dict, optional): A dictionary containing S3-compatible credentials
         for writing objects directly to buckets outside of the MCG. Defaults to None.
+        in_process (bool, optional): If True, the objects are generated from a seed and
+        uploaded directly through boto3 by S3DataVerifier. Nothing is written to file_dir,
+        the objects can be verified only with the verifier which uploaded them.
+        Supported only for MCG buckets. Defaults to False.
+        verifier (S3DataVerifier, optional): The verifier uploading the objects in-process,
+        pass it to verify the objects later with its seed. Created from mcg_obj if not set.
 
     Returns:
         list: A list containing the names of the random files that were written
+
+    Raises:
+        ValueError: If in_process is set for a bucket outside of the MCG
+
     """
+    if in_process:
+        if s3_creds or not (mcg_obj or verifier):
+            raise ValueError(
+                "In-process object upload is supported only for MCG buckets"
+            )
+        obj_lst = [f"{pattern}{i}" for i in range(amount)]
+        key_prefix = f"{prefix}/" if prefix else ""
+        verifier = verifier or S3DataVerifier(mcg_obj)
+        verifier.upload_objects(
+            bucket_to_write, [f"{key_prefix}{obj}" for obj in obj_lst], bs
+        )
+        return obj_lst
+
     # Verify that the needed directory exists
     io_pod.exec_cmd_on_pod(f"mkdir -p {file_dir}")
     full_object_path = f"s3://{bucket_to_write}"
@@ -2275,12 +2399,18 @@ def random_object_round_trip_verification(
     cleanup=False,
     result_pod=None,
     result_pod_path=None,
+    in_process=False,
+    bs="1M",
     **kwargs,
 ):
     """
     Writes random objects in a pod, uploads them to a bucket,
     downloads them from the bucket and then compares them.
 
+    With in_process set, the objects are generated from a seed and streamed
+    through boto3 by S3DataVerifier, and their checksums are verified while
+    they are downloaded, without any files or exec calls in the pod.
+
     Args:
         io_pod (ocs_ci.ocs.ocp.OCP): The pod object in which the files should be
         generated and written
@@ -2299,12 +2429,40 @@ def random_object_round_trip_verification(
         s3_creds (dict, optional): A dictionary containing S3-compatible credentials
         for writing objects directly to buckets outside of the MCG. Defaults to None.
         cleanup (bool, optional): A boolean defining whether the files should be cleaned up
-        after the verification.
+        after the verification. In-process, no files are written and the uploaded objects
+        are deleted from the bucket instead.
         result_pod (ocs_ci.ocs.ocp.OCP, optional): A second pod contianing files for comparison
         result_pod_path (str, optional):
             A string containing the path to the directory where the files reside in on the result pod
+        in_process (bool, optional): Generate, upload and verify the objects in-process.
+            Requires mcg_obj and is not supported together with s3_creds or result_pod.
+            Defaults to False.
+        bs (str, optional): The size of the random objects. Defaults to 1M.
+
+    Returns:
+        bool: True if all the written objects were downloaded
 
     """
+    if in_process:
+        if not mcg_obj or s3_creds or result_pod:
+            raise ValueError(
+                "In-process round trip verification requires mcg_obj "
+                "and doesn't support s3_creds or result_pod"
+            )
+        key_prefix = f"{prefix}/" if prefix else ""
+        object_keys = [f"{key_prefix}{pattern}{i}" for i in range(amount)]
+        verifier = S3DataVerifier(mcg_obj)
+        verifier.upload_objects(bucket_name, object_keys, bs)
+        if wait_for_replication:
+            assert compare_bucket_object_list(
+                mcg_obj, bucket_name, second_bucket_name, **kwargs
+            ), f"Objects in the buckets {bucket_name} and {second_bucket_name} are not same"
+        verified_bucket = second_bucket_name if wait_for_replication else bucket_name
+        intact = verifier.verify_objects(verified_bucket, object_keys, bs)
+        if cleanup:
+            verifier.delete_objects(bucket_name, object_keys)
+        return intact
+
     # Verify that all needed directories exist
     io_pod.exec_cmd_on_pod(f"mkdir -p {upload_dir} {download_dir}")
 
@@ -2315,6 +2473,7 @@ def random_object_round_trip_verification(
         amount=amount,
         pattern=pattern,
         prefix=prefix,
+        bs=bs,
         mcg_obj=mcg_obj,
         s3_creds=s3_creds,
     )
@@ -2422,7 +2581,9 @@ def create_aws_bs_using_cli(
     )
 
 
-def upload_bulk_buckets(s3_obj, buckets, amount=1, object_key="obj-key-0", prefix=None):
+def upload_bulk_buckets(
+    s3_obj, buckets, amount=1, object_key="obj-key-0", prefix=None, max_workers=None
+):
     """
     Upload given amount of objects with sequential keys to multiple buckets
 
@@ -2432,8 +2593,22 @@ def upload_bulk_buckets(s3_obj, buckets, amount=1, object_key="obj-key-0", prefi
         amount (int, optional): number of objects to upload per bucket
         object_key (str, optional): base object key
         prefix (str, optional): prefix for the upload path
+        max_workers (int, optional): number of concurrent uploads, when set the
+            objects are uploaded by S3BulkUploader instead of one by one
+
+    Returns:
+        dict: Transfer statistics summary when max_workers is set, None otherwise
 
     """
+    if max_workers:
+        uploader = S3BulkUploader(s3_obj, max_workers=max_workers)
+        return uploader.upload_to_buckets(
+            [bucket.name for bucket in buckets],
+            lambda _: (
+                (f"{prefix}/{object_key}-{index}", object_key)
+                for index in range(amount)
+            ),
+        )
     for bucket in buckets:
         for index in range(amount):
             s3_put_object(
@@ -2632,13 +2807,11 @@ def delete_all_noobaa_buckets(mcg_obj, request):
     buckets = mcg_obj.s3_client.list_buckets()
 
     logger.info("Deleting all buckets and its objects")
-    for bucket in buckets["Buckets"]:
-        logger.info(f"Deleting {bucket} and its objects")
-        s3_bucket = mcg_obj.s3_resource.Bucket(bucket["Name"])
-        delete_all_objects_in_batches(
-            s3_resource=mcg_obj.s3_resource, bucket_name=s3_bucket.name
-        )
-        s3_bucket.delete()
+    bucket_names = [bucket["Name"] for bucket in buckets["Buckets"]]
+    delete_buckets_objects_in_parallel(mcg_obj.s3_resource, bucket_names)
+    for bucket_name in bucket_names:
+        logger.info(f"Deleting bucket {bucket_name}")
+        mcg_obj.s3_resource.Bucket(bucket_name).delete()
 
     def finalizer():
         if "first.bucket" not in mcg_obj.s3_client.list_buckets()["Buckets"]:
@@ -2679,14 +2852,12 @@ def get_nb_bucket_stores(mcg_obj, bucket_name):
         tiers = [d["tier"] for d in bucket_data["tiering"]["tiers"]]
         for tier in tiers:
             # Retry to get the tier data as it might not be available immediately
-            retry_send_rpc_query = retry(CommandFailed, tries=5, delay=5, backoff=1)(
-                mcg_obj.send_rpc_query
+            retry_get_rpc_reply = retry(CommandFailed, tries=5, delay=5, backoff=1)(
+                mcg_obj.get_rpc_reply
             )
-            tier_data = retry_send_rpc_query(
-                "tier_api", "read_tier", {"name": tier}
-            ).json()
+            tier_data = retry_get_rpc_reply("tier_api", "read_tier", {"name": tier})
 
-            stores.update(tier_data["reply"]["attached_pools"])
+            stores.update(tier_data["attached_pools"])
 
     return list(stores)
 
@@ -3046,7 +3217,12 @@ def delete_objects_from_source_and_wait_for_deletion_sync(
 
 
 def list_objects_in_batches(
-    mcg_obj, bucket_name, batch_size=1000, yield_individual=True
+    mcg_obj,
+    bucket_name,
+    batch_size=1000,
+    yield_individual=True,
+    prefix="",
+    start_after="",
 ):
     """
     This method lists objects in a bucket either in batch of mentioned batch_size
@@ -3059,17 +3235,20 @@ def list_objects_in_batches(
         batch_size (int): Number of objects to list at a time, by default 1000
         yield_individual (bool): If True, it will yield indviudal objects until all the
         objects are listed. If False, batch of objects are yielded.
+        prefix (str): List only objects with keys starting with the prefix
+        start_after (str): List only objects with keys after this key, can be used
+            to resume a previous listing
 
     Returns:
         yield: indvidual object key or list containing batch of objects
 
     """
 
-    marker = ""
+    marker = start_after
 
     while True:
         response = s3_list_objects_v2(
-            mcg_obj, bucket_name, max_keys=batch_size, start_after=marker
+            mcg_obj, bucket_name, prefix=prefix, max_keys=batch_size, start_after=marker
         )
         if yield_individual:
             for obj in response.get("Contents", []):
@@ -3486,6 +3665,7 @@ def delete_all_objects_in_batches(
     s3_resource,
     bucket_name,
     parallelize=False,
+    versioned=False,
 ):
     """
     Delete all objects from an S3 bucket in batches.
@@ -3498,6 +3678,7 @@ def delete_all_objects_in_batches(
         s3_resource (S3.Resource): Boto3 S3 resource object
         bucket_name (str): Name of the S3 bucket
         parallelize (bool): If True, delete objects in parallel using threads
+        versioned (bool): If True, delete also all object versions and delete markers
     """
     batch_deleter = S3BatchDeleter(
         s3_resource=s3_resource,
@@ -3506,7 +3687,9 @@ def delete_all_objects_in_batches(
 
     # Delete objects in parallel or sequentially based on the use_parallel flag
     if parallelize:
-        batch_deleter.delete_in_parallel()
+        batch_deleter.delete_pipelined(versioned=versioned)
+    elif versioned:
+        batch_deleter.delete_pipelined(versioned=True, max_workers=1)
     else:
         batch_deleter.delete_sequentially()
 
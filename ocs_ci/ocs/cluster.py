@@ -14,7 +14,6 @@ import threading
 import yaml
 import time
 import os
-import pandas as pd
 import re
 import math
 
@@ -42,6 +41,7 @@ from ocs_ci.ocs.resources import ocs, storage_cluster
 import ocs_ci.ocs.constants as constant
 from ocs_ci.ocs.resources.mcg import MCG
 from ocs_ci.utility import version
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.prometheus import PrometheusAPI
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
@@ -70,6 +70,7 @@ from ocs_ci.ocs.resources.pod import (
 )
 
 logger = logging.getLogger(__name__)
+pd = LazyModule("pandas")
 
 
 class CephClusterMultiCluster(object):
@@ -1448,7 +1449,7 @@ def get_ceph_df_detail(format="json-pretty", out_yaml_format=True):
     )
 
 
-def parse_ceph_df_pools(raw_output: str) -> pd.DataFrame:
+def parse_ceph_df_pools(raw_output: str) -> "pd.DataFrame":
     """
     Parse the 'ceph df detail' command output and extract the POOLS section into a pandas DataFrame.
 
@@ -1503,7 +1504,7 @@ def parse_ceph_df_pools(raw_output: str) -> pd.DataFrame:
     return df
 
 
-def ceph_details_df_to_dict(df: pd.DataFrame) -> dict:
+def ceph_details_df_to_dict(df: "pd.DataFrame") -> dict:
     """
     Convert the DataFrame to a dictionary where the POOL column is the key
     and the rest of the columns form a nested dictionary.
@@ -3747,7 +3748,7 @@ def bring_down_mds_memory_usage_gradually():
     ), "Memory usage remained high for more than 30 minutes. Failed to bring down the memory usage of MDS"
 
 
-def parse_ceph_table_output(raw_output: str) -> pd.DataFrame:
+def parse_ceph_table_output(raw_output: str) -> "pd.DataFrame":
     """
     Parse the Ceph command table output and extract the data into a pandas DataFrame.
     The function assumes that the first row contains the header, with at least two spaces
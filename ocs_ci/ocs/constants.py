@@ -850,6 +850,10 @@ CEPH_KEYRING = "ceph-keyring.j2"
 # YAML paths
 TOOL_POD_YAML = os.path.join(TEMPLATE_DEPLOYMENT_DIR, "toolbox_pod.yaml")
 
+NODE_AGENT_DAEMONSET_YAML = os.path.join(
+    TEMPLATE_DEPLOYMENT_DIR, "node_agent_daemonset.yaml"
+)
+
 CEPHFILESYSTEM_YAML = os.path.join(TEMPLATE_CSI_FS_DIR, "CephFileSystem.yaml")
 
 CEPHBLOCKPOOL_YAML = os.path.join(TEMPLATE_DEPLOYMENT_DIR, "cephblockpool.yaml")
@@ -0,0 +1,326 @@
+"""
+Aggregated view of the DR state of all the clusters of a DR setup
+
+Waiting for the DR resources by polling one cluster after another with
+separate `oc get` calls for every kind of resource makes the detection time
+grow with the number of clusters and resources. The DRStateAggregator reads
+the DR resources and the mirroring status of all the managed clusters and the
+hub concurrently, one combined `oc get` per cluster, and publishes the
+results as snapshots. The wait functions in dr_helpers evaluate their
+conditions on the snapshots of the active aggregator when there is one.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from ocs_ci.framework import ConfigSafeThread, config, config_safe_thread_pool_task
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.utils import get_non_acm_cluster_config
+
+logger = logging.getLogger(__name__)
+
+MANAGED_CLUSTER_KINDS = (
+    constants.VOLUME_REPLICATION_GROUP,
+    constants.VOLUME_REPLICATION,
+    constants.VOLUME_GROUP_REPLICATION,
+    constants.REPLICATION_SOURCE,
+    constants.REPLICATIONDESTINATION,
+    constants.REPLICATION_GROUP_SOURCE,
+)
+HUB_KINDS = (constants.DRPC,)
+
+_active_aggregator = None
+
+
+def get_active_dr_state_aggregator():
+    """
+    Returns:
+        DRStateAggregator: The running aggregator, None if there is none
+
+    """
+    return _active_aggregator
+
+
+@dataclass
+class DRStateSnapshot:
+    """
+    DR resources and mirroring status of all the clusters sampled at one point in time
+
+    The resources are stored per cluster name and kind, a kind which couldn't
+    be read from a cluster is stored as None.
+    """
+
+    timestamp: float
+    resources: dict = field(default_factory=dict)
+    mirroring: dict = field(default_factory=dict)
+    errors: dict = field(default_factory=dict)
+    hub: str = None
+
+    def get_resources(self, cluster, kind, namespace=None, resource_name=None):
+        """
+        Args:
+            cluster (str): Name of the cluster
+            kind (str): Kind of the resources
+            namespace (str): Namespace of the resources, all namespaces if not set
+            resource_name (str): Name of the resource
+
+        Returns:
+            list: Resource dicts, None if the kind wasn't sampled on the cluster
+
+        """
+        items = self.resources.get(cluster, {}).get(kind)
+        if items is None:
+            return None
+        return [
+            item
+            for item in items
+            if (not namespace or item["metadata"].get("namespace") == namespace)
+            and (not resource_name or item["metadata"]["name"] == resource_name)
+        ]
+
+
+class DRStateAggregator:
+    """
+    Sample the DR resources of all the clusters concurrently
+
+    Usage::
+
+        with DRStateAggregator() as dr_state:
+            dr_helpers.failover(...)
+            dr_helpers.wait_for_all_resources_creation(...)
+
+    While the aggregator is running, the waits of dr_helpers evaluate their
+    conditions on its snapshots instead of polling the clusters on their own.
+    """
+
+    def __init__(self, interval=5, include_mirroring=True):
+        """
+        Args:
+            interval (int): Time in seconds between the samples
+            include_mirroring (bool): Sample also the mirroring status of the
+                block pool on the managed clusters
+
+        """
+        self.interval = interval
+        self.include_mirroring = include_mirroring
+        self.managed_clusters = {
+            cluster.ENV_DATA["cluster_name"]: cluster.MULTICLUSTER["multicluster_index"]
+            for cluster in get_non_acm_cluster_config()
+        }
+        self.hub = None
+        hub_index = config.get_active_acm_index()
+        if hub_index is not None:
+            self.hub = config.clusters[hub_index].ENV_DATA["cluster_name"]
+        self.snapshot = None
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def covers(self, cluster, kind):
+        """
+        Args:
+            cluster (str): Name of the cluster
+            kind (str): Kind of the resources
+
+        Returns:
+            bool: True if the kind is sampled on the cluster
+
+        """
+        if cluster == self.hub:
+            return kind in HUB_KINDS
+        return cluster in self.managed_clusters and kind in MANAGED_CLUSTER_KINDS
+
+    def _get_resources(self, kinds):
+        """
+        Get the resources of the current cluster by one combined `oc get`, the
+        kinds are read one by one if the combined call fails, e.g. when some of
+        the CRDs are not installed
+
+        Args:
+            kinds (tuple): Kinds of the resources
+
+        Returns:
+            dict: Kinds mapped to the lists of resources, None for unavailable kinds
+
+        """
+        try:
+            items = OCP(kind=",".join(kinds)).get(all_namespaces=True)["items"]
+            resources = {kind: [] for kind in kinds}
+            for item in items:
+                if item.get("kind") in resources:
+                    resources[item["kind"]].append(item)
+            return resources
+        except CommandFailed as e:
+            logger.debug(
+                f"Combined get of {kinds} failed, reading kinds one by one: {e}"
+            )
+        resources = {}
+        for kind in kinds:
+            try:
+                resources[kind] = OCP(kind=kind).get(all_namespaces=True)["items"]
+            except CommandFailed:
+                resources[kind] = None
+        return resources
+
+    def _sample_cluster(self, cluster_name, is_hub):
+        """
+        Returns:
+            tuple: Resources and mirroring summary of the cluster
+
+        """
+        if is_hub:
+            return self._get_resources(HUB_KINDS), None
+        mirroring = None
+        if self.include_mirroring:
+            from ocs_ci.helpers.dr_helpers import get_mirroring_status_summary
+
+            try:
+                mirroring = get_mirroring_status_summary()
+            except Exception as e:
+                logger.warning(f"Failed to get mirroring status of {cluster_name}: {e}")
+        return self._get_resources(MANAGED_CLUSTER_KINDS), mirroring
+
+    def sample(self):
+        """
+        Sample all the clusters concurrently and publish the snapshot
+
+        Returns:
+            DRStateSnapshot: The new snapshot
+
+        """
+        clusters = dict(self.managed_clusters)
+        if self.hub:
+            clusters[self.hub] = config.get_cluster_index_by_name(self.hub)
+        snapshot = DRStateSnapshot(timestamp=time.time(), hub=self.hub)
+        with ThreadPoolExecutor(max_workers=len(clusters)) as executor:
+            futures = {
+                cluster_name: executor.submit(
+                    config_safe_thread_pool_task,
+                    index,
+                    self._sample_cluster,
+                    cluster_name,
+                    cluster_name == self.hub,
+                )
+                for cluster_name, index in clusters.items()
+            }
+        for cluster_name, future in futures.items():
+            try:
+                resources, mirroring = future.result()
+                snapshot.resources[cluster_name] = resources
+                if mirroring is not None:
+                    snapshot.mirroring[cluster_name] = mirroring
+            except Exception as e:
+                logger.warning(f"Failed to sample DR state of {cluster_name}: {e}")
+                snapshot.errors[cluster_name] = str(e)
+        with self._condition:
+            self.snapshot = snapshot
+            self._condition.notify_all()
+        return snapshot
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            start = time.monotonic()
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"DR state sampling failed: {e}")
+            self._stop_event.wait(max(self.interval - (time.monotonic() - start), 0))
+
+    def start(self):
+        """
+        Start the sampling in a background thread and make this aggregator the
+        active one
+        """
+        global _active_aggregator
+        self._stop_event.clear()
+        self._thread = ConfigSafeThread(
+            config.cur_index, target=self._run, name="dr-state-aggregator", daemon=True
+        )
+        self._thread.start()
+        _active_aggregator = self
+        logger.info(
+            f"Started DR state aggregator of clusters {list(self.managed_clusters)} "
+            f"and hub {self.hub}"
+        )
+
+    def stop(self):
+        """
+        Stop the sampling
+        """
+        global _active_aggregator
+        if _active_aggregator is self:
+            _active_aggregator = None
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        with self._condition:
+            self._condition.notify_all()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def wait_for(
+        self,
+        predicate,
+        timeout=900,
+        description="DR state condition",
+        raise_on=(),
+    ):
+        """
+        Wait until a condition is met on a new snapshot
+
+        Only the snapshots sampled after the call are evaluated, so the
+        condition is never evaluated on a state older than the call.
+
+        Args:
+            predicate (function): Called with the DRStateSnapshot, the
+                condition is met when it returns True, exceptions are treated
+                as the condition not being met
+            timeout (int): Time in seconds to wait
+            description (str): Description of the condition for the logs
+            raise_on (tuple): Exception types raised by the predicate which
+                are re-raised instead of being treated as the condition not
+                being met
+
+        Returns:
+            bool: True if the condition was met, False on timeout
+
+        Raises:
+            Exception: Any exception of the raise_on types raised by the predicate
+
+        """
+        logger.info(f"Waiting for {description} on the DR state snapshots")
+        deadline = time.monotonic() + timeout
+        called = time.time()
+        evaluated = None
+        with self._condition:
+            while True:
+                snapshot = self.snapshot
+                if (
+                    snapshot
+                    and snapshot is not evaluated
+                    and snapshot.timestamp >= called
+                ):
+                    evaluated = snapshot
+                    try:
+                        if predicate(snapshot):
+                            return True
+                    except raise_on:
+                        raise
+                    except Exception as e:
+                        logger.debug(f"Evaluation of {description} failed: {e}")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stop_event.is_set():
+                    logger.error(f"{description} not met within {timeout} seconds")
+                    return False
+                self._condition.wait(remaining)
@@ -0,0 +1,399 @@
+"""
+Timeline of the DR actions with the latencies of the individual recovery phases
+
+The DRActionTimeline samples the DRPC of a workload on the hub and the VRG,
+PVCs and pods of the workload on all the managed clusters while a Failover or
+Relocate action is running, records every state transition with its timestamp
+and computes RPO/RTO style metrics of the action.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from ocs_ci.framework import ConfigSafeThread, config, config_safe_thread_pool_task
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.utils import get_non_acm_cluster_config
+from ocs_ci.utility.utils import ocsci_log_path
+
+logger = logging.getLogger(__name__)
+
+DRPC_TIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+COMPLETED_PHASES = {
+    constants.ACTION_FAILOVER: constants.STATUS_FAILEDOVER,
+    constants.ACTION_RELOCATE: constants.STATUS_RELOCATED,
+}
+WORKLOAD_KINDS = (constants.VOLUME_REPLICATION_GROUP, constants.PVC, constants.POD)
+
+
+def parse_drpc_time(value):
+    """
+    Args:
+        value (str): Timestamp from the DRPC status, e.g. lastGroupSyncTime
+
+    Returns:
+        float: Epoch time, None if the value is not set
+
+    """
+    if not value:
+        return None
+    return (
+        datetime.strptime(value, DRPC_TIME_FORMAT)
+        .replace(tzinfo=timezone.utc)
+        .timestamp()
+    )
+
+
+def _is_pod_ready(pod):
+    for condition in pod.get("status", {}).get("conditions", []):
+        if condition["type"] == "Ready":
+            return condition["status"] == "True"
+    return False
+
+
+class DRActionTimeline:
+    """
+    Record the state transitions of a workload during a DR action
+
+    Usage::
+
+        with DRActionTimeline(
+            constants.ACTION_FAILOVER, drpc_name, drpc_namespace,
+            workload_namespace, target_cluster=secondary_cluster_name,
+        ) as timeline:
+            dr_helpers.failover(..., timeline=timeline)
+            dr_helpers.wait_for_all_resources_creation(...)
+        logger.info(timeline.metrics())
+
+    The milestones of the action are measured from the moment the action was
+    initiated, which is marked by failover/relocate, or from the start of the
+    recording if the action wasn't marked.
+    """
+
+    def __init__(
+        self,
+        action,
+        drpc_name,
+        drpc_namespace,
+        workload_namespace,
+        target_cluster,
+        workload_name=None,
+        expected_pvc_count=None,
+        expected_pod_count=None,
+        interval=5,
+    ):
+        """
+        Args:
+            action (str): constants.ACTION_FAILOVER or constants.ACTION_RELOCATE
+            drpc_name (str): Name of the DRPC of the workload
+            drpc_namespace (str): Namespace of the DRPC on the hub
+            workload_namespace (str): Namespace of the workload on the managed clusters
+            target_cluster (str): Name of the cluster the workload moves to
+            workload_name (str): Name of the workload used in the results
+            expected_pvc_count (int): Number of PVCs of the workload
+            expected_pod_count (int): Number of pods of the workload
+            interval (int): Time in seconds between the samples
+
+        """
+        self.action = action
+        self.drpc_name = drpc_name
+        self.drpc_namespace = drpc_namespace
+        self.workload_namespace = workload_namespace
+        self.target_cluster = target_cluster
+        self.workload_name = workload_name or workload_namespace
+        self.expected_pvc_count = expected_pvc_count
+        self.expected_pod_count = expected_pod_count
+        self.interval = interval
+        self.managed_clusters = {
+            cluster.ENV_DATA["cluster_name"]: cluster.MULTICLUSTER["multicluster_index"]
+            for cluster in get_non_acm_cluster_config()
+        }
+        self.hub_index = config.get_active_acm_index()
+        self.events = []
+        self.marks = {}
+        self.milestones = {}
+        self.last_group_sync_time = None
+        self.start_time = None
+        self.stop_time = None
+        self._states = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @property
+    def action_start(self):
+        """
+        Returns:
+            float: Epoch time the action was initiated
+
+        """
+        return self.marks.get("action_initiated", self.start_time)
+
+    def mark(self, name):
+        """
+        Record a named point in time, e.g. the moment the DRPC was patched
+
+        Args:
+            name (str): Name of the mark
+
+        """
+        with self._lock:
+            self.marks[name] = time.time()
+        logger.info(f"DR timeline of {self.workload_name}: {name}")
+
+    def _get_drpc_state(self):
+        drpc = OCP(
+            kind=constants.DRPC,
+            namespace=self.drpc_namespace,
+            resource_name=self.drpc_name,
+        ).get()
+        status = drpc.get("status", {})
+        return {
+            "phase": status.get("phase"),
+            "progression": status.get("progression"),
+            "lastGroupSyncTime": status.get("lastGroupSyncTime"),
+        }
+
+    def _get_workload_state(self):
+        try:
+            items = OCP(
+                kind=",".join(WORKLOAD_KINDS), namespace=self.workload_namespace
+            ).get()["items"]
+        except CommandFailed as e:
+            logger.debug(f"Failed to get the workload resources: {e}")
+            items = []
+        state = {kind: {} for kind in WORKLOAD_KINDS}
+        for item in items:
+            name = item["metadata"]["name"]
+            if item["kind"] == constants.VOLUME_REPLICATION_GROUP:
+                state[item["kind"]][name] = item.get("status", {}).get("state")
+            elif item["kind"] == constants.PVC:
+                state[item["kind"]][name] = item.get("status", {}).get("phase")
+            elif item["kind"] == constants.POD:
+                state[item["kind"]][name] = _is_pod_ready(item)
+        return state
+
+    def sample(self):
+        """
+        Sample the DRPC and the workload on all the clusters concurrently and
+        record the transitions
+        """
+        now = time.time()
+        with ThreadPoolExecutor(max_workers=len(self.managed_clusters) + 1) as executor:
+            hub_future = executor.submit(
+                config_safe_thread_pool_task, self.hub_index, self._get_drpc_state
+            )
+            cluster_futures = {
+                cluster_name: executor.submit(
+                    config_safe_thread_pool_task, index, self._get_workload_state
+                )
+                for cluster_name, index in self.managed_clusters.items()
+            }
+        observations = {}
+        try:
+            drpc_state = hub_future.result()
+            for field in ("phase", "progression"):
+                observations[("hub", constants.DRPC, self.drpc_name, field)] = (
+                    drpc_state[field]
+                )
+            if self.last_group_sync_time is None and drpc_state["lastGroupSyncTime"]:
+                self.last_group_sync_time = drpc_state["lastGroupSyncTime"]
+        except Exception as e:
+            logger.warning(f"Failed to sample DRPC {self.drpc_name}: {e}")
+        target_state = None
+        for cluster_name, future in cluster_futures.items():
+            try:
+                state = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to sample workload on {cluster_name}: {e}")
+                continue
+            if cluster_name == self.target_cluster:
+                target_state = state
+            for kind, resources in state.items():
+                for name, value in resources.items():
+                    observations[(cluster_name, kind, name, "state")] = value
+        with self._lock:
+            self._record_transitions(now, observations)
+            if target_state is not None:
+                self._record_milestones(now, observations, target_state)
+
+    def _record_transitions(self, now, observations):
+        for key, value in observations.items():
+            if key in self._states and self._states[key] == value:
+                continue
+            self._states[key] = value
+            cluster, kind, name, field = key
+            self.events.append(
+                {
+                    "time": now,
+                    "cluster": cluster,
+                    "kind": kind,
+                    "name": name,
+                    "field": field,
+                    "value": value,
+                }
+            )
+
+    def _record_milestones(self, now, observations, target_state):
+        def _reached(name, condition):
+            if name not in self.milestones and condition:
+                self.milestones[name] = now
+                logger.info(f"DR timeline of {self.workload_name}: {name} reached")
+
+        phase = observations.get(("hub", constants.DRPC, self.drpc_name, "phase"))
+        _reached("drpc_completed", phase == COMPLETED_PHASES.get(self.action))
+        vrgs = target_state[constants.VOLUME_REPLICATION_GROUP].values()
+        _reached("vrg_primary", vrgs and all(state == "Primary" for state in vrgs))
+        pvcs = target_state[constants.PVC].values()
+        _reached(
+            "pvcs_bound",
+            pvcs
+            and len(pvcs) >= (self.expected_pvc_count or 0)
+            and all(state == constants.STATUS_BOUND for state in pvcs),
+        )
+        pods = target_state[constants.POD].values()
+        _reached(
+            "pods_ready",
+            pods and len(pods) >= (self.expected_pod_count or 0) and all(pods),
+        )
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            start = time.monotonic()
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"DR timeline sampling failed: {e}")
+            self._stop_event.wait(max(self.interval - (time.monotonic() - start), 0))
+
+    def start(self):
+        """
+        Start the recording in a background thread
+        """
+        self.start_time = time.time()
+        self._stop_event.clear()
+        self._thread = ConfigSafeThread(
+            config.cur_index, target=self._run, name="dr-timeline", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"Started DR timeline of {self.action} of {self.workload_name} "
+            f"to {self.target_cluster}"
+        )
+
+    def stop(self):
+        """
+        Stop the recording, the last transitions are captured by a final sample
+        """
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+            try:
+                self.sample()
+            except Exception as e:
+                logger.warning(f"DR timeline sampling failed: {e}")
+        self.stop_time = time.time()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        logger.info(f"DR timeline metrics: {self.metrics()}")
+        self.export()
+
+    def phase_durations(self):
+        """
+        Returns:
+            list: DRPC phases in the order they were observed, every phase as
+                a dict with its name, the time it was entered relative to the
+                action start and its duration in seconds
+
+        """
+        transitions = [
+            event
+            for event in self.events
+            if event["kind"] == constants.DRPC and event["field"] == "phase"
+        ]
+        end = self.stop_time or time.time()
+        phases = []
+        for index, event in enumerate(transitions):
+            left = (
+                transitions[index + 1]["time"] if index + 1 < len(transitions) else end
+            )
+            phases.append(
+                {
+                    "phase": event["value"],
+                    "entered": round(event["time"] - self.action_start, 3),
+                    "duration": round(left - event["time"], 3),
+                }
+            )
+        return phases
+
+    def metrics(self):
+        """
+        Compute the metrics of the action
+
+        RPO is the time between the last group sync before the action and the
+        action start, RTO is the time from the action start until all the pods
+        of the workload are ready on the target cluster.
+
+        Returns:
+            dict: Metrics of the action, the times are in seconds
+
+        """
+        last_sync = parse_drpc_time(self.last_group_sync_time)
+        milestones = {
+            name: round(reached - self.action_start, 3)
+            for name, reached in self.milestones.items()
+        }
+        return {
+            "workload": self.workload_name,
+            "action": self.action,
+            "target_cluster": self.target_cluster,
+            "action_start": self.action_start,
+            "rpo": round(self.action_start - last_sync, 3) if last_sync else None,
+            "rto": milestones.get("pods_ready"),
+            "milestones": milestones,
+            "phases": self.phase_durations(),
+        }
+
+    def export(self, path=None):
+        """
+        Export the metrics and the transitions to a JSON file
+
+        Args:
+            path (str): Path of the file, a file in the logs directory if not set
+
+        Returns:
+            str: Path of the file
+
+        """
+        if not path:
+            path = os.path.join(
+                ocsci_log_path(),
+                f"dr_timeline_{self.workload_name}_{self.action.lower()}_"
+                f"{int(self.start_time or time.time())}.json",
+            )
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._lock:
+            data = {
+                "metrics": self.metrics(),
+                "marks": dict(self.marks),
+                "events": [
+                    dict(event, elapsed=round(event["time"] - self.action_start, 3))
+                    for event in self.events
+                ],
+            }
+        with open(path, "w") as f:
+            json.dump(data, f)
+        logger.info(f"DR timeline exported to {path}")
+        return path
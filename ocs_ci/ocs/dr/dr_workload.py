@@ -9,9 +9,10 @@ import tempfile
 import time
 import yaml
 
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import TimeoutExpired
 
-from ocs_ci.framework import config
+from ocs_ci.framework import config, config_safe_thread_pool_task
 from ocs_ci.helpers import dr_helpers, helpers
 from ocs_ci.helpers.cnv_helpers import create_vm_secret, cal_md5sum_vm
 from ocs_ci.helpers.dr_helpers import (
@@ -24,6 +25,7 @@ from ocs_ci.helpers.helpers import (
 )
 from ocs_ci.ocs import constants, ocp
 from ocs_ci.ocs.cnv.virtual_machine import VirtualMachine
+from ocs_ci.ocs.dr.dr_timeline import DRActionTimeline
 from ocs_ci.ocs.exceptions import (
     TimeoutExpiredError,
     CommandFailed,
@@ -31,6 +33,7 @@ from ocs_ci.ocs.exceptions import (
     ResourceNotDeleted,
     ResourceWrongStatusException,
 )
+from ocs_ci.ocs.resources.drpc import get_drpc_name
 from ocs_ci.ocs.resources.pod import get_all_pods
 from ocs_ci.ocs.utils import get_primary_cluster_config, get_non_acm_cluster_config
 from ocs_ci.utility import templating
@@ -51,6 +54,8 @@ class DRWorkload(object):
         self.workload_name = workload_name
         self.workload_repo_url = workload_repo_url
         self.workload_repo_branch = workload_repo_branch
+        # Set when the workload repo was already cloned for a batch deployment
+        self.prereqs_deployed = False
 
     def deploy_workload(self):
         raise NotImplementedError("Method not implemented")
@@ -61,6 +66,57 @@ class DRWorkload(object):
     def delete_workload(self):
         raise NotImplementedError("Method not implemented")
 
+    def get_drpc_reference(self):
+        """
+        Get the DRPC protecting the workload
+
+        Returns:
+            tuple: Name and namespace of the DRPC on the hub
+
+        """
+        workload_type = getattr(self, "workload_type", None)
+        if workload_type == constants.APPLICATION_SET:
+            placement_name = getattr(self, "appset_placement_name", None) or getattr(
+                self, "cnv_workload_placement_name"
+            )
+            return f"{placement_name}-drpc", constants.GITOPS_CLUSTER_NAMESPACE
+        if workload_type == constants.DISCOVERED_APPS:
+            return self.discovered_apps_placement_name, constants.DR_OPS_NAMESPACE
+        with config.RunWithAcmConfigContext():
+            drpc_name = get_drpc_name(self.workload_namespace)
+        return drpc_name, self.workload_namespace
+
+    def dr_action_timeline(self, action, target_cluster, **kwargs):
+        """
+        Create a timeline recording a DR action of the workload
+
+        Args:
+            action (str): constants.ACTION_FAILOVER or constants.ACTION_RELOCATE
+            target_cluster (str): Name of the cluster the workload moves to
+            **kwargs: Other arguments of DRActionTimeline, e.g. interval
+
+        Returns:
+            DRActionTimeline: The timeline, to be used as a context manager
+                around the action
+
+        """
+        drpc_name, drpc_namespace = self.get_drpc_reference()
+        kwargs.setdefault(
+            "expected_pvc_count", getattr(self, "workload_pvc_count", None)
+        )
+        kwargs.setdefault(
+            "expected_pod_count", getattr(self, "workload_pod_count", None)
+        )
+        return DRActionTimeline(
+            action,
+            drpc_name,
+            drpc_namespace,
+            self.workload_namespace,
+            target_cluster,
+            workload_name=self.workload_name or self.workload_namespace,
+            **kwargs,
+        )
+
 
 class BusyBox(DRWorkload):
     """
@@ -524,6 +580,8 @@ class BusyBox(DRWorkload):
         Perform prerequisites
 
         """
+        if self.prereqs_deployed:
+            return
         # Clone workload repo
         clone_repo(
             url=self.workload_repo_url,
@@ -828,6 +886,8 @@ class BusyBox_AppSet(DRWorkload):
         Perform prerequisites
 
         """
+        if self.prereqs_deployed:
+            return
         # Clone workload repo
         clone_repo(
             url=self.workload_repo_url,
@@ -1177,6 +1237,8 @@ class CnvWorkload(DRWorkload):
         Perform prerequisites
 
         """
+        if self.prereqs_deployed:
+            return
         # Clone workload repo
         if not CnvWorkload._repo_cloned:
             CnvWorkload._repo_cloned = True
@@ -1473,6 +1535,8 @@ class BusyboxDiscoveredApps(DRWorkload):
         Perform prerequisites
 
         """
+        if self.prereqs_deployed:
+            return
         # Clone workload repo
         clone_repo(
             url=self.workload_repo_url,
@@ -1888,6 +1952,8 @@ class CnvWorkloadDiscoveredApps(DRWorkload):
         Perform prerequisites
 
         """
+        if self.prereqs_deployed:
+            return
         # Clone workload repo
         clone_repo(
             url=self.workload_repo_url,
@@ -2119,3 +2185,159 @@ class CnvWorkloadDiscoveredApps(DRWorkload):
                 ocp_obj = ocp.OCP()
                 ocp_obj.delete_project(project_name=self.workload_namespace)
                 log.info(f"Project {self.workload_namespace} deleted successfully")
+
+
+def _run_in_parallel(workloads, task, max_workers=None):
+    """
+    Run a task of every workload in a separate config safe thread
+
+    Args:
+        workloads (list): DR workload objects
+        task (function): Called with a workload
+        max_workers (int): Number of workloads processed at the same time,
+            all of them if not set
+
+    Returns:
+        dict: Workloads mapped to the exceptions raised by their tasks
+
+    """
+    restore_index = config.cur_thread_index
+    failures = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers or len(workloads)) as executor:
+            futures = {
+                workload: executor.submit(
+                    config_safe_thread_pool_task, restore_index, task, workload
+                )
+                for workload in workloads
+            }
+        for workload, future in futures.items():
+            if future.exception():
+                failures[workload] = future.exception()
+    finally:
+        # The workload methods switch the context of the threads, which also
+        # changes the current index of the main thread
+        config.switch_ctx(restore_index)
+    return failures
+
+
+def parallel_workload_operations_enabled():
+    """
+    Check if the DR workloads are deployed and deleted in parallel
+
+    Returns:
+        bool: True if ENV_DATA dr_parallel_workload_operations is set
+
+    """
+    return bool(config.ENV_DATA.get("dr_parallel_workload_operations", False))
+
+
+def deploy_workloads(workloads, parallel=None, max_workers=None, **kwargs):
+    """
+    Deploy multiple DR workloads
+
+    The workloads are deployed one after another unless parallel deployment
+    is enabled. In parallel mode the workload repositories are cloned once
+    before the deployment, then all the workloads create their placements,
+    DRPCs and applications at the same time and wait for their resources in
+    parallel, so the deployment takes about as long as the slowest workload.
+
+    Args:
+        workloads (list): DR workload objects
+        parallel (bool): True to deploy the workloads concurrently, ENV_DATA
+            dr_parallel_workload_operations is used if not set
+        max_workers (int): Number of workloads deployed at the same time in
+            parallel mode, all of them if not set
+        **kwargs: Arguments passed to deploy_workload of every workload
+
+    Raises:
+        Exception: The exception of the first workload whose deployment failed
+
+    """
+    if not workloads:
+        return
+    if parallel is None:
+        parallel = parallel_workload_operations_enabled()
+    if not parallel:
+        for workload in workloads:
+            workload.deploy_workload(**kwargs)
+        return
+    if not config.ENV_DATA.get("deploy_via_cli"):
+        # The workloads share the clone of the repository, cloning it from
+        # multiple threads would reset the files the other workloads modified
+        cloned = set()
+        for workload in workloads:
+            clone = (workload.workload_repo_url, workload.target_clone_dir)
+            if clone not in cloned:
+                workload.prereqs_deployed = False
+                workload._deploy_prereqs()
+                cloned.add(clone)
+            workload.prereqs_deployed = True
+    log.info(f"Deploying {len(workloads)} DR workloads in parallel")
+    start = time.time()
+    try:
+        failures = _run_in_parallel(
+            workloads, lambda workload: workload.deploy_workload(**kwargs), max_workers
+        )
+    finally:
+        for workload in workloads:
+            workload.prereqs_deployed = False
+    for workload, exception in failures.items():
+        log.error(
+            f"Deployment of workload {workload.workload_name} in namespace "
+            f"{workload.workload_namespace} failed: {exception}"
+        )
+    if failures:
+        raise next(iter(failures.values()))
+    log.info(f"Deployed {len(workloads)} DR workloads in {time.time() - start:.1f}s")
+
+
+def delete_workloads(workloads, parallel=None, max_workers=None, **kwargs):
+    """
+    Delete multiple DR workloads
+
+    The workloads are deleted one after another unless parallel deletion is
+    enabled.
+
+    Args:
+        workloads (list): DR workload objects
+        parallel (bool): True to delete the workloads concurrently, ENV_DATA
+            dr_parallel_workload_operations is used if not set
+        max_workers (int): Number of workloads deleted at the same time in
+            parallel mode, all of them if not set
+        **kwargs: Arguments passed to delete_workload of every workload,
+            e.g. switch_ctx
+
+    Raises:
+        ResourceNotDeleted: In case resources of any of the workloads were
+            not deleted properly
+
+    """
+    if not workloads:
+        return
+    if parallel is None:
+        parallel = parallel_workload_operations_enabled()
+    start = time.time()
+    if parallel:
+        log.info(f"Deleting {len(workloads)} DR workloads in parallel")
+        failures = _run_in_parallel(
+            workloads, lambda workload: workload.delete_workload(**kwargs), max_workers
+        )
+    else:
+        failures = {}
+        for workload in workloads:
+            try:
+                workload.delete_workload(**kwargs)
+            except ResourceNotDeleted as e:
+                failures[workload] = e
+    if failures:
+        for workload, exception in failures.items():
+            log.error(
+                f"Deletion of workload {workload.workload_name} in namespace "
+                f"{workload.workload_namespace} failed: {exception}"
+            )
+        raise ResourceNotDeleted(
+            "Deletion failed for the workload in following namespaces: "
+            f"{[workload.workload_namespace for workload in failures]}"
+        )
+    log.info(f"Deleted {len(workloads)} DR workloads in {time.time() - start:.1f}s")
@@ -820,3 +820,9 @@ class PodStabilityError(Exception):
     """Raised when pods show signs of instability (Restarts or OOMKills)"""
 
     pass
+
+
+class NodeAgentUnavailable(Exception):
+    """Raised when the node agent can't be used to execute a command on a node"""
+
+    pass
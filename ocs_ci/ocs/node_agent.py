@@ -0,0 +1,283 @@
+"""
+Persistent privileged node agents used to execute commands on the OCP nodes
+
+Every `oc debug node` call schedules, starts and tears down a new debug pod.
+The node agent DaemonSet runs one long-lived privileged pod with host PID and
+network on every node, and the commands are executed in those pods via
+`oc exec` followed by `chroot /host`, which is much faster and allows to run
+commands on all the nodes in parallel.
+
+The node agent mode is enabled by `use_node_agent` in the RUN section of the
+config, `OCP.exec_oc_debug_cmd` falls back to `oc debug` when the agent is
+not available.
+"""
+
+import logging
+import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, NodeAgentUnavailable
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility import templating
+from ocs_ci.utility.utils import TimeoutSampler
+
+logger = logging.getLogger(__name__)
+
+NODE_AGENT_NAME = "ocs-ci-node-agent"
+NODE_AGENT_NAMESPACE = "ocs-ci-node-agent"
+NODE_AGENT_LABEL = "app=ocs-ci-node-agent"
+CMD_FAILED_MSG = "CMD FAILED"
+
+# One node agent per cluster, keyed by the cluster name
+_node_agents = {}
+_node_agents_lock = threading.Lock()
+
+
+class NodeAgent:
+    """
+    Node agent DaemonSet of a single cluster
+    """
+
+    def __init__(self, namespace=NODE_AGENT_NAMESPACE):
+        """
+        Args:
+            namespace (str): Namespace of the node agent DaemonSet
+
+        """
+        self.namespace = namespace
+        self.pod_ocp = OCP(kind=constants.POD, namespace=namespace)
+        self.daemonset_ocp = OCP(kind=constants.DAEMONSET, namespace=namespace)
+        self._pods_by_node = {}
+        self._lock = threading.Lock()
+
+    def deploy(self, timeout=300):
+        """
+        Create the node agent DaemonSet if it doesn't exist and wait for its pods
+
+        Args:
+            timeout (int): Time in seconds to wait for the pods to be ready
+
+        Raises:
+            NodeAgentUnavailable: If the node agent pods are not ready in time
+
+        """
+        if not self.daemonset_ocp.is_exist(resource_name=NODE_AGENT_NAME):
+            from ocs_ci.helpers.helpers import add_scc_policy, create_resource
+
+            logger.info(f"Deploying node agent DaemonSet in namespace {self.namespace}")
+            self.create_namespace()
+            add_scc_policy(sa_name="default", namespace=self.namespace)
+            daemonset_data = templating.load_yaml(constants.NODE_AGENT_DAEMONSET_YAML)
+            daemonset_data["metadata"]["namespace"] = self.namespace
+            create_resource(**daemonset_data)
+        try:
+            for ready in TimeoutSampler(timeout, 5, self._all_pods_ready):
+                if ready:
+                    break
+        except Exception as e:
+            raise NodeAgentUnavailable(f"Node agent pods are not ready: {e}")
+        self.refresh_pods()
+
+    def create_namespace(self):
+        """
+        Create the privileged namespace of the node agent, an existing
+        namespace is reused. Unlike `oc new-project`, the current project of
+        the kubeconfig is not changed.
+        """
+        namespace_ocp = OCP(kind=constants.NAMESPACE)
+        try:
+            namespace_ocp.exec_oc_cmd(
+                f"create namespace {self.namespace}", out_yaml_format=False
+            )
+        except CommandFailed as e:
+            if "AlreadyExists" not in str(e):
+                raise
+            logger.info(f"Namespace {self.namespace} already exists")
+        namespace_ocp.add_label(
+            resource_name=self.namespace,
+            label=(
+                "security.openshift.io/scc.podSecurityLabelSync=false "
+                f"pod-security.kubernetes.io/enforce={constants.PSA_PRIVILEGED} "
+                f"pod-security.kubernetes.io/warn={constants.PSA_PRIVILEGED} --overwrite"
+            ),
+        )
+
+    def _all_pods_ready(self):
+        """
+        Returns:
+            bool: True if the node agent pods are ready on all the Ready nodes,
+                the pods on NotReady nodes can't become ready and the
+                commands on those nodes fall back to `oc debug`
+
+        """
+        status = self.daemonset_ocp.get(resource_name=NODE_AGENT_NAME)["status"]
+        nodes = OCP(kind=constants.NODE).get()["items"]
+        ready_nodes = [
+            node
+            for node in nodes
+            if any(
+                condition["type"] == "Ready" and condition["status"] == "True"
+                for condition in node.get("status", {}).get("conditions", [])
+            )
+        ]
+        return status.get("desiredNumberScheduled", 0) > 0 and status.get(
+            "numberReady", 0
+        ) >= len(ready_nodes)
+
+    def refresh_pods(self):
+        """
+        Refresh the mapping of the node names to the running node agent pods
+        """
+        pods = self.pod_ocp.get(selector=NODE_AGENT_LABEL)["items"]
+        with self._lock:
+            self._pods_by_node = {
+                pod["spec"]["nodeName"]: pod["metadata"]["name"]
+                for pod in pods
+                if pod.get("status", {}).get("phase") == constants.STATUS_RUNNING
+            }
+
+    def get_pod_name(self, node):
+        """
+        Args:
+            node (str): Name of the node
+
+        Returns:
+            str: Name of the node agent pod running on the node
+
+        Raises:
+            NodeAgentUnavailable: If there is no running node agent pod on the node
+
+        """
+        if node not in self._pods_by_node:
+            self.refresh_pods()
+        try:
+            return self._pods_by_node[node]
+        except KeyError:
+            raise NodeAgentUnavailable(f"No running node agent pod on node {node}")
+
+    def exec_cmd(self, node, cmd_list, timeout=300, use_root=True):
+        """
+        Execute commands on a node, the same way as `OCP.exec_oc_debug_cmd`
+
+        Args:
+            node (str): Node name where the commands are executed
+            cmd_list (list): List of commands eg: ['cmd1', 'cmd2']
+            timeout (int): Timeout of the execution in seconds
+            use_root (bool): If True, the commands are executed in chroot /host
+
+        Returns:
+            str: Output of the executed commands
+
+        Raises:
+            CommandFailed: When failure in command execution
+            NodeAgentUnavailable: If the node agent pod of the node is not
+                available or `oc exec` into it fails, e.g. on a NotReady node
+
+        """
+        cmd = f" || echo '{CMD_FAILED_MSG}';".join(list(cmd_list) + [" "])
+        root_option = "chroot /host /bin/bash -c" if use_root else "/bin/bash -c"
+        pod_name = self.get_pod_name(node)
+        try:
+            out = self.pod_ocp.exec_oc_cmd(
+                command=f"exec {pod_name} -- {root_option} {shlex.quote(cmd)}",
+                out_yaml_format=False,
+                timeout=timeout,
+            )
+        except CommandFailed as e:
+            # The failures of the commands are reported by CMD_FAILED_MSG in
+            # the output, so the exec itself failed, e.g. the pod was
+            # recreated or the kubelet of the node is not reachable. The next
+            # call looks up the pod of the node again.
+            with self._lock:
+                self._pods_by_node.pop(node, None)
+            raise NodeAgentUnavailable(
+                f"Exec into node agent pod {pod_name} failed: {e}"
+            )
+        out = str(out)
+        if CMD_FAILED_MSG in out:
+            raise CommandFailed(f"Command failed on node {node}: {out}")
+        return out
+
+    def exec_cmd_on_nodes(self, nodes, cmd_list, timeout=300, use_root=True):
+        """
+        Execute the same commands on multiple nodes in parallel
+
+        Args:
+            nodes (list): Names of the nodes
+            cmd_list (list): List of commands eg: ['cmd1', 'cmd2']
+            timeout (int): Timeout of the execution on a single node in seconds
+            use_root (bool): If True, the commands are executed in chroot /host
+
+        Returns:
+            dict: Node names mapped to the output of the commands
+
+        """
+        with ThreadPoolExecutor(max_workers=max(len(nodes), 1)) as executor:
+            outputs = executor.map(
+                lambda node: self.exec_cmd(node, cmd_list, timeout, use_root), nodes
+            )
+            return dict(zip(nodes, outputs))
+
+    def delete(self):
+        """
+        Delete the node agent namespace together with the DaemonSet
+        """
+        logger.info(f"Deleting node agent namespace {self.namespace}")
+        OCP(kind=constants.NAMESPACE).delete(resource_name=self.namespace, wait=False)
+        with self._lock:
+            self._pods_by_node = {}
+
+
+def get_node_agent():
+    """
+    Get the node agent of the current cluster, it is deployed on the first use
+
+    Returns:
+        NodeAgent: The node agent of the current cluster
+
+    Raises:
+        NodeAgentUnavailable: If the node agent can't be deployed
+
+    """
+    cluster_name = config.ENV_DATA.get("cluster_name")
+    with _node_agents_lock:
+        if cluster_name not in _node_agents:
+            node_agent = NodeAgent()
+            try:
+                node_agent.deploy()
+            except (CommandFailed, NodeAgentUnavailable) as e:
+                # Don't try to deploy the agent again on every command
+                _node_agents[cluster_name] = None
+                raise NodeAgentUnavailable(f"Failed to deploy node agent: {e}")
+            _node_agents[cluster_name] = node_agent
+        if not _node_agents[cluster_name]:
+            raise NodeAgentUnavailable(
+                f"Node agent deployment failed earlier on cluster {cluster_name}"
+            )
+        return _node_agents[cluster_name]
+
+
+def node_agent_enabled():
+    """
+    Returns:
+        bool: True if the commands on nodes should be executed by the node agent
+
+    """
+    return bool(config.RUN.get("use_node_agent"))
+
+
+def delete_node_agents():
+    """
+    Delete the node agents deployed on all the clusters
+    """
+    with _node_agents_lock:
+        for cluster_name, node_agent in list(_node_agents.items()):
+            if node_agent:
+                with config.RunWithConfigContext(
+                    config.get_cluster_index_by_name(cluster_name)
+                ):
+                    node_agent.delete()
+            del _node_agents[cluster_name]
@@ -15,6 +15,7 @@ import copy
 
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
+    NodeAgentUnavailable,
     NotSupportedFunctionError,
     NonUpgradedImagesFoundError,
     ResourceWrongStatusException,
@@ -243,7 +244,32 @@ class OCP(object):
         self, node, cmd_list, timeout=300, namespace="default", use_root=True
     ):
         """
-        Function to execute "oc debug" command on OCP node
+        Function to execute "oc debug" command on OCP node, the command is
+        retried when it fails
+
+        Args:
+            node (str): Node name where the command to be executed
+            cmd_list (list): List of commands eg: ['cmd1', 'cmd2']
+            timeout (int): timeout for the exec_oc_cmd, defaults to 600 seconds
+            namespace (str): Namespace name which will be used to create debug pods
+            use_root (bool): If True, the commands are executed in chroot /host
+
+        Returns:
+            out (str): Returns output of the executed command/commands
+
+        Raises:
+            CommandFailed: When failure in command execution
+        """
+        return self.exec_oc_debug_cmd_once(
+            node, cmd_list, timeout=timeout, namespace=namespace, use_root=use_root
+        )
+
+    def exec_oc_debug_cmd_once(
+        self, node, cmd_list, timeout=300, namespace="default", use_root=True
+    ):
+        """
+        Function to execute "oc debug" command on OCP node without retries,
+        for the commands which must not run later than they were scheduled
 
         Args:
             node (str): Node name where the command to be executed
@@ -259,6 +285,15 @@ class OCP(object):
         Raises:
             CommandFailed: When failure in command execution
         """
+        from ocs_ci.ocs import node_agent
+
+        if node_agent.node_agent_enabled():
+            try:
+                return node_agent.get_node_agent().exec_cmd(
+                    node, cmd_list, timeout=timeout, use_root=use_root
+                )
+            except NodeAgentUnavailable as e:
+                log.warning(f"Node agent is not available, using oc debug: {e}")
         # Appending one empty value in list for string manipulation
         create_cmd_list = copy.deepcopy(cmd_list)
         create_cmd_list.append(" ")
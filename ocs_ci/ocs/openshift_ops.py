@@ -2,15 +2,17 @@ import os
 import logging
 from shutil import which
 
-from kubernetes import config
-from openshift.dynamic import DynamicClient, exceptions
 
 from ocs_ci.framework import config as ocsci_config
 from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.utils import get_openshift_client, run_cmd
 import ocs_ci.ocs.defaults as default
 
 log = logging.getLogger(__name__)
+config = LazyModule("kubernetes.config")
+dynamic = LazyModule("openshift.dynamic")
+exceptions = LazyModule("openshift.dynamic.exceptions")
 
 
 # DEPRECATED - DO NOT USE #
@@ -24,7 +26,7 @@ class OCP(object):
     def __init__(self):
 
         k8s_client = config.new_client_from_config()
-        dyn_client = DynamicClient(k8s_client)
+        dyn_client = dynamic.DynamicClient(k8s_client)
 
         self.v1_service_list = dyn_client.resources.get(
             api_version="v1", kind="ServiceList"
@@ -1,13 +1,14 @@
 import datetime
 import logging
 
-import boto3
 
 from ocs_ci.ocs import constants
 from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
 from ocs_ci.utility import version
+from ocs_ci.utility.lazy_import import LazyModule
 
 logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
 
 
 class HttpResponseParser(object):
@@ -8,9 +8,9 @@ import tempfile
 from time import sleep
 import time
 
-import boto3
 import botocore.config
-from botocore.client import ClientError
+import requests
+from botocore.exceptions import ClientError
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
@@ -28,6 +28,7 @@ from ocs_ci.ocs.exceptions import (
     UnsupportedPlatformError,
 )
 from ocs_ci.ocs.ocp import OCP
+from ocs_ci.ocs.resources.noobaa_rpc import NoobaaRPCClient, RPCResponseDict
 from ocs_ci.ocs.resources.pod import (
     get_noobaa_pods,
     get_pods_having_label,
@@ -35,6 +36,7 @@ from ocs_ci.ocs.resources.pod import (
     wait_for_pods_to_be_running,
 )
 from ocs_ci.utility import templating, version
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility.utils import (
     get_attr_chain,
@@ -53,6 +55,7 @@ from ocs_ci.helpers.helpers import (
 import subprocess
 
 logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
 
 
 class MCG:
@@ -73,7 +76,9 @@ class MCG:
         noobaa_user,
         noobaa_password,
         data_to_mask,
-    ) = (None,) * 12
+        _rpc_client,
+    ) = (None,) * 13
+    _native_rpc_available = True
 
     def __init__(self, *args, **kwargs):
         """
@@ -220,9 +225,7 @@ class MCG:
             dict: A dictionary with information about MCG resources
 
         """
-        return self.send_rpc_query("system_api", "read_system", params={}).json()[
-            "reply"
-        ]
+        return self.get_rpc_reply("system_api", "read_system", params={})
 
     def get_bucket_info(self, bucket_name):
         """
@@ -324,21 +327,68 @@ class MCG:
         """
         return bucketname in self.cli_get_all_bucket_names()
 
+    @property
+    def rpc_client(self):
+        """
+        Native NooBaa RPC client reusing its connection and auth token between
+        the calls, created on first use
+
+        Returns:
+            NoobaaRPCClient: The RPC client
+
+        """
+        if not self._rpc_client:
+            self._rpc_client = NoobaaRPCClient(
+                mgmt_endpoint=self.mgmt_endpoint,
+                email=self.noobaa_user,
+                password=self.noobaa_password,
+                verify=retrieve_verification_mode(),
+            )
+        return self._rpc_client
+
+    @property
+    def use_native_rpc(self):
+        """
+        Returns:
+            bool: True if RPC queries are sent by the native client instead of the CLI
+
+        """
+        return self._native_rpc_available and config.ENV_DATA.get("mcg_native_rpc")
+
     def send_rpc_query(self, api, method, params=None):
         """
         Templates and sends an RPC query to the MCG mgmt endpoint
 
+        The query is sent by the native RPC client when the mcg_native_rpc
+        option in ENV_DATA is enabled, and falls back to the CLI if the
+        mgmt endpoint is not reachable.
+
         Args:
             api: The name of the API to use
             method: The method to use inside the API
             params: A dictionary containing the command payload
 
         Returns:
-            The server's response
+            RPCResponseDict: The server's response with the reply under the
+                'reply' key. A failed call of the native client returns the
+                error under the 'error' key while the CLI raises CommandFailed,
+                use get_rpc_reply to get the reply of both
 
         """
 
         masked_params = mask_secrets(str(params), self.data_to_mask)
+        if self.use_native_rpc:
+            logger.info(
+                f"Sending MCG RPC query via native client:\n{api} {method} {masked_params}"
+            )
+            try:
+                return self.rpc_client.send(api, method, params)
+            except requests.exceptions.ConnectionError as e:
+                logger.warning(
+                    f"The MCG mgmt endpoint is not reachable, falling back to the CLI: {e}"
+                )
+                self._native_rpc_available = False
+
         logger.info(
             f"Sending MCG RPC query via mcg-cli:\n{api} {method} {masked_params}"
         )
@@ -347,13 +397,51 @@ class MCG:
             f"api {api} {method} '{json.dumps(params)}' -ojson"
         )
 
-        # This class is needed to add a json method to the response dict
-        # which is needed to support existing usage
-        class CLIResponseDict(dict):
-            def json(self):
-                return self
+        # The json method is needed to support existing usage
+        return RPCResponseDict({"reply": json.loads(cli_output.stdout)})
 
-        return CLIResponseDict({"reply": json.loads(cli_output.stdout)})
+    def get_rpc_reply(self, api, method, params=None):
+        """
+        Send an RPC query and get its reply
+
+        Args:
+            api (str): The name of the API to use
+            method (str): The method to use inside the API
+            params (dict): The command payload
+
+        Returns:
+            dict: The reply of the server
+
+        Raises:
+            CommandFailed: If the RPC call failed
+
+        """
+        response = self.send_rpc_query(api, method, params)
+        response.raise_for_error()
+        return response.get("reply")
+
+    def send_rpc_queries(self, queries):
+        """
+        Send multiple RPC queries, concurrently over one connection pool when
+        the native RPC client is used
+
+        Args:
+            queries (list): List of (api, method, params) tuples
+
+        Returns:
+            list: The server's responses in the order of the queries
+
+        """
+        if self.use_native_rpc:
+            logger.info(f"Sending batch of {len(queries)} MCG RPC queries")
+            try:
+                return self.rpc_client.send_batch(queries)
+            except requests.exceptions.ConnectionError as e:
+                logger.warning(
+                    f"The MCG mgmt endpoint is not reachable, falling back to the CLI: {e}"
+                )
+                self._native_rpc_available = False
+        return [self.send_rpc_query(*query) for query in queries]
 
     def check_data_reduction(self, bucketname, expected_reduction_in_bytes):
         """
@@ -369,13 +457,11 @@ class MCG:
         """
 
         def _retrieve_reduction_data():
-            resp = self.send_rpc_query(
+            reply = self.get_rpc_reply(
                 "bucket_api", "read_bucket", params={"name": bucketname}
             )
-            bucket_data = resp.json().get("reply").get("data").get("size")
-            bucket_data_reduced = (
-                resp.json().get("reply").get("data").get("size_reduced")
-            )
+            bucket_data = reply.get("data").get("size")
+            bucket_data_reduced = reply.get("data").get("size_reduced")
             logger.info(
                 "Overall bytes stored: "
                 + str(bucket_data)
@@ -807,30 +893,20 @@ class MCG:
 
         def _get_mirroring_percentage():
             results = []
-            obj_list = (
-                self.send_rpc_query(
-                    "object_api", "list_objects", params={"bucket": bucket_name}
-                )
-                .json()
-                .get("reply")
-                .get("objects")
-            )
+            obj_list = self.get_rpc_reply(
+                "object_api", "list_objects", params={"bucket": bucket_name}
+            ).get("objects")
 
             for written_object in obj_list:
-                object_chunks = (
-                    self.send_rpc_query(
-                        "object_api",
-                        "read_object_mapping",
-                        params={
-                            "bucket": bucket_name,
-                            "key": written_object.get("key"),
-                            "obj_id": written_object.get("obj_id"),
-                        },
-                    )
-                    .json()
-                    .get("reply")
-                    .get("chunks")
-                )
+                object_chunks = self.get_rpc_reply(
+                    "object_api",
+                    "read_object_mapping",
+                    params={
+                        "bucket": bucket_name,
+                        "key": written_object.get("key"),
+                        "obj_id": written_object.get("obj_id"),
+                    },
+                ).get("chunks")
 
                 for object_chunk in object_chunks:
                     mirror_blocks = object_chunk.get("frags")[0].get("blocks")
@@ -1227,6 +1303,8 @@ class MCG:
         self.access_key = admin_credentials["AWS_SECRET_ACCESS_KEY"]
         self.noobaa_user = admin_credentials["email"]
         self.noobaa_password = admin_credentials["password"]
+        # The RPC client has to authenticate with the new credentials
+        self._rpc_client = None
 
         self.data_to_mask.extend(flatten_multilevel_dict(admin_credentials))
 
@@ -1271,6 +1349,7 @@ class MCG:
 
         self.exec_mcg_cmd(cmd)
         self.noobaa_password = new_password
+        self._rpc_client = None
 
         logger.info("Waiting a bit for the change to propogate through the system...")
         sleep(15)
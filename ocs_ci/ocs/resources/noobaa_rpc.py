@@ -0,0 +1,183 @@
+"""
+Native client of the NooBaa management RPC API
+"""
+
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ocs_ci.ocs.exceptions import CommandFailed
+
+logger = logging.getLogger(__name__)
+
+# RPC error codes which mean the cached auth token has to be renewed
+AUTH_ERROR_CODES = ("UNAUTHORIZED", "FORBIDDEN")
+
+
+class RPCResponseDict(dict):
+    """
+    RPC response with the json method of the previously used requests response
+    """
+
+    def json(self):
+        return self
+
+    def raise_for_error(self):
+        """
+        Raise the error of a failed RPC call, like the mcg-cli does
+
+        Raises:
+            CommandFailed: If the response contains an error
+
+        """
+        error = self.get("error")
+        if error:
+            raise CommandFailed(
+                f"NooBaa RPC call failed: {error.get('rpc_code')} {error.get('message')}"
+            )
+
+
+class NoobaaRPCClient:
+    """
+    Client sending RPC calls directly to the NooBaa mgmt endpoint over HTTP
+
+    A single HTTP session is reused for all the calls, so the connections to the
+    endpoint stay open between the polls, and the auth token is created once
+    and cached until NooBaa rejects it.
+    """
+
+    def __init__(
+        self, mgmt_endpoint, email, password, verify=False, timeout=120, pool_size=8
+    ):
+        """
+        Args:
+            mgmt_endpoint (str): URL of the NooBaa mgmt RPC endpoint
+            email (str): Email of the NooBaa admin user
+            password (str): Password of the NooBaa admin user
+            verify (str|bool): SSL verification mode of the requests
+            timeout (int): Timeout in seconds of a single RPC call
+            pool_size (int): Number of connections kept open to the endpoint,
+                it is also the maximal number of calls sent concurrently by
+                send_batch
+
+        """
+        self.mgmt_endpoint = mgmt_endpoint
+        self.email = email
+        self.password = password
+        self.verify = verify
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._token = None
+        self._token_lock = threading.Lock()
+
+    def _post(self, api, method, params, auth_token=None):
+        """
+        Send a single RPC call
+
+        Returns:
+            dict: The decoded RPC response
+
+        """
+        payload = {"api": api, "method": method, "params": params or {}}
+        if auth_token:
+            payload["auth_token"] = auth_token
+        response = self.session.post(
+            url=self.mgmt_endpoint,
+            data=json.dumps(payload),
+            verify=self.verify,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @property
+    def token(self):
+        """
+        Returns:
+            str: Cached auth token of the NooBaa admin user
+
+        """
+        with self._token_lock:
+            if not self._token:
+                logger.info("Creating NooBaa RPC auth token")
+                response = self._post(
+                    "auth_api",
+                    "create_auth",
+                    {
+                        "role": "admin",
+                        "system": "noobaa",
+                        "email": self.email,
+                        "password": self.password,
+                    },
+                )
+                if "error" in response:
+                    raise CommandFailed(
+                        f"Failed to create NooBaa RPC auth token: "
+                        f"{response['error'].get('message')}"
+                    )
+                self._token = response["reply"]["token"]
+            return self._token
+
+    def invalidate_token(self):
+        """
+        Drop the cached auth token, a new one is created by the next call
+        """
+        with self._token_lock:
+            self._token = None
+
+    def send(self, api, method, params=None):
+        """
+        Send an RPC call, the auth token is renewed once if NooBaa rejects it
+
+        Args:
+            api (str): The name of the API to use
+            method (str): The method to use inside the API
+            params (dict): The command payload
+
+        Returns:
+            RPCResponseDict: The server's response with the reply under the
+                'reply' key and the error of a failed call under the 'error' key
+
+        """
+        response = self._post(api, method, params, self.token)
+        error = response.get("error")
+        if error and error.get("rpc_code") in AUTH_ERROR_CODES:
+            logger.info("NooBaa RPC auth token was rejected, renewing it")
+            self.invalidate_token()
+            response = self._post(api, method, params, self.token)
+            error = response.get("error")
+        if error:
+            logger.warning(
+                f"NooBaa RPC call {api} {method} failed: "
+                f"{error.get('rpc_code')} {error.get('message')}"
+            )
+            return RPCResponseDict({"reply": response.get("reply"), "error": error})
+        return RPCResponseDict({"reply": response.get("reply")})
+
+    def send_batch(self, queries):
+        """
+        Send multiple RPC calls concurrently over the shared connection pool
+
+        Args:
+            queries (list): List of (api, method, params) tuples
+
+        Returns:
+            list: RPCResponseDict responses in the order of the queries
+
+        """
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(lambda query: self.send(*query), queries))
+
+    def close(self):
+        """
+        Close the connections of the HTTP session
+        """
+        self.session.close()
@@ -4,8 +4,7 @@ import logging
 import tempfile
 from abc import ABC, abstractmethod
 
-import boto3
-import botocore
+import botocore.exceptions
 
 from ocs_ci.framework import config
 from ocs_ci.framework.pytest_customization.marks import get_current_test_marks
@@ -30,10 +29,12 @@ from ocs_ci.ocs.resources.mcg_replication_policy import McgReplicationPolicy
 from ocs_ci.ocs.resources.rgw import RGW
 from ocs_ci.ocs.utils import oc_get_all_obc_names
 from ocs_ci.utility import templating, version
+from ocs_ci.utility.lazy_import import LazyModule
 from ocs_ci.utility.utils import TimeoutSampler, mask_secrets
 from time import sleep
 
 logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
 
 
 class OBC(object):
@@ -142,7 +142,7 @@ class PVC(OCS):
         Returns:
             str: Reclaim policy. eg: Reclaim, Delete
         """
-        return self.backed_pv_obj.get().get("spec").get("persistentVolumeReclaimPolicy")
+        return self.backed_pv_obj.data.get("spec").get("persistentVolumeReclaimPolicy")
 
     @property
     def provisioner(self):
@@ -158,7 +158,7 @@ class PVC(OCS):
         Returns:
             str: Image name associated with the RBD PVC
         """
-        return self.backed_pv_obj.get()["spec"]["csi"]["volumeAttributes"]["imageName"]
+        return self.backed_pv_obj.data["spec"]["csi"]["volumeAttributes"]["imageName"]
 
     @property
     def get_cephfs_subvolume_name(self):
@@ -168,7 +168,7 @@ class PVC(OCS):
         Returns:
             str: Subvolume name associated with the CephFS PVC
         """
-        return self.backed_pv_obj.get()["spec"]["csi"]["volumeAttributes"][
+        return self.backed_pv_obj.data["spec"]["csi"]["volumeAttributes"][
             "subvolumeName"
         ]
 
@@ -180,7 +180,7 @@ class PVC(OCS):
         Returns:
             str: volume handle name from pv
         """
-        return self.backed_pv_obj.get()["spec"]["csi"]["volumeHandle"]
+        return self.backed_pv_obj.data["spec"]["csi"]["volumeHandle"]
 
     def resize_pvc(self, new_size, verify=False, timeout=240):
         """
@@ -386,6 +386,49 @@ def get_all_pvc_objs(namespace=None, selector=None):
     return [PVC(**pvc) for pvc in all_pvcs["items"]]
 
 
+def get_pvc_backend_volumes(namespace=None, selector=None):
+    """
+    Resolve the backend volumes of all the PVCs in a namespace at once
+
+    The PVCs and the PVs are listed by a single call each and joined by the
+    volume name of the PVCs, instead of fetching the PV of every PVC separately.
+
+    Args:
+        namespace (str): Name of namespace
+        selector (str): The label selector of the PVCs
+
+    Returns:
+        dict: PVC names mapped to dictionaries with the 'pv', 'storage_class',
+            'driver', 'volume_handle', 'rbd_image' and 'cephfs_subvolume' of
+            the PVCs, the values not applicable to the volume are None.
+            PVCs which are not bound to a PV are not included.
+
+    """
+    if not namespace:
+        namespace = config.ENV_DATA["cluster_namespace"]
+    pvcs = OCP(kind=constants.PVC, namespace=namespace).get(selector=selector)
+    pvs = {pv["metadata"]["name"]: pv for pv in OCP(kind=constants.PV).get()["items"]}
+    backend_volumes = {}
+    for pvc in pvcs["items"]:
+        pv = pvs.get(pvc["spec"].get("volumeName"))
+        if not pv:
+            continue
+        csi = pv["spec"].get("csi", {})
+        volume_attributes = csi.get("volumeAttributes", {})
+        backend_volumes[pvc["metadata"]["name"]] = {
+            "pv": pv["metadata"]["name"],
+            "storage_class": pvc["spec"].get("storageClassName"),
+            "driver": csi.get("driver"),
+            "volume_handle": csi.get("volumeHandle"),
+            "rbd_image": volume_attributes.get("imageName"),
+            "cephfs_subvolume": volume_attributes.get("subvolumeName"),
+        }
+    log.info(
+        f"Resolved backend volumes of {len(backend_volumes)} PVCs in namespace {namespace}"
+    )
+    return backend_volumes
+
+
 def get_all_pvcs_in_storageclass(storage_class):
     """
     This function returen all the PVCs in a given storage class
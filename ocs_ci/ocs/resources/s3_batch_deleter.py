@@ -1,6 +1,11 @@
 import logging
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.utility.rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -9,10 +14,60 @@ logger = logging.getLogger(__name__)
 # 1GB memory usage
 MAX_OBJS_TO_KEEP_IN_MEMORY = 150000
 
+# Use 2 threads per CPU core to boost performance in I/O-bound S3 deletions,
+# but cap at 16 to prevent resource exhaustion on high-core systems.
+DEFAULT_MAX_WORKERS = min(multiprocessing.cpu_count() * 2, 16)
+
+# Interval in seconds between the progress reports of a running deletion
+PROGRESS_LOG_INTERVAL = 30
+
+
+class DeletionProgress:
+    """
+    Thread-safe counters of a running deletion
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self.start_time = time.monotonic()
+        self._last_log = self.start_time
+        self.listed = 0
+        self.deleted = 0
+        self.failed = 0
+
+    def add_listed(self, count):
+        with self._lock:
+            self.listed += count
+
+    def add_deleted(self, deleted, failed):
+        with self._lock:
+            self.deleted += deleted
+            self.failed += failed
+            now = time.monotonic()
+            if now - self._last_log >= PROGRESS_LOG_INTERVAL:
+                self._last_log = now
+                logger.info(f"Deletion progress of {self.name}: {self}")
+
+    @property
+    def rate(self):
+        """
+        Returns:
+            float: Number of deleted objects per second
+
+        """
+        return self.deleted / max(time.monotonic() - self.start_time, 1e-9)
+
+    def __str__(self):
+        return (
+            f"listed {self.listed}, deleted {self.deleted}, failed {self.failed}, "
+            f"{self.rate:.1f} objects/s"
+        )
+
 
 class S3BatchDeleter:
     """
-    This class offers two ways to clear all objects from an S3 bucket:
+    This class offers three ways to clear all objects from an S3 bucket:
 
     1. Sequentially: Deletes objects in batches of 1000 sequentially.
     Use this for typical cases with manageable object counts.
@@ -20,42 +75,64 @@ class S3BatchDeleter:
     2. In parallel: Deletes objects in batches of 1000 using multiple threads.
     This method is designed for extreme cases where the bucket has hundreds of thousands
     of objects, and should only be used for scale and cleanup purposes.
+
+    3. Pipelined: The listing runs in a producer thread feeding a bounded queue
+    of batches which are deleted by parallel workers, so the listing and the
+    deletion overlap and the amount of objects kept in memory is capped.
+    Versioned buckets are supported by deleting all the versions and delete markers.
     """
 
     MAX_BATCH_SIZE = 1000
 
-    def __init__(self, s3_resource, bucket_name):
+    def __init__(self, s3_resource, bucket_name, rate_limiter=None):
+        """
+        Args:
+            s3_resource (S3.Resource): Boto3 S3 resource object
+            bucket_name (str): Name of the S3 bucket
+            rate_limiter (RateLimiter): Limiter of the DeleteObjects requests,
+                can be shared between multiple deleters
+
+        """
         self.s3_resource = s3_resource
         self.s3_client = s3_resource.meta.client
         self.bucket_name = bucket_name
         self.bucket = s3_resource.Bucket(bucket_name)
+        self.rate_limiter = rate_limiter or RateLimiter(None)
+        self.progress = DeletionProgress(f"bucket '{bucket_name}'")
 
     def _delete_batch(self, objects_batch):
         """
         Delete a batch of objects from the S3 bucket.
         Args:
-            objects_batch (list): List of dictionaries with object keys to delete.
+            objects_batch (list): List of dictionaries with object keys
+                (and version IDs) to delete.
         Returns:
             tuple: Number of deleted objects and a list of errors.
         """
+        self.rate_limiter.acquire()
         try:
-            response = self.bucket.delete_objects(Delete={"Objects": objects_batch})
+            response = self.s3_client.delete_objects(
+                Bucket=self.bucket_name, Delete={"Objects": objects_batch}
+            )
             num_deleted = len(response.get("Deleted", []))
             errors = response.get("Errors", [])
             logger.debug(f"Deleted batch of {num_deleted} objects")
             return num_deleted, errors
         except Exception as e:
             logger.error(f"Exception during batch deletion: {e}")
-            return [], [{"Key": obj["Key"], "Error": str(e)} for obj in objects_batch]
+            return 0, [dict(obj, Error=str(e)) for obj in objects_batch]
 
     def _retry_failed(self, all_errors):
         if not all_errors:
             return
         logger.warning(f"{len(all_errors)} objects failed to delete, retrying once...")
-        failed_keys = [e["Key"] for e in all_errors]
+        failed_objs = [
+            {k: v for k, v in e.items() if k in ("Key", "VersionId")}
+            for e in all_errors
+        ]
         retry_batches = [
-            [{"Key": k} for k in failed_keys[i : i + self.MAX_BATCH_SIZE]]
-            for i in range(0, len(failed_keys), self.MAX_BATCH_SIZE)
+            failed_objs[i : i + self.MAX_BATCH_SIZE]
+            for i in range(0, len(failed_objs), self.MAX_BATCH_SIZE)
         ]
 
         final_errors = []
@@ -69,6 +146,43 @@ class S3BatchDeleter:
                 f"Deletion failed for {len(final_errors)} objects: {final_errors}"
             )
 
+    def is_versioned(self):
+        """
+        Returns:
+            bool: True if versioning is enabled or suspended on the bucket
+
+        """
+        status = self.s3_client.get_bucket_versioning(Bucket=self.bucket_name).get(
+            "Status"
+        )
+        return status in ("Enabled", "Suspended")
+
+    def _list_batches(self, versioned):
+        """
+        List the objects of the bucket page by page
+
+        Args:
+            versioned (bool): If True, list all the object versions and delete markers
+
+        Yields:
+            list: Batch of dictionaries with object keys (and version IDs) to delete
+
+        """
+        if versioned:
+            paginator = self.s3_client.get_paginator("list_object_versions")
+            for page in paginator.paginate(Bucket=self.bucket_name):
+                batch = [
+                    {"Key": obj["Key"], "VersionId": obj["VersionId"]}
+                    for obj in page.get("Versions", []) + page.get("DeleteMarkers", [])
+                ]
+                # A page can contain up to 1000 versions and 1000 delete markers
+                for i in range(0, len(batch), self.MAX_BATCH_SIZE):
+                    yield batch[i : i + self.MAX_BATCH_SIZE]
+        else:
+            paginator = self.s3_client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket_name):
+                yield [{"Key": obj["Key"]} for obj in page.get("Contents", [])]
+
     def delete_sequentially(self):
         """
         Delete all objects from the S3 bucket in batches sequentially.
@@ -80,15 +194,10 @@ class S3BatchDeleter:
         total_deleted = 0
         all_errors = []
 
-        paginator = self.s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=self.bucket_name)
-
-        for page in pages:
-            objects = page.get("Contents", [])
-            if not objects:
+        for obj_keys in self._list_batches(versioned=False):
+            if not obj_keys:
                 continue
 
-            obj_keys = [{"Key": obj["Key"]} for obj in objects]
             num_deleted, errors = self._delete_batch(obj_keys)
             total_deleted += num_deleted
             all_errors.extend(errors)
@@ -96,7 +205,7 @@ class S3BatchDeleter:
         logger.info(f"Deleted {total_deleted} objects from bucket '{self.bucket_name}'")
         self._retry_failed(all_errors)
 
-    def delete_in_parallel(self):
+    def delete_in_parallel(self, max_workers=DEFAULT_MAX_WORKERS):
         """
         Delete all objects from the S3 bucket in parallel using multiple threads.
 
@@ -104,65 +213,123 @@ class S3BatchDeleter:
         hundreds of thousands of objects and should only be used for scale
         and cleanup purposes.
 
-        This method uses a ThreadPoolExecutor to process batches of objects concurrently.
-        It is designed to optimize deletion performance by leveraging multiple threads,
-        while also managing memory usage to avoid excessive resource consumption.
+        Args:
+            max_workers (int): Number of threads deleting the batches
 
         Raises:
             Exception: If any objects fail to delete after a retry attempt.
         """
+        self.delete_pipelined(versioned=False, max_workers=max_workers)
 
-        queued_obj_count = 0
-        total_deleted = 0
+    def delete_pipelined(self, versioned=None, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Delete all objects from the S3 bucket by a producer/consumer pipeline.
+
+        A producer thread lists the bucket page by page and puts the batches
+        into a bounded queue which is consumed by parallel DeleteObjects workers.
+        The size of the queue keeps at most MAX_OBJS_TO_KEEP_IN_MEMORY objects
+        in memory regardless of the amount of objects in the bucket.
+
+        Args:
+            versioned (bool): If True, delete all object versions and delete
+                markers, detected from the bucket versioning status if not set
+            max_workers (int): Number of threads deleting the batches
+
+        Raises:
+            Exception: If any objects fail to delete after a retry attempt.
+        """
+        if versioned is None:
+            versioned = self.is_versioned()
+        logger.info(
+            f"Starting pipelined deletion in bucket '{self.bucket_name}' "
+            f"(versioned: {versioned}) using a max of {max_workers} threads"
+        )
+        self.progress = DeletionProgress(f"bucket '{self.bucket_name}'")
+        batches = queue.Queue(maxsize=MAX_OBJS_TO_KEEP_IN_MEMORY // self.MAX_BATCH_SIZE)
+        errors_lock = threading.Lock()
         failed_deletions = []
-        futures = []
+        producer_errors = []
+
+        def _producer():
+            try:
+                for batch in self._list_batches(versioned):
+                    if batch:
+                        self.progress.add_listed(len(batch))
+                        batches.put(batch)
+            except Exception as e:
+                logger.error(f"Listing of bucket '{self.bucket_name}' failed: {e}")
+                producer_errors.append(e)
+            finally:
+                for _ in range(max_workers):
+                    batches.put(None)
+
+        def _consumer():
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    return
+                num_deleted, errors = self._delete_batch(batch)
+                self.progress.add_deleted(num_deleted, len(errors))
+                if errors:
+                    with errors_lock:
+                        failed_deletions.extend(errors)
+
+        producer = threading.Thread(target=_producer, daemon=True)
+        producer.start()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in range(max_workers):
+                executor.submit(_consumer)
+        producer.join()
 
-        # Use 2 threads per CPU core to boost performance in I/O-bound S3 deletions,
-        # but cap at 16 to prevent resource exhaustion on high-core systems.
-        max_workers = min(multiprocessing.cpu_count() * 2, 16)
         logger.info(
-            f"Starting threaded deletion in bucket '{self.bucket_name}' using a max of {max_workers} threads"
+            f"Deleted {self.progress.deleted} objects from bucket "
+            f"'{self.bucket_name}': {self.progress}"
         )
+        if producer_errors:
+            raise producer_errors[0]
+        self._retry_failed(failed_deletions)
 
-        paginator = self.s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=self.bucket_name)
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            for page in pages:
-
-                # Skip in case of no objects - rare but possible edge case
-                page_contents = page.get("Contents", [])
-                if not page_contents:
-                    continue
-
-                current_batch = [{"Key": obj["Key"]} for obj in page_contents]
-                queued_obj_count += len(current_batch)
-                futures.append(executor.submit(self._delete_batch, current_batch))
-
-                if queued_obj_count >= MAX_OBJS_TO_KEEP_IN_MEMORY:
-                    logger.info(
-                        (
-                            f"Queued {queued_obj_count} objects for deletion. "
-                            "waiting for threads to finish..."
-                        )
-                    )
-
-                    for future in as_completed(futures):
-                        num_deleted, errors = future.result()
-                        total_deleted += num_deleted
-                        failed_deletions.extend(errors)
-                        logger.info(
-                            f"So far deleted {total_deleted} objects from bucket '{self.bucket_name}'"
-                        )
+def delete_buckets_objects_in_parallel(
+    s3_resource,
+    bucket_names,
+    max_buckets=4,
+    max_workers_per_bucket=DEFAULT_MAX_WORKERS,
+    requests_per_second=None,
+):
+    """
+    Delete all objects from multiple buckets concurrently, each bucket by its
+    own deletion pipeline
 
-                    queued_obj_count = 0
-                    futures = []
+    Args:
+        s3_resource (S3.Resource): Boto3 S3 resource object
+        bucket_names (list): Names of the S3 buckets
+        max_buckets (int): Number of buckets cleared at the same time
+        max_workers_per_bucket (int): Number of deletion threads per bucket
+        requests_per_second (float): Limit of DeleteObjects requests per second
+            shared by all the buckets, no limit if not set
 
-            # Wait for any remaining threads to finish
-            for future in as_completed(futures):
-                num_deleted, errors = future.result()
-                total_deleted += num_deleted
-                failed_deletions.extend(errors)
+    Raises:
+        Exception: If clearing of any of the buckets failed
 
-        logger.info(f"Deleted {total_deleted} objects from bucket '{self.bucket_name}'")
-        self._retry_failed(failed_deletions)
+    """
+    rate_limiter = RateLimiter(requests_per_second)
+    deleters = [
+        S3BatchDeleter(s3_resource, bucket_name, rate_limiter=rate_limiter)
+        for bucket_name in bucket_names
+    ]
+    logger.info(f"Deleting objects of {len(deleters)} buckets, {max_buckets} at a time")
+    with ThreadPoolExecutor(max_workers=max_buckets) as executor:
+        futures = [
+            executor.submit(
+                deleter.delete_pipelined, max_workers=max_workers_per_bucket
+            )
+            for deleter in deleters
+        ]
+    failures = [future.exception() for future in futures if future.exception()]
+    logger.info(
+        f"Deleted {sum(deleter.progress.deleted for deleter in deleters)} objects "
+        f"from {len(deleters)} buckets"
+    )
+    if failures:
+        raise Exception(f"Deletion failed for {len(failures)} buckets: {failures}")
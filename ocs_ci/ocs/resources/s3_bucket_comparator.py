@@ -0,0 +1,215 @@
+"""
+Streaming comparison of the object listings of two S3 buckets
+"""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of differing keys of each kind kept for reporting
+DEFAULT_MAX_SAMPLES = 20
+
+
+def iter_bucket_objects(
+    s3_client, bucket_name, prefix="", start_after="", page_size=1000
+):
+    """
+    Lazily iterate over the objects of a bucket in the S3 listing order
+
+    Only one page of the listing is kept in memory at a time.
+
+    Args:
+        s3_client (obj): boto3 S3 client
+        bucket_name (str): Name of the bucket
+        prefix (str): List only objects with keys starting with the prefix
+        start_after (str): List only objects with keys after this key
+        page_size (int): Number of objects requested per list_objects_v2 call
+
+    Yields:
+        dict: Object entry of the list_objects_v2 response
+
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    pages = paginator.paginate(
+        Bucket=bucket_name,
+        Prefix=prefix,
+        StartAfter=start_after,
+        PaginationConfig={"PageSize": page_size},
+    )
+    for page in pages:
+        yield from page.get("Contents", [])
+
+
+class BucketDiff:
+    """
+    Result of a bucket comparison with counts and a bounded sample of differences
+    """
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+        self.matched = 0
+        self.missing_in_first = 0
+        self.missing_in_second = 0
+        self.mismatched = 0
+        self.missing_in_first_sample = []
+        self.missing_in_second_sample = []
+        self.mismatched_sample = []
+
+    def _add(self, sample, item):
+        if len(sample) < self.max_samples:
+            sample.append(item)
+
+    def add_missing_in_first(self, key):
+        self.missing_in_first += 1
+        self._add(self.missing_in_first_sample, key)
+
+    def add_missing_in_second(self, key):
+        self.missing_in_second += 1
+        self._add(self.missing_in_second_sample, key)
+
+    def add_mismatched(self, key, reason):
+        self.mismatched += 1
+        self._add(self.mismatched_sample, (key, reason))
+
+    @property
+    def identical(self):
+        return not (self.missing_in_first or self.missing_in_second or self.mismatched)
+
+    def __str__(self):
+        summary = (
+            f"matched: {self.matched}, missing in first: {self.missing_in_first}, "
+            f"missing in second: {self.missing_in_second}, "
+            f"mismatched: {self.mismatched}"
+        )
+        if self.identical:
+            return summary
+        return (
+            f"{summary}\n"
+            f"sample of keys missing in first: {self.missing_in_first_sample}\n"
+            f"sample of keys missing in second: {self.missing_in_second_sample}\n"
+            f"sample of mismatched keys: {self.mismatched_sample}"
+        )
+
+
+class StreamingBucketComparator:
+    """
+    Compare the objects of two buckets by a sorted merge of their paged listings
+
+    Both listings are consumed lazily, so the memory usage doesn't depend on the
+    amount of objects. The comparator remembers the last key up to which both
+    buckets were identical and the following comparisons resume the listing
+    from that key instead of re-listing the buckets from scratch. This fits
+    replication checks where the already replicated objects are not expected
+    to change between the polls.
+    """
+
+    def __init__(
+        self,
+        first_s3_obj,
+        first_bucket_name,
+        second_bucket_name,
+        second_s3_obj=None,
+        prefix="",
+        compare_etag=False,
+        compare_size=False,
+        max_samples=DEFAULT_MAX_SAMPLES,
+        page_size=1000,
+    ):
+        """
+        Args:
+            first_s3_obj (obj): MCG or OBC object used to list the first bucket
+            first_bucket_name (str): Name of the first bucket
+            second_bucket_name (str): Name of the second bucket
+            second_s3_obj (obj): MCG or OBC object used to list the second bucket,
+                first_s3_obj is used when not provided
+            prefix (str): Compare only objects with keys starting with the prefix
+            compare_etag (bool): Whether to compare also the ETags of the objects
+            compare_size (bool): Whether to compare also the sizes of the objects
+            max_samples (int): Maximal number of differing keys of each kind to report
+            page_size (int): Number of objects requested per list_objects_v2 call
+
+        """
+        self.first_client = first_s3_obj.s3_client
+        self.second_client = (second_s3_obj or first_s3_obj).s3_client
+        self.first_bucket_name = first_bucket_name
+        self.second_bucket_name = second_bucket_name
+        self.prefix = prefix
+        self.compare_etag = compare_etag
+        self.compare_size = compare_size
+        self.max_samples = max_samples
+        self.page_size = page_size
+        self.checkpoint_key = ""
+        self.checkpoint_matched = 0
+
+    def reset(self):
+        """
+        Forget the checkpoint so the next comparison lists the buckets from scratch
+        """
+        self.checkpoint_key = ""
+        self.checkpoint_matched = 0
+
+    def _compare_objects(self, first_obj, second_obj):
+        """
+        Returns:
+            str: Reason of the mismatch, None if the objects match
+
+        """
+        if self.compare_size and first_obj["Size"] != second_obj["Size"]:
+            return f"size {first_obj['Size']} != {second_obj['Size']}"
+        if self.compare_etag and first_obj["ETag"] != second_obj["ETag"]:
+            return f"ETag {first_obj['ETag']} != {second_obj['ETag']}"
+        return None
+
+    def compare(self):
+        """
+        Compare the buckets, starting after the last key up to which they were identical
+
+        Returns:
+            BucketDiff: Result of the comparison, the matched count includes
+                the objects matched by the previous comparisons
+
+        """
+        diff = BucketDiff(self.max_samples)
+        diff.matched = self.checkpoint_matched
+        in_sync = True
+        first_iter = iter_bucket_objects(
+            self.first_client,
+            self.first_bucket_name,
+            self.prefix,
+            self.checkpoint_key,
+            self.page_size,
+        )
+        second_iter = iter_bucket_objects(
+            self.second_client,
+            self.second_bucket_name,
+            self.prefix,
+            self.checkpoint_key,
+            self.page_size,
+        )
+        first_obj = next(first_iter, None)
+        second_obj = next(second_iter, None)
+        while first_obj is not None or second_obj is not None:
+            if second_obj is None or (
+                first_obj is not None and first_obj["Key"] < second_obj["Key"]
+            ):
+                diff.add_missing_in_second(first_obj["Key"])
+                first_obj = next(first_iter, None)
+                in_sync = False
+                continue
+            if first_obj is None or second_obj["Key"] < first_obj["Key"]:
+                diff.add_missing_in_first(second_obj["Key"])
+                second_obj = next(second_iter, None)
+                in_sync = False
+                continue
+            mismatch_reason = self._compare_objects(first_obj, second_obj)
+            if mismatch_reason:
+                diff.add_mismatched(first_obj["Key"], mismatch_reason)
+                in_sync = False
+            else:
+                diff.matched += 1
+                if in_sync:
+                    self.checkpoint_key = first_obj["Key"]
+                    self.checkpoint_matched = diff.matched
+            first_obj = next(first_iter, None)
+            second_obj = next(second_iter, None)
+        return diff
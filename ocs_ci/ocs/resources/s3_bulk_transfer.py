@@ -0,0 +1,335 @@
+"""
+Bulk S3 transfer engine used for populating buckets with a large amount of objects
+"""
+
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+import botocore.config
+
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.utility.lazy_import import LazyModule
+from ocs_ci.utility.utils import percentile
+
+logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
+
+# Use 2 threads per CPU core for the I/O bound uploads, capped to prevent
+# resource exhaustion on high-core systems.
+DEFAULT_MAX_WORKERS = min(multiprocessing.cpu_count() * 2, 16)
+
+
+class TransferStats:
+    """
+    Thread-safe throughput and latency statistics of a bulk transfer
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.start_time = time.monotonic()
+        self.end_time = None
+        self.objects = 0
+        self.bytes = 0
+        self.errors = 0
+        self.latencies = []
+
+    def record(self, num_bytes, latency):
+        """
+        Record a successfully transferred object
+
+        Args:
+            num_bytes (int): Size of the transferred object
+            latency (float): Time in seconds the transfer took
+
+        """
+        with self._lock:
+            self.objects += 1
+            self.bytes += num_bytes
+            self.latencies.append(latency)
+
+    def record_error(self):
+        """
+        Record a failed transfer
+        """
+        with self._lock:
+            self.errors += 1
+
+    def stop(self):
+        """
+        Freeze the elapsed time of the transfer
+        """
+        self.end_time = time.monotonic()
+
+    @property
+    def elapsed(self):
+        return (self.end_time or time.monotonic()) - self.start_time
+
+    def summary(self):
+        """
+        Returns:
+            dict: Counters, throughput and latency percentiles of the transfer
+
+        """
+        with self._lock:
+            latencies = sorted(self.latencies)
+            elapsed = self.elapsed or 1e-9
+            return {
+                "objects": self.objects,
+                "bytes": self.bytes,
+                "errors": self.errors,
+                "elapsed": round(elapsed, 3),
+                "objects_per_second": round(self.objects / elapsed, 2),
+                "mib_per_second": round(self.bytes / elapsed / 2**20, 2),
+                "latency_p50": round(percentile(latencies, 50), 4),
+                "latency_p95": round(percentile(latencies, 95), 4),
+                "latency_max": round(latencies[-1] if latencies else 0, 4),
+            }
+
+
+class S3ClientPool:
+    """
+    Bounded pool of boto3 S3 clients created from the credentials of an MCG/OBC object
+
+    Each client keeps its own HTTP connection pool, so the worker threads
+    do not contend on a single client.
+    """
+
+    def __init__(self, s3_obj, size=DEFAULT_MAX_WORKERS, verify=None):
+        """
+        Args:
+            s3_obj (obj): MCG or OBC object
+            size (int): Number of clients in the pool
+            verify (str|bool): SSL verification mode, retrieved from the
+                cluster configuration by default
+
+        """
+        if verify is None:
+            from ocs_ci.ocs.bucket_utils import retrieve_verification_mode
+
+            verify = retrieve_verification_mode()
+        self.size = size
+        self._clients = queue.Queue(maxsize=size)
+        client_config = botocore.config.Config(
+            retries={"max_attempts": 8}, max_pool_connections=2
+        )
+        session = boto3.session.Session()
+        for _ in range(size):
+            self._clients.put(
+                session.client(
+                    "s3",
+                    verify=verify,
+                    endpoint_url=s3_obj.s3_client.meta.endpoint_url,
+                    region_name=s3_obj.s3_client.meta.region_name,
+                    aws_access_key_id=s3_obj.access_key_id,
+                    aws_secret_access_key=s3_obj.access_key,
+                    config=client_config,
+                )
+            )
+
+    @contextmanager
+    def client(self):
+        """
+        Borrow a client from the pool for the duration of the context
+        """
+        s3_client = self._clients.get()
+        try:
+            yield s3_client
+        finally:
+            self._clients.put(s3_client)
+
+
+class S3BulkUploader:
+    """
+    Upload a large amount of objects to S3 buckets using a bounded thread pool
+    of pooled boto3 clients.
+
+    Only a limited number of uploads is kept in flight at once, so objects
+    can be generated lazily and hundreds of thousands of keys can be uploaded
+    without holding them all in memory.
+    """
+
+    def __init__(self, s3_obj, max_workers=DEFAULT_MAX_WORKERS, verify=None):
+        """
+        Args:
+            s3_obj (obj): MCG or OBC object
+            max_workers (int): Maximal number of concurrent uploads
+            verify (str|bool): SSL verification mode
+
+        """
+        self.max_workers = max_workers
+        self.client_pool = S3ClientPool(s3_obj, size=max_workers, verify=verify)
+        self.stats = TransferStats()
+
+    def _put_object(self, bucket_name, object_key, data):
+        """
+        Upload a single object and record its statistics
+
+        Returns:
+            tuple: The object key and the error message, None on success
+
+        """
+        start = time.monotonic()
+        try:
+            with self.client_pool.client() as s3_client:
+                s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=data)
+        except Exception as e:
+            self.stats.record_error()
+            return object_key, str(e)
+        self.stats.record(len(data), time.monotonic() - start)
+        return object_key, None
+
+    def _run_bounded(self, func, items):
+        """
+        Submit func for every item while keeping the amount of pending futures bounded
+
+        Args:
+            func (function): Function receiving the unpacked item
+            items (iterable): Iterable of argument tuples
+
+        Returns:
+            list: Results of all the calls in completion order
+
+        """
+        results = []
+        max_in_flight = self.max_workers * 4
+        pending = set()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for item in items:
+                pending.add(executor.submit(func, *item))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    results.extend(future.result() for future in done)
+            done, _ = wait(pending)
+            results.extend(future.result() for future in done)
+        return results
+
+    def upload_objects(self, bucket_name, objects):
+        """
+        Upload objects to a bucket concurrently
+
+        Args:
+            bucket_name (str): Name of the bucket
+            objects (iterable): Iterable of (object_key, data) tuples,
+                can be a generator
+
+        Returns:
+            dict: Summary of the transfer statistics
+
+        Raises:
+            UnexpectedBehaviour: If some of the objects failed to upload
+
+        """
+        self.stats = TransferStats()
+        logger.info(
+            f"Uploading objects to bucket {bucket_name} "
+            f"using a max of {self.max_workers} threads"
+        )
+        results = self._run_bounded(
+            lambda key, data: self._put_object(bucket_name, key, data), objects
+        )
+        self.stats.stop()
+        failed = [(key, error) for key, error in results if error]
+        summary = self.stats.summary()
+        logger.info(f"Bulk upload to bucket {bucket_name} finished: {summary}")
+        if failed:
+            raise UnexpectedBehaviour(
+                f"Failed to upload {len(failed)} objects to bucket {bucket_name}, "
+                f"first errors: {failed[:10]}"
+            )
+        return summary
+
+    def upload_to_buckets(self, bucket_names, objects_factory):
+        """
+        Upload objects to multiple buckets concurrently
+
+        Args:
+            bucket_names (list): Names of the buckets
+            objects_factory (function): Called with the bucket name, returns an
+                iterable of (object_key, data) tuples for that bucket
+
+        Returns:
+            dict: Summary of the transfer statistics
+
+        Raises:
+            UnexpectedBehaviour: If some of the objects failed to upload
+
+        """
+
+        def _all_objects():
+            for bucket_name in bucket_names:
+                for object_key, data in objects_factory(bucket_name):
+                    yield bucket_name, object_key, data
+
+        self.stats = TransferStats()
+        results = self._run_bounded(self._put_object, _all_objects())
+        self.stats.stop()
+        failed = [(key, error) for key, error in results if error]
+        summary = self.stats.summary()
+        logger.info(f"Bulk upload to {len(bucket_names)} buckets finished: {summary}")
+        if failed:
+            raise UnexpectedBehaviour(
+                f"Failed to upload {len(failed)} objects, first errors: {failed[:10]}"
+            )
+        return summary
+
+    def upload_multipart(self, bucket_name, object_key, parts):
+        """
+        Upload an object using a multipart upload with the parts uploaded concurrently
+
+        Args:
+            bucket_name (str): Name of the bucket
+            object_key (str): Unique object Identifier
+            parts (list): Data of the individual parts, all but the last part
+                have to be at least 5MiB
+
+        Returns:
+            dict: Complete multipart upload response
+
+        """
+        self.stats = TransferStats()
+        with self.client_pool.client() as s3_client:
+            upload_id = s3_client.create_multipart_upload(
+                Bucket=bucket_name, Key=object_key
+            )["UploadId"]
+
+        def _upload_part(part_number, data):
+            start = time.monotonic()
+            with self.client_pool.client() as s3_client:
+                etag = s3_client.upload_part(
+                    Bucket=bucket_name,
+                    Key=object_key,
+                    PartNumber=part_number,
+                    UploadId=upload_id,
+                    Body=data,
+                )["ETag"]
+            self.stats.record(len(data), time.monotonic() - start)
+            return {"PartNumber": part_number, "ETag": etag}
+
+        try:
+            uploaded_parts = self._run_bounded(_upload_part, enumerate(parts, start=1))
+        except Exception:
+            logger.error(f"Failed to upload parts of {object_key}, aborting the upload")
+            with self.client_pool.client() as s3_client:
+                s3_client.abort_multipart_upload(
+                    Bucket=bucket_name, Key=object_key, UploadId=upload_id
+                )
+            raise
+        uploaded_parts.sort(key=lambda part: part["PartNumber"])
+        with self.client_pool.client() as s3_client:
+            response = s3_client.complete_multipart_upload(
+                Bucket=bucket_name,
+                Key=object_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": uploaded_parts},
+            )
+        self.stats.stop()
+        logger.info(
+            f"Multipart upload of {object_key} with {len(uploaded_parts)} parts "
+            f"finished: {self.stats.summary()}"
+        )
+        return response
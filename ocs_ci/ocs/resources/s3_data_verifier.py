@@ -0,0 +1,320 @@
+"""
+In-process generation and integrity verification of S3 objects with
+deterministic pseudo-random content
+"""
+
+import hashlib
+import io
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import botocore.exceptions as boto3exception
+
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.ocs.resources.s3_bulk_transfer import (
+    DEFAULT_MAX_WORKERS,
+    S3ClientPool,
+    TransferStats,
+)
+
+logger = logging.getLogger(__name__)
+
+# Size of the blocks the object content is generated in, the content doesn't
+# depend on the sizes of the reads
+BLOCK_SIZE = 2**20
+
+SIZE_UNITS = {"": 1, "K": 2**10, "M": 2**20, "G": 2**30}
+
+# Maximal number of keys in one DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+
+def parse_size(size):
+    """
+    Convert a dd-like size to bytes
+
+    Args:
+        size (str|int): Size in bytes or with K/M/G suffix, e.g. '1M'
+
+    Returns:
+        int: Size in bytes
+
+    """
+    if isinstance(size, int):
+        return size
+    size = size.strip().upper()
+    unit = size[-1] if size[-1] in SIZE_UNITS else ""
+    return int(size[: len(size) - len(unit)]) * SIZE_UNITS[unit]
+
+
+class DeterministicObjectStream(io.RawIOBase):
+    """
+    Seekable read-only stream of pseudo-random bytes determined by a seed and
+    an object key
+
+    The content is generated on the fly block by block, so it is never stored
+    and the same content can be regenerated for the verification.
+    """
+
+    def __init__(self, seed, object_key, size):
+        """
+        Args:
+            seed (str): Seed shared by all the objects of a verification run
+            object_key (str): Key of the object, every key gets a different content
+            size (int): Size of the object in bytes
+
+        """
+        self.seed = f"{seed}/{object_key}"
+        self.size = size
+        self._position = 0
+        self._block_index = None
+        self._block = b""
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            self._position = offset
+        elif whence == io.SEEK_CUR:
+            self._position += offset
+        elif whence == io.SEEK_END:
+            self._position = self.size + offset
+        self._position = min(max(self._position, 0), self.size)
+        return self._position
+
+    def __len__(self):
+        return self.size
+
+    def _get_block(self, index):
+        if index != self._block_index:
+            block_size = min(BLOCK_SIZE, self.size - index * BLOCK_SIZE)
+            self._block = random.Random(f"{self.seed}/{index}").randbytes(block_size)
+            self._block_index = index
+        return self._block
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.size - self._position
+        size = min(size, self.size - self._position)
+        chunks = []
+        while size > 0:
+            index, offset = divmod(self._position, BLOCK_SIZE)
+            chunk = self._get_block(index)[offset : offset + size]
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def expected_md5(seed, object_key, size):
+    """
+    Compute the MD5 checksum of a deterministic object without storing its content
+
+    Args:
+        seed (str): Seed of the verification run
+        object_key (str): Key of the object
+        size (int): Size of the object in bytes
+
+    Returns:
+        str: Hex digest of the MD5 checksum
+
+    """
+    md5 = hashlib.md5()
+    stream = DeterministicObjectStream(seed, object_key, size)
+    for chunk in iter(lambda: stream.read(BLOCK_SIZE), b""):
+        md5.update(chunk)
+    return md5.hexdigest()
+
+
+class S3DataVerifier:
+    """
+    Upload objects with deterministic content directly through boto3 and verify
+    their integrity by hashing them incrementally while they are downloaded
+
+    The expected checksums are derived from the seed, so neither the uploaded
+    nor the downloaded data is ever written to disk.
+    """
+
+    def __init__(self, s3_obj, seed=None, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Args:
+            s3_obj (obj): MCG or OBC object
+            seed (str): Seed of the object content, a random one is generated if not set
+            max_workers (int): Number of objects transferred concurrently
+
+        """
+        self.seed = seed or f"{random.getrandbits(64):016x}"
+        self.max_workers = max_workers
+        self.client_pool = S3ClientPool(s3_obj, size=max_workers)
+        self.stats = TransferStats()
+        self.failures = []
+        logger.info(f"S3 data verifier uses seed {self.seed}")
+
+    def _upload_object(self, bucket_name, object_key, size):
+        start = time.monotonic()
+        with self.client_pool.client() as s3_client:
+            s3_client.put_object(
+                Bucket=bucket_name,
+                Key=object_key,
+                Body=DeterministicObjectStream(self.seed, object_key, size),
+                ContentLength=size,
+            )
+        self.stats.record(size, time.monotonic() - start)
+
+    def upload_objects(self, bucket_name, object_keys, size="1M"):
+        """
+        Upload objects with deterministic content to a bucket
+
+        Args:
+            bucket_name (str): Name of the bucket
+            object_keys (list): Keys of the objects to upload
+            size (str|int): Size of every object, in bytes or with K/M/G suffix
+
+        Returns:
+            list: Keys of the uploaded objects
+
+        """
+        size = parse_size(size)
+        logger.info(
+            f"Uploading {len(object_keys)} objects of {size} bytes to bucket {bucket_name}"
+        )
+        self.stats = TransferStats()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(
+                executor.map(
+                    lambda key: self._upload_object(bucket_name, key, size),
+                    object_keys,
+                )
+            )
+        self.stats.stop()
+        logger.info(f"Upload to bucket {bucket_name} finished: {self.stats.summary()}")
+        return list(object_keys)
+
+    def _verify_object(self, bucket_name, object_key, source_key, size):
+        """
+        Returns:
+            str: Description of the integrity failure, None if the object is intact
+
+        """
+        start = time.monotonic()
+        expected = DeterministicObjectStream(self.seed, source_key, size)
+        md5 = hashlib.md5()
+        expected_md5_hash = hashlib.md5()
+        received = 0
+        with self.client_pool.client() as s3_client:
+            try:
+                body = s3_client.get_object(Bucket=bucket_name, Key=object_key)["Body"]
+                for chunk in body.iter_chunks(chunk_size=BLOCK_SIZE):
+                    md5.update(chunk)
+                    expected_md5_hash.update(expected.read(len(chunk)))
+                    received += len(chunk)
+            except boto3exception.ClientError as e:
+                return f"{object_key}: download failed: {e}"
+        self.stats.record(received, time.monotonic() - start)
+        if received != size:
+            return f"{object_key}: size {received} != {size}"
+        if md5.hexdigest() != expected_md5_hash.hexdigest():
+            return f"{object_key}: MD5 {md5.hexdigest()} != {expected_md5_hash.hexdigest()}"
+        return None
+
+    def verify_objects(self, bucket_name, object_keys, size="1M", key_map=None):
+        """
+        Download objects and verify their content matches the content generated
+        from the seed
+
+        Args:
+            bucket_name (str): Name of the bucket
+            object_keys (list): Keys of the objects to verify
+            size (str|int): Expected size of every object
+            key_map (function): Maps a key in the bucket to the key the object
+                was uploaded with, e.g. when the objects were copied with a
+                different prefix. Identity by default.
+
+        Returns:
+            bool: True if all the objects are intact, the descriptions of the
+                failed objects are kept in the failures attribute
+
+        """
+        size = parse_size(size)
+        key_map = key_map or (lambda key: key)
+        logger.info(f"Verifying {len(object_keys)} objects in bucket {bucket_name}")
+        self.stats = TransferStats()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            self.failures = [
+                failure
+                for failure in executor.map(
+                    lambda key: self._verify_object(
+                        bucket_name, key, key_map(key), size
+                    ),
+                    object_keys,
+                )
+                if failure
+            ]
+        self.stats.stop()
+        logger.info(
+            f"Verification of bucket {bucket_name} finished: {self.stats.summary()}"
+        )
+        if self.failures:
+            logger.error(
+                f"{len(self.failures)} objects in bucket {bucket_name} failed the "
+                f"integrity check, first failures: {self.failures[:10]}"
+            )
+            return False
+        return True
+
+    def delete_objects(self, bucket_name, object_keys):
+        """
+        Delete objects from a bucket in batches
+
+        Args:
+            bucket_name (str): Name of the bucket
+            object_keys (list): Keys of the objects to delete
+
+        """
+        logger.info(f"Deleting {len(object_keys)} objects from bucket {bucket_name}")
+        with self.client_pool.client() as s3_client:
+            for i in range(0, len(object_keys), DELETE_BATCH_SIZE):
+                s3_client.delete_objects(
+                    Bucket=bucket_name,
+                    Delete={
+                        "Objects": [
+                            {"Key": key}
+                            for key in object_keys[i : i + DELETE_BATCH_SIZE]
+                        ],
+                        "Quiet": True,
+                    },
+                )
+
+    def round_trip(self, bucket_name, object_keys, size="1M"):
+        """
+        Upload objects and verify them right away
+
+        Args:
+            bucket_name (str): Name of the bucket
+            object_keys (list): Keys of the objects
+            size (str|int): Size of every object
+
+        Raises:
+            UnexpectedBehaviour: If any of the objects failed the verification
+
+        """
+        self.upload_objects(bucket_name, object_keys, size)
+        if not self.verify_objects(bucket_name, object_keys, size):
+            raise UnexpectedBehaviour(
+                f"Round trip verification of bucket {bucket_name} failed: "
+                f"{self.failures[:10]}"
+            )
@@ -10,6 +10,7 @@ import pathlib
 from ocs_ci.helpers import helpers
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.framework import config
+from ocs_ci.utility.resource_executor import get_resource_executor
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility import templating, utils
 from ocs_ci.ocs.resources.ocs import OCS
@@ -448,20 +449,15 @@ def delete_objs_parallel(obj_list, namespace, kind):
 
     """
     ocp = OCP(kind=kind, namespace=namespace)
-    threads = list()
-    for obj in obj_list:
-        process1 = threading.Thread(
-            target=ocp.delete, kwargs={"resource_name": f"{obj.name}"}
-        )
-        process2 = threading.Thread(
-            target=ocp.wait_for_delete, kwargs={"resource_name": f"{obj.name}"}
-        )
-        process1.start()
-        process2.start()
-        threads.append(process1)
-        threads.append(process2)
-    for process in threads:
-        process.join()
+
+    def _delete(obj):
+        try:
+            ocp.delete(resource_name=obj.name)
+            ocp.wait_for_delete(resource_name=obj.name)
+        except Exception as e:
+            logger.error(f"Failed to delete {kind} {obj.name}: {e}")
+
+    get_resource_executor().map(_delete, obj_list, operation=f"delete_{kind}")
 
 
 def check_enough_resource_available_in_workers(ms_name=None, pod_dict_path=None):
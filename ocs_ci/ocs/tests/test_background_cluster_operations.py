@@ -0,0 +1,109 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from ocs_ci.krkn_chaos.background_cluster_operations import (
+    BackgroundClusterOperations,
+)
+
+
+def make_operations(**kwargs):
+    workload_ops = SimpleNamespace(namespace="test-ns", workloads=[])
+    return BackgroundClusterOperations(workload_ops, **kwargs)
+
+
+def test_pick_operation_respects_worker_count():
+    bg_ops = make_operations(
+        enabled_operations=["snapshot_lifecycle"],
+        max_concurrent_operations=2,
+        operation_max_parallel={"snapshot_lifecycle": 5},
+    )
+    assert bg_ops._pick_operation() == "snapshot_lifecycle"
+    assert bg_ops._pick_operation() == "snapshot_lifecycle"
+    assert bg_ops._pick_operation() is None
+
+
+def test_pick_operation_respects_max_parallel_and_weights():
+    bg_ops = make_operations(
+        enabled_operations=["snapshot_lifecycle", "clone_lifecycle"],
+        max_concurrent_operations=10,
+        operation_weights={"clone_lifecycle": 0},
+        operation_max_parallel={"snapshot_lifecycle": 2},
+    )
+    picked = [bg_ops._pick_operation() for _ in range(3)]
+    assert picked == ["snapshot_lifecycle", "snapshot_lifecycle", None]
+
+
+def test_pick_operation_respects_exclusion_groups():
+    bg_ops = make_operations(
+        enabled_operations=["osd_operations", "mds_failover", "snapshot_lifecycle"],
+        max_concurrent_operations=10,
+    )
+    bg_ops._in_flight["osd_operations"] = 1
+    picked = {bg_ops._pick_operation() for _ in range(20)}
+    assert picked == {"snapshot_lifecycle", None}
+
+
+def test_exclusion_groups_can_be_disabled():
+    bg_ops = make_operations(
+        enabled_operations=["osd_operations", "mds_failover"],
+        max_concurrent_operations=10,
+        operation_exclusion_groups={},
+    )
+    bg_ops._in_flight["osd_operations"] = 1
+    assert bg_ops._pick_operation() == "mds_failover"
+
+
+def test_next_interval_jitter():
+    bg_ops = make_operations(operations_per_minute=60, jitter=0.2)
+    intervals = [bg_ops._next_interval() for _ in range(100)]
+    assert all(0.8 <= interval <= 1.2 for interval in intervals)
+
+
+def test_latencies_are_recorded_by_phase(monkeypatch):
+    bg_ops = make_operations(enabled_operations=["snapshot_lifecycle"])
+    monkeypatch.setattr(bg_ops, "_namespace_exists", lambda: True)
+    bg_ops._run_operation_safe("snapshot_lifecycle", lambda: None)
+    bg_ops.mark_phase("during")
+    bg_ops._run_operation_safe("snapshot_lifecycle", lambda: None)
+    latencies = bg_ops.metrics.get_summary()["latency_by_phase"]
+    assert latencies["baseline"]["snapshot_lifecycle"]["count"] == 1
+    assert latencies["during"]["snapshot_lifecycle"]["count"] == 1
+    assert [phase["name"] for phase in bg_ops.metrics.phases] == [
+        "baseline",
+        "during",
+    ]
+
+
+def test_excluded_operations_never_overlap(monkeypatch):
+    bg_ops = make_operations(
+        enabled_operations=["osd_operations", "mds_failover"],
+        max_concurrent_operations=4,
+        operations_per_minute=6000,
+    )
+    monkeypatch.setattr(bg_ops, "_namespace_exists", lambda: True)
+    running = []
+    overlaps = []
+    lock = threading.Lock()
+
+    def operation(name):
+        def run():
+            with lock:
+                if running:
+                    overlaps.append((name, list(running)))
+                running.append(name)
+            time.sleep(0.02)
+            with lock:
+                running.remove(name)
+
+        return run
+
+    bg_ops.enabled_operations = {
+        name: operation(name) for name in bg_ops.enabled_operations
+    }
+    bg_ops._log_final_summary = lambda: None
+    bg_ops.start()
+    time.sleep(0.5)
+    bg_ops.stop(cleanup=False)
+    assert bg_ops.metrics.get_summary()["total_operations"] >= 2
+    assert overlaps == []
@@ -0,0 +1,83 @@
+from ocs_ci.krkn_chaos.background_cluster_validator import (
+    CEPHFS_DRIVER,
+    RBD_DRIVER,
+    SECTION_MARKER,
+    BackgroundClusterValidator,
+    ValidationSnapshot,
+)
+
+
+def _pv(name, claim=None, phase="Bound", csi=None):
+    spec = {"csi": csi or {}}
+    if claim:
+        spec["claimRef"] = {"namespace": claim[0], "name": claim[1]}
+    return {"metadata": {"name": name}, "spec": spec, "status": {"phase": phase}}
+
+
+def test_parse_backend_volumes():
+    output = "\n".join(
+        [
+            f"{SECTION_MARKER} rbd",
+            '["csi-vol-a", "csi-vol-b"]',
+            f"{SECTION_MARKER} cephfs fs1",
+            '[{"name": "csi-vol-c"},',
+            ' {"name": "csi-vol-d"}]',
+            f"{SECTION_MARKER} cephfs fs2",
+            "[]",
+            f"{SECTION_MARKER} cephfs fs3",
+            "Error ENOENT: subvolume group 'csi' does not exist",
+        ]
+    )
+    rbd_images, cephfs_subvolumes = BackgroundClusterValidator._parse_backend_volumes(
+        output
+    )
+    assert rbd_images == {"csi-vol-a", "csi-vol-b"}
+    assert cephfs_subvolumes == {"csi-vol-c", "csi-vol-d"}
+
+
+def test_parse_backend_volumes_without_sections():
+    assert BackgroundClusterValidator._parse_backend_volumes("") == (set(), set())
+
+
+def test_orphan_pvs():
+    snapshot = ValidationSnapshot(
+        pvs=[
+            _pv("bound", claim=("ns", "pvc-1")),
+            _pv("claim-deleted", claim=("ns", "pvc-2")),
+            _pv("released", phase="Released"),
+            _pv("available", phase="Available"),
+        ],
+        pvc_keys={("ns", "pvc-1")},
+    )
+    assert snapshot.orphan_pvs() == ["claim-deleted", "released"]
+
+
+def test_pv_backend_volumes():
+    snapshot = ValidationSnapshot(
+        pvs=[
+            _pv(
+                "rbd-named",
+                csi={"driver": RBD_DRIVER, "volumeAttributes": {"imageName": "img"}},
+            ),
+            _pv(
+                "rbd-handle",
+                csi={
+                    "driver": RBD_DRIVER,
+                    "volumeHandle": "0001-0009-openshift-storage-0000000000000001-"
+                    "1b2c3d4e-aaaa-bbbb-cccc-0123456789ab",
+                },
+            ),
+            _pv(
+                "cephfs",
+                csi={
+                    "driver": CEPHFS_DRIVER,
+                    "volumeAttributes": {"subvolumeName": "csi-vol-fs"},
+                },
+            ),
+        ]
+    )
+    assert snapshot.pv_rbd_images == {
+        "img",
+        "csi-vol-1b2c3d4e-aaaa-bbbb-cccc-0123456789ab",
+    }
+    assert snapshot.pv_cephfs_subvolumes == {"csi-vol-fs"}
@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.dr import dr_state
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+
+
+def _resource(kind, name, namespace):
+    return {"kind": kind, "metadata": {"name": name, "namespace": namespace}}
+
+
+def test_snapshot_get_resources():
+    snapshot = dr_state.DRStateSnapshot(
+        timestamp=0,
+        resources={
+            "cluster-1": {
+                constants.VOLUME_REPLICATION: [
+                    _resource(constants.VOLUME_REPLICATION, "vr-1", "app-1"),
+                    _resource(constants.VOLUME_REPLICATION, "vr-2", "app-2"),
+                ],
+                constants.REPLICATION_SOURCE: None,
+            }
+        },
+    )
+    vrs = snapshot.get_resources("cluster-1", constants.VOLUME_REPLICATION, "app-1")
+    assert [vr["metadata"]["name"] for vr in vrs] == ["vr-1"]
+    assert (
+        snapshot.get_resources(
+            "cluster-1", constants.VOLUME_REPLICATION, resource_name="vr-3"
+        )
+        == []
+    )
+    assert snapshot.get_resources("cluster-1", constants.REPLICATION_SOURCE) is None
+    assert snapshot.get_resources("cluster-2", constants.VOLUME_REPLICATION) is None
+
+
+def test_wait_for_evaluates_new_snapshots(monkeypatch):
+    monkeypatch.setattr(dr_state, "get_non_acm_cluster_config", lambda: [])
+    aggregator = dr_state.DRStateAggregator(interval=0)
+    counts = iter([0, 1, 2])
+
+    def fake_sample():
+        count = next(counts, 2)
+        snapshot = dr_state.DRStateSnapshot(
+            timestamp=dr_state.time.time(),
+            resources={"cluster-1": {constants.VOLUME_REPLICATION: [{}] * count}},
+        )
+        with aggregator._condition:
+            aggregator.snapshot = snapshot
+            aggregator._condition.notify_all()
+
+    def sampler():
+        while not aggregator._stop_event.wait(0.01):
+            fake_sample()
+
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        assert aggregator.wait_for(
+            lambda snapshot: len(
+                snapshot.get_resources("cluster-1", constants.VOLUME_REPLICATION)
+            )
+            == 2,
+            timeout=10,
+        )
+        assert not aggregator.wait_for(
+            lambda snapshot: 1 / 0, timeout=0.1, description="failing condition"
+        )
+
+        def unexpected(snapshot):
+            raise UnexpectedBehaviour("too many replaying images")
+
+        with pytest.raises(UnexpectedBehaviour):
+            aggregator.wait_for(unexpected, timeout=10, raise_on=(UnexpectedBehaviour,))
+    finally:
+        aggregator._stop_event.set()
+        thread.join()
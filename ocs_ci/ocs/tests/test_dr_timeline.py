@@ -0,0 +1,70 @@
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.dr import dr_timeline
+
+
+def test_dr_action_timeline_metrics(monkeypatch):
+    monkeypatch.setattr(dr_timeline, "get_non_acm_cluster_config", lambda: [])
+    monkeypatch.setattr(
+        dr_timeline, "config_safe_thread_pool_task", lambda index, task: task()
+    )
+    timeline = dr_timeline.DRActionTimeline(
+        constants.ACTION_FAILOVER,
+        "drpc",
+        "app",
+        "app",
+        target_cluster="cluster-2",
+        expected_pvc_count=1,
+        expected_pod_count=1,
+    )
+    timeline.managed_clusters = {"cluster-2": 1}
+    drpc_states = iter(
+        [
+            ("FailingOver", "WaitForStorageMaintenanceActivation"),
+            (constants.STATUS_FAILEDOVER, "Completed"),
+        ]
+    )
+    workload_states = iter(
+        [
+            ("Secondary", "Pending", False),
+            ("Primary", constants.STATUS_BOUND, True),
+        ]
+    )
+
+    def get_drpc_state():
+        phase, progression = next(drpc_states)
+        return {
+            "phase": phase,
+            "progression": progression,
+            "lastGroupSyncTime": "2024-01-01T00:00:00Z",
+        }
+
+    def get_workload_state():
+        vrg_state, pvc_phase, pod_ready = next(workload_states)
+        return {
+            constants.VOLUME_REPLICATION_GROUP: {"app": vrg_state},
+            constants.PVC: {"pvc": pvc_phase},
+            constants.POD: {"pod": pod_ready},
+        }
+
+    monkeypatch.setattr(timeline, "_get_drpc_state", get_drpc_state)
+    monkeypatch.setattr(timeline, "_get_workload_state", get_workload_state)
+    timeline.start_time = 1704067260.0
+    timeline.sample()
+    timeline.sample()
+    timeline.stop_time = timeline.events[-1]["time"]
+
+    metrics = timeline.metrics()
+    assert metrics["rpo"] == 60
+    assert set(metrics["milestones"]) == {
+        "drpc_completed",
+        "vrg_primary",
+        "pvcs_bound",
+        "pods_ready",
+    }
+    assert metrics["rto"] == metrics["milestones"]["pods_ready"]
+    assert [phase["phase"] for phase in metrics["phases"]] == [
+        "FailingOver",
+        constants.STATUS_FAILEDOVER,
+    ]
+    # Only the transitions are recorded, 5 resources sampled twice with all changed
+    assert len(timeline.events) == 10
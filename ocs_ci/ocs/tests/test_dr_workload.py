@@ -0,0 +1,65 @@
+import threading
+
+import pytest
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.dr import dr_workload
+from ocs_ci.ocs.exceptions import ResourceNotDeleted
+
+
+class FakeWorkload:
+    """
+    Records the threads the workload operations run in
+    """
+
+    def __init__(self, name, calls, fail_delete=False):
+        self.workload_name = name
+        self.workload_namespace = f"{name}-ns"
+        self.calls = calls
+        self.fail_delete = fail_delete
+
+    def deploy_workload(self):
+        self.calls.append((self.workload_name, threading.current_thread()))
+
+    def delete_workload(self, switch_ctx=None):
+        self.calls.append((self.workload_name, threading.current_thread()))
+        if self.fail_delete:
+            raise ResourceNotDeleted(f"{self.workload_namespace} not deleted")
+
+
+@pytest.fixture
+def workloads():
+    calls = []
+    return calls, [FakeWorkload(f"app-{index}", calls) for index in range(3)]
+
+
+def test_workloads_are_deployed_sequentially_by_default(monkeypatch, workloads):
+    calls, instances = workloads
+    monkeypatch.delitem(
+        config.ENV_DATA, "dr_parallel_workload_operations", raising=False
+    )
+    dr_workload.deploy_workloads(instances)
+    assert calls == [
+        (workload.workload_name, threading.current_thread()) for workload in instances
+    ]
+
+
+def test_workloads_are_deployed_in_parallel_when_enabled(monkeypatch, workloads):
+    calls, instances = workloads
+    monkeypatch.setitem(config.ENV_DATA, "deploy_via_cli", True)
+    monkeypatch.setitem(config.ENV_DATA, "dr_parallel_workload_operations", True)
+    dr_workload.deploy_workloads(instances)
+    assert sorted(name for name, _ in calls) == ["app-0", "app-1", "app-2"]
+    assert threading.current_thread() not in {thread for _, thread in calls}
+
+
+def test_sequential_deletion_reports_all_failures(workloads):
+    calls, instances = workloads
+    instances[0].fail_delete = True
+    instances[2].fail_delete = True
+    with pytest.raises(ResourceNotDeleted) as error:
+        dr_workload.delete_workloads(instances, parallel=False, switch_ctx=0)
+    assert len(calls) == 3
+    assert "app-0-ns" in str(error.value)
+    assert "app-2-ns" in str(error.value)
+    assert "app-1-ns" not in str(error.value)
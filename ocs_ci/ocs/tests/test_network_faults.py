@@ -0,0 +1,136 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.resiliency import network_faults
+from ocs_ci.resiliency.network_faults import (
+    REMOVE_TRIES,
+    TIMESTAMP_MARKER,
+    NetworkFaults,
+    build_node_command,
+)
+
+
+class FakeOCP:
+    """
+    Runs the node commands instantly, the commands on the nodes in fail_on
+    fail the given number of times
+    """
+
+    def __init__(self, fail_on=None):
+        self.fail_on = dict(fail_on or {})
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def exec_oc_debug_cmd_once(self, node, cmd_list, timeout=300):
+        with self._lock:
+            self.calls.append((node, cmd_list))
+            if self.fail_on.get(node):
+                self.fail_on[node] -= 1
+                raise CommandFailed(f"oc debug failed on {node}")
+        return f"{TIMESTAMP_MARKER}{time.time()}"
+
+
+def make_network_faults(ocp_obj, nodes=("node-a", "node-b"), duration=30):
+    faults = NetworkFaults.__new__(NetworkFaults)
+    faults.nodes = [SimpleNamespace(name=name) for name in nodes]
+    faults.duration = duration
+    faults.iterations = 1
+    faults.pause = 0
+    faults.sync_lead_time = 10
+    faults.fault_timeline = []
+    faults.telemetry = None
+    faults._timeline_lock = threading.Lock()
+    faults.ocp_obj = ocp_obj
+    faults.node_interfaces = {name: ["eth0"] for name in nodes}
+    faults._remove_faults_all_nodes = lambda: None
+    return faults
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(network_faults.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(network_faults.random, "randint", lambda a, b: b)
+
+
+def scheduled(faults, action):
+    return {
+        event["scheduled_at"]
+        for event in faults.fault_timeline
+        if event["action"] == action
+    }
+
+
+def test_build_node_command():
+    cmd_list = build_node_command("tc qdisc del dev {iface} root", ["a", "b"], 1.5)
+    assert cmd_list == [
+        "while [ $(date +%s%N) -lt 1500000000 ]; do sleep 0.05; done",
+        "tc qdisc del dev a root",
+        "tc qdisc del dev b root",
+        f"echo {TIMESTAMP_MARKER}$(date +%s.%N)",
+    ]
+
+
+def test_removal_is_scheduled_after_the_fault_duration():
+    faults = make_network_faults(FakeOCP(), duration=30)
+    faults._apply_fault("loss", "loss 10%")
+    (apply_at,) = scheduled(faults, "apply")
+    (remove_at,) = scheduled(faults, "remove")
+    assert remove_at == apply_at + 30
+    assert all(event["error"] is None for event in faults.fault_timeline)
+
+
+def test_removal_waits_for_the_sync_lead_time(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(
+        network_faults,
+        "time",
+        SimpleNamespace(time=lambda: clock.now, sleep=lambda seconds: None),
+    )
+
+    class SlowOCP(FakeOCP):
+        def exec_oc_debug_cmd_once(self, node, cmd_list, timeout=300):
+            # the debug pod starts after the short fault duration passed
+            clock.now += 40
+            return super().exec_oc_debug_cmd_once(node, cmd_list, timeout)
+
+    faults = make_network_faults(SlowOCP(), nodes=["node-a"], duration=5)
+    faults._apply_fault("loss", "loss 10%")
+    (apply_at,) = scheduled(faults, "apply")
+    (remove_at,) = scheduled(faults, "remove")
+    assert apply_at == 1000 + faults.sync_lead_time
+    assert remove_at == 1040 + faults.sync_lead_time
+
+
+def test_failed_apply_is_rolled_back_right_away_without_retry():
+    ocp_obj = FakeOCP(fail_on={"node-b": 1})
+    faults = make_network_faults(ocp_obj)
+    start = time.time()
+    faults._apply_fault("loss", "loss 10%")
+    (apply_at,) = scheduled(faults, "apply")
+    (remove_at,) = scheduled(faults, "remove")
+    assert apply_at >= start + faults.sync_lead_time
+    assert remove_at < apply_at + faults.duration
+    apply_calls = [call for call in ocp_obj.calls if "netem" in call[1][1]]
+    assert len(apply_calls) == 2
+
+
+def test_failed_removal_is_retried():
+    ocp_obj = FakeOCP()
+    faults = make_network_faults(ocp_obj, nodes=["node-a"])
+    ocp_obj.fail_on = {"node-a": REMOVE_TRIES - 1}
+    failures = faults._run_on_nodes(
+        faults.nodes,
+        "tc qdisc del dev {iface} root",
+        action="remove",
+        iteration=1,
+        description="loss",
+        start_at=time.time(),
+        tries=REMOVE_TRIES,
+    )
+    assert not failures
+    assert len(ocp_obj.calls) == REMOVE_TRIES
+    assert faults.fault_timeline[0]["error"] is None
@@ -0,0 +1,87 @@
+import pytest
+
+from ocs_ci.ocs import node_agent
+from ocs_ci.ocs.exceptions import CommandFailed, NodeAgentUnavailable
+from ocs_ci.ocs.node_agent import NodeAgent
+from ocs_ci.ocs.ocp import OCP
+
+
+def ready_node(name, ready=True):
+    return {
+        "metadata": {"name": name},
+        "status": {
+            "conditions": [{"type": "Ready", "status": "True" if ready else "False"}]
+        },
+    }
+
+
+class FakeOc:
+    """
+    Records the oc commands, the commands starting with a prefix of the
+    failures fail with its exception
+    """
+
+    def __init__(self):
+        self.commands = []
+        self.failures = {}
+
+    def exec_oc_cmd(self, command):
+        self.commands.append(command)
+        for prefix, error in self.failures.items():
+            if command.startswith(prefix):
+                raise error
+        return "output"
+
+
+@pytest.fixture
+def oc_commands(monkeypatch):
+    fake_oc = FakeOc()
+    monkeypatch.setattr(
+        OCP,
+        "exec_oc_cmd",
+        lambda self, command, *args, **kwargs: fake_oc.exec_oc_cmd(command),
+    )
+    return fake_oc
+
+
+def test_create_namespace_reuses_existing_namespace(oc_commands):
+    oc_commands.failures["create namespace"] = CommandFailed(
+        'Error from server (AlreadyExists): namespaces "ocs-ci-node-agent" already exists'
+    )
+    NodeAgent().create_namespace()
+    commands = oc_commands.commands
+    assert commands[0] == "create namespace ocs-ci-node-agent"
+    assert "pod-security.kubernetes.io/enforce=privileged" in commands[1]
+
+
+def test_create_namespace_raises_other_errors(oc_commands):
+    oc_commands.failures["create namespace"] = CommandFailed("Forbidden")
+    with pytest.raises(CommandFailed):
+        NodeAgent().create_namespace()
+
+
+def test_pods_ready_ignores_not_ready_nodes(monkeypatch):
+    def get(self, resource_name="", **kwargs):
+        if self.kind == "Node":
+            return {"items": [ready_node("a"), ready_node("b", ready=False)]}
+        return {"status": {"desiredNumberScheduled": 2, "numberReady": 1}}
+
+    monkeypatch.setattr(OCP, "get", get)
+    assert NodeAgent()._all_pods_ready()
+
+
+def test_exec_failure_falls_back_to_oc_debug(monkeypatch, oc_commands):
+    agent = NodeAgent()
+    agent._pods_by_node = {"node-a": "agent-pod"}
+    oc_commands.failures["exec agent-pod"] = CommandFailed(
+        "error dialing backend: dial tcp 10.0.0.1:10250: connect: no route to host"
+    )
+    monkeypatch.setattr(node_agent, "node_agent_enabled", lambda: True)
+    monkeypatch.setattr(node_agent, "get_node_agent", lambda: agent)
+
+    with pytest.raises(NodeAgentUnavailable):
+        agent.exec_cmd("node-a", ["uptime"])
+    agent._pods_by_node = {"node-a": "agent-pod"}
+    assert OCP().exec_oc_debug_cmd("node-a", ["uptime"]) == "output"
+    assert oc_commands.commands[-1].startswith("debug nodes/node-a")
+    assert "node-a" not in agent._pods_by_node
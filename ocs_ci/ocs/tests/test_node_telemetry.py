@@ -0,0 +1,168 @@
+import threading
+import time
+
+import pytest
+
+from ocs_ci.resiliency.node_telemetry import (
+    MIB,
+    SAMPLE_MARKER,
+    MetricSeries,
+    NodeTelemetry,
+    _is_whole_disk,
+    derive_metrics,
+    parse_probe_output,
+)
+
+
+def probe_sample(timestamp, cpu, mem_available, load, disk, net):
+    """
+    Render one sample as printed by the probe command
+
+    Args:
+        cpu (tuple): user, idle and iowait jiffies
+        disk (tuple): read sectors, written sectors and busy milliseconds of sda
+        net (tuple): received and transmitted bytes of eth0
+
+    """
+    user, idle, iowait = cpu
+    read, written, busy = disk
+    rx, tx = net
+    return "\n".join(
+        [
+            f"{SAMPLE_MARKER} {timestamp}",
+            f"cpu  {user} 0 0 {idle} {iowait} 0 0 0 0 0",
+            "MemTotal:       1000 kB",
+            f"MemAvailable:   {mem_available} kB",
+            f"{load} 0.50 0.25 2/300 4242",
+            f"   8       0 sda 10 0 {read} 5 20 0 {written} 7 0 {busy} 12 0 0 0 0",
+            f"   8       1 sda1 10 0 {read} 5 20 0 {written} 7 0 {busy} 12 0 0 0 0",
+            f"  eth0: {rx} 10 0 0 0 0 0 0 {tx} 10 0 0 0 0 0 0",
+            f"    lo: {rx} 10 0 0 0 0 0 0 {tx} 10 0 0 0 0 0 0",
+        ]
+    )
+
+
+OUTPUT = "\n".join(
+    [
+        "Starting pod/node-a-debug ...",
+        probe_sample(100.0, (100, 800, 100), 600, 1.5, (0, 0, 0), (0, 0)),
+        probe_sample(102.0, (400, 1400, 200), 500, 2.0, (4096, 8192, 1000), (MIB, 0)),
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "name, whole",
+    [
+        ("sda", True),
+        ("sda1", False),
+        ("vdb", True),
+        ("xvdf2", False),
+        ("nvme0n1", True),
+        ("nvme0n1p1", False),
+        ("dm-0", False),
+        ("loop0", False),
+    ],
+)
+def test_is_whole_disk(name, whole):
+    assert _is_whole_disk(name) is whole
+
+
+def test_parse_probe_output():
+    first, second = parse_probe_output(OUTPUT)
+    assert first["timestamp"] == 100.0
+    assert first["cpu_total"] == 1000
+    assert first["cpu_idle"] == 900
+    assert first["cpu_iowait"] == 100
+    assert first["MemAvailable"] == 600
+    assert first["load1"] == 1.5
+    assert second["disks"] == {"sda": (4096, 8192, 1000)}
+    assert second["net"] == {"eth0": (MIB, 0)}
+
+
+def test_derive_metrics():
+    previous, current = parse_probe_output(OUTPUT)
+    metrics = derive_metrics(previous, current)
+    assert metrics == {
+        "cpu_percent": 30.0,
+        "iowait_percent": 10.0,
+        "memory_percent": 50.0,
+        "load1": 2.0,
+        "disk_read_mib_s": 1.0,
+        "disk_write_mib_s": 2.0,
+        "disk_busy_percent": 50.0,
+        "net_rx_mib_s": 0.5,
+        "net_tx_mib_s": 0.0,
+    }
+
+
+def test_derive_metrics_after_counter_reset():
+    previous, current = parse_probe_output(OUTPUT)
+    assert derive_metrics(current, previous) == {}
+
+
+def test_metric_series():
+    series = MetricSeries(maxlen=3)
+    for timestamp in range(5):
+        series.append(timestamp, timestamp * 10)
+    assert series.get() == [(2, 20), (3, 30), (4, 40)]
+    assert series.get(start=3) == [(3, 30), (4, 40)]
+    assert series.get(end=2) == [(2, 20)]
+    aggregate = series.aggregate(start=2, end=3)
+    assert aggregate["count"] == 2
+    assert aggregate["max"] == 30
+    assert MetricSeries(maxlen=3).aggregate()["count"] == 0
+
+
+class FakeOCP:
+    """
+    Returns the probe outputs in order, the exceptions among them are raised,
+    blocks on release once the outputs are consumed
+    """
+
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.calls = 0
+        self.blocked = threading.Event()
+        self.release = threading.Event()
+
+    def exec_oc_debug_cmd(self, node, cmd_list, timeout=300):
+        self.calls += 1
+        if self.outputs:
+            output = self.outputs.pop(0)
+            if isinstance(output, Exception):
+                raise output
+            return output
+        self.blocked.set()
+        self.release.wait(10)
+        return OUTPUT
+
+
+def make_telemetry(ocp_obj):
+    telemetry = NodeTelemetry(["node-a"], interval=0.01, samples_per_batch=1)
+    telemetry.ocp_obj = ocp_obj
+    return telemetry
+
+
+def test_sampling_continues_after_unexpected_errors():
+    ocp_obj = FakeOCP([IndexError("truncated output"), KeyError("cpu"), OUTPUT])
+    telemetry = make_telemetry(ocp_obj).start()
+    try:
+        assert ocp_obj.blocked.wait(10)
+    finally:
+        telemetry.stop(timeout=0)
+        ocp_obj.release.set()
+    assert ocp_obj.calls == 4
+    assert telemetry.series["node-a"]["cpu_percent"].get() == [(102.0, 30.0)]
+
+
+def test_stop_abandons_the_running_batch():
+    ocp_obj = FakeOCP([])
+    telemetry = make_telemetry(ocp_obj).start()
+    assert ocp_obj.blocked.wait(10)
+    start = time.monotonic()
+    telemetry.stop(timeout=0.1)
+    assert time.monotonic() - start < 5
+    ocp_obj.release.set()
+    telemetry._threads[0].join(10)
+    assert telemetry.series["node-a"]["cpu_percent"].get() == []
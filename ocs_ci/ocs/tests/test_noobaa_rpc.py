@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.ocs.resources.noobaa_rpc import NoobaaRPCClient
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """
+    NooBaa mgmt endpoint accepting only the last created token
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.tokens = 0
+
+    def post(self, url, data, verify, timeout):
+        payload = json.loads(data)
+        self.calls.append(payload)
+        if payload["method"] == "create_auth":
+            self.tokens += 1
+            return FakeResponse({"reply": {"token": f"token-{self.tokens}"}})
+        if payload["auth_token"] != f"token-{self.tokens}":
+            return FakeResponse({"error": {"rpc_code": "UNAUTHORIZED"}})
+        if payload["params"].get("name") == "missing":
+            return FakeResponse(
+                {"error": {"rpc_code": "NO_SUCH_BUCKET", "message": "missing"}}
+            )
+        return FakeResponse({"reply": {"name": payload["params"].get("name")}})
+
+
+def get_client():
+    client = NoobaaRPCClient("https://noobaa-mgmt", "admin@noobaa.io", "password")
+    client.session = FakeSession()
+    return client
+
+
+def test_token_is_cached():
+    client = get_client()
+    for name in ("first", "second"):
+        response = client.send("bucket_api", "read_bucket", {"name": name})
+        assert response.json()["reply"] == {"name": name}
+    methods = [call["method"] for call in client.session.calls]
+    assert methods == ["create_auth", "read_bucket", "read_bucket"]
+
+
+def test_rejected_token_is_renewed():
+    client = get_client()
+    client.send("bucket_api", "read_bucket", {"name": "first"})
+    # another client created a new token, the cached one is rejected
+    client.session.tokens += 1
+    response = client.send("bucket_api", "read_bucket", {"name": "second"})
+    assert response.json()["reply"] == {"name": "second"}
+    assert client.token == "token-3"
+
+
+def test_error_is_returned_in_response():
+    client = get_client()
+    response = client.send("bucket_api", "read_bucket", {"name": "missing"})
+    assert "error" in response.json()
+    assert response.json()["error"]["rpc_code"] == "NO_SUCH_BUCKET"
+    with pytest.raises(CommandFailed, match="NO_SUCH_BUCKET"):
+        response.raise_for_error()
+
+
+def test_send_batch_keeps_the_order_of_the_queries():
+    client = get_client()
+    names = [f"bucket-{index}" for index in range(20)] + ["missing"]
+    responses = client.send_batch(
+        [("bucket_api", "read_bucket", {"name": name}) for name in names]
+    )
+    assert [response["reply"] for response in responses[:-1]] == [
+        {"name": name} for name in names[:-1]
+    ]
+    assert responses[-1]["error"]["rpc_code"] == "NO_SUCH_BUCKET"
+    for response in responses[:-1]:
+        response.raise_for_error()
@@ -0,0 +1,68 @@
+from ocs_ci.ocs import constants
+
+# pvc module can't be imported before the pod module due to a circular import
+from ocs_ci.ocs.resources import pod  # noqa: F401
+from ocs_ci.ocs.resources import pvc
+
+
+def _pvc(name, volume_name, storage_class):
+    return {
+        "metadata": {"name": name},
+        "spec": {"volumeName": volume_name, "storageClassName": storage_class},
+    }
+
+
+def _pv(name, driver, volume_attributes):
+    return {
+        "metadata": {"name": name},
+        "spec": {
+            "csi": {
+                "driver": driver,
+                "volumeHandle": f"handle-{name}",
+                "volumeAttributes": volume_attributes,
+            }
+        },
+    }
+
+
+def test_get_pvc_backend_volumes(monkeypatch):
+    resources = {
+        constants.PVC: [
+            _pvc("rbd-pvc", "pv-1", "ocs-storagecluster-ceph-rbd"),
+            _pvc("cephfs-pvc", "pv-2", "ocs-storagecluster-cephfs"),
+            _pvc("pending-pvc", None, "ocs-storagecluster-ceph-rbd"),
+        ],
+        constants.PV: [
+            _pv("pv-1", "rbd.csi.ceph.com", {"imageName": "csi-vol-1"}),
+            _pv("pv-2", "cephfs.csi.ceph.com", {"subvolumeName": "csi-vol-2"}),
+            _pv("pv-3", "rbd.csi.ceph.com", {"imageName": "csi-vol-3"}),
+        ],
+    }
+    calls = []
+
+    def fake_get(self, *args, **kwargs):
+        calls.append(self.kind)
+        return {"items": resources[self.kind]}
+
+    monkeypatch.setattr(pvc.OCP, "get", fake_get)
+    backend_volumes = pvc.get_pvc_backend_volumes(namespace="test")
+
+    assert sorted(calls) == sorted([constants.PVC, constants.PV])
+    assert backend_volumes == {
+        "rbd-pvc": {
+            "pv": "pv-1",
+            "storage_class": "ocs-storagecluster-ceph-rbd",
+            "driver": "rbd.csi.ceph.com",
+            "volume_handle": "handle-pv-1",
+            "rbd_image": "csi-vol-1",
+            "cephfs_subvolume": None,
+        },
+        "cephfs-pvc": {
+            "pv": "pv-2",
+            "storage_class": "ocs-storagecluster-cephfs",
+            "driver": "cephfs.csi.ceph.com",
+            "volume_handle": "handle-pv-2",
+            "rbd_image": None,
+            "cephfs_subvolume": "csi-vol-2",
+        },
+    }
@@ -0,0 +1,96 @@
+import threading
+
+import pytest
+
+from ocs_ci.ocs.resources.s3_batch_deleter import (
+    S3BatchDeleter,
+    delete_buckets_objects_in_parallel,
+)
+
+
+class FakePaginator:
+    def __init__(self, client, operation):
+        self.client = client
+        self.operation = operation
+
+    def paginate(self, Bucket):
+        objects = sorted(self.client.buckets[Bucket])
+        for i in range(0, len(objects), 1000):
+            page = objects[i : i + 1000]
+            if self.operation == "list_object_versions":
+                yield {
+                    "Versions": [{"Key": k, "VersionId": v} for k, v in page],
+                    "DeleteMarkers": [],
+                }
+            else:
+                yield {"Contents": [{"Key": k} for k, _ in page]}
+
+
+class FakeS3Client:
+    def __init__(self, buckets, failing_keys=()):
+        self.buckets = buckets
+        self.failing_keys = set(failing_keys)
+        self.lock = threading.Lock()
+
+    def get_paginator(self, operation):
+        return FakePaginator(self, operation)
+
+    def get_bucket_versioning(self, Bucket):
+        return {"Status": "Enabled"} if Bucket.startswith("versioned") else {}
+
+    def delete_objects(self, Bucket, Delete):
+        deleted, errors = [], []
+        with self.lock:
+            for obj in Delete["Objects"]:
+                if obj["Key"] in self.failing_keys:
+                    errors.append(dict(obj, Code="InternalError"))
+                    continue
+                self.buckets[Bucket].discard((obj["Key"], obj.get("VersionId")))
+                deleted.append(obj)
+        return {"Deleted": deleted, "Errors": errors}
+
+
+class FakeS3Resource:
+    def __init__(self, client):
+        self.meta = self
+        self.client = client
+
+    def Bucket(self, name):
+        return name
+
+
+def make_resource(buckets, failing_keys=()):
+    return FakeS3Resource(FakeS3Client(buckets, failing_keys))
+
+
+def test_delete_pipelined():
+    buckets = {"bucket": {(f"obj-{i}", None) for i in range(3500)}}
+    deleter = S3BatchDeleter(make_resource(buckets), "bucket")
+    deleter.delete_pipelined(max_workers=4)
+    assert not buckets["bucket"]
+    assert deleter.progress.deleted == 3500
+
+
+def test_delete_pipelined_versioned():
+    buckets = {"versioned-bucket": {(f"obj-{i % 10}", f"v{i}") for i in range(1200)}}
+    deleter = S3BatchDeleter(make_resource(buckets), "versioned-bucket")
+    deleter.delete_pipelined(max_workers=2)
+    assert not buckets["versioned-bucket"]
+
+
+def test_delete_pipelined_failure():
+    buckets = {"bucket": {(f"obj-{i}", None) for i in range(10)}}
+    deleter = S3BatchDeleter(make_resource(buckets, failing_keys=["obj-3"]), "bucket")
+    with pytest.raises(Exception, match="Deletion failed for 1 objects"):
+        deleter.delete_pipelined(max_workers=2)
+
+
+def test_delete_buckets_objects_in_parallel():
+    buckets = {
+        "first": {(f"obj-{i}", None) for i in range(1500)},
+        "versioned-second": {(f"obj-{i}", "v1") for i in range(1500)},
+    }
+    delete_buckets_objects_in_parallel(
+        make_resource(buckets), list(buckets), requests_per_second=100
+    )
+    assert not any(buckets.values())
@@ -0,0 +1,76 @@
+from ocs_ci.ocs.resources.s3_bucket_comparator import StreamingBucketComparator
+
+
+class FakePaginator:
+    def __init__(self, buckets, calls):
+        self.buckets = buckets
+        self.calls = calls
+
+    def paginate(self, Bucket, Prefix, StartAfter, PaginationConfig):
+        self.calls.append((Bucket, StartAfter))
+        objects = [
+            obj
+            for obj in sorted(self.buckets[Bucket], key=lambda obj: obj["Key"])
+            if obj["Key"] > StartAfter and obj["Key"].startswith(Prefix)
+        ]
+        page_size = PaginationConfig["PageSize"]
+        for i in range(0, len(objects), page_size):
+            yield {"Contents": objects[i : i + page_size]}
+
+
+class FakeS3Obj:
+    def __init__(self, buckets):
+        self.s3_client = self
+        self.buckets = buckets
+        self.calls = []
+
+    def get_paginator(self, operation):
+        return FakePaginator(self.buckets, self.calls)
+
+
+def make_objects(keys, etag='"a"', size=1):
+    return [{"Key": key, "ETag": etag, "Size": size} for key in keys]
+
+
+def test_identical_buckets():
+    keys = [f"obj-{i:03}" for i in range(50)]
+    s3_obj = FakeS3Obj({"first": make_objects(keys), "second": make_objects(keys)})
+    diff = StreamingBucketComparator(s3_obj, "first", "second", page_size=7).compare()
+    assert diff.identical
+    assert diff.matched == 50
+
+
+def test_differences_are_counted_and_sampled():
+    s3_obj = FakeS3Obj(
+        {
+            "first": make_objects([f"a-{i:03}" for i in range(30)] + ["b", "c"]),
+            "second": make_objects(["b", "d"]) + make_objects(["c"], etag='"x"'),
+        }
+    )
+    comparator = StreamingBucketComparator(
+        s3_obj, "first", "second", compare_etag=True, max_samples=5
+    )
+    diff = comparator.compare()
+    assert not diff.identical
+    assert diff.matched == 1
+    assert diff.missing_in_second == 30
+    assert len(diff.missing_in_second_sample) == 5
+    assert diff.missing_in_first_sample == ["d"]
+    assert [key for key, _ in diff.mismatched_sample] == ["c"]
+
+
+def test_compare_resumes_from_checkpoint():
+    buckets = {
+        "first": make_objects(["a", "b", "c", "d"]),
+        "second": make_objects(["a", "b"]),
+    }
+    s3_obj = FakeS3Obj(buckets)
+    comparator = StreamingBucketComparator(s3_obj, "first", "second")
+    assert comparator.compare().missing_in_second == 2
+    assert comparator.checkpoint_key == "b"
+
+    buckets["second"] = make_objects(["a", "b", "c", "d"])
+    diff = comparator.compare()
+    assert diff.identical
+    assert diff.matched == 4
+    assert s3_obj.calls[-2:] == [("first", "b"), ("second", "b")]
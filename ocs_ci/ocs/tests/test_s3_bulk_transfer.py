@@ -0,0 +1,111 @@
+import shlex
+import subprocess
+from contextlib import contextmanager
+
+import pytest
+
+from ocs_ci.ocs import bucket_utils
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.ocs.resources import s3_bulk_transfer
+from ocs_ci.ocs.resources.s3_bulk_transfer import (
+    S3BulkUploader,
+    TransferStats,
+    percentile,
+)
+
+
+class FakeS3Client:
+    def __init__(self, failing_keys=()):
+        self.objects = {}
+        self.failing_keys = set(failing_keys)
+
+    def put_object(self, Bucket, Key, Body):
+        if Key in self.failing_keys:
+            raise Exception(f"failed to put {Key}")
+        self.objects[(Bucket, Key)] = Body
+
+
+class FakeClientPool:
+    def __init__(self, s3_client):
+        self.s3_client = s3_client
+
+    @contextmanager
+    def client(self):
+        yield self.s3_client
+
+
+@pytest.fixture
+def fake_uploader(monkeypatch):
+    def _factory(failing_keys=()):
+        s3_client = FakeS3Client(failing_keys)
+        monkeypatch.setattr(
+            s3_bulk_transfer,
+            "S3ClientPool",
+            lambda *args, **kwargs: FakeClientPool(s3_client),
+        )
+        return S3BulkUploader(None, max_workers=4), s3_client
+
+    return _factory
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([], 95) == 0
+
+
+def test_transfer_stats_summary():
+    stats = TransferStats()
+    stats.record(2**20, 0.1)
+    stats.record(2**20, 0.3)
+    stats.record_error()
+    stats.stop()
+    summary = stats.summary()
+    assert summary["objects"] == 2
+    assert summary["bytes"] == 2 * 2**20
+    assert summary["errors"] == 1
+    assert summary["latency_max"] == 0.3
+
+
+def test_upload_objects(fake_uploader):
+    uploader, s3_client = fake_uploader()
+    objects = ((f"obj-{i}", "data") for i in range(100))
+    summary = uploader.upload_objects("bucket", objects)
+    assert summary["objects"] == 100
+    assert len(s3_client.objects) == 100
+
+
+def test_upload_to_buckets(fake_uploader):
+    uploader, s3_client = fake_uploader()
+    uploader.upload_to_buckets(
+        ["first", "second"], lambda bucket: [(f"{bucket}-obj", "data")]
+    )
+    assert set(s3_client.objects) == {
+        ("first", "first-obj"),
+        ("second", "second-obj"),
+    }
+
+
+def test_upload_objects_failure(fake_uploader):
+    uploader, _ = fake_uploader(failing_keys=["obj-3"])
+    with pytest.raises(UnexpectedBehaviour, match="obj-3"):
+        uploader.upload_objects("bucket", [(f"obj-{i}", "data") for i in range(5)])
+    assert uploader.stats.errors == 1
+
+
+def test_craft_s3_batch_command_quotes_args(monkeypatch):
+    monkeypatch.setattr(
+        bucket_utils,
+        "craft_s3_command",
+        lambda cmd, mcg_obj, api=False: f'sh -c "{cmd}"',
+    )
+    keys = ["plain", "with space", "semi;colon", "$(touch pwned)", "quote'd"]
+    command = bucket_utils.craft_s3_batch_command(
+        "echo UPLOADED:{}", keys, None, parallelism=2
+    )
+    output = subprocess.run(
+        shlex.split(command), capture_output=True, text=True, check=True
+    ).stdout
+    assert sorted(output.splitlines()) == sorted(f"UPLOADED:{key}" for key in keys)
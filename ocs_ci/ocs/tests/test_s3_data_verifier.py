@@ -0,0 +1,158 @@
+import hashlib
+import io
+from contextlib import contextmanager
+
+import botocore.exceptions
+import pytest
+
+from ocs_ci.ocs import bucket_utils
+from ocs_ci.ocs.resources import s3_data_verifier
+from ocs_ci.ocs.resources.s3_data_verifier import (
+    BLOCK_SIZE,
+    DeterministicObjectStream,
+    S3DataVerifier,
+    expected_md5,
+    parse_size,
+)
+
+
+class FakeBody:
+    def __init__(self, data):
+        self.data = data
+
+    def iter_chunks(self, chunk_size):
+        for i in range(0, len(self.data), chunk_size):
+            yield self.data[i : i + chunk_size]
+
+
+class FakeS3Client:
+    """
+    In-memory S3 client shared by all the borrowers of the fake pool
+    """
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body, ContentLength):
+        self.objects[(Bucket, Key)] = Body.read()
+
+    def get_object(self, Bucket, Key):
+        if (Bucket, Key) not in self.objects:
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "NoSuchKey", "Message": "Not found"}}, "GetObject"
+            )
+        return {"Body": FakeBody(self.objects[(Bucket, Key)])}
+
+    def delete_objects(self, Bucket, Delete):
+        for obj in Delete["Objects"]:
+            self.objects.pop((Bucket, obj["Key"]), None)
+
+
+class FakeClientPool:
+    def __init__(self, s3_obj, size):
+        self.s3_client = s3_obj
+
+    @contextmanager
+    def client(self):
+        yield self.s3_client
+
+
+@pytest.fixture
+def s3_client(monkeypatch):
+    monkeypatch.setattr(s3_data_verifier, "S3ClientPool", FakeClientPool)
+    return FakeS3Client()
+
+
+def test_parse_size():
+    assert parse_size("1M") == 2**20
+    assert parse_size("4k") == 4 * 2**10
+    assert parse_size("512") == 512
+    assert parse_size(10) == 10
+
+
+def test_stream_content_does_not_depend_on_read_sizes():
+    size = BLOCK_SIZE * 2 + 123
+    whole = DeterministicObjectStream("seed", "key", size).read()
+    stream = DeterministicObjectStream("seed", "key", size)
+    chunks = []
+    for read_size in (7, BLOCK_SIZE, 1000, BLOCK_SIZE * 3):
+        chunks.append(stream.read(read_size))
+    assert len(whole) == size
+    assert b"".join(chunks) == whole
+
+
+def test_stream_content_depends_on_seed_and_key():
+    first = DeterministicObjectStream("seed", "key", 1024).read()
+    assert first == DeterministicObjectStream("seed", "key", 1024).read()
+    assert first != DeterministicObjectStream("seed", "other", 1024).read()
+    assert first != DeterministicObjectStream("other", "key", 1024).read()
+
+
+def test_stream_seek():
+    stream = DeterministicObjectStream("seed", "key", 4096)
+    data = stream.read()
+    assert stream.seek(0, io.SEEK_END) == 4096
+    stream.seek(100)
+    assert stream.read(50) == data[100:150]
+    assert stream.tell() == 150
+
+
+def test_expected_md5():
+    size = BLOCK_SIZE + 1
+    data = DeterministicObjectStream("seed", "key", size).read()
+    assert expected_md5("seed", "key", size) == hashlib.md5(data).hexdigest()
+
+
+def test_verify_objects_reports_every_failed_object(s3_client):
+    keys = [f"obj-{i}" for i in range(4)]
+    verifier = S3DataVerifier(s3_client, seed="seed", max_workers=2)
+    verifier.upload_objects("bucket", keys, "4K")
+    assert verifier.verify_objects("bucket", keys, "4K")
+    assert verifier.failures == []
+
+    s3_client.objects[("bucket", "obj-1")] = b"x" * 4096
+    del s3_client.objects[("bucket", "obj-2")]
+    assert not verifier.verify_objects("bucket", keys, "4K")
+    assert sorted(failure.split(":")[0] for failure in verifier.failures) == [
+        "obj-1",
+        "obj-2",
+    ]
+
+
+def test_verification_with_the_same_seed(s3_client):
+    keys = ["a", "b"]
+    S3DataVerifier(s3_client, seed="seed").upload_objects("bucket", keys, 1000)
+    assert S3DataVerifier(s3_client, seed="seed").verify_objects("bucket", keys, 1000)
+    assert not S3DataVerifier(s3_client, seed="other").verify_objects(
+        "bucket", keys, 1000
+    )
+
+
+def test_write_objects_in_process_uses_given_verifier(s3_client):
+    verifier = S3DataVerifier(s3_client, seed="seed")
+    objects = bucket_utils.write_random_test_objects_to_bucket(
+        None,
+        "bucket",
+        "/unused",
+        amount=2,
+        prefix="dir",
+        bs="1K",
+        in_process=True,
+        verifier=verifier,
+    )
+    assert objects == ["ObjKey-0", "ObjKey-1"]
+    keys = [f"dir/{obj}" for obj in objects]
+    assert verifier.verify_objects("bucket", keys, "1K")
+    verifier.delete_objects("bucket", keys)
+    assert s3_client.objects == {}
+
+
+def test_write_objects_in_process_rejects_non_mcg_bucket():
+    with pytest.raises(ValueError):
+        bucket_utils.write_random_test_objects_to_bucket(
+            None,
+            "bucket",
+            "/unused",
+            s3_creds={"endpoint": "https://s3.example.com"},
+            in_process=True,
+        )
@@ -0,0 +1,60 @@
+import os
+import struct
+import zlib
+
+from ocs_ci.ocs.ui.artefact_writer import (
+    PNG_SIGNATURE,
+    UIArtefactWriter,
+    recompress_png,
+)
+
+
+def make_chunk(chunk_type, data):
+    return (
+        struct.pack(">I", len(data))
+        + chunk_type
+        + data
+        + struct.pack(">I", zlib.crc32(chunk_type + data))
+    )
+
+
+def make_png(width=64, height=64):
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    # filter byte and one RGB row repeated, stored without compression
+    raw = (b"\x00" + b"\x10\x20\x30" * width) * height
+    image_data = zlib.compress(raw, 0)
+    return (
+        PNG_SIGNATURE
+        + make_chunk(b"IHDR", header)
+        + make_chunk(b"IDAT", image_data[:100])
+        + make_chunk(b"IDAT", image_data[100:])
+        + make_chunk(b"IEND", b"")
+    )
+
+
+def test_recompress_png():
+    png = make_png()
+    recompressed = recompress_png(png)
+    assert len(recompressed) < len(png)
+    # the image data is the same
+    idat_offset = recompressed.index(b"IDAT")
+    (length,) = struct.unpack(">I", recompressed[idat_offset - 4 : idat_offset])
+    image_data = recompressed[idat_offset + 4 : idat_offset + 4 + length]
+    assert zlib.decompress(image_data) == (b"\x00" + b"\x10\x20\x30" * 64) * 64
+    assert recompress_png(b"not a png") == b"not a png"
+
+
+def test_identical_dom_is_stored_once(tmp_path):
+    writer = UIArtefactWriter()
+    first, second, third = (str(tmp_path / f"dom{i}.html") for i in range(3))
+    writer.write_dom(first, "<html>page</html>")
+    writer.write_dom(second, "<html>page</html>")
+    writer.write_dom(third, "<html>other page</html>")
+    writer.write_screenshot(str(tmp_path / "screenshot.png"), make_png())
+    writer.close()
+
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+    assert os.stat(first).st_ino != os.stat(third).st_ino
+    with open(second) as fd:
+        assert fd.read() == "<html>page</html>"
+    assert (tmp_path / "screenshot.png").read_bytes().startswith(PNG_SIGNATURE)
@@ -0,0 +1,37 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from ocs_ci.ocs.ui.wait_timing import (
+    UIWaitTimings,
+    format_locator,
+    timed_wait,
+    ui_wait_timings,
+)
+
+
+def test_format_locator():
+    assert format_locator(("//button", By.XPATH)) == "xpath=//button"
+    assert format_locator((By.ID, "save")) == "id=save"
+
+
+def test_wait_timings_summary():
+    timings = UIWaitTimings()
+    for duration in (1, 2, 3):
+        timings.record("PvcUI.do_click", ("//button", By.XPATH), duration)
+    timings.record("PvcUI.do_click", ("save", By.ID), 30, timed_out=True)
+
+    first, second = timings.summary()
+    assert first["locator"] == "id=save"
+    assert first["timeouts"] == 1
+    assert second["count"] == 3
+    assert second["total"] == 6
+
+
+def test_timed_wait_records_timeout():
+    ui_wait_timings.clear()
+    with pytest.raises(TimeoutException):
+        with timed_wait("wait_for_element_to_be_visible", ("save", By.ID)):
+            raise TimeoutException()
+    assert ui_wait_timings.summary()[0]["timeouts"] == 1
+    ui_wait_timings.clear()
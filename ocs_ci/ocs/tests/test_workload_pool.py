@@ -0,0 +1,72 @@
+import pytest
+
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.resiliency.workload_pool import IOWorkloadPool
+
+
+class FakeImpl:
+    def __init__(self, name, corrupted=False):
+        self.deployment_name = name
+        self.current_replicas = 1
+        self.is_paused = False
+        self.is_running = True
+        self.corrupted = corrupted
+        self.verified_since = []
+
+    def validate_data_integrity(self, since_time=None):
+        self.verified_since.append(since_time)
+        if self.corrupted:
+            raise UnexpectedBehaviour("Data corruption found")
+
+
+class FakeWorkload:
+    def __init__(self, name, corrupted=False):
+        self.workload_impl = FakeImpl(name, corrupted)
+        self.cleaned_up = False
+
+    def resume_workload(self):
+        self.workload_impl.is_paused = False
+
+    def scale_down_pods(self, replicas):
+        self.workload_impl.current_replicas = replicas
+
+    def stop_workload(self):
+        self.workload_impl.is_running = False
+
+    def cleanup_workload(self):
+        self.cleaned_up = True
+
+
+def test_lease_and_release():
+    workloads = [FakeWorkload("wl-1"), FakeWorkload("wl-2")]
+    pool = IOWorkloadPool()
+    pool.provision(lambda: workloads)
+
+    with pool.leased(count=1) as leased:
+        assert pool.free_count == 1
+        leased[0].workload_impl.is_paused = True
+        leased[0].workload_impl.current_replicas = 3
+    assert pool.free_count == 2
+    assert not workloads[0].workload_impl.is_paused
+    assert workloads[0].workload_impl.current_replicas == 1
+
+    with pool.leased(count=1):
+        pass
+    # The second verification only checks the logs since the first one
+    first, second = workloads[0].workload_impl.verified_since
+    assert first is None and second is not None
+
+    with pytest.raises(UnexpectedBehaviour):
+        pool.lease(count=3)
+
+
+def test_release_discards_corrupted_workload():
+    corrupted = FakeWorkload("wl-2", corrupted=True)
+    pool = IOWorkloadPool()
+    pool.provision(lambda: [FakeWorkload("wl-1"), corrupted])
+
+    with pytest.raises(UnexpectedBehaviour, match="wl-2"):
+        with pool.leased():
+            pass
+    assert corrupted.cleaned_up
+    assert pool.free_count == 1
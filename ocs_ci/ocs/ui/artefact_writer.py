@@ -0,0 +1,169 @@
+"""
+Writing of the UI failure artefacts in a background thread
+
+The screenshots and the DOM copies are captured from the browser on the test
+thread, because they have to show the page at the time of the capture, but
+writing them to the disk doesn't have to block the test. The writer takes
+them from a bounded queue, recompresses the screenshots and stores identical
+DOM copies only once, the duplicates are hard links to the first copy.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import queue
+import struct
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def recompress_png(data, level=9):
+    """
+    Recompress the image data of a PNG with the given zlib compression level,
+    the browsers encode the screenshots with a fast and weak compression
+
+    Args:
+        data (bytes): PNG image
+        level (int): zlib compression level
+
+    Returns:
+        bytes: The recompressed PNG, the original one if it can't be parsed
+            or the recompressed one isn't smaller
+
+    """
+    if not data.startswith(PNG_SIGNATURE):
+        return data
+    chunks = []
+    image_data = []
+    offset = len(PNG_SIGNATURE)
+    try:
+        while offset < len(data):
+            (length,) = struct.unpack(">I", data[offset : offset + 4])
+            chunk_type = data[offset + 4 : offset + 8]
+            chunk_data = data[offset + 8 : offset + 8 + length]
+            offset += length + 12
+            if chunk_type == b"IDAT":
+                if not image_data:
+                    chunks.append((b"IDAT", None))
+                image_data.append(chunk_data)
+            else:
+                chunks.append((chunk_type, chunk_data))
+        compressed = zlib.compress(zlib.decompress(b"".join(image_data)), level)
+    except (struct.error, zlib.error) as e:
+        logger.debug(f"PNG can't be recompressed: {e}")
+        return data
+    parts = [PNG_SIGNATURE]
+    for chunk_type, chunk_data in chunks:
+        if chunk_data is None:
+            chunk_data = compressed
+        parts.append(struct.pack(">I", len(chunk_data)))
+        parts.append(chunk_type + chunk_data)
+        parts.append(struct.pack(">I", zlib.crc32(chunk_type + chunk_data)))
+    recompressed = b"".join(parts)
+    return recompressed if len(recompressed) < len(data) else data
+
+
+class UIArtefactWriter:
+    """
+    Background writer of the screenshots and DOM copies
+    """
+
+    def __init__(self, max_queue_size=50):
+        """
+        Args:
+            max_queue_size (int): Maximal number of artefacts waiting to be
+                written, the capture blocks when the queue is full
+
+        """
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._dom_files = {}
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="ui-artefact-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                write, path, content = task
+                write(path, content)
+            except Exception:
+                logger.exception(f"Failed to write UI artefact {task[1]}")
+            finally:
+                self._queue.task_done()
+
+    def _put(self, write, path, content):
+        self._start()
+        self._queue.put((write, path, content))
+
+    def _write_screenshot(self, path, png):
+        with open(path, "wb") as fd:
+            fd.write(recompress_png(png))
+
+    def _write_dom(self, path, html):
+        content = html.encode("utf-8")
+        dom_hash = hashlib.sha256(content).hexdigest()
+        first_copy = self._dom_files.get(dom_hash)
+        if first_copy and os.path.isfile(first_copy):
+            try:
+                os.link(first_copy, path)
+                logger.debug(f"DOM {path} is identical to {first_copy}")
+                return
+            except OSError:
+                pass
+        with open(path, "wb") as fd:
+            fd.write(content)
+        self._dom_files[dom_hash] = path
+
+    def write_screenshot(self, path, png):
+        """
+        Args:
+            path (str): Path to the PNG file
+            png (bytes): Screenshot captured from the browser
+
+        """
+        self._put(self._write_screenshot, path, png)
+
+    def write_dom(self, path, html):
+        """
+        Args:
+            path (str): Path to the HTML file
+            html (str): Page source captured from the browser
+
+        """
+        self._put(self._write_dom, path, html)
+
+    def flush(self):
+        """
+        Wait until all the queued artefacts are written
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+        Write the queued artefacts and stop the background thread
+        """
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join()
+
+
+ui_artefact_writer = UIArtefactWriter()
+atexit.register(ui_artefact_writer.close)
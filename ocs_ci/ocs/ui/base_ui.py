@@ -36,7 +36,9 @@ from ocs_ci.ocs.exceptions import (
     NotSupportedProxyConfiguration,
 )
 from ocs_ci.ocs.ocp import get_ocp_url
+from ocs_ci.ocs.ui.artefact_writer import ui_artefact_writer
 from ocs_ci.ocs.ui.views import locators_for_current_ocp_version
+from ocs_ci.ocs.ui.wait_timing import timed_wait, ui_wait_timings
 from ocs_ci.utility.templating import Templating
 from ocs_ci.utility.retry import retry
 from ocs_ci.utility import version
@@ -63,7 +65,10 @@ def wait_for_element_to_be_clickable(locator, timeout=30):
     """
     wait = WebDriverWait(SeleniumDriver(), timeout)
     try:
-        web_element = wait.until(ec.element_to_be_clickable((locator[1], locator[0])))
+        with timed_wait("wait_for_element_to_be_clickable", locator):
+            web_element = wait.until(
+                ec.element_to_be_clickable((locator[1], locator[0]))
+            )
     except TimeoutException:
         take_screenshot()
         copy_dom()
@@ -85,9 +90,10 @@ def wait_for_element_to_be_visible(locator, timeout=30):
     """
     wait = WebDriverWait(SeleniumDriver(), timeout)
     try:
-        web_element = wait.until(
-            ec.visibility_of_element_located((locator[1], locator[0]))
-        )
+        with timed_wait("wait_for_element_to_be_visible", locator):
+            web_element = wait.until(
+                ec.visibility_of_element_located((locator[1], locator[0]))
+            )
     except TimeoutException:
         take_screenshot()
         copy_dom()
@@ -220,9 +226,10 @@ class BaseUI:
 
             wait = WebDriverWait(self.driver, timeout)
             try:
-                element = wait.until(
-                    ec.element_to_be_clickable((locator[1], locator[0]))
-                )
+                with timed_wait(f"{type(self).__name__}.do_click", locator):
+                    element = wait.until(
+                        ec.element_to_be_clickable((locator[1], locator[0]))
+                    )
                 element.click()
             except TimeoutException as e:
                 self.take_screenshot(f"{type(self).__name__}-{date_time}")
@@ -299,13 +306,11 @@ class BaseUI:
                 version.get_semantic_version(get_ocp_version(), True)
                 <= version.VERSION_4_11
             ):
-                element = wait.until(
-                    ec.presence_of_element_located((locator[1], locator[0]))
-                )
+                condition = ec.presence_of_element_located((locator[1], locator[0]))
             else:
-                element = wait.until(
-                    ec.visibility_of_element_located((locator[1], locator[0]))
-                )
+                condition = ec.visibility_of_element_located((locator[1], locator[0]))
+            with timed_wait(f"{type(self).__name__}.do_send_keys", locator):
+                element = wait.until(condition)
             element.send_keys(text)
         except TimeoutException as e:
             self.take_screenshot()
@@ -474,7 +479,12 @@ class BaseUI:
         wait = WebDriverWait(
             self.driver, timeout, ignored_exceptions=ignored_exceptions
         )
-        return wait.until(ec.visibility_of_element_located((locator[1], locator[0])))
+        with timed_wait(
+            f"{type(self).__name__}.wait_for_element_to_be_visible", locator
+        ):
+            return wait.until(
+                ec.visibility_of_element_located((locator[1], locator[0]))
+            )
 
     def wait_for_element_to_be_present(
         self, locator, timeout=30, ignored_exceptions=None
@@ -493,7 +503,10 @@ class BaseUI:
         wait = WebDriverWait(
             self.driver, timeout, ignored_exceptions=ignored_exceptions
         )
-        return wait.until(ec.presence_of_element_located((locator[1], locator[0])))
+        with timed_wait(
+            f"{type(self).__name__}.wait_for_element_to_be_present", locator
+        ):
+            return wait.until(ec.presence_of_element_located((locator[1], locator[0])))
 
     def get_element_attribute(self, locator, attribute, safe: bool = False):
         """
@@ -562,6 +575,7 @@ class BaseUI:
 
         page_hash = "empty"
         page_hash_new = ""
+        start_time = time.monotonic()
 
         # comparing old and new page DOM hash together to verify the page is fully loaded
         retry_counter = 0
@@ -577,7 +591,18 @@ class BaseUI:
                     f"Current URL did not finish loading in {retries * sleep_time}"
                 )
                 self.take_screenshot()
+                ui_wait_timings.record(
+                    f"{type(self).__name__}.page_has_loaded",
+                    module_loc,
+                    time.monotonic() - start_time,
+                    timed_out=True,
+                )
                 return
+        ui_wait_timings.record(
+            f"{type(self).__name__}.page_has_loaded",
+            module_loc,
+            time.monotonic() - start_time,
+        )
         logger.info(f"page loaded: {self.driver.current_url}")
 
     def refresh_page(self):
@@ -629,7 +654,8 @@ class BaseUI:
 
         """
         wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(ec.element_to_be_clickable((locator[1], locator[0])))
+        with timed_wait(f"{type(self).__name__}.do_clear", locator):
+            element = wait.until(ec.element_to_be_clickable((locator[1], locator[0])))
         element.clear()
 
     def clear_with_ctrl_a_del(self, locator, timeout=30):
@@ -664,11 +690,14 @@ class BaseUI:
             poll_frequency=1,
         )
         try:
-            wait.until(
-                ec.text_to_be_present_in_element(
-                    (locator[1], locator[0]), expected_text
+            with timed_wait(
+                f"{type(self).__name__}.wait_until_expected_text_is_found", locator
+            ):
+                wait.until(
+                    ec.text_to_be_present_in_element(
+                        (locator[1], locator[0]), expected_text
+                    )
                 )
-            )
             return True
         except TimeoutException:
             self.take_screenshot()
@@ -700,7 +729,8 @@ class BaseUI:
                 ignored_exceptions=ignored_exceptions,
                 poll_frequency=1,
             )
-            wait.until(ec.presence_of_element_located(locator))
+            with timed_wait(f"{type(self).__name__}.check_element_presence", locator):
+                wait.until(ec.presence_of_element_located(locator))
             return True
         except (NoSuchElementException, StaleElementReferenceException):
             logger.error("Expected element not found on UI")
@@ -792,7 +822,6 @@ def copy_dom(name_suffix: str = "", dom_folder=None):
         dom_folder = screenshot_dom_location(type_loc="dom")
     if not os.path.isdir(dom_folder):
         Path(dom_folder).mkdir(parents=True, exist_ok=True)
-    time.sleep(1)
     if name_suffix:
         name_suffix = f"_{name_suffix}"
     filename = os.path.join(
@@ -800,10 +829,8 @@ def copy_dom(name_suffix: str = "", dom_folder=None):
         f"{datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S.%f')}{name_suffix}_DOM.html",
     )
     logger.info(f"Copy DOM file: {filename}")
-    html = SeleniumDriver().page_source
-    with open(filename, "w") as f:
-        f.write(html)
-    time.sleep(0.5)
+    # the page source is captured now, the file is written in the background
+    ui_artefact_writer.write_dom(filename, SeleniumDriver().page_source)
 
 
 def take_screenshot(name_suffix: str = "", screenshots_folder=None):
@@ -818,7 +845,6 @@ def take_screenshot(name_suffix: str = "", screenshots_folder=None):
         screenshots_folder = screenshot_dom_location(type_loc="screenshot")
     if not os.path.isdir(screenshots_folder):
         Path(screenshots_folder).mkdir(parents=True, exist_ok=True)
-    time.sleep(1)
     if name_suffix:
         name_suffix = f"_{name_suffix}"
     filename = os.path.join(
@@ -826,8 +852,9 @@ def take_screenshot(name_suffix: str = "", screenshots_folder=None):
         f"{datetime.datetime.now().strftime('%Y-%m-%dT%H-%M-%S.%f')}{name_suffix}.png",
     )
     logger.debug(f"Creating screenshot: {filename}")
-    SeleniumDriver().save_screenshot(filename)
-    time.sleep(0.5)
+    ui_artefact_writer.write_screenshot(
+        filename, SeleniumDriver().get_screenshot_as_png()
+    )
 
 
 def garbage_collector_webdriver():
@@ -2,7 +2,6 @@ import json
 import logging
 import time
 import datetime
-import pandas as pd
 
 from ocs_ci.framework import config
 from ocs_ci.ocs import constants
@@ -14,8 +13,10 @@ from ocs_ci.ocs.constants import (
 from ocs_ci.ocs.ocp import OCP, get_all_resource_names_of_a_kind
 from ocs_ci.ocs.resources.pod import Pod
 from ocs_ci.ocs.utils import get_pod_name_by_pattern
+from ocs_ci.utility.lazy_import import LazyModule
 
 logger = logging.getLogger(__name__)
+pd = LazyModule("pandas")
 
 
 class TopologyUiStr:
@@ -0,0 +1,160 @@
+"""
+Reuse of the logged in browser session across the UI tests
+
+Launching the browser and logging in to the console takes a significant part
+of a short UI test. With UI_SELENIUM.reuse_browser_session enabled, the
+browser of the SeleniumDriver singleton stays open and logged in after a test
+and the next test for the same cluster and user gets it after a reset of the
+state left by the previous test. The browser is logged in again when the
+session was closed or expired.
+"""
+
+import logging
+from contextlib import suppress
+
+from selenium.common.exceptions import (
+    InvalidSessionIdException,
+    NoAlertPresentException,
+    TimeoutException,
+    WebDriverException,
+)
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.ocp import get_ocp_url
+from ocs_ci.ocs.ui.base_ui import (
+    SeleniumDriver,
+    close_browser,
+    copy_dom,
+    login_ui,
+    take_screenshot,
+    wait_for_element_to_be_visible,
+)
+from ocs_ci.ocs.ui.views import locators_for_current_ocp_version
+
+logger = logging.getLogger(__name__)
+
+
+class UISessionPool:
+    """
+    Logged in browser session shared by the UI tests
+
+    Usage::
+
+        driver = ui_session_pool.acquire()
+        ...
+        ui_session_pool.release()
+    """
+
+    def __init__(self):
+        self.driver = None
+        self.key = None
+        self.console_url = None
+        self.logins = 0
+        self.reuses = 0
+
+    @property
+    def enabled(self):
+        """
+        Returns:
+            bool: True if the browser session is reused across the tests
+
+        """
+        return config.UI_SELENIUM.get("reuse_browser_session", False)
+
+    def _is_alive(self):
+        """
+        Returns:
+            bool: True if the browser of the pool is still the SeleniumDriver
+                singleton and its session is open
+
+        """
+        instance = getattr(SeleniumDriver, "instance", None)
+        if self.driver is None or getattr(instance, "driver", None) is not self.driver:
+            return False
+        try:
+            self.driver.current_url
+        except WebDriverException:
+            return False
+        return True
+
+    def _reset(self):
+        """
+        Close the windows and alerts left by the previous test and load the
+        console, the console navigation is visible only if the session is
+        still logged in
+
+        Raises:
+            TimeoutException: If the console navigation is not visible
+
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        with suppress(NoAlertPresentException):
+            self.driver.switch_to.alert.dismiss()
+        self.driver.get(self.console_url)
+        page_nav_loc = locators_for_current_ocp_version()["page"]
+        wait_for_element_to_be_visible(page_nav_loc["page_navigator_sidebar"], 60)
+
+    def acquire(self, username=None, password=None):
+        """
+        Get the logged in browser for a test
+
+        Args:
+            username (str): User to log in, kubeadmin if not set
+            password (str): Password of the user
+
+        Returns:
+            WebDriver: The logged in browser
+
+        """
+        key = (config.cur_index, username)
+        if self.key == key and self._is_alive():
+            try:
+                self._reset()
+                self.reuses += 1
+                logger.info(
+                    f"Reusing the logged in browser session ({self.reuses} reuses, "
+                    f"{self.logins} logins)"
+                )
+                return self.driver
+            except (TimeoutException, WebDriverException) as e:
+                logger.warning(f"Browser session can't be reused, logging in: {e}")
+        self.close()
+        self.driver = login_ui(username=username, password=password)
+        self.console_url = get_ocp_url()
+        self.key = key
+        self.logins += 1
+        return self.driver
+
+    def release(self):
+        """
+        Return the browser after a test, the screenshot and the DOM of the
+        last page of the test are saved as when the browser is closed
+        """
+        if not self._is_alive():
+            self.driver = None
+            self.key = None
+            return
+        try:
+            take_screenshot("release_browser_session")
+            copy_dom("release_browser_session")
+        except InvalidSessionIdException:
+            logger.error("InvalidSessionIdException occurred")
+            self.driver = None
+            self.key = None
+
+    def close(self):
+        """
+        Close the browser of the pool
+        """
+        if self.driver is not None:
+            if self._is_alive():
+                close_browser()
+            self.driver = None
+            self.key = None
+
+
+ui_session_pool = UISessionPool()
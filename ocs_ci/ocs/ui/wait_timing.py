@@ -0,0 +1,179 @@
+"""
+Timing of the waits for the UI elements
+
+Most of the UI suite time is spent waiting for the elements located by the
+page objects. The waits of BaseUI are timed per page object, operation and
+locator, so the waits which dominate the suite time or time out often can be
+found and their timeouts tightened.
+"""
+
+import csv
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from ocs_ci.framework import config
+from ocs_ci.utility.utils import percentile
+
+logger = logging.getLogger(__name__)
+
+BY_STRATEGIES = {value for name, value in vars(By).items() if not name.startswith("_")}
+
+
+def format_locator(locator):
+    """
+    Args:
+        locator (tuple): (GUI element (str), type (By)) or (type (By), GUI
+            element (str))
+
+    Returns:
+        str: The locator in the form "<type>=<GUI element>"
+
+    """
+    if not isinstance(locator, (tuple, list)) or len(locator) != 2:
+        return str(locator)
+    if locator[0] in BY_STRATEGIES:
+        return f"{locator[0]}={locator[1]}"
+    return f"{locator[1]}={locator[0]}"
+
+
+class UIWaitTimings:
+    """
+    Durations of the waits for the UI elements
+    """
+
+    def __init__(self):
+        self._durations = defaultdict(list)
+        self._timeouts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._durations)
+
+    def record(self, operation, locator, duration, timed_out=False):
+        """
+        Args:
+            operation (str): Page object and method which waited, e.g.
+                "PvcUI.do_click"
+            locator (tuple): Locator of the element
+            duration (float): Duration of the wait in seconds
+            timed_out (bool): True if the element wasn't found in time
+
+        """
+        key = (operation, format_locator(locator))
+        with self._lock:
+            self._durations[key].append(duration)
+            if timed_out:
+                self._timeouts[key] += 1
+
+    def summary(self):
+        """
+        Returns:
+            list: Dicts with the statistics of the waits per operation and
+                locator, sorted by the total time spent in the waits
+
+        """
+        with self._lock:
+            durations = {key: sorted(values) for key, values in self._durations.items()}
+            timeouts = dict(self._timeouts)
+        rows = [
+            {
+                "operation": operation,
+                "locator": locator,
+                "count": len(values),
+                "timeouts": timeouts.get((operation, locator), 0),
+                "total": round(sum(values), 3),
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "max": round(values[-1], 3),
+            }
+            for (operation, locator), values in durations.items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def write_csv(self, path):
+        """
+        Args:
+            path (str): Path to the CSV file with the summary of the waits
+
+        """
+        rows = self.summary()
+        with open(path, "w", newline="") as fd:
+            writer = csv.DictWriter(
+                fd,
+                fieldnames=[
+                    "operation",
+                    "locator",
+                    "count",
+                    "timeouts",
+                    "total",
+                    "p50",
+                    "p95",
+                    "max",
+                ],
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def clear(self):
+        with self._lock:
+            self._durations.clear()
+            self._timeouts.clear()
+
+
+ui_wait_timings = UIWaitTimings()
+
+
+@contextmanager
+def timed_wait(operation, locator):
+    """
+    Time a wait for an UI element
+
+    Args:
+        operation (str): Page object and method which waits
+        locator (tuple): Locator of the element
+
+    """
+    start = time.monotonic()
+    timed_out = False
+    try:
+        yield
+    except TimeoutException:
+        timed_out = True
+        raise
+    finally:
+        ui_wait_timings.record(
+            operation, locator, time.monotonic() - start, timed_out=timed_out
+        )
+
+
+def report_ui_wait_timings(top=20):
+    """
+    Write the summary of the UI waits of the session to the log directory and
+    log the waits which took the most time
+
+    Args:
+        top (int): Number of the logged waits
+
+    """
+    if not len(ui_wait_timings):
+        return
+    path = os.path.join(
+        os.path.expanduser(config.RUN["log_dir"]),
+        f"ui_wait_timings_{config.RUN['run_id']}.csv",
+    )
+    ui_wait_timings.write_csv(path)
+    lines = [
+        f"{row['total']:>9.1f}s {row['count']:>5} waits {row['timeouts']:>3} timeouts "
+        f"p95 {row['p95']:>6.1f}s {row['operation']} {row['locator']}"
+        for row in ui_wait_timings.summary()[:top]
+    ]
+    logger.info(
+        f"UI waits which took the most time, all waits in {path}:\n" + "\n".join(lines)
+    )
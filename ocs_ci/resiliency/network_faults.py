@@ -2,6 +2,9 @@ import time
 import random
 import logging
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from ocs_ci.ocs import ocp
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
@@ -10,9 +13,46 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.utility.utils import ceph_health_check
 from ocs_ci.ocs.platform_nodes import PlatformNodesFactory
+from ocs_ci.resiliency.node_telemetry import get_active_telemetry
 
 log = logging.getLogger(__name__)
 
+# Seconds between dispatching the fault commands and their common start time on
+# the nodes, it covers the start of the 'oc debug' pods or the 'oc exec' into
+# the node agent pods
+DEBUG_SYNC_LEAD_TIME = 45
+NODE_AGENT_SYNC_LEAD_TIME = 5
+
+TIMESTAMP_MARKER = "NETWORK_FAULT_TIMESTAMP="
+
+# Attempts of the fault removal and the delay in seconds between the attempts, the
+# fault is applied only once, a late retry would apply it out of sync
+REMOVE_TRIES = 3
+RETRY_DELAY = 5
+
+
+def build_node_command(cmd_template, interfaces, start_at):
+    """
+    Build the command list of a node which waits for the common start time,
+    runs the command on all the interfaces and reports the timestamp of the
+    change
+
+    Args:
+        cmd_template (str): Command with an '{iface}' placeholder for the interface
+        interfaces (list): Names of the interfaces of the node
+        start_at (float): Epoch time the command starts at, the command starts
+            right away if the time already passed
+
+    Returns:
+        list: Commands for `exec_oc_debug_cmd`
+
+    """
+    return [
+        f"while [ $(date +%s%N) -lt {int(start_at * 1e9)} ]; do sleep 0.05; done",
+        *[cmd_template.format(iface=iface) for iface in interfaces],
+        f"echo {TIMESTAMP_MARKER}$(date +%s.%N)",
+    ]
+
 
 class NetworkFaults(PlatformNodesFactory):
     """
@@ -22,7 +62,14 @@ class NetworkFaults(PlatformNodesFactory):
     """
 
     def __init__(
-        self, nodes, interface_types=["default"], duration=30, iterations=4, pause=15
+        self,
+        nodes,
+        interface_types=["default"],
+        duration=30,
+        iterations=4,
+        pause=15,
+        sync_lead_time=None,
+        telemetry=None,
     ):
         """
         Initializes the NetworkFaults object.
@@ -33,12 +80,20 @@ class NetworkFaults(PlatformNodesFactory):
             duration (int): Time in seconds to hold the fault per iteration.
             iterations (int): Number of iterations to apply the fault.
             pause (int): Pause duration in seconds between fault iterations.
+            sync_lead_time (int): Seconds the fault commands wait on the nodes for
+                a common start time, chosen by the command execution mode if not set.
+            telemetry (NodeTelemetry): Running node telemetry the fault events are
+                marked in, the active telemetry if not set.
         """
         super().__init__()
         self.nodes = nodes
         self.duration = duration
         self.iterations = iterations
         self.pause = pause
+        self.sync_lead_time = sync_lead_time
+        self.fault_timeline = []
+        self.telemetry = telemetry or get_active_telemetry()
+        self._timeline_lock = threading.Lock()
         self.ocp_obj = ocp.OCP()
         self.platform_node_obj = self.get_nodes_platform()
         self.node_interfaces = self._get_all_node_network_interfaces(interface_types)
@@ -94,6 +149,16 @@ class NetworkFaults(PlatformNodesFactory):
         """
         Applies a specified tc netem fault in looped iterations across all interfaces.
 
+        In every iteration the fault is applied on all the selected nodes at once,
+        every node gets a single command invocation covering all its interfaces.
+        The commands wait for a common start time, so the fault window starts
+        near-simultaneously on all the nodes regardless of how long it takes
+        to start the debug pods. The removal is scheduled at the start time of
+        the fault plus the duration, so the fault is held for the duration
+        regardless of the sync lead time. The fault is removed from all the
+        selected nodes in parallel right away if applying it failed on some
+        of them.
+
         Examples of tc netem commands:
         - tc qdisc add dev <interface> root netem delay 100ms
         # Introduces 100ms constant latency
@@ -133,37 +198,54 @@ class NetworkFaults(PlatformNodesFactory):
                 remaining_nodes = self.nodes.copy()
 
             count = min(len(remaining_nodes), random.randint(1, len(self.nodes)))
-            selected_nodes = random.sample(remaining_nodes, count)
-
-            for node in selected_nodes:
-                interfaces = self.node_interfaces.get(node.name, [])
-                for iface in interfaces:
-                    log.info(
-                        f"[Iteration {i+1}] Applying {description} on {node.name}/{iface}"
-                    )
-                    cmd = f"tc qdisc replace dev {iface} root netem {netem_command}"
-                    try:
-                        self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd])
-                        covered_nodes.add(node.name)
-                    except (CommandFailed, subprocess.TimeoutExpired) as e:
-                        log.error(f"Failed to apply fault on {node.name}/{iface}: {e}")
-
-            log.info(f"[Iteration {i+1}] Holding fault for {self.duration}s")
-            time.sleep(self.duration)
-
-            for node in selected_nodes:
-                interfaces = self.node_interfaces.get(node.name, [])
-                for iface in interfaces:
-                    log.info(
-                        f"[Iteration {i+1}] Removing fault from {node.name}/{iface}"
+            selected_nodes = [
+                node
+                for node in random.sample(remaining_nodes, count)
+                if self.node_interfaces.get(node.name)
+            ]
+            if not selected_nodes:
+                log.warning(f"[Iteration {i+1}] No interfaces on the selected nodes")
+                continue
+
+            log.info(
+                f"[Iteration {i+1}] Applying {description} on "
+                f"{', '.join(node.name for node in selected_nodes)}"
+            )
+            apply_at = time.time() + self._get_sync_lead_time()
+            remove_at = time.time()
+            try:
+                failures = self._run_on_nodes(
+                    selected_nodes,
+                    f"tc qdisc replace dev {{iface}} root netem {netem_command}",
+                    action="apply",
+                    iteration=i + 1,
+                    description=description,
+                    start_at=apply_at,
+                )
+                covered_nodes.update(
+                    node.name for node in selected_nodes if node.name not in failures
+                )
+                if failures:
+                    log.error(
+                        f"[Iteration {i+1}] Failed to apply fault on "
+                        f"{', '.join(failures)}, rolling back the iteration"
                     )
-                    cmd = f"tc qdisc del dev {iface} root"
-                    try:
-                        self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd])
-                    except (CommandFailed, subprocess.TimeoutExpired) as e:
-                        log.error(
-                            f"Failed to remove fault from {node.name}/{iface}: {e}"
-                        )
+                else:
+                    log.info(f"[Iteration {i+1}] Holding fault for {self.duration}s")
+                    remove_at = apply_at + self.duration
+            finally:
+                log.info(f"[Iteration {i+1}] Removing fault from all selected nodes")
+                self._run_on_nodes(
+                    selected_nodes,
+                    "tc qdisc del dev {iface} root",
+                    action="remove",
+                    iteration=i + 1,
+                    description=description,
+                    # The removal needs the same lead time to start the
+                    # commands on all the nodes at once as the apply
+                    start_at=max(remove_at, time.time() + self._get_sync_lead_time()),
+                    tries=REMOVE_TRIES,
+                )
 
             if i < self.iterations - 1:
                 log.info(
@@ -174,42 +256,156 @@ class NetworkFaults(PlatformNodesFactory):
         log.info("All iterations completed. Clearing any residual faults.")
         self._remove_faults_all_nodes()
 
-    def _remove_faults_all_nodes(self):
+    def _get_sync_lead_time(self):
         """
-        Removes all netem qdiscs from all interfaces on all nodes,
-        and verifies that the faults have been successfully cleared.
+        Returns:
+            int: Seconds between dispatching the node commands and their common
+                start time, it has to cover the start of the slowest command
+
         """
-        log.info("Performing cleanup of all interfaces on all nodes")
+        if self.sync_lead_time is not None:
+            return self.sync_lead_time
+        from ocs_ci.ocs.node_agent import node_agent_enabled
 
-        for node in self.nodes:
-            interfaces = self.node_interfaces.get(node.name, [])
-            for iface in interfaces:
-                cmd_del = f"tc qdisc del dev {iface} root || true"
-                try:
-                    self.ocp_obj.exec_oc_debug_cmd(node=node.name, cmd_list=[cmd_del])
-                    log.debug(f"Deleted qdisc on {node.name}/{iface}")
-                except (CommandFailed, subprocess.TimeoutExpired) as e:
-                    log.warning(f"Could not delete qdisc on {node.name}/{iface}: {e}")
-                    continue
+        return (
+            NODE_AGENT_SYNC_LEAD_TIME if node_agent_enabled() else DEBUG_SYNC_LEAD_TIME
+        )
+
+    def _run_on_nodes(
+        self, nodes, cmd_template, action, iteration, description, start_at, tries=1
+    ):
+        """
+        Runs a tc command on all interfaces of the nodes in parallel
 
-                # Verify removal
-                cmd_verify = f"tc qdisc show dev {iface}"
+        The commands of a node are executed in a single invocation, all the
+        invocations are released at once by a barrier and wait on the nodes for
+        a common start time, after which every node reports its own timestamp
+        of the change. The timestamps are recorded in `fault_timeline`.
+
+        The commands are executed without the retries of `exec_oc_debug_cmd`,
+        a retry after the start time runs right away, out of sync with the
+        other nodes, so only the commands with more tries are retried.
+
+        Args:
+            nodes (list): Node objects to run the command on.
+            cmd_template (str): Command with an '{iface}' placeholder for the interface.
+            action (str): Action of the command for the timeline, e.g. 'apply'.
+            iteration (int): Number of the fault iteration.
+            description (str): Description of the fault.
+            start_at (float): Epoch time the commands start at on the nodes.
+            tries (int): Number of attempts of the command on a node.
+
+        Returns:
+            dict: Names of the nodes where the command failed mapped to the errors.
+        """
+        barrier = threading.Barrier(len(nodes))
+        failures = {}
+
+        def _run(node):
+            cmd_list = build_node_command(
+                cmd_template, self.node_interfaces[node.name], start_at
+            )
+            event = {
+                "iteration": iteration,
+                "description": description,
+                "action": action,
+                "node": node.name,
+                "interfaces": self.node_interfaces[node.name],
+                "scheduled_at": start_at,
+                "completed_at": None,
+                "error": None,
+            }
+            barrier.wait()
+            for attempt in range(1, tries + 1):
                 try:
-                    output = self.ocp_obj.exec_oc_debug_cmd(
-                        node=node.name, cmd_list=[cmd_verify]
+                    output = self.ocp_obj.exec_oc_debug_cmd_once(
+                        node=node.name,
+                        cmd_list=cmd_list,
+                        timeout=max(start_at - time.time(), 0) + 300,
                     )
-                    if "netem" in output:
-                        log.error(
-                            f"Verification failed: netem still active on {node.name}/{iface}"
-                        )
-                    else:
-                        log.info(
-                            f"Verified: netem successfully removed from {node.name}/{iface}"
-                        )
+                    event["completed_at"] = self._parse_timestamp(output)
+                    event["error"] = None
+                    failures.pop(node.name, None)
+                    break
                 except (CommandFailed, subprocess.TimeoutExpired) as e:
-                    log.warning(
-                        f"Could not verify qdisc status on {node.name}/{iface}: {e}"
+                    log.error(
+                        f"Failed to {action} fault on {node.name} "
+                        f"(attempt {attempt}/{tries}): {e}"
                     )
+                    event["error"] = str(e)
+                    failures[node.name] = e
+                    if attempt < tries:
+                        time.sleep(RETRY_DELAY)
+            with self._timeline_lock:
+                self.fault_timeline.append(event)
+            return event
+
+        with ThreadPoolExecutor(max_workers=len(nodes)) as executor:
+            events = list(executor.map(_run, nodes))
+
+        completed = [e["completed_at"] for e in events if e["completed_at"]]
+        if completed:
+            log.info(
+                f"[Iteration {iteration}] {action.capitalize()} of {description} "
+                f"completed on {len(completed)}/{len(nodes)} nodes, skew between "
+                f"the nodes: {max(completed) - min(completed):.3f}s"
+            )
+            if self.telemetry:
+                self.telemetry.mark_event(
+                    f"{description} {action} #{iteration}", min(completed)
+                )
+        return failures
+
+    @staticmethod
+    def _parse_timestamp(output):
+        """
+        Args:
+            output (str): Output of the node command ending with the timestamp marker.
+
+        Returns:
+            float: Epoch time reported by the node, local time if not reported.
+        """
+        for line in reversed(str(output).splitlines()):
+            if line.startswith(TIMESTAMP_MARKER):
+                try:
+                    return float(line[len(TIMESTAMP_MARKER) :])
+                except ValueError:
+                    break
+        return time.time()
+
+    def _remove_faults_all_nodes(self):
+        """
+        Removes all netem qdiscs from all interfaces on all nodes in parallel,
+        and verifies that the faults have been successfully cleared.
+        """
+        log.info("Performing cleanup of all interfaces on all nodes")
+
+        def _cleanup(node):
+            interfaces = self.node_interfaces.get(node.name, [])
+            if not interfaces:
+                return
+            cmd_list = [
+                f"tc qdisc del dev {iface} root || true" for iface in interfaces
+            ]
+            cmd_list += [f"tc qdisc show dev {iface}" for iface in interfaces]
+            try:
+                output = self.ocp_obj.exec_oc_debug_cmd(
+                    node=node.name, cmd_list=cmd_list
+                )
+            except (CommandFailed, subprocess.TimeoutExpired) as e:
+                log.warning(f"Could not clean up qdiscs on {node.name}: {e}")
+                return
+            # Verify removal
+            if "netem" in output:
+                log.error(f"Verification failed: netem still active on {node.name}")
+            else:
+                log.info(
+                    f"Verified: netem successfully removed from {node.name}/"
+                    f"{','.join(interfaces)}"
+                )
+
+        with ThreadPoolExecutor(max_workers=max(len(self.nodes), 1)) as executor:
+            list(executor.map(_cleanup, self.nodes))
 
         time.sleep(5)
         log.info("All fault configurations attempted and verified.")
@@ -10,8 +10,28 @@ class NodeStats:
     """
     Class to retrieve and manage OpenShift node statistics such as CPU, memory,
     disk, and network metrics from a given node using `oc debug`.
+
+    The methods take one-shot samples of a single node, use `start_telemetry`
+    for continuous sampling of multiple nodes.
     """
 
+    @staticmethod
+    def start_telemetry(nodes, interval=5, **kwargs):
+        """
+        Start continuous sampling of the /proc metrics of the nodes in background.
+
+        Args:
+            nodes (list): Node objects or node names.
+            interval (float): Interval in seconds between the samples. Default 5.
+            **kwargs: Other arguments of NodeTelemetry.
+
+        Returns:
+            NodeTelemetry: The running sampler, stop it by its stop method.
+        """
+        from ocs_ci.resiliency.node_telemetry import NodeTelemetry
+
+        return NodeTelemetry(nodes, interval=interval, **kwargs).start()
+
     @staticmethod
     def cpu_stats(node_obj, interval=1, count=2, format="json"):
         """
@@ -0,0 +1,487 @@
+"""
+Continuous telemetry of the OCP nodes derived from /proc
+
+The metrics of all the nodes are sampled at a fixed cadence by background
+threads, one per node. Every command executed on a node collects a batch of
+samples timestamped by the node itself, so the cost of starting the debug pod
+is shared by the whole batch (a batch of a single sample is used with the node
+agent, where the command execution is cheap). The derived metrics are kept in
+bounded in-memory time series which can be aggregated over any time window,
+e.g. around the fault injection events, and exported to the logs directory.
+"""
+
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import deque
+
+from ocs_ci.framework import ConfigSafeThread, config
+from ocs_ci.ocs import ocp
+from ocs_ci.ocs.exceptions import CommandFailed, NodeAgentUnavailable
+from ocs_ci.utility.utils import ocsci_log_path, percentile
+
+log = logging.getLogger(__name__)
+
+SAMPLE_MARKER = "NODE_TELEMETRY_SAMPLE"
+SECTOR_SIZE = 512
+MIB = 2**20
+
+METRICS = (
+    "cpu_percent",
+    "iowait_percent",
+    "memory_percent",
+    "load1",
+    "disk_read_mib_s",
+    "disk_write_mib_s",
+    "disk_busy_percent",
+    "net_rx_mib_s",
+    "net_tx_mib_s",
+)
+
+# Whole disks only, the partitions would count the same IO twice
+DISK_PREFIXES = ("sd", "vd", "xvd", "nvme", "hd")
+
+# The running telemetry the fault injections mark their events in
+_active_telemetry = None
+
+
+def get_active_telemetry():
+    """
+    Returns:
+        NodeTelemetry: The last started telemetry which is still running, None
+            if there is no running telemetry
+
+    """
+    return _active_telemetry
+
+
+def build_probe_command(count, interval):
+    """
+    Build the shell command printing `count` samples of the /proc counters
+
+    Args:
+        count (int): Number of samples
+        interval (float): Interval in seconds between the samples
+
+    Returns:
+        str: The shell command
+
+    """
+    return (
+        f"for i in $(seq {count}); do "
+        f"echo {SAMPLE_MARKER} $(date +%s.%N); "
+        f"head -1 /proc/stat; "
+        f"grep -E '^(MemTotal|MemAvailable):' /proc/meminfo; "
+        f"cat /proc/loadavg; "
+        f"cat /proc/diskstats; "
+        f"tail -n +3 /proc/net/dev; "
+        f"[ $i -lt {count} ] && sleep {interval}; "
+        f"done; true"
+    )
+
+
+def _is_whole_disk(name):
+    if not name.startswith(DISK_PREFIXES):
+        return False
+    if name.startswith("nvme"):
+        return "p" not in name.split("n", 2)[-1]
+    return not name[-1].isdigit()
+
+
+def parse_probe_output(output):
+    """
+    Parse the raw /proc counters printed by the probe command
+
+    Args:
+        output (str): Output of the command built by build_probe_command
+
+    Returns:
+        list: Dictionaries with the raw counters of the samples
+
+    """
+    samples = []
+    sample = None
+    for line in output.splitlines():
+        fields = line.split()
+        if not fields:
+            continue
+        if fields[0] == SAMPLE_MARKER:
+            sample = {"timestamp": float(fields[1]), "disks": {}, "net": {}}
+            samples.append(sample)
+        elif sample is None:
+            continue
+        elif fields[0] == "cpu":
+            values = [int(value) for value in fields[1:9]]
+            sample["cpu_total"] = sum(values)
+            sample["cpu_idle"] = values[3] + values[4]
+            sample["cpu_iowait"] = values[4]
+        elif fields[0] in ("MemTotal:", "MemAvailable:"):
+            sample[fields[0].rstrip(":")] = int(fields[1])
+        elif len(fields) == 5 and "/" in fields[3]:
+            sample["load1"] = float(fields[0])
+        elif len(fields) >= 14 and fields[0].isdigit():
+            if _is_whole_disk(fields[2]):
+                sample["disks"][fields[2]] = (
+                    int(fields[5]),
+                    int(fields[9]),
+                    int(fields[12]),
+                )
+        elif ":" in line:
+            name, counters = line.split(":", 1)
+            counters = counters.split()
+            if name.strip() != "lo" and len(counters) >= 9:
+                sample["net"][name.strip()] = (int(counters[0]), int(counters[8]))
+    return samples
+
+
+def derive_metrics(previous, current):
+    """
+    Derive the metrics from two consecutive samples of the raw counters
+
+    Args:
+        previous (dict): Earlier sample returned by parse_probe_output
+        current (dict): Later sample returned by parse_probe_output
+
+    Returns:
+        dict: Metric names mapped to the values, empty if the counters were
+            reset in between, e.g. by a node reboot
+
+    """
+    elapsed = current["timestamp"] - previous["timestamp"]
+    cpu_total = current.get("cpu_total", 0) - previous.get("cpu_total", 0)
+    if elapsed <= 0 or cpu_total <= 0:
+        return {}
+    metrics = {
+        "cpu_percent": 100
+        * (1 - (current["cpu_idle"] - previous["cpu_idle"]) / cpu_total),
+        "iowait_percent": 100
+        * (current["cpu_iowait"] - previous["cpu_iowait"])
+        / cpu_total,
+    }
+    if current.get("MemTotal") and "MemAvailable" in current:
+        metrics["memory_percent"] = (
+            100 * (current["MemTotal"] - current["MemAvailable"]) / current["MemTotal"]
+        )
+    if "load1" in current:
+        metrics["load1"] = current["load1"]
+
+    disks = [
+        (counters, previous["disks"][name])
+        for name, counters in current["disks"].items()
+        if name in previous["disks"]
+    ]
+    deltas = [[new - old for new, old in zip(cur, prev)] for cur, prev in disks]
+    if deltas and all(delta >= 0 for disk in deltas for delta in disk):
+        metrics["disk_read_mib_s"] = (
+            sum(d[0] for d in deltas) * SECTOR_SIZE / MIB / elapsed
+        )
+        metrics["disk_write_mib_s"] = (
+            sum(d[1] for d in deltas) * SECTOR_SIZE / MIB / elapsed
+        )
+        metrics["disk_busy_percent"] = min(
+            100 * max(d[2] for d in deltas) / (elapsed * 1000), 100
+        )
+
+    interfaces = [
+        (counters, previous["net"][name])
+        for name, counters in current["net"].items()
+        if name in previous["net"]
+    ]
+    rx = sum(cur[0] - prev[0] for cur, prev in interfaces)
+    tx = sum(cur[1] - prev[1] for cur, prev in interfaces)
+    if interfaces and rx >= 0 and tx >= 0:
+        metrics["net_rx_mib_s"] = rx / MIB / elapsed
+        metrics["net_tx_mib_s"] = tx / MIB / elapsed
+    return {name: round(value, 3) for name, value in metrics.items()}
+
+
+class MetricSeries:
+    """
+    Bounded time series of a single metric, the oldest samples are dropped
+    """
+
+    def __init__(self, maxlen):
+        """
+        Args:
+            maxlen (int): Maximal number of kept samples
+
+        """
+        self._samples = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def append(self, timestamp, value):
+        with self._lock:
+            self._samples.append((timestamp, value))
+
+    def get(self, start=None, end=None):
+        """
+        Args:
+            start (float): Epoch time of the start of the window, unbounded if not set
+            end (float): Epoch time of the end of the window, unbounded if not set
+
+        Returns:
+            list: (timestamp, value) tuples within the window
+
+        """
+        with self._lock:
+            samples = list(self._samples)
+        return [
+            (timestamp, value)
+            for timestamp, value in samples
+            if (start is None or timestamp >= start)
+            and (end is None or timestamp <= end)
+        ]
+
+    def aggregate(self, start=None, end=None):
+        """
+        Args:
+            start (float): Epoch time of the start of the window, unbounded if not set
+            end (float): Epoch time of the end of the window, unbounded if not set
+
+        Returns:
+            dict: Count, p50, p95 and max of the values within the window
+
+        """
+        values = sorted(value for _, value in self.get(start, end))
+        return {
+            "count": len(values),
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": values[-1] if values else 0,
+        }
+
+
+class NodeTelemetry:
+    """
+    Background sampler of the /proc metrics of multiple nodes
+    """
+
+    def __init__(self, nodes, interval=5, samples_per_batch=None, retention=3600):
+        """
+        Args:
+            nodes (list): Node objects or node names
+            interval (float): Interval in seconds between the samples
+            samples_per_batch (int): Number of samples collected by one command
+                on a node, 1 with the node agent and 12 with 'oc debug' if not set
+            retention (int): Time in seconds the samples are kept for
+
+        """
+        self.node_names = [getattr(node, "name", node) for node in nodes]
+        self.interval = interval
+        if samples_per_batch is None:
+            from ocs_ci.ocs.node_agent import node_agent_enabled
+
+            samples_per_batch = 1 if node_agent_enabled() else 12
+        self.samples_per_batch = samples_per_batch
+        maxlen = max(int(retention / interval), 1)
+        self.series = {
+            node_name: {metric: MetricSeries(maxlen) for metric in METRICS}
+            for node_name in self.node_names
+        }
+        self.events = []
+        self._last_samples = {}
+        self._stop_event = threading.Event()
+        self._threads = []
+        self.ocp_obj = ocp.OCP(kind="node")
+
+    def _collect_batch(self, node_name):
+        """
+        Collect one batch of samples from a node and record the derived metrics
+
+        Returns:
+            int: Number of recorded samples
+
+        """
+        output = self.ocp_obj.exec_oc_debug_cmd(
+            node=node_name,
+            cmd_list=[build_probe_command(self.samples_per_batch, self.interval)],
+            timeout=self.samples_per_batch * self.interval + 120,
+        )
+        if self._stop_event.is_set():
+            # The batch of a stopped telemetry is abandoned
+            return 0
+        recorded = 0
+        for sample in parse_probe_output(output):
+            previous = self._last_samples.get(node_name)
+            self._last_samples[node_name] = sample
+            if previous is None:
+                continue
+            for metric, value in derive_metrics(previous, sample).items():
+                self.series[node_name][metric].append(sample["timestamp"], value)
+            recorded += 1
+        return recorded
+
+    def _sample_node(self, node_name):
+        while not self._stop_event.is_set():
+            try:
+                self._collect_batch(node_name)
+                # The first sample of the next batch continues the series
+                self._stop_event.wait(self.interval)
+            except (
+                CommandFailed,
+                NodeAgentUnavailable,
+                subprocess.TimeoutExpired,
+                ValueError,
+            ) as e:
+                log.warning(f"Failed to collect telemetry of node {node_name}: {e}")
+                self._last_samples.pop(node_name, None)
+                self._stop_event.wait(self.interval)
+            except Exception:
+                # e.g. a truncated probe output, the sampling has to continue
+                log.exception(f"Unexpected error in telemetry of node {node_name}")
+                self._last_samples.pop(node_name, None)
+                self._stop_event.wait(self.interval)
+
+    def start(self):
+        """
+        Start sampling all the nodes in background threads
+        """
+        log.info(
+            f"Starting telemetry of nodes {', '.join(self.node_names)} with an "
+            f"interval of {self.interval}s"
+        )
+        self._stop_event.clear()
+        self._threads = [
+            ConfigSafeThread(
+                config.cur_index,
+                target=self._sample_node,
+                args=(node_name,),
+                name=f"node-telemetry-{node_name}",
+                daemon=True,
+            )
+            for node_name in self.node_names
+        ]
+        for thread in self._threads:
+            thread.start()
+        global _active_telemetry
+        _active_telemetry = self
+        return self
+
+    def stop(self, timeout=5):
+        """
+        Stop sampling, the running batches are abandoned and their samples
+        are discarded
+
+        Args:
+            timeout (float): Time in seconds to wait for the idle sampling
+                threads to exit, the threads running a batch are daemon
+                threads left to finish the command in background
+
+        """
+        global _active_telemetry
+        if _active_telemetry is self:
+            _active_telemetry = None
+        self._stop_event.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+        running = [thread.name for thread in self._threads if thread.is_alive()]
+        if running:
+            log.info(f"Abandoned the running telemetry batches of {running}")
+        log.info("Node telemetry stopped")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def mark_event(self, name, timestamp=None):
+        """
+        Record an event, e.g. a fault injection, to aggregate the metrics around
+
+        Args:
+            name (str): Name of the event
+            timestamp (float): Epoch time of the event, now if not set
+
+        Returns:
+            float: Epoch time of the event
+
+        """
+        timestamp = timestamp or time.time()
+        self.events.append({"name": name, "timestamp": timestamp})
+        log.info(f"Node telemetry event '{name}' at {timestamp:.3f}")
+        return timestamp
+
+    def aggregate(self, start=None, end=None):
+        """
+        Aggregate the metrics of all the nodes within a time window
+
+        Args:
+            start (float): Epoch time of the start of the window, unbounded if not set
+            end (float): Epoch time of the end of the window, unbounded if not set
+
+        Returns:
+            dict: Node names mapped to the metric names mapped to the aggregates
+
+        """
+        return {
+            node_name: {
+                metric: series.aggregate(start, end)
+                for metric, series in node_series.items()
+            }
+            for node_name, node_series in self.series.items()
+        }
+
+    def aggregate_around(self, event, before=60, after=60):
+        """
+        Aggregate the metrics of all the nodes before and after an event
+
+        Args:
+            event (str|float): Name of a recorded event, its last occurrence is
+                used, or an epoch time
+            before (float): Length in seconds of the window before the event
+            after (float): Length in seconds of the window after the event
+
+        Returns:
+            dict: 'before' and 'after' aggregates as returned by aggregate
+
+        Raises:
+            KeyError: If there is no event of the name
+
+        """
+        if isinstance(event, str):
+            timestamps = [e["timestamp"] for e in self.events if e["name"] == event]
+            if not timestamps:
+                raise KeyError(f"No node telemetry event '{event}'")
+            event = timestamps[-1]
+        return {
+            "before": self.aggregate(event - before, event),
+            "after": self.aggregate(event, event + after),
+        }
+
+    def export(self, path=None):
+        """
+        Export the samples, events and aggregates to a JSON file
+
+        Args:
+            path (str): Path of the file, a file in the logs directory if not set
+
+        Returns:
+            str: Path of the file
+
+        """
+        if not path:
+            path = os.path.join(
+                ocsci_log_path(), f"node_telemetry_{int(time.time())}.json"
+            )
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {
+            "interval": self.interval,
+            "events": self.events,
+            "aggregates": self.aggregate(),
+            "series": {
+                node_name: {
+                    metric: series.get() for metric, series in node_series.items()
+                }
+                for node_name, node_series in self.series.items()
+            },
+        }
+        with open(path, "w") as f:
+            json.dump(data, f)
+        log.info(f"Node telemetry exported to {path}")
+        return path
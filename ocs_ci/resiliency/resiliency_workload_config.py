@@ -122,6 +122,16 @@ class ResiliencyWorkloadConfig:
         resiliency_config = self.config.ENV_DATA.get("resiliency_config", {})
         return resiliency_config.get("background_cluster_operations", {})
 
+    def get_node_telemetry_config(self) -> Dict[str, Any]:
+        """
+        Get node telemetry configuration.
+
+        Returns:
+            dict: Node telemetry configuration dictionary
+        """
+        resiliency_config = self.config.ENV_DATA.get("resiliency_config", {})
+        return resiliency_config.get("node_telemetry", {})
+
     def get_scaling_config(self) -> Dict[str, Any]:
         """
         Get workload scaling configuration.
@@ -212,6 +222,16 @@ class ResiliencyWorkloadConfig:
         vdbench_config = self.get_vdbench_config()
         return vdbench_config.get("workload_loop", 1)
 
+    def use_workload_pool(self) -> bool:
+        """
+        Check if the VDBENCH workloads are leased from the session workload pool.
+
+        Returns:
+            bool: True if the workload pool is used (default: False)
+        """
+        vdbench_config = self.get_vdbench_config()
+        return vdbench_config.get("use_workload_pool", False)
+
     def use_encrypted_pvc(self) -> bool:
         """
         Check if encrypted PVCs should be used for VDBENCH workloads.
@@ -24,7 +24,15 @@ class ResiliencyWorkloadOps:
     to validate workload health, start background operations, and perform cleanup.
     """
 
-    def __init__(self, project, workloads, workload_types=None, scaling_helper=None):
+    def __init__(
+        self,
+        project,
+        workloads,
+        workload_types=None,
+        scaling_helper=None,
+        workload_pool=None,
+        leased_workloads=None,
+    ):
         """
         Initialize ResiliencyWorkloadOps.
 
@@ -33,6 +41,9 @@ class ResiliencyWorkloadOps:
             workloads: List of workload objects or dict of {workload_type: [workload_objects]}
             workload_types: List of workload types (VDBENCH, CNV_WORKLOAD, FIO, etc.)
             scaling_helper: Optional WorkloadScalingHelper instance
+            workload_pool: IOWorkloadPool the leased workloads belong to
+            leased_workloads: Workloads leased from the workload pool, they are
+                already running and are released back instead of being cleaned up
         """
         self.project = project
         self.namespace = project.namespace
@@ -53,6 +64,9 @@ class ResiliencyWorkloadOps:
             self.workload_types[0] if self.workload_types else "VDBENCH"
         )
 
+        self.workload_pool = workload_pool
+        self.leased_workloads = list(leased_workloads or [])
+
         # Scaling helper
         self.scaling_helper = scaling_helper
         self.scaling_thread = None
@@ -74,6 +88,8 @@ class ResiliencyWorkloadOps:
 
         # Start all workloads
         for workload in self.workloads:
+            if workload in self.leased_workloads:
+                continue
             log.info(f"Starting workload: {workload}")
             workload.start_workload()
 
@@ -97,19 +113,35 @@ class ResiliencyWorkloadOps:
         try:
             from ocs_ci.krkn_chaos.background_cluster_operations import (
                 BackgroundClusterOperations,
+            )
+            from ocs_ci.krkn_chaos.background_cluster_validator import (
                 BackgroundClusterValidator,
             )
 
-            self.background_cluster_ops = BackgroundClusterOperations()
-            self.background_cluster_ops.start_operations()
-
+            # Capture the baseline of the backend volumes for the orphan checks
             self.background_cluster_validator = BackgroundClusterValidator(
-                self.background_cluster_ops
+                self.namespace
             )
+            self.background_cluster_validator.pre_operation_validation()
+
+            bg_ops_config = (
+                ResiliencyWorkloadConfig().get_background_operations_config()
+            )
+            self.background_cluster_ops = BackgroundClusterOperations(
+                workload_ops=self,
+                enabled_operations=bg_ops_config.get("enabled_operations"),
+                operation_interval=bg_ops_config.get("operation_interval", 60),
+                max_concurrent_operations=bg_ops_config.get(
+                    "max_concurrent_operations", 3
+                ),
+            )
+            self.background_cluster_ops.start()
 
             log.info("Background cluster operations started successfully")
         except Exception as e:
             log.warning(f"Failed to start background cluster operations: {e}")
+            self.background_cluster_ops = None
+            self.background_cluster_validator = None
 
     def _start_background_scaling(self):
         """Start background scaling operations."""
@@ -167,22 +199,27 @@ class ResiliencyWorkloadOps:
         if self.background_cluster_ops:
             log.info("Stopping background cluster operations")
             try:
-                self.background_cluster_ops.stop_operations()
+                # Record the orphans while the last operations are still running
+                self.background_cluster_validator.continuous_validation(
+                    check_orphans=True
+                )
+                self.background_cluster_ops.stop(cleanup=True)
 
                 # Validate background operations
-                if self.background_cluster_validator:
-                    validation_result = (
-                        self.background_cluster_validator.validate_all_operations()
+                validation_result, _ = (
+                    self.background_cluster_validator.post_operation_validation()
+                )
+                if not validation_result:
+                    validation_errors.append(
+                        "Background cluster operations validation failed"
                     )
-                    if not validation_result:
-                        validation_errors.append(
-                            "Background cluster operations validation failed"
-                        )
             except Exception as e:
                 log.warning(f"Failed to stop background cluster operations: {e}")
 
         # Validate and cleanup workloads
         for workload in self.workloads:
+            if workload in self.leased_workloads:
+                continue
             try:
                 log.info(f"Validating workload: {workload}")
 
@@ -224,6 +261,18 @@ class ResiliencyWorkloadOps:
                     f"Failed to validate/cleanup workload {workload_name}: {e}"
                 )
 
+        # Release the pooled workloads, their data integrity is verified on
+        # the logs since their previous verification
+        if self.leased_workloads:
+            leased_workloads, self.leased_workloads = self.leased_workloads, []
+            try:
+                self.workload_pool.release(
+                    leased_workloads,
+                    verify=ResiliencyWorkloadConfig().should_run_verification(),
+                )
+            except UnexpectedBehaviour as e:
+                validation_errors.append(str(e))
+
         # Report validation errors
         if validation_errors:
             error_msg = "\n".join(validation_errors)
@@ -263,6 +312,7 @@ class ResiliencyWorkloadFactory:
         scaling_helper=None,
         timeout=180,
         storageclass_factory=None,
+        workload_pool=None,
     ):
         """
         Create ResiliencyWorkloadOps based on the configured workload types.
@@ -277,6 +327,8 @@ class ResiliencyWorkloadFactory:
             scaling_helper: Optional WorkloadScalingHelper instance
             timeout: Timeout for operations
             storageclass_factory: Storage class factory fixture (for encrypted PVCs)
+            workload_pool: IOWorkloadPool to lease the VDBENCH workloads from
+                instead of creating them
 
         Returns:
             ResiliencyWorkloadOps: Configured workload operations manager
@@ -288,10 +340,14 @@ class ResiliencyWorkloadFactory:
         log.info(f"Created project: {proj_obj.namespace}")
 
         all_workloads = []
+        leased_workloads = []
 
         # Create workloads for each configured type
         for workload_type in self.workload_types:
-            if workload_type == "VDBENCH":
+            if workload_type == "VDBENCH" and workload_pool:
+                leased_workloads = workload_pool.lease()
+                all_workloads.extend(leased_workloads)
+            elif workload_type == "VDBENCH":
                 workloads = self._create_vdbench_workloads(
                     proj_obj,
                     multi_pvc_factory,
@@ -317,9 +373,52 @@ class ResiliencyWorkloadFactory:
         log.info(f"Created {len(all_workloads)} workloads")
 
         return ResiliencyWorkloadOps(
-            proj_obj, all_workloads, self.workload_types, scaling_helper
+            proj_obj,
+            all_workloads,
+            self.workload_types,
+            scaling_helper,
+            workload_pool,
+            leased_workloads,
         )
 
+    def provision_workload_pool(
+        self,
+        workload_pool,
+        project,
+        multi_pvc_factory,
+        vdbench_block_config,
+        vdbench_filesystem_config,
+        storageclass_factory=None,
+    ):
+        """
+        Provision the session workload pool with running VDBENCH workloads.
+
+        Args:
+            workload_pool: IOWorkloadPool to provision
+            project: OCS project object of the pooled workloads
+            multi_pvc_factory: Session scoped multi-PVC factory fixture
+            vdbench_block_config: VDBENCH block config fixture
+            vdbench_filesystem_config: VDBENCH filesystem config fixture
+            storageclass_factory: Session scoped storage class factory fixture
+                (optional, for encrypted PVCs)
+        """
+        from ocs_ci.resiliency.workload_pool import create_pooled_workload
+
+        def create_workloads():
+            workloads = self._create_vdbench_workloads(
+                project,
+                multi_pvc_factory,
+                create_pooled_workload,
+                vdbench_block_config,
+                vdbench_filesystem_config,
+                storageclass_factory,
+            )
+            for workload in workloads:
+                workload.start_workload()
+            return workloads
+
+        workload_pool.provision(create_workloads)
+
     def _create_vdbench_workloads(
         self,
         project,
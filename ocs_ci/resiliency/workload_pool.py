@@ -0,0 +1,278 @@
+"""
+Pool of background IO workloads shared by the krkn chaos and resiliency tests
+
+Deploying the IO workloads, binding their PVCs and waiting for the pods takes
+minutes per test. The pool provisions the workloads once per session, the
+tests lease them and release them back when they are done. The data integrity
+of a workload is verified on every release, only on the validation results
+logged since the previous verification.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager, suppress
+from datetime import datetime, timezone
+
+from ocs_ci.ocs.exceptions import UnexpectedBehaviour
+from ocs_ci.resiliency.resiliency_workload import workload_object
+
+log = logging.getLogger(__name__)
+
+
+def create_pooled_workload(workload_type, pvc_obj, **kwargs):
+    """
+    Create a workload object without a per test finalizer, with the same
+    signature as the resiliency_workload fixture factory
+
+    Args:
+        workload_type (str): Type of the workload, e.g. "VDBENCH"
+        pvc_obj (PVC): PVC used by the workload
+
+    Returns:
+        Workload: The workload object, the pool cleans it up
+
+    """
+    workload_cls = workload_object(workload_type, namespace=pvc_obj.namespace)
+    return workload_cls(pvc_obj, **kwargs)
+
+
+class PooledWorkload:
+    """
+    State of a workload kept by the pool
+    """
+
+    def __init__(self, workload):
+        """
+        Args:
+            workload (Workload): The started workload
+
+        """
+        self.workload = workload
+        self.leased = False
+        self.lease_count = 0
+        self.verified_until = None
+        impl = getattr(workload, "workload_impl", None)
+        self.replicas = getattr(impl, "current_replicas", None) or 1
+
+    @property
+    def name(self):
+        impl = getattr(self.workload, "workload_impl", None)
+        return getattr(impl, "deployment_name", str(self.workload))
+
+
+class IOWorkloadPool:
+    """
+    Session wide pool of running IO workloads
+
+    Usage::
+
+        pool = IOWorkloadPool()
+        if not pool.provisioned:
+            pool.provision(create_workloads)
+        with pool.leased() as workloads:
+            ...
+        pool.cleanup()
+    """
+
+    def __init__(self):
+        self.pooled = []
+        self.provisioned = False
+        self._lock = threading.Lock()
+
+    def provision(self, create_workloads):
+        """
+        Create and start the workloads of the pool
+
+        Args:
+            create_workloads (function): Called without arguments, creates and
+                starts the workloads and returns them as a list
+
+        Raises:
+            UnexpectedBehaviour: If no workload was created
+
+        """
+        workloads = create_workloads()
+        if not workloads:
+            raise UnexpectedBehaviour("No workloads were created for the pool")
+        with self._lock:
+            self.pooled.extend(PooledWorkload(workload) for workload in workloads)
+            self.provisioned = True
+        log.info(f"Workload pool provisioned with {len(workloads)} workloads")
+
+    @property
+    def workloads(self):
+        """
+        Returns:
+            list: All the workload objects of the pool
+
+        """
+        with self._lock:
+            return [pooled.workload for pooled in self.pooled]
+
+    @property
+    def free_count(self):
+        """
+        Returns:
+            int: Number of workloads which are not leased
+
+        """
+        with self._lock:
+            return sum(not pooled.leased for pooled in self.pooled)
+
+    def lease(self, count=None):
+        """
+        Lease workloads from the pool
+
+        Args:
+            count (int): Number of workloads, all the free workloads if not set
+
+        Returns:
+            list: The leased workload objects
+
+        Raises:
+            UnexpectedBehaviour: If there are not enough free workloads
+
+        """
+        with self._lock:
+            free = [pooled for pooled in self.pooled if not pooled.leased]
+            count = len(free) if count is None else count
+            if not free or len(free) < count:
+                raise UnexpectedBehaviour(
+                    f"Workload pool has {len(free)} free workloads, {count or 1} requested"
+                )
+            for pooled in free[:count]:
+                pooled.leased = True
+                pooled.lease_count += 1
+        log.info(f"Leased {count} workloads from the pool, {len(free) - count} free")
+        return [pooled.workload for pooled in free[:count]]
+
+    def _get_pooled(self, workload):
+        for pooled in self.pooled:
+            if pooled.workload is workload:
+                return pooled
+        raise ValueError(f"Workload {workload} doesn't belong to the pool")
+
+    def _verify(self, workloads):
+        """
+        Returns:
+            dict: Pooled workloads which failed the verification mapped to the errors
+
+        """
+        failures = {}
+        for workload in workloads:
+            pooled = self._get_pooled(workload)
+            impl = getattr(workload, "workload_impl", None)
+            if not hasattr(impl, "validate_data_integrity"):
+                continue
+            verified_until = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+            try:
+                impl.validate_data_integrity(since_time=pooled.verified_until)
+                pooled.verified_until = verified_until
+            except Exception as e:
+                failures[pooled] = e
+        return failures
+
+    def verify_integrity(self, workloads=None):
+        """
+        Verify the data integrity of workloads, only the validation results
+        logged since the previous verification of a workload are checked
+
+        Args:
+            workloads (list): Workload objects, all the workloads of the pool
+                if not set
+
+        Returns:
+            list: Descriptions of the failed verifications
+
+        """
+        if workloads is None:
+            workloads = self.workloads
+        return [
+            f"{pooled.name}: {error}"
+            for pooled, error in self._verify(workloads).items()
+        ]
+
+    def _reset(self, pooled):
+        """
+        Bring a workload back to the state it was provisioned in
+        """
+        impl = getattr(pooled.workload, "workload_impl", None)
+        if getattr(impl, "is_paused", False):
+            pooled.workload.resume_workload()
+        elif impl is not None and not getattr(impl, "is_running", True):
+            pooled.workload.start_workload()
+        current_replicas = getattr(impl, "current_replicas", pooled.replicas)
+        if current_replicas > pooled.replicas:
+            pooled.workload.scale_down_pods(pooled.replicas)
+        elif current_replicas < pooled.replicas:
+            pooled.workload.scale_up_pods(pooled.replicas)
+
+    def _discard(self, pooled):
+        log.warning(f"Discarding workload {pooled.name} from the pool")
+        with suppress(Exception):
+            pooled.workload.stop_workload()
+        with suppress(Exception):
+            pooled.workload.cleanup_workload()
+        with self._lock:
+            self.pooled.remove(pooled)
+
+    def release(self, workloads, verify=True):
+        """
+        Verify the leased workloads and return them to the pool, a workload
+        which fails the verification or can't be reset is removed from the pool
+
+        Args:
+            workloads (list): Leased workload objects
+            verify (bool): Verify the data integrity of the workloads
+
+        Raises:
+            UnexpectedBehaviour: If the data integrity verification failed
+
+        """
+        failures = self._verify(workloads) if verify else {}
+        for workload in workloads:
+            pooled = self._get_pooled(workload)
+            if pooled in failures:
+                self._discard(pooled)
+                continue
+            try:
+                self._reset(pooled)
+            except Exception as e:
+                log.warning(f"Failed to reset workload {pooled.name}: {e}")
+                self._discard(pooled)
+                continue
+            with self._lock:
+                pooled.leased = False
+        log.info(f"Released {len(workloads)} workloads, {self.free_count} free")
+        if failures:
+            raise UnexpectedBehaviour(
+                f"Data integrity verification failed for {len(failures)} pooled "
+                f"workloads: {[f'{pooled.name}: {error}' for pooled, error in failures.items()]}"
+            )
+
+    @contextmanager
+    def leased(self, count=None, verify=True):
+        """
+        Lease workloads for the duration of the context
+
+        Args:
+            count (int): Number of workloads, all the free workloads if not set
+            verify (bool): Verify the data integrity of the workloads on release
+
+        Yields:
+            list: The leased workload objects
+
+        """
+        workloads = self.lease(count)
+        try:
+            yield workloads
+        finally:
+            self.release(workloads, verify=verify)
+
+    def cleanup(self):
+        """
+        Stop and delete all the workloads of the pool
+        """
+        log.info(f"Cleaning up {len(self.pooled)} pooled workloads")
+        for pooled in list(self.pooled):
+            self._discard(pooled)
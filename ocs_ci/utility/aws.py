@@ -1,7 +1,6 @@
 import os
 import logging
 import time
-import boto3
 import random
 import json
 import traceback
@@ -21,9 +20,11 @@ from ocs_ci.framework import config
 from ocs_ci.ocs import constants, defaults, exceptions
 from ocs_ci.ocs.parallel import parallel
 from ocs_ci.utility.templating import load_yaml
+from ocs_ci.utility.lazy_import import LazyModule
 from tempfile import NamedTemporaryFile
 
 logger = logging.getLogger(__name__)
+boto3 = LazyModule("boto3")
 
 TIMEOUT = 90
 SLEEP = 3
@@ -0,0 +1,271 @@
+"""
+Cluster health gate with cached verdicts between the tests
+
+The full Ceph health verification around every test execs into the toolbox
+pod with long retries even when nothing could have changed the health since
+the previous test. With RUN.health_gate enabled, a background thread probes
+the health of the clusters with one `ceph health` exec every
+RUN.health_gate_interval seconds and the health checks between the tests
+answer from the last verdict. The gate is dirty after a test marked as
+disruptive until the full verification after it passes, so a disrupted
+cluster is always verified with the retries and the recovery.
+"""
+
+import logging
+import subprocess
+import threading
+import time
+
+from ocs_ci.framework import config, config_safe_thread_pool_task
+from ocs_ci.framework.sharding import DISRUPTIVE_MARKERS
+from ocs_ci.ocs.exceptions import CommandFailed, NoRunningCephToolBoxException
+from ocs_ci.utility.utils import run_ceph_health_cmd
+
+logger = logging.getLogger(__name__)
+
+# Markers of the tests without the health checks around them
+SKIP_HEALTH_CHECK_MARKERS = ("resiliency", "chaos")
+
+
+def probe_ceph_health(index):
+    """
+    Run one `ceph health` command on the cluster without retries
+
+    Args:
+        index (int): Index of the cluster config
+
+    Returns:
+        str: The output of the ceph health command
+
+    """
+    return config_safe_thread_pool_task(
+        index,
+        lambda: run_ceph_health_cmd(config.ENV_DATA["cluster_namespace"]),
+    )
+
+
+def is_disruptive_test(node):
+    """
+    Args:
+        node (pytest.Item): Test
+
+    Returns:
+        bool: True if the test is marked with a disruptive marker
+
+    """
+    return any(node.get_closest_marker(marker) for marker in DISRUPTIVE_MARKERS)
+
+
+class ClusterHealth:
+    """
+    Last health verdict of one cluster
+    """
+
+    def __init__(self):
+        self.healthy = False
+        self.healthy_since = None
+        self.checked_at = None
+        self.dirty = False
+        self.health = None
+
+
+class HealthGate:
+    """
+    Cached health verdicts of the clusters
+
+    Usage::
+
+        if not health_gate.is_healthy(index):
+            ceph_health_check(...)
+            health_gate.record(index, True, verified=True)
+    """
+
+    def __init__(self, probe=probe_ceph_health):
+        """
+        Args:
+            probe (function): Function returning the output of the ceph
+                health command of the cluster with the given config index
+
+        """
+        self.probe = probe
+        self._clusters = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def enabled(self):
+        """
+        Returns:
+            bool: True if the health checks between the tests use the gate
+
+        """
+        return config.RUN.get("health_gate", False)
+
+    @property
+    def interval(self):
+        return config.RUN.get("health_gate_interval", 60)
+
+    @property
+    def max_age(self):
+        return config.RUN.get("health_gate_max_age", 300)
+
+    def _get(self, index):
+        return self._clusters.setdefault(index, ClusterHealth())
+
+    def record(self, index, healthy, health=None, verified=False):
+        """
+        Store the health verdict of the cluster
+
+        Args:
+            index (int): Index of the cluster config
+            healthy (bool): True if the health is HEALTH_OK
+            health (str): Output of the ceph health command
+            verified (bool): True if the verdict comes from the full
+                verification, which clears the dirty state
+
+        """
+        now = time.time()
+        with self._lock:
+            cluster = self._get(index)
+            if cluster.dirty and not verified:
+                return
+            if healthy and not cluster.healthy:
+                cluster.healthy_since = now
+            if not healthy:
+                cluster.healthy_since = None
+            cluster.healthy = healthy
+            cluster.checked_at = now
+            cluster.health = health
+            if verified:
+                cluster.dirty = False
+
+    def mark_dirty(self, index):
+        """
+        Invalidate the verdict of the cluster until the next full
+        verification
+
+        Args:
+            index (int): Index of the cluster config
+
+        """
+        with self._lock:
+            self._get(index).dirty = True
+
+    def skip_health_checks(self, node, index):
+        """
+        Check if the health checks around the test are skipped. The cluster
+        is marked dirty for such a test when the gate is enabled, so the test
+        after it is verified fully instead of answered from a verdict probed
+        before the disruption.
+
+        Args:
+            node (pytest.Item): Test
+            index (int): Index of the cluster config
+
+        Returns:
+            str: Name of the marker the health checks are skipped for, None
+                if they are not skipped
+
+        """
+        for mark in node.iter_markers():
+            if mark.name.lower() in SKIP_HEALTH_CHECK_MARKERS:
+                if self.enabled:
+                    self.mark_dirty(index)
+                return mark.name
+        return None
+
+    def is_healthy(self, index):
+        """
+        Args:
+            index (int): Index of the cluster config
+
+        Returns:
+            bool: True if the last verdict of the cluster is healthy, not
+                older than RUN.health_gate_max_age and no disruptive test
+                ran since it
+
+        """
+        cluster = self._clusters.get(index)
+        return bool(
+            cluster
+            and cluster.healthy
+            and not cluster.dirty
+            and time.time() - cluster.checked_at <= self.max_age
+        )
+
+    def healthy_since(self, index):
+        """
+        Args:
+            index (int): Index of the cluster config
+
+        Returns:
+            float: Time since when the cluster is healthy, None if it is not
+
+        """
+        cluster = self._clusters.get(index)
+        return cluster.healthy_since if cluster and cluster.healthy else None
+
+    def check(self, index):
+        """
+        Probe the health of the cluster once and store the verdict
+
+        Args:
+            index (int): Index of the cluster config
+
+        Returns:
+            bool: True if the health is HEALTH_OK
+
+        """
+        try:
+            health = self.probe(index).strip()
+        except (
+            CommandFailed,
+            NoRunningCephToolBoxException,
+            subprocess.TimeoutExpired,
+        ) as e:
+            logger.warning(f"Health probe of the cluster {index} failed: {e}")
+            self.record(index, False)
+            return False
+        healthy = health.startswith("HEALTH_OK")
+        self.record(index, healthy, health)
+        return healthy
+
+    def watch(self, index):
+        """
+        Probe the health of the cluster in the background thread
+
+        Args:
+            index (int): Index of the cluster config
+
+        """
+        with self._lock:
+            self._get(index)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="health-gate", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            for index in list(self._clusters):
+                try:
+                    self.check(index)
+                except Exception:
+                    logger.exception(f"Health probe of the cluster {index} failed")
+
+    def stop(self):
+        """
+        Stop the background thread
+        """
+        self._stop.set()
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            thread.join(timeout=self.interval)
+
+
+health_gate = HealthGate()
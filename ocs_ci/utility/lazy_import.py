@@ -0,0 +1,41 @@
+"""
+Lazy loading of heavy third-party modules
+
+Modules like pandas, boto3 or kubernetes take hundreds of milliseconds to
+import. Imported at the top of the modules which are imported by almost
+everything, they slow down every run-ci invocation, collection-only runs and
+the unit tests, even when the code using them never runs.
+"""
+
+import importlib
+
+
+class LazyModule:
+    """
+    Proxy of a module which is imported on the first attribute access
+
+    Usage::
+
+        pd = LazyModule("pandas")
+
+        def to_frame(data):
+            return pd.DataFrame(data)
+    """
+
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Full name of the module, e.g. "botocore.exceptions"
+
+        """
+        self.__dict__["_name"] = name
+
+    def __getattr__(self, attr):
+        # the imported module is cached in sys.modules by importlib
+        return getattr(importlib.import_module(self._name), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(importlib.import_module(self._name), attr, value)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
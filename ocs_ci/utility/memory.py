@@ -6,17 +6,18 @@ Module for memory related util functions.
 import os
 import logging
 import tempfile
-import numpy as np
-import pandas as pd
 from psutil import Process, ZombieProcess, NoSuchProcess
 from psutil._common import bytes2human
 from ocs_ci.ocs import constants
+from ocs_ci.utility.lazy_import import LazyModule
 from threading import Timer
 
 from ocs_ci.utility.utils import get_testrun_name
 
 current_factory = logging.getLogRecordFactory()
 log = logging.getLogger(__name__)
+np = LazyModule("numpy")
+pd = LazyModule("pandas")
 
 
 class MemoryMonitor(Timer):
@@ -31,7 +32,8 @@ class MemoryMonitor(Timer):
 
 consumed_ram_log = []
 _columns_df = ["pid", "name", "ts", "rss", "vms", "status"]
-_df = pd.DataFrame(columns=_columns_df)
+# created when the memory monitor starts, pandas is imported lazily
+_df = None
 mon: MemoryMonitor
 _mem_csv: str
 
@@ -161,8 +163,8 @@ def stop_monitor_memory(save_csv: bool = False) -> tuple:
 
 
 def read_peak_mem_stats(
-    stat: constants, df: pd.DataFrame = None, csv_path: str = None
-) -> pd.DataFrame:
+    stat: constants, df: "pd.DataFrame" = None, csv_path: str = None
+) -> "pd.DataFrame":
     """
     Read peak memory stats from Dataframe or csv file. Processes with stat above avg will be taken
     Table will be reduced to only processes with stat > avg(stat) if number of processes will be
@@ -207,7 +209,7 @@ def read_peak_mem_stats(
 
 def peak_mem_stats_human_readable(
     stat: constants, csv_path: str = None
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     make peak mem stats dataframe human-readable
     dataframe columns = [name, proc_start, proc_end, rss_peak]
@@ -220,6 +222,8 @@ def peak_mem_stats_human_readable(
         pd.DataFrame: peak memory stats dataframe
     """
     global _df
+    if _df is None:
+        _df = pd.DataFrame(columns=_columns_df)
     df_peak = read_peak_mem_stats(stat, _df, csv_path)
     df_peak = df_peak.sort_values(by=f"{stat}_peak", ascending=False)
     df_peak[f"{stat}_peak"] = df_peak[f"{stat}_peak"].apply(bytes2human)
@@ -269,12 +273,12 @@ def get_peak_sum_mem() -> tuple:
     return ram_max, virt_max
 
 
-def catch_empty_mem_df(df: pd.DataFrame):
+def catch_empty_mem_df(df: "pd.DataFrame"):
     """
     routine function to catch psutil failures and fill memory dataframe with failure markers,
     therefore we may see number of failures and ignore them on examination stage
     """
-    if df.empty:
+    if df is None or df.empty:
         log.debug("Dataframe is empty, reinitializing")
         global _columns_df
         df = pd.DataFrame(
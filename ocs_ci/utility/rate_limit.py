@@ -0,0 +1,66 @@
+"""
+Client side rate limiting of requests sent from multiple threads
+"""
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens are refilled at the rate of `rate` per second up to `burst` tokens,
+    every acquire consumes one token and blocks until it is available.
+    """
+
+    def __init__(self, rate, burst=None):
+        """
+        Args:
+            rate (float): Number of allowed requests per second, no limit if not set
+            burst (int): Maximal number of requests allowed at once, defaults to rate
+
+        """
+        self.rate = rate
+        self.burst = burst or max(int(rate or 1), 1)
+        self._tokens = self.burst
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._last_refill) * self.rate
+        )
+        self._last_refill = now
+
+    def acquire(self):
+        """
+        Wait until a request is allowed
+
+        Returns:
+            float: Time in seconds spent waiting
+
+        """
+        if not self.rate:
+            return 0
+        waited = 0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
@@ -0,0 +1,325 @@
+"""
+Readiness orchestration of the operator installations
+
+An operator is ready after a chain of steps, catalog source -> subscription
+-> CSV -> CRDs -> CRs, and most operators installed during the deployment
+don't depend on each other. The ReadinessGraph runs the install steps as a
+dependency graph, every step starts as soon as the steps it requires are
+ready, so the independent branches wait concurrently. The waiters of this
+module wait with `oc wait`, which watches the resource, instead of polling
+it with fixed sleeps.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from ocs_ci.framework import config, config_safe_thread_pool_task
+from ocs_ci.ocs import constants
+from ocs_ci.ocs.exceptions import CommandFailed, TimeoutExpiredError
+from ocs_ci.ocs.ocp import OCP
+from ocs_ci.utility.utils import (
+    TimeoutSampler,
+    wait_custom_resource_defenition_available,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReadinessStep:
+    """
+    Install step of the readiness graph
+    """
+
+    def __init__(self, name, func, args, kwargs, requires, config_index):
+        self.name = name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.requires = tuple(requires)
+        self.config_index = config_index
+        self.started = None
+        self.finished = None
+
+
+class ReadinessGraph:
+    """
+    Dependency graph of the install steps
+
+    Usage::
+
+        graph = ReadinessGraph("operators")
+        graph.add_step("lso", setup_local_storage)
+        graph.add_step("cnv", CNVInstaller().deploy_cnv)
+        graph.add_step("odf", deploy_ocs, requires=["lso"])
+        graph.run()
+    """
+
+    def __init__(self, name="deployment"):
+        """
+        Args:
+            name (str): Name of the graph used in the logs
+
+        """
+        self.name = name
+        self.steps = {}
+
+    def add_step(self, name, func, *args, requires=(), config_index=None, **kwargs):
+        """
+        Add a step to the graph, the required steps have to be added before
+        the step, so the order of the steps is always a valid sequential
+        order
+
+        Args:
+            name (str): Unique name of the step
+            func (function): Function performing the step
+            requires (list): Names of the steps which have to be ready before
+                the step starts
+            config_index (int): Index of the cluster config the step runs
+                with, the current cluster if not set
+            *args: Positional arguments of the function
+            **kwargs: Keyword arguments of the function
+
+        Raises:
+            ValueError: If the step already exists or requires an unknown step
+
+        """
+        if name in self.steps:
+            raise ValueError(f"Step {name} is already in the {self.name} graph")
+        unknown = [required for required in requires if required not in self.steps]
+        if unknown:
+            raise ValueError(
+                f"Step {name} requires steps {unknown} not added to the {self.name} graph"
+            )
+        self.steps[name] = ReadinessStep(
+            name, func, args, kwargs, requires, config_index
+        )
+
+    def _run_step(self, step):
+        logger.info(f"Starting {self.name} step {step.name}")
+        step.started = time.time()
+        try:
+            step.func(*step.args, **step.kwargs)
+        finally:
+            step.finished = time.time()
+        logger.info(
+            f"{self.name} step {step.name} is ready in "
+            f"{step.finished - step.started:.1f} seconds"
+        )
+
+    def run(self, max_workers=None):
+        """
+        Run the steps, every step starts as soon as its required steps are
+        ready. When a step fails, no other step is started and the exception
+        of the step is raised after the running steps finish.
+
+        Args:
+            max_workers (int): Maximal number of the steps running at once,
+                all the ready steps run at once if not set. With 1, the steps
+                run one after another in the calling thread in the order they
+                were added.
+
+        """
+        start = time.time()
+        if max_workers == 1:
+            for step in self.steps.values():
+                self._run_step(step)
+            self.log_timeline(start)
+            return
+
+        current_index = config.cur_index
+        pending = list(self.steps.values())
+        done = set()
+        running = {}
+        failure = None
+        with ThreadPoolExecutor(
+            max_workers=max_workers or len(pending) or 1
+        ) as executor:
+            while pending or running:
+                if failure is None:
+                    for step in [
+                        step
+                        for step in pending
+                        if all(required in done for required in step.requires)
+                    ]:
+                        pending.remove(step)
+                        index = (
+                            current_index
+                            if step.config_index is None
+                            else step.config_index
+                        )
+                        future = executor.submit(
+                            config_safe_thread_pool_task, index, self._run_step, step
+                        )
+                        running[future] = step
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(step.name)
+                    except Exception as e:
+                        logger.error(f"{self.name} step {step.name} failed: {e}")
+                        failure = failure or e
+        self.log_timeline(start)
+        if failure is not None:
+            raise failure
+
+    def log_timeline(self, start):
+        """
+        Log when the steps started and how long they took
+
+        Args:
+            start (float): Start time of the graph
+
+        """
+        lines = [
+            f"{step.name:<30} start +{step.started - start:>7.1f}s "
+            f"took {step.finished - step.started:>7.1f}s"
+            for step in self.steps.values()
+            if step.started is not None and step.finished is not None
+        ]
+        logger.info(
+            f"{self.name} steps finished in {time.time() - start:.1f} seconds:\n"
+            + "\n".join(lines)
+        )
+
+
+def wait_for_catalog_source_ready(
+    name, namespace=constants.MARKETPLACE_NAMESPACE, timeout=600
+):
+    """
+    Wait for the catalog source to be connected
+
+    Args:
+        name (str): Name of the catalog source
+        namespace (str): Namespace of the catalog source
+        timeout (int): Time in seconds to wait
+
+    Raises:
+        TimeoutExpiredError: If the catalog source is not ready in time
+
+    """
+    catalog_source = OCP(kind=constants.CATSRC, namespace=namespace)
+    if not catalog_source.wait(
+        resource_name=name,
+        condition=None,
+        jsonpath="'{.status.connectionState.lastObservedState}'=READY",
+        timeout=timeout,
+    ):
+        raise TimeoutExpiredError(
+            timeout, f"Catalog source {name} is not READY after {timeout} seconds"
+        )
+
+
+def wait_for_subscription_csv(name, namespace, timeout=600, sleep=5):
+    """
+    Wait for the subscription to resolve the CSV of the operator
+
+    Args:
+        name (str): Name of the subscription
+        namespace (str): Namespace of the subscription
+        timeout (int): Time in seconds to wait
+        sleep (int): Time in seconds between the checks of the subscription
+
+    Returns:
+        str: Name of the CSV
+
+    Raises:
+        TimeoutExpiredError: If the subscription has no CSV in time
+
+    """
+    subscription = OCP(kind=constants.SUBSCRIPTION_WITH_ACM, namespace=namespace)
+    for sample in TimeoutSampler(
+        timeout, sleep, subscription.get, resource_name=name, dont_raise=True
+    ):
+        csv_name = (sample or {}).get("status", {}).get("currentCSV")
+        if csv_name:
+            logger.info(f"Subscription {name} resolved CSV {csv_name}")
+            return csv_name
+        logger.debug(f"Still waiting for the CSV of the subscription {name}")
+
+
+def wait_for_csv_succeeded(name, namespace, timeout=720):
+    """
+    Wait for the CSV to reach the Succeeded phase
+
+    Args:
+        name (str): Name of the CSV
+        namespace (str): Namespace of the CSV
+        timeout (int): Time in seconds to wait
+
+    Raises:
+        TimeoutExpiredError: If the CSV doesn't succeed in time
+
+    """
+    csv = OCP(kind=constants.CLUSTER_SERVICE_VERSION, namespace=namespace)
+    if not csv.wait(
+        resource_name=name,
+        condition=None,
+        jsonpath="'{.status.phase}'=Succeeded",
+        timeout=timeout,
+    ):
+        raise TimeoutExpiredError(
+            timeout, f"CSV {name} is not Succeeded after {timeout} seconds"
+        )
+
+
+def wait_for_operator_ready(subscription_name, namespace, timeout=720):
+    """
+    Wait for the subscription to resolve the CSV and for the CSV to succeed
+
+    Args:
+        subscription_name (str): Name of the subscription of the operator
+        namespace (str): Namespace of the operator
+        timeout (int): Time in seconds to wait for the whole chain
+
+    Returns:
+        str: Name of the CSV of the operator
+
+    Raises:
+        TimeoutExpiredError: If the operator is not ready in time
+
+    """
+    start = time.time()
+    csv_name = wait_for_subscription_csv(subscription_name, namespace, timeout)
+    remaining = max(1, int(timeout - (time.time() - start)))
+    wait_for_csv_succeeded(csv_name, namespace, remaining)
+    logger.info(
+        f"Operator {subscription_name} is ready in {time.time() - start:.1f} seconds"
+    )
+    return csv_name
+
+
+def wait_for_crd_established(name, timeout=600):
+    """
+    Wait for the CRD to be established, the custom resources of the CRD can
+    be created only after that
+
+    Args:
+        name (str): Name of the CRD
+        timeout (int): Time in seconds to wait
+
+    Raises:
+        TimeoutExpiredError: If the CRD is not established in time
+
+    """
+    start = time.time()
+    if not wait_custom_resource_defenition_available(name, timeout):
+        raise TimeoutExpiredError(
+            timeout, f"CRD {name} doesn't exist after {timeout} seconds"
+        )
+    remaining = max(1, int(timeout - (time.time() - start)))
+    try:
+        OCP(kind=constants.CRD_KIND).exec_oc_cmd(
+            f"wait {constants.CRD_KIND} {name} --for=condition=Established "
+            f"--timeout={remaining}s",
+            out_yaml_format=False,
+            timeout=remaining + 30,
+        )
+    except CommandFailed as e:
+        raise TimeoutExpiredError(
+            timeout, f"CRD {name} is not Established after {timeout} seconds: {e}"
+        )
@@ -0,0 +1,262 @@
+"""
+Shared executor of the operations on cluster resources
+
+The bulk helpers creating or deleting many resources run every operation as
+a separate oc process. Started all at once, they overload the client host
+and the requests get throttled by the API priority and fairness of the
+cluster. The executor runs the operations on a bounded thread pool, limits
+the rate of the operations per cluster, retries the throttled operations
+with an exponential backoff and collects the latencies of the operations.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from ocs_ci.framework import config, config_safe_thread_pool_task
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.rate_limit import RateLimiter
+from ocs_ci.utility.utils import percentile
+
+logger = logging.getLogger(__name__)
+
+THROTTLING_ERRORS = ("Too Many Requests", "TooManyRequests", "status code 429")
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+
+def is_throttling_error(error):
+    """
+    Args:
+        error (Exception): Error raised by an operation
+
+    Returns:
+        bool: True if the request was rejected by the API server because of
+            too many requests (HTTP 429)
+
+    """
+    return isinstance(error, CommandFailed) and any(
+        message in str(error) for message in THROTTLING_ERRORS
+    )
+
+
+def get_resource_executor():
+    """
+    Get the executor shared by the bulk resource helpers, it is created on
+    the first use with the limits from the RUN section of the config
+
+    Returns:
+        ResourceOperationExecutor: The shared executor
+
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = ResourceOperationExecutor(
+                max_workers=config.RUN.get("resource_ops_max_workers", 10),
+                qps=config.RUN.get("resource_ops_qps"),
+                burst=config.RUN.get("resource_ops_burst"),
+            )
+        return _shared_executor
+
+
+def shutdown_resource_executor(report_file=None):
+    """
+    Report the operation metrics of the shared executor and shut it down, the
+    next get_resource_executor call creates a new one
+
+    Args:
+        report_file (str): Path of the JSON file the metrics are saved to,
+            they are only logged if not set
+
+    Returns:
+        dict: The metrics of the shared executor, None if it was not created
+
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        executor = _shared_executor
+        _shared_executor = None
+    if executor is None:
+        return None
+    executor.shutdown(wait=False)
+    metrics = executor.metrics()
+    for operation, values in sorted(metrics.items()):
+        logger.info(
+            f"Resource operation {operation}: {values['count']} runs, "
+            f"{values['failed']} failed, {values['throttled']} throttled, "
+            f"p50 {values['p50']}s, p95 {values['p95']}s, max {values['max']}s"
+        )
+    if report_file and metrics:
+        with open(report_file, "w") as fd:
+            json.dump(metrics, fd, indent=2, sort_keys=True)
+        logger.info(f"Resource operation metrics saved to '{report_file}'")
+    return metrics
+
+
+class ResourceOperationExecutor:
+    """
+    Bounded thread pool for operations on cluster resources with client side
+    rate limiting per cluster
+
+    The operations run in the cluster context they were submitted from.
+
+    Usage::
+
+        executor = get_resource_executor()
+        executor.map(lambda obj: obj.delete(), pvc_objs, operation="delete_pvc")
+        logger.info(executor.metrics())
+    """
+
+    def __init__(self, max_workers=10, qps=None, burst=None, retries=5, backoff=1):
+        """
+        Args:
+            max_workers (int): Maximal number of concurrent operations
+            qps (float): Maximal number of operations started per second on
+                one cluster, no limit if not set
+            burst (int): Maximal number of operations started at once on one
+                cluster, defaults to qps
+            retries (int): Number of retries of a throttled operation
+            backoff (float): Delay in seconds before the first retry of a
+                throttled operation, doubled with every retry
+
+        """
+        self.max_workers = max_workers
+        self.qps = qps
+        self.burst = burst
+        self.retries = retries
+        self.backoff = backoff
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="resource-ops"
+        )
+        self._limiters = {}
+        self._latencies = defaultdict(list)
+        self._failures = defaultdict(int)
+        self._throttled = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _get_limiter(self, cluster_index):
+        with self._lock:
+            if cluster_index not in self._limiters:
+                self._limiters[cluster_index] = RateLimiter(self.qps, self.burst)
+            return self._limiters[cluster_index]
+
+    def _run(self, cluster_index, operation, func, args, kwargs):
+        limiter = self._get_limiter(cluster_index)
+        attempt = 0
+        while True:
+            limiter.acquire()
+            start = time.monotonic()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if is_throttling_error(e) and attempt < self.retries:
+                    delay = self.backoff * 2**attempt
+                    attempt += 1
+                    with self._lock:
+                        self._throttled[operation] += 1
+                    logger.warning(
+                        f"Operation {operation} throttled by the API server, "
+                        f"retrying in {delay} seconds"
+                    )
+                    time.sleep(delay)
+                    continue
+                with self._lock:
+                    self._failures[operation] += 1
+                    self._latencies[operation].append(time.monotonic() - start)
+                raise
+            with self._lock:
+                self._latencies[operation].append(time.monotonic() - start)
+            return result
+
+    def submit(self, func, *args, operation=None, **kwargs):
+        """
+        Submit an operation
+
+        Args:
+            func (function): The operation
+            operation (str): Name of the operation in the metrics, defaults to
+                the name of the function
+
+        Returns:
+            concurrent.futures.Future: Future of the result of the operation
+
+        """
+        operation = operation or getattr(func, "__name__", str(func))
+        cluster_index = getattr(config.thread_local_data, "config_index", None)
+        if cluster_index is None:
+            cluster_index = config.cur_index
+        return self._executor.submit(
+            config_safe_thread_pool_task,
+            cluster_index,
+            self._run,
+            cluster_index,
+            operation,
+            func,
+            args,
+            kwargs,
+        )
+
+    def map(self, func, items, operation=None):
+        """
+        Run an operation for every item and wait for all of them
+
+        Args:
+            func (function): The operation, called with one item
+            items (iterable): The items
+            operation (str): Name of the operation in the metrics
+
+        Returns:
+            list: Results of the operations in the order of the items
+
+        Raises:
+            Exception: The first error raised by the operations, after all of
+                them finished
+
+        """
+        futures = [self.submit(func, item, operation=operation) for item in items]
+        errors = [future.exception() for future in futures]
+        for error in errors:
+            if error is not None:
+                raise error
+        return [future.result() for future in futures]
+
+    def metrics(self):
+        """
+        Returns:
+            dict: Operation names mapped to the number of runs, failures and
+                throttled attempts and the latencies in seconds
+
+        """
+        with self._lock:
+            latencies = {
+                operation: sorted(values)
+                for operation, values in self._latencies.items()
+            }
+            failures = dict(self._failures)
+            throttled = dict(self._throttled)
+        return {
+            operation: {
+                "count": len(values),
+                "failed": failures.get(operation, 0),
+                "throttled": throttled.get(operation, 0),
+                "p50": round(percentile(values, 50), 3),
+                "p95": round(percentile(values, 95), 3),
+                "max": round(values[-1], 3),
+            }
+            for operation, values in latencies.items()
+        }
+
+    def shutdown(self, wait=True):
+        """
+        Shutdown the thread pool
+
+        Args:
+            wait (bool): Wait for the submitted operations to finish
+
+        """
+        self._executor.shutdown(wait=wait)
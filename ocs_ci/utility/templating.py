@@ -1,5 +1,9 @@
+import hashlib
 import json
 import logging
+import os
+import threading
+from functools import lru_cache
 from jinja2 import Environment, FileSystemLoader, Template
 import yaml
 
@@ -10,6 +14,77 @@ from ocs_ci.utility.utils import censor_values, get_url_content
 
 logger = logging.getLogger(__name__)
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed template files by path and kind of parsing, with the hash of the
+# content they were parsed from
+_file_cache = {}
+_file_cache_lock = threading.Lock()
+
+
+def _load_cached(file_path, kind, parse):
+    """
+    Parse a local file, the templates of the repository are parsed once and
+    the cached result is returned until their content changes. The other
+    files, e.g. the rendered temporary files, are parsed on every call, so
+    the cache doesn't grow with them.
+
+    Args:
+        file_path (str): Path to the file
+        kind (str): Kind of the parsing, part of the cache key
+        parse (function): Called with the content of the file, returns the
+            parsed data
+
+    Returns:
+        object: The parsed data, shared by all the callers, it must not be
+            modified
+
+    """
+    file_path = os.path.abspath(file_path)
+    with open(file_path, "r") as fs:
+        content = fs.read()
+    if not file_path.startswith(os.path.join(TEMPLATE_DIR, "")):
+        return parse(content)
+    digest = hashlib.sha1(content.encode()).hexdigest()
+    key = (file_path, kind)
+    with _file_cache_lock:
+        cached = _file_cache.get(key)
+    if cached and cached[0] == digest:
+        return cached[1]
+    data = parse(content)
+    with _file_cache_lock:
+        _file_cache[key] = (digest, data)
+    return data
+
+
+def clear_template_cache():
+    """
+    Drop all the cached parsed files
+    """
+    with _file_cache_lock:
+        _file_cache.clear()
+
+
+def _copy_data(data):
+    """
+    Copy data loaded from YAML, much cheaper than deepcopy for plain dicts
+    and lists, the scalars are immutable and shared
+
+    Args:
+        data (object): Loaded YAML data
+
+    Returns:
+        object: Copy of the data
+
+    """
+    if isinstance(data, dict):
+        return {key: _copy_data(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_copy_data(item) for item in data]
+    if isinstance(data, (set, bytearray)):
+        return deepcopy(data)
+    return data
+
 
 def load_config_data(data_path):
     """
@@ -78,9 +153,7 @@ class Templating:
         Returns: rendered template
 
         """
-        j2_env = Environment(loader=FileSystemLoader(self._base_path), trim_blocks=True)
-        j2_env.filters["to_nice_yaml"] = to_nice_yaml
-        j2_template = j2_env.get_template(template_path)
+        j2_template = _get_jinja2_env(self._base_path).get_template(template_path)
         return j2_template.render(**data)
 
     @property
@@ -101,6 +174,24 @@ class Templating:
         self._base_path = path
 
 
+@lru_cache(maxsize=None)
+def _get_jinja2_env(base_path):
+    """
+    Get the Jinja2 environment of a base path, the environment keeps the
+    compiled templates and recompiles a template when its file changes
+
+    Args:
+        base_path (str): Path from which the templates are loaded
+
+    Returns:
+        jinja2.Environment: The environment shared by all the renders
+
+    """
+    j2_env = Environment(loader=FileSystemLoader(base_path), trim_blocks=True)
+    j2_env.filters["to_nice_yaml"] = to_nice_yaml
+    return j2_env
+
+
 def generate_yaml_from_jinja2_template_with_data(file_, **kwargs):
     """
     Generate yaml fron jinja2 yaml with processed data
@@ -117,9 +208,7 @@ def generate_yaml_from_jinja2_template_with_data(file_, **kwargs):
     Examples:
         generate_yaml_from_template(file_='path/to/file/name', pv_data_dict')
     """
-    with open(file_, "r") as stream:
-        data = stream.read()
-    template = Template(data)
+    template = _load_cached(file_, "jinja2", Template)
     out = template.render(**kwargs)
     return yaml.safe_load(out)
 
@@ -140,6 +229,9 @@ def load_yaml(file, multi_document=False):
     """
     Load yaml file (local or from URL) and convert it to dictionary
 
+    Local files are parsed once and cached until they change, every call
+    returns its own copy of the data which can be modified freely.
+
     Args:
         file (str): Path to the file or URL address
         multi_document (bool): True if yaml contains more documents
@@ -151,12 +243,21 @@ def load_yaml(file, multi_document=False):
             iteration returns dict from one loaded document from a file.
 
     """
-    loader = yaml.safe_load_all if multi_document else yaml.safe_load
     if file.startswith("http"):
+        loader = yaml.safe_load_all if multi_document else yaml.safe_load
         return loader(get_url_content(file))
-    else:
-        with open(file, "r") as fs:
-            return loader(fs.read())
+    if multi_document:
+        documents = _load_cached(
+            file,
+            "yaml_all",
+            lambda content: list(yaml.load_all(content, Loader=YAML_LOADER)),
+        )
+        return (_copy_data(document) for document in documents)
+    return _copy_data(
+        _load_cached(
+            file, "yaml", lambda content: yaml.load(content, Loader=YAML_LOADER)
+        )
+    )
 
 
 def get_n_document_from_yaml(yaml_generator, index=0):
@@ -0,0 +1,67 @@
+from types import SimpleNamespace
+
+from ocs_ci.framework import config
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility.health_gate import HealthGate
+
+
+class FakeNode:
+    def __init__(self, *markers):
+        self.markers = [SimpleNamespace(name=marker) for marker in markers]
+
+    def iter_markers(self):
+        return iter(self.markers)
+
+
+def test_health_gate_caches_verdict():
+    outputs = ["HEALTH_OK", "HEALTH_WARN 1 osds down"]
+    gate = HealthGate(probe=lambda index: outputs.pop(0))
+    assert not gate.is_healthy(0)
+    assert gate.check(0)
+    assert gate.is_healthy(0)
+    healthy_since = gate.healthy_since(0)
+    assert healthy_since is not None
+    assert not gate.check(0)
+    assert not gate.is_healthy(0)
+    assert gate.healthy_since(0) is None
+
+
+def test_health_gate_dirty_until_verified():
+    gate = HealthGate(probe=lambda index: "HEALTH_OK")
+    gate.check(0)
+    gate.mark_dirty(0)
+    # the probe doesn't clear the dirty state, only the full verification
+    gate.check(0)
+    assert not gate.is_healthy(0)
+    gate.record(0, True, verified=True)
+    assert gate.is_healthy(0)
+
+
+def test_health_gate_probe_failure():
+    def probe(index):
+        raise CommandFailed("No running Ceph tools pod found")
+
+    gate = HealthGate(probe=probe)
+    assert not gate.check(1)
+    assert not gate.is_healthy(1)
+
+
+def test_health_gate_dirty_after_test_without_health_checks(monkeypatch):
+    monkeypatch.setitem(config.RUN, "health_gate", True)
+    gate = HealthGate(probe=lambda index: "HEALTH_OK")
+    gate.check(0)
+    assert gate.skip_health_checks(FakeNode("tier1"), 0) is None
+    assert gate.is_healthy(0)
+    assert gate.skip_health_checks(FakeNode("polarion_id", "Resiliency"), 0) == (
+        "Resiliency"
+    )
+    gate.check(0)
+    assert not gate.is_healthy(0)
+
+
+def test_health_gate_disabled_is_not_marked_dirty(monkeypatch):
+    monkeypatch.setitem(config.RUN, "health_gate", False)
+    gate = HealthGate(probe=lambda index: "HEALTH_OK")
+    gate.check(0)
+    assert gate.skip_health_checks(FakeNode("chaos"), 0) == "chaos"
+    assert gate.is_healthy(0)
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+from ocs_ci.utility.lazy_import import LazyModule
+
+HEAVY_MODULES = ["pandas", "numpy", "scipy", "boto3", "kubernetes", "git", "bs4"]
+
+
+def test_lazy_module_imports_on_attribute_access():
+    json = LazyModule("json")
+    assert json.loads("[1]") == [1]
+    assert "json" in repr(json)
+
+
+def test_startup_does_not_import_heavy_modules():
+    code = (
+        "import sys\n"
+        "import ocs_ci.framework.pytest_customization.ocscilib\n"
+        f"print(sorted(set({HEAVY_MODULES!r}).intersection(sys.modules)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
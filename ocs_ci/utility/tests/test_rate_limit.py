@@ -0,0 +1,67 @@
+import json
+import time
+
+from ocs_ci.ocs.exceptions import CommandFailed
+from ocs_ci.utility import resource_executor
+from ocs_ci.utility.rate_limit import RateLimiter
+from ocs_ci.utility.resource_executor import (
+    ResourceOperationExecutor,
+    get_resource_executor,
+    shutdown_resource_executor,
+)
+
+
+def test_rate_limiter_allows_burst():
+    limiter = RateLimiter(rate=1, burst=5)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+def test_rate_limiter_throttles():
+    limiter = RateLimiter(rate=20, burst=1)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+def test_rate_limiter_without_rate():
+    limiter = RateLimiter(None)
+    assert all(limiter.acquire() == 0 for _ in range(1000))
+
+
+def test_resource_executor_retries_throttled_operations():
+    executor = ResourceOperationExecutor(max_workers=2, backoff=0.01)
+    attempts = []
+
+    def create(item):
+        attempts.append(item)
+        if attempts.count(item) == 1 and item == 2:
+            raise CommandFailed(
+                "Error from server (TooManyRequests): Too Many Requests"
+            )
+        return item * 10
+
+    try:
+        assert executor.map(create, [1, 2, 3], operation="create") == [10, 20, 30]
+    finally:
+        executor.shutdown()
+    metrics = executor.metrics()["create"]
+    assert metrics["count"] == 3
+    assert metrics["throttled"] == 1
+    assert metrics["failed"] == 0
+
+
+def test_shutdown_resource_executor_reports_metrics(tmp_path, monkeypatch):
+    monkeypatch.setattr(resource_executor, "_shared_executor", None)
+    assert shutdown_resource_executor() is None
+    executor = get_resource_executor()
+    executor.map(lambda item: item, [1, 2], operation="delete")
+    report_file = tmp_path / "metrics.json"
+    metrics = shutdown_resource_executor(str(report_file))
+    assert metrics["delete"]["count"] == 2
+    assert json.loads(report_file.read_text()) == metrics
+    assert get_resource_executor() is not executor
+    shutdown_resource_executor()
@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from ocs_ci.utility.readiness import ReadinessGraph
+
+
+def test_readiness_graph_runs_independent_steps_concurrently():
+    events = []
+    lock = threading.Lock()
+    started = {"lso": threading.Event(), "cnv": threading.Event()}
+
+    def step(name, overlaps_with=None):
+        with lock:
+            events.append(f"start {name}")
+        if overlaps_with:
+            # the step can end only while the other one runs
+            started[name].set()
+            assert started[overlaps_with].wait(timeout=10)
+        with lock:
+            events.append(f"end {name}")
+
+    graph = ReadinessGraph("test")
+    graph.add_step("lso", step, "lso", "cnv")
+    graph.add_step("cnv", step, "cnv", "lso")
+    graph.add_step("odf", step, "odf", requires=["lso"])
+    graph.run()
+
+    assert set(events[:2]) == {"start lso", "start cnv"}
+    assert events.index("start odf") > events.index("end lso")
+
+
+def test_readiness_graph_sequential_order():
+    order = []
+    graph = ReadinessGraph("test")
+    for name in ("acm", "lso", "odf"):
+        graph.add_step(name, order.append, name)
+    graph.run(max_workers=1)
+    assert order == ["acm", "lso", "odf"]
+
+
+def test_readiness_graph_failure_stops_dependent_steps():
+    order = []
+
+    def fail():
+        raise RuntimeError("CSV failed")
+
+    graph = ReadinessGraph("test")
+    graph.add_step("lso", fail)
+    graph.add_step("cnv", order.append, "cnv")
+    graph.add_step("odf", order.append, "odf", requires=["lso"])
+    with pytest.raises(RuntimeError, match="CSV failed"):
+        graph.run()
+    assert "odf" not in order
+
+
+def test_readiness_graph_unknown_requirement():
+    graph = ReadinessGraph("test")
+    with pytest.raises(ValueError):
+        graph.add_step("odf", print, requires=["lso"])
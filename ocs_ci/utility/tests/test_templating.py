@@ -0,0 +1,51 @@
+import os
+
+from ocs_ci.utility import templating
+
+
+def test_load_yaml_returns_independent_copies(tmp_path):
+    yaml_file = tmp_path / "pvc.yaml"
+    yaml_file.write_text("metadata:\n  name: pvc\nspec:\n  accessModes: [RWO]\n")
+
+    first = templating.load_yaml(str(yaml_file))
+    first["metadata"]["name"] = "changed"
+    first["spec"]["accessModes"].append("RWX")
+    assert templating.load_yaml(str(yaml_file)) == {
+        "metadata": {"name": "pvc"},
+        "spec": {"accessModes": ["RWO"]},
+    }
+
+
+def test_load_yaml_reloads_changed_file(tmp_path):
+    yaml_file = tmp_path / "docs.yaml"
+    yaml_file.write_text("a: 1\n---\nb: 2\n")
+    assert list(templating.load_yaml(str(yaml_file), multi_document=True)) == [
+        {"a": 1},
+        {"b": 2},
+    ]
+
+    yaml_file.write_text("a: 10\n")
+    stat = os.stat(yaml_file)
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert templating.load_yaml(str(yaml_file)) == {"a": 10}
+
+
+def test_load_yaml_caches_only_templates(tmp_path, monkeypatch):
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    monkeypatch.setattr(templating, "TEMPLATE_DIR", str(template_dir))
+    monkeypatch.setattr(templating, "_file_cache", {})
+    rendered_file = tmp_path / "rendered.yaml"
+    rendered_file.write_text("name: rendered\n")
+    template_file = template_dir / "pod.yaml"
+    template_file.write_text("name: pod-a\n")
+
+    assert templating.load_yaml(str(rendered_file)) == {"name": "rendered"}
+    assert templating.load_yaml(str(template_file)) == {"name": "pod-a"}
+    assert list(templating._file_cache) == [(str(template_file), "yaml")]
+
+    # same size and mtime, only the content differs
+    stat = os.stat(template_file)
+    template_file.write_text("name: pod-b\n")
+    os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert templating.load_yaml(str(template_file)) == {"name": "pod-b"}
@@ -139,6 +139,13 @@ def test_run_cmd_simple_negative_ignoreerror(caplog):
     assert caplog.records[3].message == f"Command return code: {return_code}"
 
 
+def test_run_cmd_with_input():
+    """
+    Check that the input of run_cmd is streamed to the stdin of the command.
+    """
+    assert utils.run_cmd("cat", input=b"streamed manifest") == "streamed manifest"
+
+
 class A:
     def __init__(self, amount):
         self.num = amount
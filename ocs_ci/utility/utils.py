@@ -22,25 +22,16 @@ import shutil
 from copy import deepcopy
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-import pandas as pd
-from scipy.stats import tmean, scoreatpercentile
 from shutil import which, move, rmtree
-import pexpect
 import pytest
 import unicodedata
 
-import hcl2
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3 import Retry
 import yaml
-import git
-from bs4 import BeautifulSoup
-from paramiko import SSHClient, AutoAddPolicy
-from paramiko.auth_handler import AuthenticationException, SSHException
 from semantic_version import Version
 from tempfile import NamedTemporaryFile, mkdtemp, TemporaryDirectory
-from jinja2 import FileSystemLoader, Environment
 from ocs_ci.framework import config
 from ocs_ci.framework import GlobalVariables as GV
 from ocs_ci.ocs import constants, defaults
@@ -64,9 +55,7 @@ from ocs_ci.ocs.exceptions import (
     ClusterNotInSTSModeException,
 )
 from ocs_ci.utility import version as version_module
-from ocs_ci.utility.flexy import load_cluster_info
 from ocs_ci.utility.retry import retry
-from ocs_ci.utility.jira import JiraHelper
 from psutil._common import bytes2human
 from ocs_ci.ocs.constants import HCI_PROVIDER_CLIENT_PLATFORMS
 
@@ -657,6 +646,8 @@ def run_cmd_interactive(
         InteractivePromptException: in case something goes wrong
 
     """
+    import pexpect
+
     env = os.environ.copy()
     env["KUBECONFIG"] = config.RUN.get("kubeconfig")
     child = pexpect.spawn(cmd, env=env)
@@ -838,7 +829,8 @@ def exec_cmd(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            stdin=subprocess.PIPE,
+            # the data passed as input is written to stdin by subprocess.run
+            stdin=None if "input" in kwargs else subprocess.PIPE,
             timeout=timeout,
             env=_env,
             **kwargs,
@@ -2250,6 +2242,8 @@ def add_mem_stats(soup):
     Add performance summary to the soup to print the table:
     columns = ['TC name', 'Peak total RAM consumed', 'Peak total VMS consumed', 'RAM leak']
     """
+    import pandas as pd
+
     if "memory" in config.RUN and isinstance(config.RUN["memory"], pd.DataFrame):
         mem_table = config.RUN["memory"]
         mem_table["Peak RAM consumed"] = mem_table["Peak total RAM consumed"].apply(
@@ -2292,6 +2286,8 @@ def email_reports(session):
     Email results of test run
 
     """
+    from bs4 import BeautifulSoup
+
     # calculate percentage pass
     # reporter = session.config.pluginmanager.get_plugin("terminalreporter")
     # passed = len(reporter.stats.get("passed", []))
@@ -2357,6 +2353,8 @@ def save_reports():
     Save reports of test run to logs directory
 
     """
+    import pandas as pd
+
     try:
         if (
             "memory" in config.RUN
@@ -3006,6 +3004,8 @@ def ceph_health_recover(
         CephHealthRecoveredException: When Ceph health was recovered
 
     """
+    from ocs_ci.utility.jira import JiraHelper
+
     ceph_health_fixes = [
         {
             "pattern": r"daemons have recently crashed",
@@ -3775,6 +3775,9 @@ def upload_file(
         ssh_connection (SSHClient): SSH connection to use for the remote connection
 
     """
+    from paramiko import AutoAddPolicy, SSHClient
+    from paramiko.auth_handler import AuthenticationException, SSHException
+
     if not user:
         user = "root"
     try:
@@ -4070,6 +4073,7 @@ def remove_keys_from_tf_variable_file(tf_file, keys):
 
     """
     # importing here to avoid dependencies
+    import hcl2
     from ocs_ci.utility.templating import dump_data_to_json
 
     with open(tf_file, "r") as fd:
@@ -4643,6 +4647,8 @@ def login_to_mirror_registry(authfile, cluster_config=None):
         authfile (str): authfile (pull-secret) path
 
     """
+    from ocs_ci.utility.flexy import load_cluster_info
+
     if not cluster_config:
         cluster_config = config
     # load cluster info
@@ -4759,6 +4765,8 @@ def get_trim_mean(values, percentage=20):
             the regular mean average is returned
 
     """
+    from scipy.stats import scoreatpercentile, tmean
+
     lower_limit = scoreatpercentile(values, percentage)
     upper_limit = scoreatpercentile(values, 100 - percentage)
     try:
@@ -5159,6 +5167,8 @@ def download_file_from_git_repo(git_repo_url, path_to_file_in_git, filename):
         filename (str): Name of the file to write the download to
 
     """
+    import git
+
     log.debug(
         f"Download file '{path_to_file_in_git}' from "
         f"git repository {git_repo_url} to local file '{filename}'."
@@ -5801,6 +5811,9 @@ def add_time_report_to_email(session, soup):
     """
     Takes the time report dictionary and converts it into HTML table
     """
+    from bs4 import BeautifulSoup
+    from jinja2 import Environment, FileSystemLoader
+
     data = GV.TIMEREPORT_DICT
     sorted_data = dict(
         sorted(data.items(), key=lambda item: item[1].get("total", 0), reverse=True)
@@ -6758,3 +6771,21 @@ def create_kubeconfig(kubeconfig_path):
                 "Kubeconfig doesn't exists and RUN['kubeadmin_password'] and RUN['ocp_url'] "
                 "environment variables were not provided."
             )
+
+
+def percentile(sorted_values, percent):
+    """
+    Get the percentile of already sorted values using the nearest-rank method
+
+    Args:
+        sorted_values (list): Sorted list of numbers
+        percent (float): Requested percentile (0-100)
+
+    Returns:
+        float: The percentile value, or 0 if there are no values
+
+    """
+    if not sorted_values:
+        return 0
+    rank = max(int(round(percent / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
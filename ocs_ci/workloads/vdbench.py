@@ -1071,10 +1071,14 @@ class VdbenchWorkload:
         except CommandFailed as e:
             log.warning(f"Failed to capture pod logs: {e}")
 
-    def get_all_deployment_pod_logs(self):
+    def get_all_deployment_pod_logs(self, since_time=None):
         """
         Get logs from all pods belonging to the Vdbench workload deployment.
 
+        Args:
+            since_time (str): RFC3339 timestamp, only the log lines written
+                after it are returned if set
+
         Returns:
             str: Combined log output from all related pods
         """
@@ -1091,7 +1095,12 @@ class VdbenchWorkload:
                     pod_name = pod.replace("pod/", "")
                     log.info(f"Fetching logs from pod: {pod_name}")
                     try:
-                        pod_logs = run_cmd(f"oc logs {pod_name} -n {self.namespace}")
+                        since_param = (
+                            f" --since-time={since_time}" if since_time else ""
+                        )
+                        pod_logs = run_cmd(
+                            f"oc logs {pod_name} -n {self.namespace}{since_param}"
+                        )
                         logs_output.append(f"=== Logs for {pod_name} ===\n{pod_logs}\n")
                     except CommandFailed as e:
                         error_msg = f"Failed to get logs from {pod_name}: {e}"
@@ -1108,20 +1117,24 @@ class VdbenchWorkload:
         log.info("Combined logs output:\n" + "\n".join(logs_output))
         return "\n".join(logs_output)
 
-    def validate_data_integrity(self):
+    def validate_data_integrity(self, since_time=None):
         """
         Validate data integrity by parsing Vdbench logs for validation errors.
 
         Checks for the data validation summary line:
         "Total amount of key blocks read and validated: X; key blocks marked in error: Y"
 
+        Args:
+            since_time (str): RFC3339 timestamp, only the validation results
+                logged after it are checked if set
+
         Raises:
             AssertionError: If any key blocks are marked in error (data corruption detected)
         """
         import re
 
         log.info("Validating data integrity from Vdbench logs...")
-        logs = self.get_all_deployment_pod_logs()
+        logs = self.get_all_deployment_pod_logs(since_time=since_time)
 
         # Pattern to match Vdbench validation summary
         # Example: "14:13:30.227 localhost-0: 14:13:30.226 Total amount of
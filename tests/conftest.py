@@ -68,6 +68,8 @@ from ocs_ci.ocs.dr.dr_workload import (
     CnvWorkload,
     BusyboxDiscoveredApps,
     CnvWorkloadDiscoveredApps,
+    delete_workloads,
+    deploy_workloads,
 )
 from ocs_ci.ocs.exceptions import (
     CommandFailed,
@@ -88,6 +90,7 @@ from ocs_ci.ocs.exceptions import (
 )
 from ocs_ci.ocs.fill_pool_job import FillPoolJob
 from ocs_ci.ocs.mcg_workload import mcg_job_factory as mcg_job_factory_implementation
+from ocs_ci.ocs.node_agent import delete_node_agents
 from ocs_ci.ocs.node import get_node_objs, schedule_nodes
 from ocs_ci.ocs.ocp import OCP
 from ocs_ci.ocs.resources import pvc
@@ -225,7 +228,11 @@ from ocs_ci.ocs.resources.rgw import RGW
 from ocs_ci.ocs.jenkins import Jenkins
 from ocs_ci.ocs.amq import AMQ
 from ocs_ci.ocs.elasticsearch import ElasticSearch
+from ocs_ci.ocs.ui.artefact_writer import ui_artefact_writer
 from ocs_ci.ocs.ui.base_ui import login_ui, close_browser
+from ocs_ci.ocs.ui.session_pool import ui_session_pool
+from ocs_ci.utility.health_gate import health_gate, is_disruptive_test
+from ocs_ci.ocs.ui.wait_timing import report_ui_wait_timings
 from ocs_ci.ocs.ui.block_pool import BlockPoolUI
 from ocs_ci.ocs.ui.storageclass import StorageClassUI
 from ocs_ci.ocs.couchbase import CouchBase
@@ -453,6 +460,9 @@ def pytest_collection_modifyitems(session, config, items):
                 squad = marker.name.split("_")[0]
                 item.user_properties.append(("squad", squad.capitalize()))
 
+    # Removing the items one by one from the list is quadratic for the full
+    # tests tree, the removed items are filtered out at once
+    removed_items = set()
     # Skip version checks during collect-only to avoid cluster connections
     if not (
         teardown
@@ -460,7 +470,7 @@ def pytest_collection_modifyitems(session, config, items):
         or (deploy and skip_ocs_deployment)
         or config.option.collectonly
     ):
-        for item in items[:]:
+        for item in items:
             skipif_ocp_version_marker = item.get_closest_marker("skipif_ocp_version")
             skipif_ocs_version_marker = item.get_closest_marker("skipif_ocs_version")
             skipif_upgraded_from_marker = item.get_closest_marker(
@@ -476,7 +486,7 @@ def pytest_collection_modifyitems(session, config, items):
             if skipif_lvm_not_installed_marker:
                 if not ocsci_config.RUN.get("lvm", False):
                     log.info(f"Test {item} will be removed due to lvm not installed")
-                    items.remove(item)
+                    removed_items.add(item)
                     continue
             if skipif_ocp_version_marker:
                 skip_condition = skipif_ocp_version_marker.args
@@ -486,7 +496,7 @@ def pytest_collection_modifyitems(session, config, items):
                     log.debug(
                         f"Test: {item} will be skipped due to OCP {skip_condition}"
                     )
-                    items.remove(item)
+                    removed_items.add(item)
                     continue
             if skipif_ocs_version_marker:
                 skip_condition = skipif_ocs_version_marker.args
@@ -494,7 +504,7 @@ def pytest_collection_modifyitems(session, config, items):
                 # and condition will be first element in the tuple
                 if skipif_ocs_version(skip_condition[0]):
                     log.debug(f"Test: {item} will be skipped due to {skip_condition}")
-                    items.remove(item)
+                    removed_items.add(item)
                     continue
             if (
                 skipif_upgraded_from_marker
@@ -507,7 +517,7 @@ def pytest_collection_modifyitems(session, config, items):
                         f"Test: {item} will be skipped because the OCS cluster is"
                         f" upgraded from one of these versions: {skip_args[0]}"
                     )
-                    items.remove(item)
+                    removed_items.add(item)
             if skipif_no_kms_marker:
                 try:
                     if not is_kms_enabled(dont_raise=True):
@@ -515,7 +525,7 @@ def pytest_collection_modifyitems(session, config, items):
                             f"Test: {item} it will be skipped because the OCS cluster"
                             " has not configured cluster-wide encryption with KMS"
                         )
-                        items.remove(item)
+                        removed_items.add(item)
                 except KeyError:
                     log.warning(
                         "Cluster is not yet installed. Skipping skipif_no_kms check."
@@ -527,17 +537,19 @@ def pytest_collection_modifyitems(session, config, items):
                         f"Test: {item} will be skipped due to UI test"
                         f" {skip_condition.args} is not available"
                     )
-                    items.remove(item)
+                    removed_items.add(item)
                     continue
     # Skip UI test on openshift dedicated, ODF-MS, FaaS platform
     if ocsci_config.ENV_DATA["platform"].lower() in constants.MANAGED_SERVICE_PLATFORMS:
-        for item in items.copy():
+        for item in items:
             if "/ui/" in str(item.fspath):
                 log.debug(
                     f"Test {item} is removed from the collected items"
                     f" UI is not supported on {ocsci_config.ENV_DATA['platform'].lower()}"
                 )
-                items.remove(item)
+                removed_items.add(item)
+    if removed_items:
+        items[:] = [item for item in items if item not in removed_items]
     # If multicluster upgrade scenario
     if ocsci_config.multicluster and ocsci_config.UPGRADE.get("upgrade", False):
         for item in items:
@@ -2055,21 +2067,30 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
     node = request.node
 
     # Skip health check if the test is marked as 'Resiliency' or 'Chaos'
-    skip_markers = ["resiliency", "chaos"]
-    for mark in node.iter_markers():
-        if mark.name.lower() in skip_markers:
-            log.info(
-                f"Skipping Ceph health check for test marked with '{mark.name.title()}'"
-            )
-            return
+    skip_marker = health_gate.skip_health_checks(node, ocsci_config.cur_index)
+    if skip_marker:
+        log.info(
+            f"Skipping Ceph health check for test marked with '{skip_marker.title()}'"
+        )
+        return
 
     # ignore ceph health check for the TestFailurePropagator test cases
     if "FailurePropagator" in str(node.cls):
         return
 
+    # The cached verdicts of the health gate are not used for the
+    # multi-storagecluster external clusters, they are not probed by the gate
+    use_health_gate = health_gate.enabled and not ocsci_config.DEPLOYMENT.get(
+        "multi_storagecluster"
+    )
+    cluster_index = ocsci_config.cur_index
+
     def finalizer():
         if not skipped:
             multi_storagecluster_external_health_passed = False
+            disruptive = is_disruptive_test(node)
+            if use_health_gate and disruptive:
+                health_gate.mark_dirty(cluster_index)
             try:
                 teardown = ocsci_config.RUN["cli_params"]["teardown"]
                 skip_ocs_deployment = ocsci_config.ENV_DATA["skip_ocs_deployment"]
@@ -2080,16 +2101,27 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                     or mcg_only_deployment
                     or not ceph_cluster_installed
                 ):
-                    # We are allowing 20 re-tries for health check, to avoid teardown failures for cases like:
-                    # "flip-flopping ceph health OK and warn because of:
-                    # HEALTH_WARN Reduced data availability: 2 pgs peering
-                    ceph_health_check_with_toolbox_recovery(
-                        namespace=ocsci_config.ENV_DATA["cluster_namespace"],
-                        fix_ceph_health=True,
-                        update_jira=True,
-                        no_exception_if_jira_issue_updated=True,
-                    )
-                    log.info("Ceph health check passed at teardown!")
+                    if (
+                        use_health_gate
+                        and not disruptive
+                        and health_gate.check(cluster_index)
+                    ):
+                        log.info(
+                            "Ceph health is HEALTH_OK at teardown, skipping the full health check"
+                        )
+                    else:
+                        # We are allowing 20 re-tries for health check, to avoid teardown failures for cases like:
+                        # "flip-flopping ceph health OK and warn because of:
+                        # HEALTH_WARN Reduced data availability: 2 pgs peering
+                        ceph_health_check_with_toolbox_recovery(
+                            namespace=ocsci_config.ENV_DATA["cluster_namespace"],
+                            fix_ceph_health=True,
+                            update_jira=True,
+                            no_exception_if_jira_issue_updated=True,
+                        )
+                        log.info("Ceph health check passed at teardown!")
+                        if use_health_gate:
+                            health_gate.record(cluster_index, True, verified=True)
                     if ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
                         ceph_health_check_multi_storagecluster_external()
                         log.info(
@@ -2098,6 +2130,8 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                         multi_storagecluster_external_health_passed = True
 
             except CephHealthException:
+                if use_health_gate:
+                    health_gate.record(cluster_index, False, verified=True)
                 if not ocsci_config.RUN["skip_reason_test_found"]:
                     squad_name = None
                     for marker in node.iter_markers():
@@ -2141,6 +2175,17 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
         if mark.name in tier_marks_name + upgrade_marks_name and ocsci_config.RUN.get(
             "cephcluster"
         ):
+            if use_health_gate:
+                health_gate.watch(cluster_index)
+                if health_gate.is_healthy(cluster_index):
+                    healthy_since = time.strftime(
+                        "%H:%M:%S",
+                        time.localtime(health_gate.healthy_since(cluster_index)),
+                    )
+                    log.info(
+                        f"Ceph health is HEALTH_OK since {healthy_since}, skipping the health check at setup"
+                    )
+                    return
             log.info("Checking for Ceph Health OK ")
             external_multi_storagecluster_status = False
             try:
@@ -2155,6 +2200,8 @@ def health_checker(request, tier_marks_name, upgrade_marks_name):
                 if not ocsci_config.DEPLOYMENT.get("multi_storagecluster"):
                     if status:
                         log.info("Ceph health check passed at setup")
+                        if use_health_gate:
+                            health_gate.record(cluster_index, True, verified=True)
                         return
                 else:
                     external_multi_storagecluster_status = (
@@ -4683,6 +4730,16 @@ def ceph_toolbox(request):
             log.info("Failed to create toolbox")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def node_agent_teardown(request):
+    """
+    Delete the node agents deployed during the session when the node agent
+    mode is enabled
+    """
+    if ocsci_config.RUN.get("use_node_agent"):
+        request.addfinalizer(delete_node_agents)
+
+
 @pytest.fixture(scope="function")
 def node_drain_teardown(request):
     """
@@ -5790,6 +5847,11 @@ def setup_ui(request):
 
 
 def setup_ui_fixture(request):
+    if ui_session_pool.enabled:
+        driver = ui_session_pool.acquire()
+        request.addfinalizer(ui_session_pool.release)
+        return driver
+
     driver = login_ui()
 
     def finalizer():
@@ -7509,6 +7571,7 @@ def create_workload_factory():
         """
         ctx.append(switch_ctx)
         total_pvc_count = 0
+        new_instances = []
 
         if pvc_interface == constants.CEPHBLOCKPOOL:
             interface = constants.RBD_INTERFACE
@@ -7535,9 +7598,8 @@ def create_workload_factory():
                     "workload_path", workload_details["workload_dir"]
                 ),
             )
-            instances.append(workload)
+            new_instances.append(workload)
             total_pvc_count += workload_details["pvc_count"]
-            workload.deploy_workload()
 
         for index in range(num_of_appset):
             workload_key = "dr_workload_appset"
@@ -7558,9 +7620,10 @@ def create_workload_factory():
                     "workload_path", workload_details["workload_dir"]
                 ),
             )
-            instances.append(workload)
+            new_instances.append(workload)
             total_pvc_count += workload_details["pvc_count"]
-            workload.deploy_workload()
+        instances.extend(new_instances)
+        deploy_workloads(new_instances)
         if (
             ocsci_config.MULTICLUSTER["multicluster_mode"] == constants.RDR_MODE
             and pvc_interface == constants.CEPHBLOCKPOOL
@@ -7569,17 +7632,7 @@ def create_workload_factory():
         return instances
 
     def _teardown():
-        failed_to_delete = []
-        for instance in instances:
-            try:
-                instance.delete_workload(switch_ctx=ctx[0])
-            except ResourceNotDeleted:
-                failed_to_delete.append(instance.workload_namespace)
-
-        if failed_to_delete:
-            raise ResourceNotDeleted(
-                f"Deletion failed for the workload in following namespaces: {failed_to_delete}"
-            )
+        delete_workloads(instances, switch_ctx=ctx[0])
 
     def factory(
         num_of_subscription=1,
@@ -10492,6 +10545,18 @@ def pytest_sessionfinish(session, exitstatus):
     except Exception:
         log.exception("During finishing the Cluster load an exception was hit!")
 
+    try:
+        health_gate.stop()
+    except Exception:
+        log.exception("Stopping of the health gate failed")
+
+    try:
+        ui_session_pool.close()
+        report_ui_wait_timings()
+        ui_artefact_writer.close()
+    except Exception:
+        log.exception("Closing of the UI browser session and artefact writer failed")
+
     # Handle dr workload teardown if its set
     if session._dr_workload_teardown:
         try:
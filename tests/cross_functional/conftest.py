@@ -1969,6 +1969,25 @@ def resiliency_workload(request):
     return factory
 
 
+@pytest.fixture(scope="session")
+def io_workload_pool(
+    project_factory_session, multi_pvc_factory_session, storageclass_factory_session
+):
+    """
+    Session wide pool of background IO workloads shared by the krkn chaos and
+    resiliency tests. The pool is provisioned by the first test leasing from it
+    and the workloads are deleted at the end of the session.
+
+    Depends on the session scoped factories used to provision the pool, so the
+    pool is cleaned up before its project and PVCs are deleted.
+    """
+    from ocs_ci.resiliency.workload_pool import IOWorkloadPool
+
+    pool = IOWorkloadPool()
+    yield pool
+    pool.cleanup()
+
+
 @pytest.fixture
 def run_platform_stress(request):
     """Factory fixture to create and run a PlatformStress object.
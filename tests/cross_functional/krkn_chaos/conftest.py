@@ -234,6 +234,9 @@ def workload_ops(request, project_factory, multi_pvc_factory, storageclass_facto
                 """No-op validation and cleanup when workloads are disabled."""
                 log.info("No workloads to clean up")
 
+            def mark_background_operations_phase(self, phase):
+                """No-op, no background operations run without workloads."""
+
         try:
             yield NoWorkloadOps()
         finally:
@@ -273,11 +276,25 @@ def workload_ops(request, project_factory, multi_pvc_factory, storageclass_facto
 
     # Create workload factory and workloads using registry-based approach
     factory = KrknWorkloadFactory()
+
+    # Lease the VDBENCH workloads from the session pool if enabled
+    workload_pool = None
+    if config.use_workload_pool():
+        workload_pool = request.getfixturevalue("io_workload_pool")
+        if not workload_pool.provisioned:
+            factory.provision_workload_pool(
+                workload_pool,
+                request.getfixturevalue("project_factory_session")(),
+                request.getfixturevalue("multi_pvc_factory_session"),
+                request.getfixturevalue("storageclass_factory_session"),
+            )
+
     ops = factory.create_workload_ops(
         project_factory,
         multi_pvc_factory,
         loaded_fixtures=fixtures,  # Pass all loaded fixtures
         storageclass_factory=storageclass_factory,  # Pass storageclass factory for encrypted PVCs
+        workload_pool=workload_pool,
     )
 
     try:
@@ -285,7 +302,10 @@ def workload_ops(request, project_factory, multi_pvc_factory, storageclass_facto
     finally:
         # Best-effort cleanup if the test aborted before calling validate_and_cleanup
         log.info("Performing best-effort workload cleanup")
+        ops.release_leased_workloads()
         for w in ops.workloads:
+            if workload_pool and w in workload_pool.workloads:
+                continue
             with suppress(Exception):
                 if hasattr(w, "stop_workload"):
                     w.stop_workload()
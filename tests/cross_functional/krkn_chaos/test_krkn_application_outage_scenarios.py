@@ -132,7 +132,9 @@ class TestKrKnApplicationOutageScenarios:
         config.write_to_file(location=krkn_scenario_directory)
 
         # 5. Execute chaos scenarios using KrknExecutionHelper
-        executor = KrknExecutionHelper(namespace=constants.OPENSHIFT_STORAGE_NAMESPACE)
+        executor = KrknExecutionHelper(
+            namespace=constants.OPENSHIFT_STORAGE_NAMESPACE, workload_ops=workload_ops
+        )
         chaos_data = executor.execute_chaos_scenarios(
             config, group_name, "grouped application outage"
         )
@@ -271,7 +273,9 @@ class TestKrKnApplicationOutageScenarios:
         config.write_to_file(location=krkn_scenario_directory)
 
         # Execute strength test scenarios using KrknExecutionHelper
-        executor = KrknExecutionHelper(namespace=constants.OPENSHIFT_STORAGE_NAMESPACE)
+        executor = KrknExecutionHelper(
+            namespace=constants.OPENSHIFT_STORAGE_NAMESPACE, workload_ops=workload_ops
+        )
         chaos_data = executor.execute_strength_test_scenarios(
             config, target_component, stress_level
         )
@@ -3,14 +3,50 @@ import os
 import logging
 from contextlib import suppress
 from ocs_ci.ocs import constants
+from ocs_ci.ocs.node import get_nodes
+from ocs_ci.resiliency.node_stats import NodeStats
 from ocs_ci.resiliency.resiliency_helper import (
     ResiliencyConfig,
     WorkloadScalingHelper,
 )
+from ocs_ci.resiliency.resiliency_workload_config import ResiliencyWorkloadConfig
+from ocs_ci.utility.utils import ocsci_log_path
 
 log = logging.getLogger(__name__)
 
 
+@pytest.fixture(autouse=True)
+def node_telemetry(request):
+    """
+    Sample the /proc metrics of all the nodes during the test, the fault
+    injections mark their events in the running telemetry. The samples are
+    exported to node_telemetry/<test name>.json in the logs directory.
+
+    Configured by the node_telemetry section of the resiliency config.
+    """
+    telemetry_config = ResiliencyWorkloadConfig().get_node_telemetry_config()
+    if not telemetry_config.get("enabled", False):
+        yield None
+        return
+
+    nodes = get_nodes(constants.WORKER_MACHINE) + get_nodes(constants.MASTER_MACHINE)
+    telemetry = NodeStats.start_telemetry(
+        nodes, interval=telemetry_config.get("interval", 5)
+    )
+    try:
+        yield telemetry
+    finally:
+        telemetry.stop()
+        try:
+            telemetry.export(
+                os.path.join(
+                    ocsci_log_path(), "node_telemetry", f"{request.node.name}.json"
+                )
+            )
+        except OSError as e:
+            log.warning(f"Failed to export node telemetry: {e}")
+
+
 @pytest.fixture
 def platfrom_failure_scenarios():
     """List Platform Failures scanarios"""
@@ -112,6 +148,21 @@ def workload_ops(
 
     # Create workload factory and workloads
     factory = ResiliencyWorkloadFactory()
+
+    # Lease the VDBENCH workloads from the session pool if enabled
+    workload_pool = None
+    if config.use_workload_pool():
+        workload_pool = request.getfixturevalue("io_workload_pool")
+        if not workload_pool.provisioned:
+            factory.provision_workload_pool(
+                workload_pool,
+                request.getfixturevalue("project_factory_session")(),
+                request.getfixturevalue("multi_pvc_factory_session"),
+                vdbench_block_config,
+                vdbench_filesystem_config,
+                request.getfixturevalue("storageclass_factory_session"),
+            )
+
     ops = factory.create_workload_ops(
         project_factory,
         multi_pvc_factory,
@@ -121,6 +172,7 @@ def workload_ops(
         awscli_pod=awscli_pod,
         storageclass_factory=storageclass_factory,
         scaling_helper=scaling_helper,
+        workload_pool=workload_pool,
     )
 
     try:
@@ -134,8 +186,13 @@ def workload_ops(
             with suppress(Exception):
                 scaling_helper.cleanup(timeout=60)
 
-        # Cleanup workloads
+        # Release the pooled workloads, cleanup the others
+        if ops.leased_workloads:
+            with suppress(Exception):
+                workload_pool.release(ops.leased_workloads, verify=False)
         for w in ops.workloads:
+            if workload_pool and w in workload_pool.workloads:
+                continue
             with suppress(Exception):
                 if hasattr(w, "stop_workload"):
                     w.stop_workload()